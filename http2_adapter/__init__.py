@@ -10,7 +10,9 @@ HTTP/2 Adapter for Requests HTTP Library
 """
 
 from .huffman import HTTP2Huffman
+from .huffman import http2_huffman
 
 __all__ = [
-    ["HTTP2Huffman"],
+    "HTTP2Huffman",
+    "http2_huffman",
 ]
@@ -0,0 +1,476 @@
+# -*- coding: utf-8 -*-
+
+"""
+http2-adapter benchmarks
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+Micro benchmarks for the hot paths of the adapter, run them with::
+
+    $ python -m http2_adapter.bench frames
+    $ python -m http2_adapter.bench huffman
+    $ python -m http2_adapter.bench hpack
+    $ python -m http2_adapter.bench import
+"""
+
+import json
+import os
+import subprocess
+import sys
+import timeit
+from base64 import urlsafe_b64encode
+from binascii import unhexlify
+from hashlib import sha256
+from struct import pack
+
+from .huffman import encode as huffman_encode
+from .huffman import encode_many as huffman_encode_many
+from .huffman import _load_numpy
+from .huffman import decode as huffman_decode
+from .huffman import HTTP2Huffman
+from .huffman_4bits import decode as huffman_decode_4bits
+from .frame import HTTP2FrameHeader
+from .frame import HTTP2FrameReader
+from .frame import HTTP2FrameWriter
+from .frame import HTTP2HeadersFrame
+from .frame import HTTP2WindowUpdateFrame
+from .frame import HTTP_V2_ACK_FLAG
+from .frame import HTTP_V2_DATA_FRAME
+from .frame import HTTP_V2_END_HEADERS_FLAG
+from .frame import HTTP_V2_HEADERS_FRAME
+from .frame import HTTP_V2_PING_FRAME
+from .frame import HTTP_V2_SETTINGS_FRAME
+from .frame import HTTP_V2_WINDOW_UPDATE_FRAME
+from .frame import HTTP_V2_WINDOW_UPDATE_SIZE
+from .frame import http2_control_frames
+from .hpack import HTTP2Hpack
+from .hpack import HPACK_INCR_INDEXING
+from .hpack import HPACK_WITHOUT_INDEXING
+
+
+# Huffman encoded header values taken from RFC 7541, Appendix C.
+huffman_rfc7541_corpus = tuple(unhexlify(item) for item in (
+    b"f1e3c2e5f23a6ba0ab90f4ff",
+    b"a8eb10649cbf",
+    b"25a849e95ba97d7f",
+    b"25a849e95bb8e8b4bf",
+    b"6402",
+    b"aec3771a4b",
+    b"d07abe941054d444a8200595040b8166e082a62d1bff",
+    b"9d29ad171863c78f0b97c8e9ae82ae43d3",
+    b"640eff",
+    b"d07abe941054d444a8200595040b8166e084a62d1bff",
+    b"9bd9ab",
+    b"94e7821dd7f2e6c7b335dfdfcd5b3960d5af27087f3672c1ab270fb5291f9587316065"
+    b"c003ed4ee5b1063d5007",
+))
+
+
+def token(seed, size):
+    """Builds a deterministic url-safe base64 token.
+
+    :param seed: bytes which tell tokens apart.
+    :param size: the token length.
+    :rtype: bytes.
+    """
+    chunks, digest = [], seed
+    while sum(len(chunk) for chunk in chunks) < size:
+        digest = sha256(digest).digest()
+        chunks.append(urlsafe_b64encode(digest).rstrip(b"="))
+
+    return b"".join(chunks)[:size]
+
+
+def paths(count):
+    """Builds count distinct request paths with query strings."""
+    return [b"/api/v2/tenants/%d/orders/" % (i % 97) + token(b"%d" % i, 22)
+            + b"?page=%d&per_page=50&sort=-created_at" % (i % 13)
+            for i in range(count)]
+
+
+def cookie(seed, count):
+    """Builds a Cookie header value with count pairs."""
+    return b"; ".join(b"%s_%d=" % (seed, i) + token(seed + b"%d" % i, 40)
+                      for i in range(count))
+
+
+def jwt(seed, claims_size):
+    """Builds an Authorization header value with a (fake) JWT bearer token."""
+    header = urlsafe_b64encode(b'{"alg":"RS256","typ":"JWT","kid":"%s"}'
+                               % token(seed, 16)).rstrip(b"=")
+    return b"Bearer " + b".".join([header, token(seed + b"claims", claims_size),
+                                   token(seed + b"signature", 342)])
+
+
+def huffman_corpora():
+    """Builds the plain header values the Huffman codec is measured over,
+    on demand, so that importing this module costs nothing.
+
+    :rtype: a tuple of tuples (name, values, lower).
+    """
+    return (
+        ("cookies", (cookie(b"sid", 4), cookie(b"prefs", 24),
+                     cookie(b"tracking", 96)), False),
+        ("jwt bearer tokens", tuple(jwt(b"%d" % i, 200 + i * 150)
+                                    for i in range(4)), False),
+        ("paths", tuple(paths(200)), False),
+        ("header names", (
+            b"Accept", b"Accept-Encoding", b"Accept-Language",
+            b"Authorization", b"Cache-Control", b"Content-Length",
+            b"Content-Type", b"Cookie", b"If-Modified-Since",
+            b"If-None-Match", b"User-Agent", b"Referer", b"X-Forwarded-For",
+            b"X-Request-Id", b"X-Tenant-Id", b"Access-Control-Allow-Origin",
+            b"Strict-Transport-Security",
+        ), True),
+        ("rfc7541 values", tuple(huffman_decode(item)
+                                 for item in huffman_rfc7541_corpus), False),
+    )
+
+
+def bench(func, corpus, repeat=5, number=200):
+    """Measures how long func takes to process the whole corpus.
+
+    :param func: a callable which accepts an item of the corpus.
+    :param corpus: a sequence of inputs.
+    :rtype: the best time (in seconds) of a single pass over the corpus.
+    """
+    def run():
+        for item in corpus:
+            func(item)
+
+    return min(timeit.repeat(run, repeat=repeat, number=number)) / number
+
+
+def report(name, seconds, nbytes, baseline=None):
+    """Prints a line of the benchmark result.
+
+    :param name: what was measured.
+    :param seconds: the time of a pass over the corpus.
+    :param nbytes: the size of the corpus.
+    :param baseline: the time of the reference, if any.
+    """
+    line = "%-32s %10.1f us %8.2f MB/s %8.1f ns/B" % (
+        name, seconds * 1e6, nbytes / seconds / 1e6, seconds * 1e9 / nbytes)
+    if baseline is not None:
+        line += " %6.2fx" % (baseline / seconds)
+
+    print(line)
+
+
+def bench_huffman():
+    """Measures the Huffman codec over realistic header values.
+    Throughputs are relative to the plain size for both directions.
+    """
+    for name, corpus, lower in huffman_corpora():
+        nbytes = sum(len(item) for item in corpus)
+        encoded = [huffman_encode(item, lower) for item in corpus]
+        report("encode, %s" % name,
+               bench(lambda item: huffman_encode(item, lower), corpus),
+               nbytes)
+        report("decode, %s" % name, bench(huffman_decode, encoded), nbytes)
+
+    print("")
+
+    corpus = huffman_rfc7541_corpus
+    nbytes = sum(len(huffman_decode(item)) for item in corpus)
+    baseline = bench(huffman_decode_4bits, corpus)
+    report("decode 4 bits, rfc7541 values", baseline, nbytes)
+    report("decode 8 bits, rfc7541 values", bench(huffman_decode, corpus),
+           nbytes, baseline)
+
+    cached = HTTP2Huffman(cache_size=1 << 16)
+    report("decode cached, rfc7541 values", bench(cached.decode, corpus),
+           nbytes, baseline)
+
+    batch = paths(20000)
+    nbytes = sum(len(item) for item in batch)
+    scalar = bench(lambda values: [huffman_encode(value) for value in values],
+                   [batch], repeat=3, number=3)
+    report("encode scalar, 20k paths", scalar, nbytes)
+    if _load_numpy():
+        report("encode_many numpy, 20k paths",
+               bench(huffman_encode_many, [batch], repeat=3, number=3),
+               nbytes, scalar)
+    else:
+        print("%-32s skipped, NumPy is not installed"
+              % "encode_many numpy, 20k paths")
+
+
+# hpack-test-case (https://github.com/http2jp/hpack-test-case) stories, a
+# story is a connection, its cases the header blocks, with the wire if the
+# blocks come from an implementation.
+hpack_stories_dir = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "tests", "hpack-test-case")
+
+
+def load_hpack_stories(directory=hpack_stories_dir):
+    """Loads the stories of directory and its sub directories.
+
+    :param directory: where the story_*.json files are.
+    :rtype: a list of tuples (name, header_table_size, cases), cases are
+            tuples (headers, wire), wire is None for the raw data.
+    """
+    stories = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for filename in sorted(files):
+            if not (filename.startswith("story_")
+                    and filename.endswith(".json")):
+                continue
+
+            with open(os.path.join(root, filename)) as f:
+                story = json.load(f)
+
+            cases = story["cases"]
+            header_table_size = cases[0].get("header_table_size", 4096)
+            stories.append((
+                os.path.relpath(os.path.join(root, filename), directory),
+                header_table_size,
+                [([(name.encode("utf-8"), value.encode("utf-8"))
+                   for header in case["headers"]
+                   for name, value in header.items()],
+                  unhexlify(case["wire"]) if "wire" in case else None)
+                 for case in cases]))
+
+    return stories
+
+
+# indexing strategies: (name, encoder factory)
+hpack_strategies = (
+    ("static table only",
+     lambda size: HTTP2Hpack(None, size, policy=lambda header, max_size:
+                             HPACK_WITHOUT_INDEXING)),
+    ("index all",
+     lambda size: HTTP2Hpack(None, size, policy=lambda header, max_size:
+                             HPACK_INCR_INDEXING)),
+    ("default policy", lambda size: HTTP2Hpack(None, size)),
+    ("default policy, auto tune",
+     lambda size: HTTP2Hpack(None, size, auto_tune=True)),
+)
+
+
+def replay_hpack(stories, factory):
+    """Encodes the stories, each with a new encoder.
+
+    :param stories: as loaded by load_hpack_stories.
+    :param factory: creates an encoder from the header table size.
+    :rtype: a list of lists of the header blocks, per story.
+    """
+    blocks = []
+    for name, header_table_size, cases in stories:
+        encoder = factory(header_table_size)
+        blocks.append([bytes(encoder.encode(headers))
+                       for headers, wire in cases])
+
+    return blocks
+
+
+def check_hpack_stories(stories):
+    """Decodes the wire of the stories, and checks the headers.
+
+    :param stories: as loaded by load_hpack_stories.
+    :rtype: a list of the failures, tuples (story name, seqno, reason).
+    """
+    failures = []
+    for name, header_table_size, cases in stories:
+        decoder = HTTP2Hpack(None, header_table_size)
+        for seqno, (headers, wire) in enumerate(cases):
+            if wire is None:
+                continue
+
+            try:
+                decoded = decoder.decode(wire)
+            except Exception as e:
+                failures.append((name, seqno, repr(e)))
+                break
+
+            if decoded != headers:
+                failures.append((name, seqno, "headers mismatch"))
+
+    return failures
+
+
+def bench_hpack():
+    """Replays the hpack-test-case stories, checks the decoder against the
+    wire of the stories which have one, and measures each indexing strategy
+    over all the stories.
+    """
+    stories = load_hpack_stories()
+    blocks = sum(len(cases) for name, size, cases in stories)
+    headers = sum(len(case[0]) for name, size, cases in stories
+                  for case in cases)
+    plain = sum(len(name) + len(value) for _, size, cases in stories
+                for case in cases for name, value in case[0])
+
+    failures = check_hpack_stories(stories)
+    print("%d stories, %d header blocks, %d headers, %d failures"
+          % (len(stories), blocks, headers, len(failures)))
+    for failure in failures:
+        print("  %s, case %d: %s" % failure)
+
+    print("")
+    print("%-32s %12s %12s %8s %8s" % ("strategy", "encode h/s",
+                                       "decode h/s", "B/h", "ratio"))
+
+    for name, factory in hpack_strategies:
+        encoded = replay_hpack(stories, factory)
+        nbytes = sum(len(block) for story in encoded for block in story)
+
+        encode = min(timeit.repeat(lambda: replay_hpack(stories, factory),
+                                   repeat=3, number=3)) / 3
+
+        def decode():
+            for story, (_, size, cases) in zip(encoded, stories):
+                decoder = HTTP2Hpack(None, size)
+                for block in story:
+                    decoder.decode(block)
+
+        decode_time = min(timeit.repeat(decode, repeat=3, number=3)) / 3
+        print("%-32s %12.0f %12.0f %8.2f %8.3f"
+              % (name, headers / encode, headers / decode_time,
+                 float(nbytes) / headers, float(nbytes) / plain))
+
+
+def frame(_type, flags, sid, payload):
+    """Serializes a frame by hand, for the frame corpus."""
+    return pack(">IBI", len(payload) << 8 | _type, flags, sid) + payload
+
+
+def frames_stream(streams):
+    """Builds the frames a client receives for streams responses: a
+    HEADERS frame, 4 DATA frames of 4 KB and a WINDOW_UPDATE frame each,
+    and a PING and SETTINGS ACK now and then.
+
+    :rtype: the byte stream.
+    """
+    headers = unhexlify(b"88c16196d07abe941054d444a8200595040b8166e084a62d1b"
+                        b"ffc05a839bd9ab77ad94e7821dd7f2e6c7b335dfdfcd5b3960"
+                        b"d5af27087f3672c1ab270fb5291f9587316065c003ed4ee5b1"
+                        b"063d5007")
+    chunk = token(b"data", 4096)
+    frames = []
+    for sid in range(1, streams * 2, 2):
+        frames.append(frame(HTTP_V2_HEADERS_FRAME, HTTP_V2_END_HEADERS_FLAG,
+                            sid, headers))
+        frames.extend(frame(HTTP_V2_DATA_FRAME, int(i == 3), sid, chunk)
+                      for i in range(4))
+        frames.append(frame(HTTP_V2_WINDOW_UPDATE_FRAME, 0, 0,
+                            pack(">I", 4 * len(chunk))))
+        if sid % 16 == 1:
+            frames.append(frame(HTTP_V2_PING_FRAME, HTTP_V2_ACK_FLAG, 0,
+                                pack(">Q", sid)))
+            frames.append(frame(HTTP_V2_SETTINGS_FRAME, HTTP_V2_ACK_FLAG, 0,
+                                b""))
+
+    return b"".join(frames)
+
+
+def bench_frames():
+    """Measures the frames parsed and serialized per second."""
+    stream = frames_stream(200)
+
+    def parse():
+        reader = HTTP2FrameReader()
+        for offset in range(0, len(stream), 1 << 14):
+            reader.feed(stream[offset:offset + (1 << 14)])
+            for _ in reader:
+                pass
+
+    reader = HTTP2FrameReader(buffer_size=len(stream))
+    reader.feed(stream)
+    parsed = list(reader)
+    seconds = min(timeit.repeat(parse, repeat=5, number=5)) / 5
+    print("%-32s %10.0f frames/s %8.1f MB/s"
+          % ("parse, reader", len(parsed) / seconds,
+             len(stream) / seconds / 1e6))
+
+    frames = [item for item in parsed
+              if not isinstance(item, HTTP2HeadersFrame)]
+    nbytes = sum(len(item.serialize()) for item in frames)
+    seconds = min(timeit.repeat(
+        lambda: [item.serialize() for item in frames],
+        repeat=5, number=5)) / 5
+    print("%-32s %10.0f frames/s %8.1f MB/s"
+          % ("serialize", len(frames) / seconds, nbytes / seconds / 1e6))
+
+    buf = HTTP2FrameWriter()
+
+    def gather():
+        for item in frames:
+            item.serialize_into(buf)
+        buf.clear()
+
+    seconds = min(timeit.repeat(gather, repeat=5, number=5)) / 5
+    print("%-32s %10.0f frames/s %8.1f MB/s"
+          % ("serialize_into, writer", len(frames) / seconds,
+             nbytes / seconds / 1e6))
+
+    def build():
+        header = HTTP2FrameHeader(HTTP_V2_WINDOW_UPDATE_FRAME,
+                                  HTTP_V2_WINDOW_UPDATE_SIZE, 0)
+        HTTP2WindowUpdateFrame(header, 1 << 16).serialize_into(buf)
+
+    def cached():
+        buf.write(http2_control_frames.window_update(1 << 16))
+
+    for name, send in (("WINDOW_UPDATE, built", build),
+                       ("WINDOW_UPDATE, cached", cached)):
+        seconds = min(timeit.repeat(send, repeat=5, number=10000)) / 10000
+        buf.clear()
+        print("%-32s %10.0f frames/s" % (name, 1 / seconds))
+
+
+def bench_interpreter(statement, setup="pass", repeat=5):
+    """Measures statement in fresh interpreters, e.g. an import.
+
+    :param statement: the code to measure.
+    :param setup: the code runs before, e.g. importing the dependencies.
+    :rtype: the best time (in seconds).
+    """
+    script = ("from timeit import default_timer as timer\n%s\n"
+              "start = timer()\n%s\nprint(timer() - start)"
+              % (setup, statement))
+    return min(float(subprocess.check_output([sys.executable, "-c", script]))
+               for _ in range(repeat))
+
+
+def bench_import():
+    """Measures the import time of the package.
+    Dependencies are imported beforehand, only our own modules count.
+    """
+    setup = "import requests, urllib3"
+    baseline = bench_interpreter("import http2_adapter\n"
+                                 "http2_adapter.huffman"
+                                 "._load_decode_table_8bits()", setup)
+    lazy = bench_interpreter("import http2_adapter", setup)
+
+    print("%-32s %10.1f ms" % ("import, eager tables", baseline * 1e3))
+    print("%-32s %10.1f ms %6.2fx" % ("import", lazy * 1e3, baseline / lazy))
+
+
+benchmarks = {
+    "frames": bench_frames,
+    "hpack": bench_hpack,
+    "huffman": bench_huffman,
+    "import": bench_import,
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    names = argv or sorted(benchmarks)
+    for name in names:
+        if name not in benchmarks:
+            sys.stderr.write("unknown benchmark \"%s\", choose from: %s\n"
+                             % (name, ", ".join(sorted(benchmarks))))
+            return 1
+
+    for name in names:
+        print("[%s]" % name)
+        benchmarks[name]()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,3 +20,27 @@ is_py3 = (_ver[0] == 3)
 empty_unit = "" if is_py2 else b""
 range_iter = xrange if is_py2 else range
 unit_type = str if is_py2 else bytes
+
+
+if is_py2:
+    from binascii import unhexlify as _unhexlify
+
+    def int_to_bytes(value, size):
+        """Converts a non-negative integer to size big-endian bytes."""
+        return _unhexlify("%0*x" % (size << 1, value))
+else:
+    def int_to_bytes(value, size):
+        """Converts a non-negative integer to size big-endian bytes."""
+        return value.to_bytes(size, "big")
+
+
+if is_py2:
+    def octet_view(data):
+        """Returns a view of data whose items are integers.
+        memoryview yields str items on python/2.x, so the data is copied.
+        """
+        return bytearray(data)
+else:
+    def octet_view(data):
+        """Returns a view of data whose items are integers, without copying."""
+        return memoryview(data)
@@ -29,6 +29,10 @@ class HTTP2HpackEncodeError(HTTP2HpackError):
 class HTTP2HpackDecodeError(HTTP2HpackError):
     """An HTTP/2 hpack decoding error occurred."""
 
+
+class HTTP2HpackTruncatedError(HTTP2HpackDecodeError):
+    """An HTTP/2 hpack header block ended in the middle of a field."""
+
 class HTTP2HpackHuffmanDecodeError(HTTP2Error):
     """An hTTP/2 hpack huffman decoding error occurred."""
 
@@ -7,11 +7,13 @@ http/2 protocol frames implements
 This module implements all the frames defined in HTTP/2 protocol.
 """
 
-from .compat import is_py2, is_py3, empty_object
+from .compat import is_py2, is_py3, empty_unit, unit_type
 from .exceptions import HTTP2FrameError
+from .hpack import hpack_header_name
+from .huffman import HTTP2HuffmanCache
 
 from array import array
-from struct import pack, unpack
+from struct import Struct
 from urllib3.exceptions import HTTPError as _HTTPError
 
 # error codes
@@ -50,6 +52,11 @@ HTTP_V2_DEFAULT_FRAME_SIZE = 1 << 14
 
 HTTP_V2_FRAME_HEADER_SIZE = 9
 
+HTTP_V2_CONNECTION_PREFACE = b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n"
+
+# the most buffers a sendmsg (writev) call takes, IOV_MAX on Linux.
+HTTP_V2_IOV_MAX = 1024
+
 # frame types
 HTTP_V2_DATA_FRAME          = 0x0
 HTTP_V2_HEADERS_FRAME       = 0x1
@@ -107,6 +114,49 @@ HTTP_V2_FRAME_FLAG_NAME = {
     HTTP_V2_PRIORITY_FLAG    : "PRIORITY",
 }
 
+# the flags defined for any frame type, the others are ignored.
+HTTP_V2_FRAME_FLAGS_MASK = (HTTP_V2_ACK_FLAG | HTTP_V2_END_STREAM_FLAG
+                            | HTTP_V2_END_HEADERS_FLAG | HTTP_V2_PADDED_FLAG
+                            | HTTP_V2_PRIORITY_FLAG)
+
+# the codecs of the frame header and the fixed size payload fields, compiled
+# once for all, parse with unpack_from at an offset.
+_frame_header = Struct(">IBI")
+_uint8 = Struct(">B")
+_uint32 = Struct(">I")
+_uint64 = Struct(">Q")
+_priority = Struct(">IB")
+_setting = Struct(">HI")
+_goaway = Struct(">II")
+
+# connection-specific header fields, which are not allowed in HTTP/2.
+# See https://tools.ietf.org/html/rfc7540#section-8.1.2.2 for more details.
+HTTP_V2_CONNECTION_HEADERS = frozenset([
+    b"connection", b"keep-alive", b"proxy-connection", b"transfer-encoding",
+    b"upgrade",
+])
+
+
+def _unpad(header, payload):
+    """Strips the Pad Length field and the padding of a PADDED frame.
+
+    :param header: a instance of :class: `HTTP2FrameHeader`.
+    :param payload: data stream.
+    :rtype: the payload without the padding.
+    """
+    if not header.has_flag(HTTP_V2_PADDED_FLAG):
+        return payload
+
+    if header.length == 0:
+        raise HTTP2FrameError("PADDED frame with incorrect length: 0")
+
+    pad_length = _uint8.unpack_from(payload)[0]
+    if pad_length >= header.length:
+        raise HTTP2FrameError("frame with incorrect length: %d "
+                              "padding: %d" % (header.length, pad_length))
+
+    return payload[1:header.length - pad_length]
+
 
 class HTTP2FrameHeader(object):
     """The HTTP/2 frame header class.
@@ -126,7 +176,12 @@ class HTTP2FrameHeader(object):
     :param _sid: the stream identifier where this frame belongs.
     :param _flags: the frame flags, e.g. a HEADERS frame with a END_STREAM.
     """
-    def __init__(self, _type, _length, _sid, _flags=None):
+    __slots__ = ("__type", "__length", "__sid", "__flags")
+
+    def __init__(self, _type, _length, _sid, _flags=HTTP_V2_NO_FLAG):
+        if _flags is None:
+            _flags = HTTP_V2_NO_FLAG
+
         HTTP2FrameHeader.check_frame_type(_type)
         HTTP2FrameHeader.check_frame_length(_length)
         HTTP2FrameHeader.check_frame_sid(_sid)
@@ -137,19 +192,26 @@ class HTTP2FrameHeader(object):
         self.__flags = _flags
 
     def __repr__(self):
-        return "<HTTP/2 Frame header [%s]>" %
-                    HTTP2FrameHeader.get_frame_name(self.__type)
+        return "<HTTP/2 Frame header [%s]>" % (
+            HTTP2FrameHeader.get_frame_type_name(self.__type))
 
     def serialize(self):
         """Serializes the frame header
         rtype: string for python/2.x whereas bytes for python/3.x.
         """
         length_type = self.__length << 8 | self.__type
-        return pack(">IBI", length_type, self.__flags, self.__sid)
+        return _frame_header.pack(length_type, self.__flags, self.__sid)
+
+    def serialize_into(self, buf):
+        """Serializes the frame header into the send buffer.
+
+        :param buf: a instance of :class: `HTTP2FrameWriter`.
+        """
+        buf.write(self.serialize())
 
     def has_flag(self, flag):
         """Checks the specific flag."""
-        return self.__flag & flag == flag
+        return self.__flags & flag == flag
 
     @property
     def flags(self):
@@ -177,24 +239,39 @@ class HTTP2FrameHeader(object):
         return HTTP_V2_FRAME_TYPE_NAME.get(_type, "UNKNOWN")
 
     @staticmethod
-    def parse_frame_header(data):
+    def parse_frame_header(data, offset=0):
         """Parses the data and builds a frame header.
-        :param data: str/bytes data pends to parse. 
+        :param data: bytes, bytearray or memoryview data pends to parse.
+        :param offset: where the frame header starts in data.
         :rtype: a instance of :class: `HTTP2FrameHeader`.
-
-        for python/2.x, data shall be a str object,
-        where as for python/3.x, data shall be a bytes object.
         """
-        if is_py2 and not isinstance(data, str):
-            raise ValueError("invalid param type '%s'" % type(data))
-        elif is_py3 and not isinstance(data, bytes):
-            raise ValueError("invalid param type '%s'" % type(data))
-
-        if len(data) < HTTP_V2_FRAME_HEADER_SIZE:
+        if len(data) - offset < HTTP_V2_FRAME_HEADER_SIZE:
             raise HTTP2FrameError("header size too small")
 
-        data = data[:HTTP_V2_FRAME_HEADER_SIZE]
-        return HTTP2FrameHeader(*unpack(">IBI", data))
+        length_type, flags, sid = _frame_header.unpack_from(data, offset)
+        HTTP2FrameHeader.check_frame_flags(flags)
+        header = HTTP2FrameHeader.from_wire(length_type, flags, sid)
+        HTTP2FrameHeader.check_frame_type(header.type)
+        return header
+
+    @staticmethod
+    def from_wire(length_type, flags, sid):
+        """Builds a frame header from the fields unpacked off the wire, which
+        are valid by construction: the length and the type are 24 and 8 bits
+        wide, the reserved bit is masked, so nothing is checked but for the
+        undefined flags, which are masked too.
+
+        :param length_type: the length (24 bits) and the type (8 bits).
+        :param flags: the frame flags.
+        :param sid: the stream identifier and the reserved bit.
+        :rtype: a instance of :class: `HTTP2FrameHeader`.
+        """
+        header = HTTP2FrameHeader.__new__(HTTP2FrameHeader)
+        header.__type = length_type & 0xff
+        header.__length = length_type >> 8
+        header.__sid = sid & HTTP_V2_STREAM_ID_MASK
+        header.__flags = flags & HTTP_V2_FRAME_FLAGS_MASK
+        return header
 
     @staticmethod
     def check_frame_type(_type, need=None):
@@ -229,7 +306,7 @@ class HTTP2FrameHeader(object):
                 dummy |= flag
 
         if dummy != _flags:
-            raise HTTP2FrameError("invalid frame flags: 0x%x." % flags)
+            raise HTTP2FrameError("invalid frame flags: 0x%x." % _flags)
 
 
 class HTTP2HeadersFrame(object):
@@ -247,21 +324,148 @@ class HTTP2HeadersFrame(object):
     |                   Padding (*)                                 ...
     +-----------------------------------------------------------------+
     
+    The header names are lowercased through the interned names table of
+    hpack, the values are encoded to bytes, the connection-specific headers
+    are dropped, as well as Host, which :authority replaces.
+
     :param _header: a instance of :class: `HTTP2FrameHeader`.
     :param _authority: the authority portion of the target URI.
     :param _path: the path and query parts of the target URI.
     :param _method: the HTTP method.
     :param _headers: a dict represents the request headers.
+    :param _scheme: the scheme of the target URI.
     """
-    def __init__(self, _header, _authority, _path, _method, _headers):
+    __slots__ = ("header_block", "__header", "__fragment", "__priority")
+
+    def __init__(self, _header, _authority, _path, _method, _headers,
+                 _scheme=b"https"):
         HTTP2FrameHeader.check_frame_type(_header.type, HTTP_V2_HEADERS_FRAME)
-        self.header_block = dict((key.lower(), headers[key]) for key in headers)
-        self.header_block[":authority"] = authority
-        self.header_block[":method"] = method
-        self.header_block[":path"] = path
+        header_block = [
+            (b":method", HTTP2HeadersFrame.header_value(_method)),
+            (b":scheme", HTTP2HeadersFrame.header_value(_scheme)),
+            (b":path", HTTP2HeadersFrame.header_value(_path)),
+            (b":authority", HTTP2HeadersFrame.header_value(_authority)),
+        ]
+
+        for key in _headers:
+            name = hpack_header_name(key)
+            value = HTTP2HeadersFrame.header_value(_headers[key])
+            if name in HTTP_V2_CONNECTION_HEADERS or name == b"host":
+                continue
+            elif name == b"te" and value != b"trailers":
+                continue
+
+            header_block.append((name, value))
+
+        self.header_block = header_block
         self.__header = _header
+        self.__fragment = None
+        self.__priority = None
+
+    def __repr__(self):
+        return "<HTTP/2 HEADERS frame>"
 
-    def serialize(self, hpack):
+    @property
+    def header(self):
+        """Returns the frame header."""
+        return self.__header
+
+    @property
+    def fragment(self):
+        """Returns the header block fragment of a parsed frame."""
+        return self.__fragment
+
+    @property
+    def priority(self):
+        """Returns a tuple (dependency, weight, exclusive) if the frame has the
+        PRIORITY flag, else None.
+        """
+        return self.__priority
+
+    @staticmethod
+    def parse_frame(header, payload):
+        """Parses the HEADERS frame, the header block fragment is a slice of
+        the payload, which the hpack decoder of the connection decodes once
+        the block is complete (END_HEADERS).
+        Caller should assure that the payload size is equal to header.length
+        and that the header is of the frame type.
+
+        :param header: a instance of :class: `HTTP2FrameHeader`.
+        :param payload: data stream.
+        :rtype: a instance of :class: `HTTP2HeadersFrame`.
+        """
+        if header.stream_id == 0x0:
+            raise HTTP2FrameError("HEADERS frame with "
+                                  "the 0x0 stream identifier")
+
+        payload = _unpad(header, payload)
+        priority = None
+        if header.has_flag(HTTP_V2_PRIORITY_FLAG):
+            if len(payload) < HTTP_V2_PRIORITY_SIZE:
+                raise HTTP2FrameError("HEADERS frame with incorrect "
+                                      "length: %d" % header.length)
+
+            depend, weight = _priority.unpack_from(payload)
+            priority = (depend & HTTP_V2_STREAM_ID_MASK, weight + 1,
+                        bool(depend >> 31))
+            payload = payload[HTTP_V2_PRIORITY_SIZE:]
+
+        frame = HTTP2HeadersFrame.__new__(HTTP2HeadersFrame)
+        frame.header_block = None
+        frame.__header = header
+        frame.__fragment = payload
+        frame.__priority = priority
+        return frame
+
+    @staticmethod
+    def header_value(value):
+        """Returns the header value as bytes, str is encoded in latin-1."""
+        if isinstance(value, unit_type):
+            return value
+
+        return value.encode("latin-1")
+
+    def serialize(self, hpack, max_frame_size=HTTP_V2_DEFAULT_FRAME_SIZE):
+        """Serializes the HEADERS frame, followed by CONTINUATION frames if
+        the header block does not fit in a frame.
+
+        :param hpack: the :class:`HTTP2Hpack` encoder of the connection.
+        :param max_frame_size: the SETTINGS_MAX_FRAME_SIZE of the peer.
+        :rtype: the data stream.
+        """
+        buf = HTTP2FrameWriter()
+        self.serialize_into(buf, hpack, max_frame_size)
+        return buf.getvalue()
+
+    def serialize_into(self, buf, hpack,
+                       max_frame_size=HTTP_V2_DEFAULT_FRAME_SIZE):
+        """Serializes the HEADERS frame into the send buffer, followed by
+        CONTINUATION frames if the header block does not fit in a frame.
+        The fragments are slices of the encoded header block.
+
+        :param buf: a instance of :class: `HTTP2FrameWriter`.
+        :param hpack: the :class:`HTTP2Hpack` encoder of the connection.
+        :param max_frame_size: the SETTINGS_MAX_FRAME_SIZE of the peer.
+        """
+        block = memoryview(hpack.encode(self.header_block))
+        sid = self.__header.stream_id
+        length_type = HTTP_V2_HEADERS_FRAME
+        flags = self.__header.flags & HTTP_V2_END_STREAM_FLAG
+        offset = 0
+        while True:
+            fragment = block[offset:offset + max_frame_size]
+            offset += len(fragment)
+            if offset >= len(block):
+                flags |= HTTP_V2_END_HEADERS_FLAG
+
+            buf.write(_frame_header.pack(len(fragment) << 8 | length_type,
+                                         flags, sid))
+            buf.write(fragment)
+            if offset >= len(block):
+                return
+
+            length_type = HTTP_V2_CONTINUATION_FRAME
+            flags = HTTP_V2_NO_FLAG
 
 
 class HTTP2DataFrame(object):
@@ -279,6 +483,8 @@ class HTTP2DataFrame(object):
     :param _data: the body data.
     :param _pad: the padding data.
     """
+    __slots__ = ("__header", "__data", "__pad")
+
     def __init__(self, _header, _data, _pad=None):
         HTTP2FrameHeader.check_frame_type(_header.type, HTTP_V2_DATA_FRAME)
         pad_flag = _header.has_flag(HTTP_V2_PADDED_FLAG)
@@ -294,50 +500,67 @@ class HTTP2DataFrame(object):
     def __repr__(self):
         return "<HTTP/2 DATA frame>"
 
+    @property
+    def header(self):
+        """Returns the frame header."""
+        return self.__header
+
+    @property
+    def data(self):
+        """Returns the body data."""
+        return self.__data
+
     def serialize(self):
         """Serializes the DATA frame.
 
         :rtype: the data stream.
         """
         header = self.__header.serialize()
-        data = empty_object
-        if self.__header.has_flag(HTTP_V2_PADDED_FLAG) is not None:
-            data = pack(">B", len(self.__pad))
+        if not self.__header.has_flag(HTTP_V2_PADDED_FLAG):
+            return empty_unit.join([header, self.__data])
+
+        return empty_unit.join([header, _uint8.pack(len(self.__pad)),
+                                self.__data, self.__pad])
 
-        return empty_object.join([data, self.__data, self.__pad])
+    def serialize_into(self, buf):
+        """Serializes the DATA frame into the send buffer, the data is not
+        copied if it is large, but referenced until the buffer is flushed.
+
+        :param buf: a instance of :class: `HTTP2FrameWriter`.
+        """
+        header = self.__header.serialize()
+        if not self.__header.has_flag(HTTP_V2_PADDED_FLAG):
+            buf.write(header)
+            buf.write(self.__data)
+            return
+
+        buf.write(header + _uint8.pack(len(self.__pad)))
+        buf.write(self.__data)
+        buf.write(self.__pad)
 
     @staticmethod
     def parse_frame(header, payload):
         """Parses the DATA frame.
-        Caller should assure that the payload size is equal to header.length.
+        Caller should assure that the payload size is equal to header.length
+        and that the header is of the frame type.
 
         :param header: a instance of :class: `HTTP2FrameHeader`.
         :param payload: data stream.
         :rtype: a instance of :class: `HTTP2DataFrame`.
         """
-        if header.type != HTTP_V2_DATA_FRAME:
-            raise HTTP2FrameError("invalid frame type: %s" %
-                HTTP2FrameHeader.get_frame_name(header.type))
-        elif header.length != len(payload):
-            raise HTTP2FrameError("invalid payload length: %d" % header.length)
-
-        pad_length = 0
-        if header.has_flag(HTTP_V2_PADDED_FLAG):
-            if header.length == 0:
-                raise HTTP2FrameError("PADDED DATA frame "
-                                      "with incorrect length: 0")
-            pad_length, payload = payload[0], payload[1:]
-
-        if pad_length >= header.length:
-            raise HTTP2FrameError("DATA frame with incorrect length: %d "
-                                  "padding: %d" % (header.length, pad_length))
-
-        data_length = header.length - pad_length
-        if pad_length == 0:
-            return HTTP2DataFrame(header, payload)
+        if header.stream_id == 0x0:
+            raise HTTP2FrameError("DATA frame with the 0x0 stream identifier")
+
+        frame = HTTP2DataFrame.__new__(HTTP2DataFrame)
+        frame.__header = header
+        if header.flags & HTTP_V2_PADDED_FLAG:
+            frame.__data = _unpad(header, payload)
+            frame.__pad = payload[1 + len(frame.__data):]
         else:
-            return HTTP2DataFrame(header, payload[:data_length],
-                                  payload[data_length:])
+            frame.__data = payload
+            frame.__pad = None
+
+        return frame
 
 class HTTP2PriorityFrame(object):
     """The HTTP/2 PRIORITY frame class
@@ -353,6 +576,8 @@ class HTTP2PriorityFrame(object):
     :param _weight: the corresponding stream weight.
     :param _excl: whether the stream dependency is exclusive.
     """
+    __slots__ = ("__header", "__depend", "__weight", "__excl")
+
     def __init__(self, _header, depend, weight, excl=False):
         HTTP2FrameHeader.check_frame_type(_header.type, HTTP_V2_PRIORITY_FRAME)
         HTTP2FrameHeader.check_frame_sid(depend)
@@ -367,11 +592,21 @@ class HTTP2PriorityFrame(object):
         self.__header = _header
         self.__depend = depend
         self.__weight = weight
-        self__excl = excl
+        self.__excl = excl
 
     def __repr__(self):
         return "<HTTP/2 PRIORITY frame>"
 
+    @property
+    def header(self):
+        """Returns the frame header."""
+        return self.__header
+
+    @property
+    def priority(self):
+        """Returns a tuple (dependency, weight, exclusive)."""
+        return self.__depend, self.__weight, self.__excl
+
     def serialize(self):
         """Serializes the PRIORITY frame.
 
@@ -380,28 +615,44 @@ class HTTP2PriorityFrame(object):
         header = self.__header.serialize()
         depend = self.__depend
         if self.__excl:
-            depend |= 1 << 32
-        data = pack(">IB", depend, self.__weight)
-        return empty_object.join([header, data])
+            depend |= 1 << 31
+        data = _priority.pack(depend, self.__weight - 1)
+        return empty_unit.join([header, data])
+
+    def serialize_into(self, buf):
+        """Serializes the PRIORITY frame into the send buffer.
+
+        :param buf: a instance of :class: `HTTP2FrameWriter`.
+        """
+        buf.write(self.serialize())
 
     @staticmethod
     def parse_frame(header, payload):
         """Parses the PRIORITY frame.
-        Caller should assure that the payload size is equal to header.length.
+        Caller should assure that the payload size is equal to header.length
+        and that the header is of the frame type.
 
         :param header: a instance of :class: `HTTP2FrameHeader`.
         :param payload: data stream.
         :rtype: a instance of :class: `HTTP2PriorityFrame`.
         """
-        if header.type != HTTP_V2_PRIORITY_FRAME:
-            raise HTTP2FrameError("invalid frame type: %s" %
-                HTTP2FrameHeader.get_frame_type_name(header.type))
-        elif header.length != len(payload):
-            raise HTTP2FrameError("invalid payload length: %d" % len(payload))
+        if header.length != HTTP_V2_PRIORITY_SIZE:
+            raise HTTP2FrameError("invalid frame length: %d" % header.length)
 
-        depend, weight = unpack(">IB", payload)
-        excl = True if depend & (1 << 32) else False
-        return HTTP2PriorityFrame(header, depend, weight, excl)
+        elif header.stream_id == 0x0:
+            raise HTTP2FrameError("PRIORITY frame cannot specify "
+                                  "the whole connection")
+
+        depend, weight = _priority.unpack_from(payload)
+        frame = HTTP2PriorityFrame.__new__(HTTP2PriorityFrame)
+        frame.__header = header
+        frame.__depend = depend & HTTP_V2_STREAM_ID_MASK
+        frame.__weight = weight + 1
+        frame.__excl = True if depend & (1 << 31) else False
+        if frame.__depend == header.stream_id:
+            raise HTTP2FrameError("dependency stream cannot be itself")
+
+        return frame
 
 
 class HTTP2RSTStreamFrame(object):
@@ -414,8 +665,11 @@ class HTTP2RSTStreamFrame(object):
     :param _header: a instance of :class: `HTTP2FrameHeader`.
     :param _code: the specific error code.
     """
+    __slots__ = ("__header", "__code")
+
     def __init__(self, _header, _code):
-        HTTP2FrameHeader.check_frame_type(_header.type, need=HTTP_V2_PRIORITY_FRAME)
+        HTTP2FrameHeader.check_frame_type(_header.type,
+                                          need=HTTP_V2_RST_STREAM_FRAME)
         if _header.stream_id == 0x0:
             raise HTTP2FrameError("RST_STREAM frame with "
                                   "the 0x0 stream identifier")
@@ -423,39 +677,63 @@ class HTTP2RSTStreamFrame(object):
         if _code < HTTP_V2_NO_ERROR or _code > HTTP_V2_HTTP_1_1_REQUIRED:
             raise HTTP2FrameError("invalid error code 0x%x" % _code)
 
-        self__header = _header
+        self.__header = _header
         self.__code = _code
 
     def __repr__(self):
         return "<HTTP/2 RST_STREAM frame>"
 
+    @property
+    def header(self):
+        """Returns the frame header."""
+        return self.__header
+
+    @property
+    def code(self):
+        """Returns the error code."""
+        return self.__code
+
     def serialize(self):
-        """Serializes the PRIORITY frame.
+        """Serializes the RST_STREAM frame.
 
         :rtype: the data stream.
         """
         header = self.__header.serialize()
-        code = pack(">I", self.__code)
-        return empty_object.join([header, code])
+        code = _uint32.pack(self.__code)
+        return empty_unit.join([header, code])
+
+    def serialize_into(self, buf):
+        """Serializes the RST_STREAM frame into the send buffer.
+
+        :param buf: a instance of :class: `HTTP2FrameWriter`.
+        """
+        buf.write(self.serialize())
 
     @staticmethod
     def parse_frame(header, payload):
         """Parses the RST_STREAM frame.
-        Caller should assure that the payload size is equal to header.length.
+        Caller should assure that the payload size is equal to header.length
+        and that the header is of the frame type.
 
         :param header: a instance of :class: `HTTP2FrameHeader`.
         :param payload: data stream.
         :rtype: a instance of :class: `HTTP2RSTStreamFrame`.
         """
-        HTTP2FrameHeader.check_frame_type(header.type,
-                                          need=HTTP_V2_RST_STREAM_FRAME)
         if header.length != HTTP_V2_RST_STREAM_SIZE:
             raise HTTP2FrameError("invalid frame length: %d" % header.length)
-        elif header.length != len(payload):
-            raise HTTP2FrameError("invalid payload length: %d" % len(payload))
 
-        code = unpack(">I", payload)
-        return HTTP2RSTStreamFrame(header, code)
+        elif header.stream_id == 0x0:
+            raise HTTP2FrameError("RST_STREAM frame with "
+                                  "the 0x0 stream identifier")
+
+        code = _uint32.unpack_from(payload)[0]
+        if code > HTTP_V2_HTTP_1_1_REQUIRED:
+            raise HTTP2FrameError("invalid error code 0x%x" % code)
+
+        frame = HTTP2RSTStreamFrame.__new__(HTTP2RSTStreamFrame)
+        frame.__header = header
+        frame.__code = code
+        return frame
 
 
 class HTTP2SettingsFrame(object):
@@ -470,6 +748,8 @@ class HTTP2SettingsFrame(object):
     :param _header: a instance of :class: `HTTP2FrameHeader`.
     :param _settings: a list of setting items, each item is a tuple.
     """
+    __slots__ = ("__header", "__settings")
+
     def __init__(self, _header, _settings=[]):
         HTTP2FrameHeader.check_frame_type(_header.type,
                                           need=HTTP_V2_SETTINGS_FRAME)
@@ -484,19 +764,29 @@ class HTTP2SettingsFrame(object):
             raise HTTP2FrameError("SETTINGS frame with "
                                   "incorrect length: %d" % _header.length)
 
+        # unknown setting params are kept, the receiver must ignore them.
         for key, value in _settings:
-            if key < SETTINGS_MAX_HEADER_LIST_SIZE or
-               key > HTTP_V2_SETTINGS_MAX_HEADER_LIST_SIZE:
-                raise HTTP2FrameError("unknown setting param id: 0x%x" % key)
+            if key < 0 or key > 0xffff:
+                raise HTTP2FrameError("invalid setting param id: 0x%x" % key)
             elif value < 0 or value > (1 << 32) - 1:
                 raise HTTP2FrameError("invalid setting param value: 0x%x" % key)
 
-        self__header = _header
+        self.__header = _header
         self.__settings = _settings
 
     def __repr__(self):
         return "<HTTP/2 SETTINGS frame>"
 
+    @property
+    def header(self):
+        """Returns the frame header."""
+        return self.__header
+
+    @property
+    def settings(self):
+        """Returns the list of the setting items, tuples (id, value)."""
+        return self.__settings
+
     def serialize(self):
         """Serializes the SETTINGS frame.
 
@@ -504,32 +794,43 @@ class HTTP2SettingsFrame(object):
         """
         items = [self.__header.serialize()]
         for key, value in self.__settings:
-            items.append(pack(">HI", key, value))
-        return empty_object.join(items)
+            items.append(_setting.pack(key, value))
+        return empty_unit.join(items)
+
+    def serialize_into(self, buf):
+        """Serializes the SETTINGS frame into the send buffer.
+
+        :param buf: a instance of :class: `HTTP2FrameWriter`.
+        """
+        buf.write(self.serialize())
 
     @staticmethod
     def parse_frame(header, payload):
         """Parses the SETTINGS frame.
-        Caller should assure that the payload size is equal to header.length.
+        Caller should assure that the payload size is equal to header.length
+        and that the header is of the frame type.
 
         :param header: a instance of :class: `HTTP2FrameHeader`.
         :param payload: data stream.
-        :rtype: a instance of :class: `HTTP2RSTStreamFrame`.
+        :rtype: a instance of :class: `HTTP2SettingsFrame`.
         """
-        HTTP2FrameHeader.check_frame_type(header.type,
-                                          need=HTTP_V2_RST_STREAM_FRAME)
-        if header.length % HTTP_V2_SETTINGS_FRAME != 0:
+        if header.length % HTTP_V2_SETTINGS_PARAM_SIZE != 0:
             raise HTTP2FrameError("invalid frame length: %d" % header.length)
-        elif header.length != len(payload):
-            raise HTTP2FrameError("invalid payload length: %d" % len(payload))
-
-        settings = []
-        for i in range(0, header.length, HTTP_V2_SETTINGS_FRAME):
-            piece = payload[i:i+HTTP_V2_SETTINGS_PARAM_SIZE])
-            param_id, param_value = unpack(">BI", piece)
-            settings.append((param_id, param_value))
+        elif header.stream_id != 0x0:
+            raise HTTP2FrameError("SETTINGS frame with the inproper "
+                                  "stream identifier: %d" % header.stream_id)
+        elif header.flags & HTTP_V2_ACK_FLAG and header.length > 0:
+            raise HTTP2FrameError("SETTINGS frame with ACK flag "
+                                  "and non-zero length")
 
-        return HTTP2SettingsFrame(header, settings)
+        # the ids and the values unpacked are in range by construction.
+        unpack_setting = _setting.unpack_from
+        frame = HTTP2SettingsFrame.__new__(HTTP2SettingsFrame)
+        frame.__header = header
+        frame.__settings = [unpack_setting(payload, i) for i in
+                            range(0, header.length,
+                                  HTTP_V2_SETTINGS_PARAM_SIZE)]
+        return frame
 
 
 class HTTP2PushPromiseFrame(object):
@@ -545,8 +846,95 @@ class HTTP2PushPromiseFrame(object):
     |                       Padding (*)                           ...
     +---------------------------------------------------------------+
 
+    :param _header: a instance of :class: `HTTP2FrameHeader`.
+    :param _promised_sid: the identifier of the stream reserved.
+    :param _fragment: the header block fragment.
     """
-    pass
+    __slots__ = ("__header", "__promised_sid", "__fragment")
+
+    def __init__(self, _header, _promised_sid, _fragment):
+        HTTP2FrameHeader.check_frame_type(_header.type,
+                                          need=HTTP_V2_PUSH_PROMISE_FRAME)
+        HTTP2FrameHeader.check_frame_sid(_promised_sid)
+        if _header.stream_id == 0x0:
+            raise HTTP2FrameError("PUSH_PROMISE frame with "
+                                  "the 0x0 stream identifier")
+
+        self.__header = _header
+        self.__promised_sid = _promised_sid
+        self.__fragment = _fragment
+
+    def __repr__(self):
+        return "<HTTP/2 PUSH_PROMISE frame>"
+
+    @property
+    def header(self):
+        """Returns the frame header."""
+        return self.__header
+
+    @property
+    def promised_stream_id(self):
+        """Returns the identifier of the stream reserved."""
+        return self.__promised_sid
+
+    @property
+    def fragment(self):
+        """Returns the header block fragment."""
+        return self.__fragment
+
+    def serialize(self):
+        """Serializes the PUSH_PROMISE frame.
+
+        :rtype: the data stream.
+        """
+        buf = HTTP2FrameWriter()
+        self.serialize_into(buf)
+        return buf.getvalue()
+
+    def serialize_into(self, buf):
+        """Serializes the PUSH_PROMISE frame into the send buffer. The padding
+        is not kept, a PADDED frame is padded with zeros to its length.
+
+        :param buf: a instance of :class: `HTTP2FrameWriter`.
+        """
+        header = self.__header.serialize()
+        promised_sid = _uint32.pack(self.__promised_sid)
+        if not self.__header.has_flag(HTTP_V2_PADDED_FLAG):
+            buf.write(header + promised_sid)
+            buf.write(self.__fragment)
+            return
+
+        pad_length = (self.__header.length - 1 - HTTP_V2_STREAM_ID_SIZE
+                      - len(self.__fragment))
+        buf.write(header + _uint8.pack(pad_length) + promised_sid)
+        buf.write(self.__fragment)
+        buf.write(b"\x00" * pad_length)
+
+    @staticmethod
+    def parse_frame(header, payload):
+        """Parses the PUSH_PROMISE frame.
+        Caller should assure that the payload size is equal to header.length
+        and that the header is of the frame type.
+
+        :param header: a instance of :class: `HTTP2FrameHeader`.
+        :param payload: data stream.
+        :rtype: a instance of :class: `HTTP2PushPromiseFrame`.
+        """
+        if header.stream_id == 0x0:
+            raise HTTP2FrameError("PUSH_PROMISE frame with "
+                                  "the 0x0 stream identifier")
+
+        payload = _unpad(header, payload)
+        if len(payload) < HTTP_V2_STREAM_ID_SIZE:
+            raise HTTP2FrameError("PUSH_PROMISE frame with incorrect "
+                                  "length: %d" % header.length)
+
+        frame = HTTP2PushPromiseFrame.__new__(HTTP2PushPromiseFrame)
+        frame.__header = header
+        frame.__promised_sid = (_uint32.unpack_from(payload)[0]
+                                & HTTP_V2_STREAM_ID_MASK)
+        frame.__fragment = payload[HTTP_V2_STREAM_ID_SIZE:]
+        return frame
 
 
 class HTTP2PingFrame(object):
@@ -561,6 +949,8 @@ class HTTP2PingFrame(object):
     :param _header: a instance of :class: `HTTP2FrameHeader`.
     :param _opaque: an 8 octets of opaque data in the payload.
     """
+    __slots__ = ("__header", "__opaque")
+
     def __init__(self, _header, _opaque=0):
         HTTP2FrameHeader.check_frame_type(_header.type, need=HTTP_V2_PING_FRAME)
         if _header.stream_id != 0x0:
@@ -573,32 +963,52 @@ class HTTP2PingFrame(object):
     def __repr__(self):
         return "<HTTP/2 PING frame>"
 
+    @property
+    def header(self):
+        """Returns the frame header."""
+        return self.__header
+
+    @property
+    def opaque(self):
+        """Returns the opaque data, as an integer."""
+        return self.__opaque
+
     def serialize(self):
         """Serializes the PING frame.
 
         :rtype: the data frame.
         """
         header = self.__header.serialize()
-        opaque = pack(">Q", self.__opaque)
-        return empty_object.join([header, opaque])
+        opaque = _uint64.pack(self.__opaque)
+        return empty_unit.join([header, opaque])
+
+    def serialize_into(self, buf):
+        """Serializes the PING frame into the send buffer.
+
+        :param buf: a instance of :class: `HTTP2FrameWriter`.
+        """
+        buf.write(self.serialize())
 
     @staticmethod
     def parse_frame(header, payload):
         """Parses the PING frame.
-        Caller should assure that the payload size is equal to header.length.
+        Caller should assure that the payload size is equal to header.length
+        and that the header is of the frame type.
 
         :param header: a instance of :class: `HTTP2FrameHeader`.
         :param payload: data stream.
         :rtype: a instance of :class: `HTTP2PingFrame`.
         """
-        HTTP2FrameHeader.check_frame_type(header.type, need=HTTP_V2_PING_FRAME)
         if header.length != HTTP_V2_PING_SIZE:
             raise HTTP2FrameError("invalid frame length: %d" % header.length)
-        elif header.length != len(payload):
-            raise HTTP2FrameError("invalid payload length: %d" % len(payload))
+        elif header.stream_id != 0x0:
+            raise HTTP2FrameError("PING frame with the inproper "
+                                  "stream identifier: %d" % header.stream_id)
 
-        opaque = unpack(">Q", payload)
-        return HTTP2PingFrame(header, opaque)
+        frame = HTTP2PingFrame.__new__(HTTP2PingFrame)
+        frame.__header = header
+        frame.__opaque = _uint64.unpack_from(payload)[0]
+        return frame
 
 
 class HTTP2GoAwayFrame(object):
@@ -617,12 +1027,14 @@ class HTTP2GoAwayFrame(object):
     :param _code: the error code.
     :param _debug: additional debug data.
     """
-    def __init__(self, _header, _last_stream_id, _code, _debug=empty_object):
+    __slots__ = ("__header", "__last_sid", "__code", "__debug")
+
+    def __init__(self, _header, _last_stream_id, _code, _debug=empty_unit):
         HTTP2FrameHeader.check_frame_type(_header.type,
                                           need=HTTP_V2_GOAWAY_FRAME)
         HTTP2FrameHeader.check_frame_sid(_last_stream_id)
         if _header.stream_id != 0x0:
-            raise HTTP2FrameError("SETTINGS frame with the inproper "
+            raise HTTP2FrameError("GOAWAY frame with the inproper "
                                   "stream identifier: %d" % _header.stream_id)
 
         length = 4 + 4 + len(_debug)
@@ -638,31 +1050,68 @@ class HTTP2GoAwayFrame(object):
     def __repr__(self):
         return "<HTTP/2 GOAWAY frame>"
 
+    @property
+    def header(self):
+        """Returns the frame header."""
+        return self.__header
+
+    @property
+    def last_stream_id(self):
+        """Returns the identifier of the last peer-initialized stream."""
+        return self.__last_sid
+
+    @property
+    def code(self):
+        """Returns the error code."""
+        return self.__code
+
+    @property
+    def debug(self):
+        """Returns the additional debug data."""
+        return self.__debug
+
     def serialize(self):
         """Serializes the GOAWAY frame.
 
         :rtype: the data frame.
         """
         header = self.__header.serialize()
-        data = pack(">II", self.__last_sid, self.__code)
-        return empty_object.join([header, data, self.__debug])
+        data = _goaway.pack(self.__last_sid, self.__code)
+        return empty_unit.join([header, data, self.__debug])
+
+    def serialize_into(self, buf):
+        """Serializes the GOAWAY frame into the send buffer.
+
+        :param buf: a instance of :class: `HTTP2FrameWriter`.
+        """
+        header = self.__header.serialize()
+        buf.write(header + _goaway.pack(self.__last_sid, self.__code))
+        buf.write(self.__debug)
 
     @staticmethod
     def parse_frame(header, payload):
         """Parses the GOAWAY frame.
-        Caller should assure that the payload size is equal to header.length.
+        Caller should assure that the payload size is equal to header.length
+        and that the header is of the frame type.
 
         :param header: a instance of :class: `HTTP2FrameHeader`.
         :param payload: data stream.
         :rtype: a instance of :class: `HTTP2GoAwayFrame`.
         """
-        HTTP2FrameHeader.check_frame_type(header.type,
-                                          need=HTTP_V2_GOAWAY_FRAME)
-        if header.length != len(payload):
-            raise HTTP2FrameError("invalid payload length: %d" % len(payload))
+        if header.length < HTTP_V2_GOAWAY_SIZE:
+            raise HTTP2FrameError("invalid frame length: %d" % header.length)
+
+        elif header.stream_id != 0x0:
+            raise HTTP2FrameError("GOAWAY frame with the inproper "
+                                  "stream identifier: %d" % header.stream_id)
 
-        last_sid, err_code, debug = unpack(">II", payload[:8]), payload[8:]
-        return HTTP2GoAwayFrame(header, last_sid, err_code, debug)
+        last_sid, code = _goaway.unpack_from(payload)
+        frame = HTTP2GoAwayFrame.__new__(HTTP2GoAwayFrame)
+        frame.__header = header
+        frame.__last_sid = last_sid & HTTP_V2_STREAM_ID_MASK
+        frame.__code = code
+        frame.__debug = payload[HTTP_V2_GOAWAY_SIZE:]
+        return frame
 
 
 class HTTP2WindowUpdateFrame(object):
@@ -675,42 +1124,500 @@ class HTTP2WindowUpdateFrame(object):
     :param _header: a instance of :class: `HTTP2FrameHeader`.
     :param _incr: the window size increment.
     """
+    __slots__ = ("__header", "__incr")
+
     def __init__(self, _header, _incr):
         HTTP2FrameHeader.check_frame_type(_header.type,
                                           need=HTTP_V2_WINDOW_UPDATE_FRAME)
-        if _inrc == 0x0:
+        _incr &= HTTP_V2_MAX_WINDOW
+        if _incr == 0x0:
             raise HTTP2FrameError("WINDOW_UPDATE frame with 0 increment")
 
         self.__header = _header
-        self.__incr = _incr & 0x7fffffff
+        self.__incr = _incr
 
     def __repr__(self):
         return "<HTTP/2 WINDOW_UPDATE frame>"
 
+    @property
+    def header(self):
+        """Returns the frame header."""
+        return self.__header
+
+    @property
+    def increment(self):
+        """Returns the window size increment."""
+        return self.__incr
+
     def serialize(self):
         """Serializes the WINDOW_UPDATE frame.
 
         :rtype: the data frame.
         """
         header = self.__header.serialize()
-        data = pack(">I", self.__incr)
-        return empty_object.join([header, data])
+        data = _uint32.pack(self.__incr)
+        return empty_unit.join([header, data])
+
+    def serialize_into(self, buf):
+        """Serializes the WINDOW_UPDATE frame into the send buffer.
+
+        :param buf: a instance of :class: `HTTP2FrameWriter`.
+        """
+        buf.write(self.serialize())
 
     @staticmethod
     def parse_frame(header, payload):
         """Parses the WINDOW_UPDATE frame.
-        Caller should assure that the payload size is equal to header.length.
+        Caller should assure that the payload size is equal to header.length
+        and that the header is of the frame type.
 
         :param header: a instance of :class: `HTTP2FrameHeader`.
         :param payload: data stream.
         :rtype: a instance of :class: `HTTP2WindowUpdateFrame`.
         """
-        HTTP2FrameHeader.check_frame_type(header.type,
-                                          need=HTTP_V2_GOAWAY_FRAME)
-        if header.length != len(payload):
-            raise HTTP2FrameError("invalid payload length: %d" % len(payload))
-        elif header.length != 4:
-            raise  HTTP2FrameError("invalid header length: %d" % header.length)
+        if header.length != HTTP_V2_WINDOW_UPDATE_SIZE:
+            raise HTTP2FrameError("invalid header length: %d" % header.length)
+
+        incr = _uint32.unpack_from(payload)[0] & HTTP_V2_MAX_WINDOW
+        if incr == 0x0:
+            raise HTTP2FrameError("WINDOW_UPDATE frame with 0 increment")
+
+        frame = HTTP2WindowUpdateFrame.__new__(HTTP2WindowUpdateFrame)
+        frame.__header = header
+        frame.__incr = incr
+        return frame
+
+
+class HTTP2ContinuationFrame(object):
+    """The HTTP/2 CONTINUATION frame class
+
+    +---------------------------------------------------------------+
+    |                   Header Block Fragment (*)                 ...
+    +---------------------------------------------------------------+
+
+    :param _header: a instance of :class: `HTTP2FrameHeader`.
+    :param _fragment: the header block fragment.
+    """
+    __slots__ = ("__header", "__fragment")
+
+    def __init__(self, _header, _fragment):
+        HTTP2FrameHeader.check_frame_type(_header.type,
+                                          need=HTTP_V2_CONTINUATION_FRAME)
+        if _header.stream_id == 0x0:
+            raise HTTP2FrameError("CONTINUATION frame with "
+                                  "the 0x0 stream identifier")
+
+        self.__header = _header
+        self.__fragment = _fragment
+
+    def __repr__(self):
+        return "<HTTP/2 CONTINUATION frame>"
+
+    @property
+    def header(self):
+        """Returns the frame header."""
+        return self.__header
+
+    @property
+    def fragment(self):
+        """Returns the header block fragment."""
+        return self.__fragment
+
+    def serialize(self):
+        """Serializes the CONTINUATION frame.
+
+        :rtype: the data stream.
+        """
+        return empty_unit.join([self.__header.serialize(), self.__fragment])
+
+    def serialize_into(self, buf):
+        """Serializes the CONTINUATION frame into the send buffer.
+
+        :param buf: a instance of :class: `HTTP2FrameWriter`.
+        """
+        buf.write(self.__header.serialize())
+        buf.write(self.__fragment)
+
+    @staticmethod
+    def parse_frame(header, payload):
+        """Parses the CONTINUATION frame.
+        Caller should assure that the payload size is equal to header.length
+        and that the header is of the frame type.
+
+        :param header: a instance of :class: `HTTP2FrameHeader`.
+        :param payload: data stream.
+        :rtype: a instance of :class: `HTTP2ContinuationFrame`.
+        """
+        if header.stream_id == 0x0:
+            raise HTTP2FrameError("CONTINUATION frame with "
+                                  "the 0x0 stream identifier")
+
+        frame = HTTP2ContinuationFrame.__new__(HTTP2ContinuationFrame)
+        frame.__header = header
+        frame.__fragment = payload
+        return frame
+
+
+# frame type -> the parser of the frame, indexed by any 8 bits type, None
+# for the unknown ones. The parsers trust the type of the frame header, as
+# they are picked by it, and build the frames without the constructors, so
+# the fields are validated once only, when they come off the wire.
+HTTP_V2_FRAME_PARSERS = [
+    HTTP2DataFrame.parse_frame,             # DATA
+    HTTP2HeadersFrame.parse_frame,          # HEADERS
+    HTTP2PriorityFrame.parse_frame,         # PRIORITY
+    HTTP2RSTStreamFrame.parse_frame,        # RST_STREAM
+    HTTP2SettingsFrame.parse_frame,         # SETTINGS
+    HTTP2PushPromiseFrame.parse_frame,      # PUSH_PROMISE
+    HTTP2PingFrame.parse_frame,             # PING
+    HTTP2GoAwayFrame.parse_frame,           # GOAWAY
+    HTTP2WindowUpdateFrame.parse_frame,     # WINDOW_UPDATE
+    HTTP2ContinuationFrame.parse_frame,     # CONTINUATION
+]
+HTTP_V2_FRAME_PARSERS += [None] * (256 - len(HTTP_V2_FRAME_PARSERS))
+
+
+class HTTP2FrameReader(object):
+    """Parses the byte stream of a connection into frames.
+
+    The data is received (recv_into) or copied (feed) into a receive buffer
+    of a fixed capacity, the frames are parsed in place, their payloads,
+    e.g. the data of a DATA frame, are memoryview slices of the buffer.
+
+    The buffer is never written over the frames parsed, so the slices stay
+    valid: once the free space at the end of the buffer is too small for
+    the next read or frame, a new buffer is allocated and the unparsed data
+    only is moved into it. The frames of unknown types are skipped.
+
+    +----------------+-------------------+------------------------+
+    | parsed frames  |  unparsed data    |       free space       |
+    +----------------+-------------------+------------------------+
+                     ^                   ^
+                   start                end
+
+    :param max_frame_size: the SETTINGS_MAX_FRAME_SIZE we advertised.
+    :param buffer_size: the capacity of the receive buffer.
+    :param recv_size: the free space a recv_into call needs at least.
+    """
+    def __init__(self, max_frame_size=HTTP_V2_DEFAULT_FRAME_SIZE,
+                 buffer_size=1 << 16, recv_size=1 << 12):
+        self.max_frame_size = max_frame_size
+        self.buffer_size = max(buffer_size, recv_size)
+        self.recv_size = recv_size
+        self.__buf = bytearray(self.buffer_size)
+        self.__view = memoryview(self.__buf)
+        self.__start = 0
+        self.__end = 0
+
+    def __repr__(self):
+        return "<HTTP/2 Frame reader, %d bytes pending>" % len(self)
+
+    def __len__(self):
+        return self.__end - self.__start
+
+    def __iter__(self):
+        return self.frames()
+
+    def __reserve(self, size):
+        """Makes room for size bytes after the unparsed data."""
+        if len(self.__buf) - self.__end >= size:
+            return
+
+        pending = self.__end - self.__start
+        buf = bytearray(max(self.buffer_size, pending + size))
+        buf[:pending] = self.__view[self.__start:self.__end]
+        self.__buf = buf
+        self.__view = memoryview(buf)
+        self.__start = 0
+        self.__end = pending
+
+    def feed(self, data):
+        """Appends the data received to the receive buffer.
+
+        :param data: bytes, bytearray or memoryview.
+        """
+        size = len(data)
+        self.__reserve(size)
+        self.__view[self.__end:self.__end + size] = data
+        self.__end += size
+
+    def recv_into(self, sock):
+        """Receives data from the socket into the receive buffer directly.
+
+        :param sock: a socket object (or whatever has recv_into).
+        :rtype: the count of bytes received, 0 if the peer closed.
+        """
+        self.__reserve(self.recv_size)
+        size = sock.recv_into(self.__view[self.__end:])
+        self.__end += size
+        return size
+
+    def frames(self):
+        """Yields the frames complete in the receive buffer.
+
+        :rtype: a generator of frames, e.g. :class:`HTTP2DataFrame`.
+        """
+        unpack_header = _frame_header.unpack_from
+        from_wire = HTTP2FrameHeader.from_wire
+        parsers = HTTP_V2_FRAME_PARSERS
+        while self.__end - self.__start >= HTTP_V2_FRAME_HEADER_SIZE:
+            start = self.__start
+            length_type, flags, sid = unpack_header(self.__buf, start)
+            length = length_type >> 8
+            if length > self.max_frame_size:
+                raise HTTP2FrameError("frame length %d exceeds the maximum "
+                                      "%d" % (length, self.max_frame_size))
+
+            end = start + HTTP_V2_FRAME_HEADER_SIZE + length
+            if end > self.__end:
+                # make room for the whole frame in advance.
+                self.__reserve(end - self.__end)
+                return
+
+            self.__start = end
+            parse = parsers[length_type & 0xff]
+            if parse is not None:
+                yield parse(from_wire(length_type, flags, sid),
+                            self.__view[start + HTTP_V2_FRAME_HEADER_SIZE:end])
+
+
+class HTTP2FrameWriter(object):
+    """Gathers the frames to send of a connection and flushes them in a
+    single sendmsg (writev) call.
+
+    The frame headers and the small payloads are copied into a bytearray,
+    the large payloads, e.g. the data of a DATA frame, are only referenced,
+    the buffers are handed to the kernel as they are, without being joined.
+    They must not change until they are flushed.
+
+    +-------------------+   +------------------+   +-------------------+
+    | headers, control  |   |   DATA payload   |   | headers, control  |
+    | frames (copied)   |   |   (referenced)   |   | frames (copied)   |
+    +-------------------+   +------------------+   +-------------------+
+
+    :param copy_size: the payloads smaller than it are copied.
+    """
+    def __init__(self, copy_size=1 << 10):
+        self.copy_size = copy_size
+        self.__chunks = []
+        self.__tail = None
+        self.__size = 0
+
+    def __repr__(self):
+        return "<HTTP/2 Frame writer, %d bytes pending>" % self.__size
+
+    def __len__(self):
+        return self.__size
+
+    def write(self, data):
+        """Appends the data to send, copied or referenced after its size.
+
+        :param data: bytes, bytearray or memoryview.
+        """
+        size = len(data)
+        if size >= self.copy_size:
+            self.__chunks.append(data)
+            self.__tail = None
+        elif size:
+            if self.__tail is None:
+                self.__tail = bytearray()
+                self.__chunks.append(self.__tail)
+            self.__tail += data
+
+        self.__size += size
+
+    def getvalue(self):
+        """Returns the data pending, joined.
+
+        :rtype: the data stream.
+        """
+        return empty_unit.join(unit_type(chunk) for chunk in self.__chunks)
+
+    def clear(self):
+        """Drops the data pending."""
+        self.__chunks = []
+        self.__tail = None
+        self.__size = 0
+
+    def __consume(self, size):
+        """Drops the size bytes sent off the data pending."""
+        chunks = self.__chunks
+        i = 0
+        while i < len(chunks) and size >= len(chunks[i]):
+            size -= len(chunks[i])
+            self.__size -= len(chunks[i])
+            i += 1
+
+        del chunks[:i]
+        if size:
+            chunks[0] = memoryview(chunks[0])[size:]
+            self.__size -= size
+
+        # the bytearray cannot grow while a slice of it is alive.
+        if not chunks or chunks[-1] is not self.__tail:
+            self.__tail = None
+
+    def flush(self, sock):
+        """Sends the data pending, with sendmsg if the socket has it, else
+        (e.g. a SSL socket) chunk by chunk with send, so that nothing is
+        joined.
+        A non-blocking socket raises as its send would, the data it did not
+        take stays pending.
+
+        :param sock: a socket object.
+        :rtype: the count of bytes sent.
+        """
+        sent = 0
+        vectored = True
+        while self.__chunks:
+            if vectored:
+                try:
+                    size = sock.sendmsg(self.__chunks[:HTTP_V2_IOV_MAX])
+                except (AttributeError, NotImplementedError):
+                    vectored = False
+                    continue
+            else:
+                size = sock.send(self.__chunks[0])
+
+            self.__consume(size)
+            sent += size
+
+        return sent
+
+
+class HTTP2ControlFrameCache(object):
+    """Pre-serialized control frames, keyed by their parameters.
+
+    The SETTINGS ACK, the connection preface with the initial SETTINGS, the
+    PINGs we send and the connection WINDOW_UPDATE frames of the usual
+    increments are the same bytes over and over, for all the connections.
+    They are built, and validated, once through the frame classes, then
+    sending one is copying its bytes into the send buffer, e.g.
+
+        writer.write(http2_control_frames.window_update(1 << 16))
+
+    The PING ACKs, which echo the opaque data of the peer, and the stream
+    WINDOW_UPDATE frames, whose stream identifiers keep growing, would not
+    repeat, so they are built on every call and never cached.
+
+    The frames live in a :class:`HTTP2HuffmanCache` whose budget counts
+    entries, not bytes (each frame is charged 1), so the least recently
+    used frames are dropped once max_entries frames are cached.
+
+    :param max_entries: the most frames cached.
+    """
+    def __init__(self, max_entries=1 << 8):
+        self.max_entries = max_entries
+        self.__frames = HTTP2HuffmanCache(max_entries)
+
+    def __repr__(self):
+        return "<HTTP/2 Control frame cache %d/%d frames>" % (
+            len(self), self.max_entries)
+
+    def __len__(self):
+        return len(self.__frames)
+
+    @property
+    def hits(self):
+        """Returns the number of lookups which found the frame."""
+        return self.__frames.hits
+
+    @property
+    def misses(self):
+        """Returns the number of lookups which missed."""
+        return self.__frames.misses
+
+    def __put(self, key, frame):
+        """Caches the frame serialized and returns it."""
+        self.__frames.put(key, frame, 1)
+        return frame
+
+    def clear(self):
+        """Drops the frames cached and resets the counters."""
+        self.__frames.clear()
+
+    def settings(self, settings=(), ack=False):
+        """Returns the SETTINGS frame serialized.
+
+        :param settings: a list of setting items, each item is a tuple.
+        :param ack: whether it is a SETTINGS ACK, without settings.
+        :rtype: the data stream.
+        """
+        settings = tuple(tuple(item) for item in settings)
+        key = (HTTP_V2_SETTINGS_FRAME, ack, settings)
+        frame = self.__frames.get(key)
+        if frame is not None:
+            return frame
+
+        flags = HTTP_V2_ACK_FLAG if ack else HTTP_V2_NO_FLAG
+        header = HTTP2FrameHeader(HTTP_V2_SETTINGS_FRAME,
+                                  len(settings) * HTTP_V2_SETTINGS_PARAM_SIZE,
+                                  0, flags)
+        frame = HTTP2SettingsFrame(header, list(settings)).serialize()
+        return self.__put(key, frame)
+
+    def settings_ack(self):
+        """Returns the SETTINGS ACK frame serialized.
+
+        :rtype: the data stream.
+        """
+        return self.settings(ack=True)
+
+    def preface(self, settings=()):
+        """Returns the client connection preface, i.e. the magic octets and
+        the initial SETTINGS frame, serialized.
+
+        :param settings: a list of setting items, each item is a tuple.
+        :rtype: the data stream.
+        """
+        settings = tuple(tuple(item) for item in settings)
+        key = (HTTP_V2_CONNECTION_PREFACE, settings)
+        frame = self.__frames.get(key)
+        if frame is not None:
+            return frame
+
+        header = HTTP2FrameHeader(HTTP_V2_SETTINGS_FRAME,
+                                  len(settings) * HTTP_V2_SETTINGS_PARAM_SIZE,
+                                  0)
+        frame = HTTP_V2_CONNECTION_PREFACE + \
+            HTTP2SettingsFrame(header, list(settings)).serialize()
+        return self.__put(key, frame)
+
+    def ping(self, opaque=0, ack=False):
+        """Returns the PING frame serialized, the PING ACKs are not cached.
+
+        :param opaque: the opaque data, as an integer.
+        :param ack: whether it is a PING ACK, which echoes the opaque data.
+        :rtype: the data stream.
+        """
+        key = (HTTP_V2_PING_FRAME, opaque)
+        frame = None if ack else self.__frames.get(key)
+        if frame is not None:
+            return frame
+
+        flags = HTTP_V2_ACK_FLAG if ack else HTTP_V2_NO_FLAG
+        header = HTTP2FrameHeader(HTTP_V2_PING_FRAME, HTTP_V2_PING_SIZE, 0,
+                                  flags)
+        frame = HTTP2PingFrame(header, opaque).serialize()
+        return frame if ack else self.__put(key, frame)
+
+    def window_update(self, incr, sid=0):
+        """Returns the WINDOW_UPDATE frame serialized, the stream ones are
+        not cached.
+
+        :param incr: the window size increment.
+        :param sid: the stream identifier, 0 for the connection.
+        :rtype: the data stream.
+        """
+        key = (HTTP_V2_WINDOW_UPDATE_FRAME, incr)
+        frame = self.__frames.get(key) if sid == 0x0 else None
+        if frame is not None:
+            return frame
+
+        header = HTTP2FrameHeader(HTTP_V2_WINDOW_UPDATE_FRAME,
+                                  HTTP_V2_WINDOW_UPDATE_SIZE, sid)
+        frame = HTTP2WindowUpdateFrame(header, incr).serialize()
+        return self.__put(key, frame) if sid == 0x0 else frame
+
 
-        incr = unpack(">I", payload)
-        return HTTP2WindowUpdateFrame(header, incr)
+http2_control_frames = HTTP2ControlFrameCache()
@@ -5,79 +5,565 @@ http/2 hpack implements
 ~~~~~~~~~~~~~~~~~~~~~~~~
 """
 
-from struct import pack, unpack
+from collections import OrderedDict
+from .compat import octet_view
 from .compat import range_iter
+from .compat import unit_type
+from .exceptions import HTTP2HpackError
 from .exceptions import HTTP2HpackEncodeError
 from .exceptions import HTTP2HpackDecodeError
-from .huffman import HTTP2Huffman
+from .exceptions import HTTP2HpackTruncatedError
+from .exceptions import HTTP2HpackHuffmanDecodeError
+from .huffman import http2_huffman
 
 
 # The Static Table Definition.
 # See https://tools.ietf.org/html/rfc7541#appendix-A for more details.
 hpack_static_table = (
-    (":authority", ""),
-    (":method", "GET"),
-    (":method", "POST"),
-    (":path", "/")
-    (":path", "/index.html"),
-    (":scheme", "http"),
-    (":scheme", "https"),
-    (":status", "200"),
-    (":status", "204"),
-    (":status", "206"),
-    (":status", "304"),
-    (":status", "400"),
-    (":status", "404"),
-    (":status", "500"),
-    ("accept-charset", ""),
-    ("accept-encoding", "gzip, deflate"),
-    ("accept-language", ""),
-    ("accept-ranges", ""),
-    ("accept", ""),
-    ("access-control-allow-origin", 
-    ("age", ""),
-    ("allow", ""),
-    ("authorization", ""),
-    ("cache-control", ""),
-    ("content-disposition", ""),
-    ("content-encoding", ""),
-    ("content-language", ""),
-    ("content-length", ""),
-    ("content-location", ""),
-    ("content-rang", ""),
-    ("content-type", ""),
-    ("cookie", ""),
-    ("date", ""),
-    ("etag", ""),
-    ("expect", ""),
-    ("expires", ""),
-    ("from", ""),
-    ("host", ""),
-    ("if-match", ""),
-    ("if-modified-since", ""),
-    ("if-none-match", ""),
-    ("if-rang", ""),
-    ("if-unmodified-since", ""),
-    ("last-modified", ""),
-    ("link", ""),
-    ("location", ""),
-    ("max-forward", ""),
-    ("proxy-authenticate", ""),
-    ("proxy-authorization", ""),
-    ("range", ""),
-    ("referer", ""),
-    ("refresh",  ""),
-    ("retry-after", ""),
-    ("server", ""),
-    ("set-cookie", ""),
-    ("strict-transport-security", ""),
-    ("transfer-encoding", ""),
-    ("user-agent", ""),
-    ("vary", ""),
-    ("via", ""),
-    ("www-authenticat", ""),
+    (b":authority", b""),
+    (b":method", b"GET"),
+    (b":method", b"POST"),
+    (b":path", b"/"),
+    (b":path", b"/index.html"),
+    (b":scheme", b"http"),
+    (b":scheme", b"https"),
+    (b":status", b"200"),
+    (b":status", b"204"),
+    (b":status", b"206"),
+    (b":status", b"304"),
+    (b":status", b"400"),
+    (b":status", b"404"),
+    (b":status", b"500"),
+    (b"accept-charset", b""),
+    (b"accept-encoding", b"gzip, deflate"),
+    (b"accept-language", b""),
+    (b"accept-ranges", b""),
+    (b"accept", b""),
+    (b"access-control-allow-origin", b""),
+    (b"age", b""),
+    (b"allow", b""),
+    (b"authorization", b""),
+    (b"cache-control", b""),
+    (b"content-disposition", b""),
+    (b"content-encoding", b""),
+    (b"content-language", b""),
+    (b"content-length", b""),
+    (b"content-location", b""),
+    (b"content-range", b""),
+    (b"content-type", b""),
+    (b"cookie", b""),
+    (b"date", b""),
+    (b"etag", b""),
+    (b"expect", b""),
+    (b"expires", b""),
+    (b"from", b""),
+    (b"host", b""),
+    (b"if-match", b""),
+    (b"if-modified-since", b""),
+    (b"if-none-match", b""),
+    (b"if-range", b""),
+    (b"if-unmodified-since", b""),
+    (b"last-modified", b""),
+    (b"link", b""),
+    (b"location", b""),
+    (b"max-forwards", b""),
+    (b"proxy-authenticate", b""),
+    (b"proxy-authorization", b""),
+    (b"range", b""),
+    (b"referer", b""),
+    (b"refresh", b""),
+    (b"retry-after", b""),
+    (b"server", b""),
+    (b"set-cookie", b""),
+    (b"strict-transport-security", b""),
+    (b"transfer-encoding", b""),
+    (b"user-agent", b""),
+    (b"vary", b""),
+    (b"via", b""),
+    (b"www-authenticate", b""),
 )
 
+HPACK_STATIC_TABLE_SIZE = len(hpack_static_table)
+
+# (name, value) -> index and name -> the first index of this name, for
+# the static table.
+hpack_static_index = dict(
+    (header, index) for index, header in
+    reversed(tuple(enumerate(hpack_static_table, 1))))
+hpack_static_name_index = dict(
+    (header[0], index) for index, header in
+    reversed(tuple(enumerate(hpack_static_table, 1))))
+
+# common header names outside the static table.
+hpack_extra_header_names = (
+    b"access-control-allow-credentials", b"access-control-allow-headers",
+    b"access-control-allow-methods", b"access-control-expose-headers",
+    b"access-control-max-age", b"access-control-request-headers",
+    b"access-control-request-method", b"alt-svc", b"connection",
+    b"content-security-policy", b"dnt", b"early-data", b"keep-alive",
+    b"origin", b"pragma", b"priority", b"proxy-connection",
+    b"sec-fetch-dest", b"sec-fetch-mode", b"sec-fetch-site",
+    b"sec-fetch-user", b"te", b"timing-allow-origin", b"traceparent",
+    b"tracestate", b"upgrade", b"upgrade-insecure-requests", b"x-api-key",
+    b"x-content-type-options", b"x-correlation-id", b"x-csrf-token",
+    b"x-forwarded-for", b"x-forwarded-host", b"x-forwarded-proto",
+    b"x-frame-options", b"x-request-id", b"x-requested-with",
+    b"x-xss-protection",
+)
+
+
+def _build_header_names():
+    """Maps the known header names, as bytes and str, lowercase and
+    capitalized per word (e.g. "Content-Type"), to the interned lowercase
+    bytes name.
+    """
+    names = {}
+    for name in tuple(hpack_static_name_index) + hpack_extra_header_names:
+        text = name.decode("ascii")
+        for variant in (text, "-".join(word.capitalize()
+                                       for word in text.split("-"))):
+            names[variant] = name
+            names[variant.encode("ascii")] = name
+
+    return names
+
+
+hpack_header_names = _build_header_names()
+
+
+def hpack_header_name(name):
+    """Returns the lowercase bytes name. The known names take a single dict
+    lookup, and are interned, i.e. the same objects as in the static table,
+    other names are lowercased and encoded.
+
+    :param name: a header name, str or bytes, in any case.
+    :rtype: bytes.
+    """
+    interned = hpack_header_names.get(name)
+    if interned is not None:
+        return interned
+
+    name = name.lower()
+    if not isinstance(name, bytes):
+        name = name.encode("latin-1")
+
+    return hpack_header_names.get(name, name)
+
+
+# the overhead of an entry in the dynamic table.
+HPACK_ENTRY_OVERHEAD = 32
+
+# the initial (and the least) slots of the dynamic table ring buffer.
+HPACK_DYNAMIC_TABLE_SLOTS = 16
+
+# the largest dynamic table size the table tuner models.
+HPACK_TUNER_MAX_SIZE = 1 << 16
+
+
+# the representations of the headers outside the index table.
+HPACK_INCR_INDEXING = 0
+HPACK_WITHOUT_INDEXING = 1
+HPACK_NEVER_INDEXED = 2
+HPACK_INDEXED = 3
+
+
+class HTTP2HpackIndexingPolicy(object):
+    """Chooses the representation of the headers which are not inside the
+    index table, i.e. whether they go into the dynamic table.
+
+    The headers repeated on every request of a connection are worth an
+    entry, the ones whose values change every time only evict them:
+
+    * names in never_indexed are never indexed, by intermediaries either.
+    * values of the names in sensitive are never indexed if shorter than
+      min_sensitive_size, short credentials are guessable by probing the
+      compression (RFC 7541, 7.1), long tokens are indexed.
+    * names in not_indexed are not indexed, e.g. request ids.
+    * entries larger than half of the dynamic table are not indexed, they
+      would evict most of it.
+
+    :param never_indexed: header names never indexed.
+    :param sensitive: header names never indexed if the value is short.
+    :param not_indexed: header names not indexed.
+    :param min_sensitive_size: the size from which sensitive values are
+                               indexed.
+    """
+    never_indexed = frozenset([b"proxy-authorization"])
+    sensitive = frozenset([b"authorization", b"cookie"])
+    not_indexed = frozenset([
+        b"content-length", b"date", b"etag", b"if-modified-since",
+        b"if-none-match", b"if-range", b"if-unmodified-since",
+        b"last-modified", b"traceparent", b"tracestate", b"x-amzn-trace-id",
+        b"x-b3-parentspanid", b"x-b3-spanid", b"x-b3-traceid",
+        b"x-correlation-id", b"x-request-id",
+    ])
+
+    def __init__(self, never_indexed=None, sensitive=None, not_indexed=None,
+                 min_sensitive_size=20):
+        if never_indexed is not None:
+            self.never_indexed = frozenset(never_indexed)
+        if sensitive is not None:
+            self.sensitive = frozenset(sensitive)
+        if not_indexed is not None:
+            self.not_indexed = frozenset(not_indexed)
+
+        self.min_sensitive_size = min_sensitive_size
+
+    def __repr__(self):
+        return "<HTTP/2 Hpack indexing policy>"
+
+    def __call__(self, header, max_table_size):
+        """Chooses the representation of the header.
+
+        :param header: a tuple (name, value), outside the index table.
+        :param max_table_size: the maximum size of the dynamic table.
+        :rtype: HPACK_INCR_INDEXING, HPACK_WITHOUT_INDEXING or
+                HPACK_NEVER_INDEXED.
+        """
+        name, value = header
+        if name in self.never_indexed:
+            return HPACK_NEVER_INDEXED
+        elif name in self.sensitive and len(value) < self.min_sensitive_size:
+            return HPACK_NEVER_INDEXED
+        elif name in self.not_indexed:
+            return HPACK_WITHOUT_INDEXING
+        elif (len(name) + len(value) + HPACK_ENTRY_OVERHEAD) << 1 \
+                > max_table_size:
+            return HPACK_WITHOUT_INDEXING
+
+        return HPACK_INCR_INDEXING
+
+
+hpack_indexing_policy = HTTP2HpackIndexingPolicy()
+
+
+class HTTP2HpackStats(object):
+    """Counts the header blocks coded by a :class:`HTTP2Hpack`, i.e. of a
+    connection and direction.
+
+    plain_bytes is the size of the names and values, encoded_bytes the size
+    of the header blocks, the representations are counted per header.
+    """
+    def __init__(self):
+        self.blocks = 0
+        self.headers = 0
+        self.plain_bytes = 0
+        self.encoded_bytes = 0
+        self.indexed = 0
+        self.incr_indexing = 0
+        self.without_indexing = 0
+        self.never_indexed = 0
+
+    def __repr__(self):
+        return ("<HTTP/2 Hpack stats, %d headers, %d/%d bytes, ratio %.2f>"
+                % (self.headers, self.encoded_bytes, self.plain_bytes,
+                   self.compression_ratio))
+
+    @property
+    def compression_ratio(self):
+        """Returns encoded_bytes / plain_bytes, 0.0 if nothing was coded."""
+        if not self.plain_bytes:
+            return 0.0
+
+        return float(self.encoded_bytes) / self.plain_bytes
+
+
+class HTTP2HpackTemplate(object):
+    """A header block template, see :meth:`HTTP2Hpack.compile`.
+
+    The parts are tuples (representation, data, header), data is the
+    encoded field for the fixed headers and the name for the varying ones,
+    whose representation is None.
+
+    :param hpack: the :class:`HTTP2Hpack` which compiled the template.
+    :param parts: the compiled headers, in order.
+    """
+    def __init__(self, hpack, parts):
+        self.hpack = hpack
+        self.parts = parts
+        self.varying = sum(1 for part in parts if part[0] is None)
+        self.plain_bytes = sum(len(part[2][0]) + len(part[2][1])
+                               for part in parts if part[0] is not None)
+
+    def __repr__(self):
+        return "<HTTP/2 Hpack template, %d headers, %d varying>" % (
+            len(self.parts), self.varying)
+
+    def render(self, values=(), headers=(), buf=None):
+        """Encodes a header block from the template, see
+        :meth:`HTTP2Hpack.encode_template`.
+        """
+        return self.hpack.encode_template(self, values, headers, buf)
+
+
+class HTTP2HpackDynamicTable(object):
+    """The HPACK dynamic table.
+
+    The entries live in a ring buffer, so that insertion, eviction and
+    index lookups are all O(1). Every entry gets a sequence number at
+    insertion and sits in the slot (sequence number % capacity); the newest
+    entry has the index 1 and the sequence number (insertions - 1).
+
+    The ring follows the entry count, it doubles once full and halves once
+    three quarters empty, rather than taking the max_size / 32 slots the
+    table may hold at most: max_size comes from the peer, which may set it
+    up to 2^32 - 1.
+
+    Dicts map (name, value) and name to the sequence number of the newest
+    entry holding them, for lookups in O(1) as well.
+
+    The lookups are counted in hits (header matched), name_hits (only the
+    name matched) and misses, the evictions in evictions and evicted_bytes.
+
+    :param max_size: the maximum size of the table.
+    """
+    def __init__(self, max_size):
+        self.__max_size = max_size
+        self.__size = 0
+        self.__length = 0
+        self.__insertions = 0
+        self.__slots = [None] * HPACK_DYNAMIC_TABLE_SLOTS
+        self.__index = {}
+        self.__name_index = {}
+
+        self.hits = 0
+        self.name_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+
+    def __repr__(self):
+        return "<HTTP/2 Hpack dynamic table %d/%d bytes>" % (self.__size,
+                                                            self.__max_size)
+
+    def __len__(self):
+        return self.__length
+
+    def __iter__(self):
+        """Iterates the entries in index order, the newest first."""
+        for index in range_iter(1, self.__length + 1):
+            yield self.get(index)
+
+    @property
+    def size(self):
+        """Returns the size of the table, i.e. the entries plus overhead."""
+        return self.__size
+
+    @property
+    def max_size(self):
+        """Returns the maximum size of the table."""
+        return self.__max_size
+
+    @property
+    def insertions(self):
+        """Returns how many entries were ever inserted."""
+        return self.__insertions
+
+    @property
+    def hit_rate(self):
+        """Returns hits / lookups, 0.0 if nothing was looked up."""
+        lookups = self.hits + self.name_hits + self.misses
+        if not lookups:
+            return 0.0
+
+        return float(self.hits) / lookups
+
+    def __reshape(self, capacity):
+        """Moves the entries into a ring buffer of capacity slots."""
+        slots = self.__slots
+        first = self.__insertions - self.__length
+        entries = [slots[seq % len(slots)]
+                   for seq in range_iter(first, self.__insertions)]
+        self.__slots = slots = [None] * capacity
+        for seq, header in enumerate(entries, first):
+            slots[seq % capacity] = header
+
+    def __evict(self):
+        """Drops the oldest entry."""
+        seq = self.__insertions - self.__length
+        slot = seq % len(self.__slots)
+        header = self.__slots[slot]
+        self.__slots[slot] = None
+        self.__length -= 1
+        size = len(header[0]) + len(header[1]) + HPACK_ENTRY_OVERHEAD
+        self.__size -= size
+        self.evictions += 1
+        self.evicted_bytes += size
+        capacity = len(self.__slots)
+        if capacity > HPACK_DYNAMIC_TABLE_SLOTS and \
+                self.__length < capacity // 4:
+            self.__reshape(capacity // 2)
+
+        # a newer entry may hold the same header or name.
+        if self.__index.get(header) == seq:
+            del self.__index[header]
+        if self.__name_index.get(header[0]) == seq:
+            del self.__name_index[header[0]]
+
+    def add(self, header):
+        """Inserts an entry, after evicting the oldest ones as needed.
+
+        :param header: a tuple (name, value).
+        :rtype: True if the entry was added, False if it is larger than the
+                table, which is emptied then.
+        """
+        size = len(header[0]) + len(header[1]) + HPACK_ENTRY_OVERHEAD
+        if size > self.__max_size:
+            # an attempt to add an entry larger than the maximum size causes
+            # the table to be emptied of all existing entries.
+            while self.__length:
+                self.__evict()
+            return False
+
+        while self.__size + size > self.__max_size:
+            self.__evict()
+
+        if self.__length == len(self.__slots):
+            self.__reshape(self.__length * 2)
+
+        seq = self.__insertions
+        self.__slots[seq % len(self.__slots)] = header
+        self.__insertions += 1
+        self.__length += 1
+        self.__size += size
+        self.__index[header] = seq
+        self.__name_index[header[0]] = seq
+        return True
+
+    def get(self, index):
+        """Returns the entry with the (dynamic table) index.
+
+        :param index: the index in the dynamic table, starts from 1.
+        :rtype: a tuple (name, value), or None if out of bound.
+        """
+        if index < 1 or index > self.__length:
+            return None
+
+        return self.__slots[(self.__insertions - index) % len(self.__slots)]
+
+    def search(self, header):
+        """Looks up the header in the table.
+
+        :param header: a tuple (name, value).
+        :rtype: a tuple (index, matched), like :meth:`HTTP2Hpack.search_header`
+                but with the index in the dynamic table.
+        """
+        seq = self.__index.get(header)
+        if seq is not None:
+            self.hits += 1
+            return self.__insertions - seq, True
+
+        seq = self.__name_index.get(header[0])
+        if seq is not None:
+            self.name_hits += 1
+            return self.__insertions - seq, False
+
+        self.misses += 1
+        return 0, False
+
+    def resize(self, max_size):
+        """Changes the maximum size, evicts the entries which do not fit.
+
+        :param max_size: the new maximum size.
+        """
+        while self.__size > max_size:
+            self.__evict()
+
+        self.__max_size = max_size
+
+
+class HTTP2HpackTableTuner(object):
+    """Chooses the size of an encoder's dynamic table from the observed
+    reuse of the headers.
+
+    The tuner replays the headers into a model of a table of the maximum
+    size: the position of a header is the count of bytes inserted before
+    it, and a header found again at (inserted bytes - position) <= size
+    would be indexed by any table of that size at least. These reuse
+    distances are summed up per step of size, weighted by the header size,
+    i.e. by the bytes the index saves.
+
+    Every window header blocks, the smallest size which keeps all but
+    tolerance of the savings is chosen, and the counts are halved, so the
+    size follows the traffic.
+
+    The limit comes from the peer, which may set it up to 2^32 - 1, so the
+    model is capped at ceiling, and the savings are kept in a dict of the
+    buckets seen only.
+
+    :param max_size: the limit, i.e. the peer's SETTINGS_HEADER_TABLE_SIZE.
+    :param window: the count of header blocks between size changes.
+    :param tolerance: the share of the savings which may be given up.
+    :param step: the granularity of the size.
+    :param ceiling: the largest size modelled, hence chosen.
+    """
+    def __init__(self, max_size, window=64, tolerance=0.02, step=256,
+                 ceiling=HPACK_TUNER_MAX_SIZE):
+        self.max_size = min(max_size, ceiling)
+        self.window = window
+        self.tolerance = tolerance
+        self.step = step
+        self.blocks = 0
+        self.savings = {}
+        self.__positions = OrderedDict()
+        self.__inserted = 0
+
+    def __repr__(self):
+        return "<HTTP/2 Hpack table tuner, %d bytes at most>" % self.max_size
+
+    def observe(self, header, policy):
+        """Replays a header which is not inside the static table.
+
+        :param header: a tuple (name, value).
+        :param policy: the indexing policy of the encoder.
+        """
+        position = self.__positions.get(header)
+        if position is not None and self.__inserted - position <= \
+                self.max_size:
+            bucket = (self.__inserted - position + self.step - 1) // self.step
+            self.savings[bucket] = self.savings.get(bucket, 0) + \
+                len(header[0]) + len(header[1])
+            return
+
+        if policy(header, self.max_size) != HPACK_INCR_INDEXING:
+            return
+
+        positions = self.__positions
+        positions.pop(header, None)
+        positions[header] = self.__inserted
+        self.__inserted += len(header[0]) + len(header[1]) \
+            + HPACK_ENTRY_OVERHEAD
+
+        # forget the headers any table would have evicted, even the header
+        # just inserted if it is larger than the table.
+        horizon = self.__inserted - self.max_size
+        while positions and next(iter(positions.values())) < horizon:
+            positions.popitem(last=False)
+
+    def end_block(self):
+        """Ends a header block.
+
+        :rtype: the new table size at the end of a window, else None.
+        """
+        self.blocks += 1
+        if self.blocks < self.window:
+            return None
+
+        savings = self.savings
+        target = sum(savings.values()) * (1 - self.tolerance)
+        size, total = 0, 0
+        for bucket in sorted(savings):
+            total += savings[bucket]
+            if total >= target:
+                size = min(bucket * self.step, self.max_size)
+                break
+
+        self.blocks = 0
+        self.savings = dict((bucket, saving >> 1)
+                            for bucket, saving in savings.items()
+                            if saving > 1)
+        return size
+
 
 class HTTP2Hpack:
     """The HTTP/2 Hpack class
@@ -96,52 +582,66 @@ class HTTP2Hpack:
     > at the lowest index, and the oldest entry of a dynamic table is at the
     > highest index.
 
-    :param dynamic: initialized dynamic table
+    :param dynamic: initialized dynamic table, in index order.
+    :param max_dynamic_table_size: the maximum size of the dynamic table.
+    :param huff: the :class:`HTTP2Huffman` codec, defaults to the shared
+                 codec, pass one with caches for repeated header values.
+    :param policy: chooses the representation of the headers outside the
+                   index table, see :class:`HTTP2HpackIndexingPolicy`.
+    :param max_header_list_size: the maximum size of a decoded header list,
+                                 i.e. SETTINGS_MAX_HEADER_LIST_SIZE, None
+                                 for no limit.
+    :param auto_tune: whether the encoder resizes its dynamic table, within
+                      max_dynamic_table_size, see
+                      :class:`HTTP2HpackTableTuner`.
     """
-    def __init__(self, dynamic, max_dynamic_table_size):
+    def __init__(self, dynamic, max_dynamic_table_size, huff=None,
+                 policy=None, max_header_list_size=None, auto_tune=False):
         self.__static = hpack_static_table
-        self.__dynamic = dynamic or []
-        self.__dynamic_table_size = 0
+        self.__dynamic = HTTP2HpackDynamicTable(max_dynamic_table_size)
+        self.__huff = huff or http2_huffman
+        self.policy = policy or hpack_indexing_policy
+        self.__stats = HTTP2HpackStats()
+
+        # the limit from SETTINGS_HEADER_TABLE_SIZE, and the table size
+        # updates to signal at the beginning of the next header block.
         self.__max_dynamic_table_size = max_dynamic_table_size
-        self.__huff = HTTP2Huffman()
-
-        index = 0
-        for item in self.__dynamic:
-            size = len(item[0]) + len(item[1]) + 32
-            self.__dynamic_table_size += size
-
-        if self.__dynamic_table_size > self.__max_dynamic_table_size:
-            raise HTTP2HpackError("initial dynamic table too large")
-
-    def __check_dynamic_table(self, size):
-        """Evicts some items properly.
-        Before a new entry is added to the dynamic table, entries are evicted
-        from the end of the dynamic table until the size of the dynamic table
-        is less than or equal to (maximum size - new entry size) or until the
-        table is empty.
-
-        :param size: size of the new item.
-        :rtype: True if the new item can be added or False otherwise.
-        """
-        if self.__dynamic_table_size + size < self.__max_dynamic_table_size:
-            return True
-        elif size > self.__max_dynamic_table_size:
-            # an attempt to add an entry larger than the maximum size causes the
-            # table to be emptied of all existing entries and results in an
-            # empty table.
-            self.__dynamic = []
-            return False
-        else:
-            index = 0
-            temp_dynamic_table_size = self.__dynamic_table_size
-            for item in self.__dynamic:
-                index += 1
-                temp_dynamic_table_size -= len(item[0]) + len(item[1]) + 32
-                if temp_dynamic_table_size + size <= self.__max_dynamic_table_size:
-                    break
+        self.__size_updates = []
+        self.__tuner = None
+        if auto_tune:
+            self.__tuner = HTTP2HpackTableTuner(max_dynamic_table_size)
+
+        # the header block being decoded, see decode_fragment.
+        self.max_header_list_size = max_header_list_size
+        self.__block_headers = []
+        self.__block_size = 0
+        self.__block_tail = None
+        self.__block_encoded_bytes = 0
+
+        # the given entries are in index order, i.e. the newest first.
+        for header in reversed(dynamic or []):
+            size = len(header[0]) + len(header[1]) + HPACK_ENTRY_OVERHEAD
+            if self.__dynamic.size + size > max_dynamic_table_size:
+                raise HTTP2HpackError("initial dynamic table too large")
+
+            self.__dynamic.add(header)
 
-            self.__dynamic = self.__dynamic[index:]
-            return True
+    @property
+    def dynamic_table(self):
+        """Returns the :class:`HTTP2HpackDynamicTable`."""
+        return self.__dynamic
+
+    @property
+    def stats(self):
+        """Returns the :class:`HTTP2HpackStats` of the header blocks."""
+        return self.__stats
+
+    @property
+    def tuner(self):
+        """Returns the :class:`HTTP2HpackTableTuner`, None if the table size
+        is not tuned.
+        """
+        return self.__tuner
 
     def append_header(self, header):
         """append a new entry (header) to the dynamic table.
@@ -152,9 +652,7 @@ class HTTP2Hpack:
         if not isinstance(header, tuple):
             raise ValueError("unexpected type \"%s\" for header" % type(header))
 
-        size = 32 + len(header[0]) + len(header[1])
-        if self.__check_dynamic_table(size) is True:
-            self.__dynamic.append(header)
+        self.__dynamic.add(header)
 
     def inside_index_table(self, header):
         """Judges whether the pair of header name and value is inside the hpack
@@ -167,47 +665,664 @@ class HTTP2Hpack:
         if not isinstance(header, tuple):
             raise ValueError("unexpected type \"%s\" for header" % type(header))
 
-        return header in self.__static or header in self.__dynamic
+        return self.search_header(header)[1]
+
+    def search_header(self, header):
+        """Looks up the header in the static and dynamic tables.
+        The static table is preferred, and the newest entry in the dynamic
+        table, as they have the smallest indexes.
+
+        :param header: a tuple (name, value).
+        :rtype: a tuple (index, matched), index is the index of the whole
+                header if matched is True, of the name only otherwise, 0 if
+                the name is not in the tables.
+        """
+        index = hpack_static_index.get(header)
+        if index is not None:
+            return index, True
+
+        index, matched = self.__dynamic.search(header)
+        if matched:
+            return HPACK_STATIC_TABLE_SIZE + index, True
+
+        static_index = hpack_static_name_index.get(header[0])
+        if static_index is not None:
+            return static_index, False
+        elif index:
+            return HPACK_STATIC_TABLE_SIZE + index, False
+
+        return 0, False
 
     def index_of_header(self, header):
-        if not self.inside_index_table(header):
-            raise HTTP2HpackEncodeError("header %s not in index table" % header)
+        """Returns the index of the header (both name and value).
+
+        :param header: a tuple which represents the header.
+        :rtype: the index, starts from 1.
+        """
+        index, matched = self.search_header(header)
+        if not matched:
+            raise HTTP2HpackEncodeError("header %s not in index table"
+                                        % (header,))
 
-        index = 0
-        for table in [self.__static, self.__dynamic]:
-            index += 1
-            for item in table:
-                if header == item:
-                    return index
+        return index
 
-    def encode_indexed(self, header):
+    @staticmethod
+    def encode_integer(value, prefix, flags=0, buf=None):
+        """Integer representation
+          0   1   2   3   4   5   6   7
+        +---+---+---+---+---+---+---+---+
+        | ? | ? | ? |       Value       |
+        +---+---+---+-------------------+
+        | 1 |    Value-(2^N-1) LSB      |
+        +---+---------------------------+
+                       ...
+        +---+---------------------------+
+        | 0 |    Value-(2^N-1) MSB      |
+        +---+---------------------------+
+
+        :param value: the integer waits for encoding.
+        :param prefix: the prefix size N, in bits.
+        :param flags: the bits before the prefix in the first octet.
+        :param buf: the bytearray to write into, a new one if None.
+        :rtype: the bytearray written into.
+        """
+        if buf is None:
+            buf = bytearray()
+
+        limit = (1 << prefix) - 1
+        if value < limit:
+            buf.append(flags | value)
+            return buf
+
+        buf.append(flags | limit)
+        value -= limit
+        while value >= 0x80:
+            buf.append(value & 0x7f | 0x80)
+            value >>= 7
+
+        buf.append(value)
+        return buf
+
+    def encode_string(self, data, buf=None):
+        """String literal representation
+          0   1   2   3   4   5   6   7
+        +---+---+---+---+---+---+---+---+
+        | H |    String Length (7+)     |
+        +---+---------------------------+
+        |  String Data (Length octets)  |
+        +-------------------------------+
+
+        The data is Huffman encoded only if that makes it shorter, the
+        encoded size is calculated before doing any encoding work.
+
+        :param data: the string waits for encoding.
+        :param buf: the bytearray to write into, a new one if None.
+        :rtype: the bytearray written into.
+        """
+        if buf is None:
+            buf = bytearray()
+
+        size = self.__huff.encoded_length(data)
+        if size < len(data):
+            self.encode_integer(size, 7, 0x80, buf)
+            buf += self.__huff.encode(data)
+        else:
+            self.encode_integer(len(data), 7, 0, buf)
+            buf += data
+
+        return buf
+
+    def encode_indexed(self, header, buf=None):
         """Indexed header field representation
           0   1   2   3   4   5   6   7
         +---+---+---+---+---+---+---+---+
         | 1 |         Index (7+)        |
         +---+---------------------------+
 
-        :param index: index that caller want to use.
-        :rtype: the encoded data stream.
+        :param header: a tuple (name, value) inside the index table.
+        :param buf: the bytearray to write into, a new one if None.
+        :rtype: the bytearray written into.
+        """
+        return self.encode_integer(self.index_of_header(header), 7, 0x80, buf)
+
+    def __encode_literal(self, header, index, prefix, flags, buf):
+        """Writes a literal header field, the name is indexed if possible.
+          0   1   2   3   4   5   6   7
+        +---+---+---+---+---+---+---+---+
+        |     flags     |  Index (N+)   |
+        +---+---+-----------------------+
+        | H |     Value Length (7+)     |
+        +---+---------------------------+
+        | Value String (Length octets)  |
+        +-------------------------------+
+
+          0   1   2   3   4   5   6   7
+        +---+---+---+---+---+---+---+---+
+        |     flags     |       0       |
+        +---+---+-----------------------+
+        | H |     Name Length (7+)      |
+        +---+---------------------------+
+        |  Name String (Length octets)  |
+        +---+---------------------------+
+        | H |     Value Length (7+)     |
+        +---+---------------------------+
+        | Value String (Length octets)  |
+        +-------------------------------+
+        """
+        if buf is None:
+            buf = bytearray()
+
+        self.encode_integer(index, prefix, flags, buf)
+        if not index:
+            self.encode_string(header[0], buf)
+
+        return self.encode_string(header[1], buf)
+
+    def encode_incr_indexing(self, header, buf=None):
+        """Literal header field with incremental indexing, the header is
+        appended to the dynamic table.
+          0   1   2   3   4   5   6   7
+        +---+---+---+---+---+---+---+---+
+        | 0 | 1 |      Index (6+)       |
+        +---+---+-----------------------+
+
+        :param header: a tuple (name, value).
+        :param buf: the bytearray to write into, a new one if None.
+        :rtype: the bytearray written into.
+        """
+        index = self.search_header(header)[0]
+        buf = self.__encode_literal(header, index, 6, 0x40, buf)
+        self.append_header(header)
+        return buf
+
+    def encode_without_indexing(self, header, buf=None):
+        """Literal header field without indexing.
+          0   1   2   3   4   5   6   7
+        +---+---+---+---+---+---+---+---+
+        | 0 | 0 | 0 | 0 |  Index (4+)   |
+        +---+---+-----------------------+
+
+        :param header: a tuple (name, value).
+        :param buf: the bytearray to write into, a new one if None.
+        :rtype: the bytearray written into.
+        """
+        index = self.search_header(header)[0]
+        return self.__encode_literal(header, index, 4, 0x00, buf)
+
+    def encode_never_indexed(self, header, buf=None):
+        """Literal header field never indexed, intermediaries must not index
+        the header either, e.g. for credentials.
+          0   1   2   3   4   5   6   7
+        +---+---+---+---+---+---+---+---+
+        | 0 | 0 | 0 | 1 |  Index (4+)   |
+        +---+---+-----------------------+
+
+        :param header: a tuple (name, value).
+        :param buf: the bytearray to write into, a new one if None.
+        :rtype: the bytearray written into.
+        """
+        index = self.search_header(header)[0]
+        return self.__encode_literal(header, index, 4, 0x10, buf)
+
+    def encode_table_size_update(self, size, buf=None):
+        """Dynamic table size update, the dynamic table is resized as well.
+          0   1   2   3   4   5   6   7
+        +---+---+---+---+---+---+---+---+
+        | 0 | 0 | 1 |   Max size (5+)   |
+        +---+---------------------------+
+
+        :param size: the new maximum size of the dynamic table.
+        :param buf: the bytearray to write into, a new one if None.
+        :rtype: the bytearray written into.
+        """
+        if size > self.__max_dynamic_table_size:
+            raise HTTP2HpackEncodeError("dynamic table size %d exceeds the "
+                                        "limit %d"
+                                        % (size, self.__max_dynamic_table_size))
+
+        self.__dynamic.resize(size)
+        return self.encode_integer(size, 5, 0x20, buf)
+
+    def update_dynamic_table_size(self, size):
+        """Changes the size of the dynamic table, the update is signaled at the
+        beginning of the next header block encoded by :meth:`encode`.
+
+        > the smallest maximum table size that occurs in that interval MUST be
+        > signaled in a dynamic table size update. The final maximum size is
+        > always signaled, resulting in at most two dynamic table size updates.
+
+        :param size: the new maximum size of the dynamic table.
+        """
+        if size > self.__max_dynamic_table_size:
+            raise HTTP2HpackEncodeError("dynamic table size %d exceeds the "
+                                        "limit %d"
+                                        % (size, self.__max_dynamic_table_size))
+
+        updates = self.__size_updates
+        if not updates:
+            updates.append(size)
+        elif len(updates) == 1:
+            if size > updates[0]:
+                updates.append(size)
+            else:
+                updates[0] = size
+        elif size <= updates[0]:
+            del updates[1:]
+            updates[0] = size
+        else:
+            updates[1] = size
+
+    def __encode_size_updates(self, buf):
+        """Writes the dynamic table size updates asked for since the last
+        header block.
+        """
+        for size in self.__size_updates:
+            self.encode_table_size_update(size, buf)
+
+        self.__size_updates = []
+
+    def __encode_header(self, header, buf):
+        """Writes a header in the representation chosen by encode."""
+        stats = self.__stats
+        stats.headers += 1
+        stats.plain_bytes += len(header[0]) + len(header[1])
+
+        index, matched = self.search_header(header)
+        if self.__tuner is not None and \
+                not (matched and index <= HPACK_STATIC_TABLE_SIZE):
+            self.__tuner.observe(header, self.policy)
+
+        if matched:
+            stats.indexed += 1
+            self.encode_integer(index, 7, 0x80, buf)
+            return
+
+        representation = self.policy(header, self.__dynamic.max_size)
+        if representation == HPACK_INCR_INDEXING:
+            stats.incr_indexing += 1
+            self.__encode_literal(header, index, 6, 0x40, buf)
+            self.__dynamic.add(header)
+        elif representation == HPACK_WITHOUT_INDEXING:
+            stats.without_indexing += 1
+            self.__encode_literal(header, index, 4, 0x00, buf)
+        else:
+            stats.never_indexed += 1
+            self.__encode_literal(header, index, 4, 0x10, buf)
+
+    def encode(self, headers, buf=None):
+        """Encodes a header block, headers are indexed if they are inside the
+        index table, the policy chooses the literal representation otherwise.
+
+        :param headers: an iterable of tuples (name, value).
+        :param buf: the bytearray to write into, a new one if None.
+        :rtype: the bytearray written into.
+        """
+        if buf is None:
+            buf = bytearray()
+
+        start = len(buf)
+        self.__encode_size_updates(buf)
+        for header in headers:
+            self.__encode_header(header, buf)
+
+        self.__stats.blocks += 1
+        self.__stats.encoded_bytes += len(buf) - start
+        self.__tune()
+        return buf
+
+    def __tune(self):
+        """Ends a header block for the tuner, and asks for the size it
+        chooses, if any.
+        """
+        if self.__tuner is None:
+            return
+
+        size = self.__tuner.end_block()
+        if size is None:
+            return
+
+        pending = self.__size_updates
+        if size != (pending[-1] if pending else self.__dynamic.max_size):
+            self.update_dynamic_table_size(size)
+
+    def compile(self, headers):
+        """Compiles a header block template, for the requests which only
+        differ in a few values. Headers with the value None vary, their
+        values are given to each rendering.
+
+        The fixed headers are encoded once, to fields which do not depend on
+        the dynamic table: indexes in the static table, or literals whose
+        names are indexed in the static table. The fixed headers the policy
+        indexes are looked up in the dynamic table on rendering, and the
+        precompiled literal with incremental indexing is written if they
+        are not inside it.
+
+        :param headers: an iterable of tuples (name, value or None).
+        :rtype: a :class:`HTTP2HpackTemplate`.
+        """
+        parts = []
+        for header in headers:
+            if header[1] is None:
+                parts.append((None, header[0], None))
+                continue
+
+            index = hpack_static_index.get(header)
+            if index is not None:
+                parts.append((HPACK_INDEXED,
+                              unit_type(self.encode_integer(index, 7, 0x80)),
+                              header))
+                continue
+
+            index = hpack_static_name_index.get(header[0], 0)
+            representation = self.policy(header, self.__dynamic.max_size)
+            if representation == HPACK_INCR_INDEXING:
+                prefix, flags = 6, 0x40
+            elif representation == HPACK_WITHOUT_INDEXING:
+                prefix, flags = 4, 0x00
+            else:
+                prefix, flags = 4, 0x10
+
+            data = self.__encode_literal(header, index, prefix, flags, None)
+            parts.append((representation, unit_type(data), header))
+
+        return HTTP2HpackTemplate(self, parts)
+
+    def encode_template(self, template, values=(), headers=(), buf=None):
+        """Encodes a header block from a template, the output is the same
+        as :meth:`encode` gives for the headers, but for the names of the
+        fixed headers, which may be sent as literals where encode would
+        index them in the dynamic table.
+
+        :param template: a :class:`HTTP2HpackTemplate`, it can be compiled
+                         by another :class:`HTTP2Hpack` with the same policy.
+        :param values: the values of the varying headers, in order.
+        :param headers: an iterable of tuples (name, value), appended to the
+                        header block.
+        :param buf: the bytearray to write into, a new one if None.
+        :rtype: the bytearray written into.
+        """
+        if len(values) != template.varying:
+            raise HTTP2HpackEncodeError("%d values for %d varying headers"
+                                        % (len(values), template.varying))
+
+        if buf is None:
+            buf = bytearray()
+
+        start = len(buf)
+        self.__encode_size_updates(buf)
+
+        stats = self.__stats
+        dynamic = self.__dynamic
+        values = iter(values)
+        for representation, data, header in template.parts:
+            if representation is None:
+                self.__encode_header((data, next(values)), buf)
+            elif representation == HPACK_INCR_INDEXING:
+                if self.__tuner is not None:
+                    self.__tuner.observe(header, self.policy)
+
+                index, matched = dynamic.search(header)
+                if matched:
+                    stats.indexed += 1
+                    index += HPACK_STATIC_TABLE_SIZE
+                    if index < 0x7f:
+                        buf.append(0x80 | index)
+                    else:
+                        self.encode_integer(index, 7, 0x80, buf)
+                else:
+                    stats.incr_indexing += 1
+                    buf += data
+                    dynamic.add(header)
+            else:
+                if representation == HPACK_INDEXED:
+                    stats.indexed += 1
+                elif representation == HPACK_WITHOUT_INDEXING:
+                    stats.without_indexing += 1
+                else:
+                    stats.never_indexed += 1
+
+                buf += data
+
+        stats.headers += len(template.parts) - template.varying
+        stats.plain_bytes += template.plain_bytes
+        for header in headers:
+            self.__encode_header(header, buf)
+
+        stats.blocks += 1
+        stats.encoded_bytes += len(buf) - start
+        self.__tune()
+        return buf
+
+    @staticmethod
+    def decode_integer(view, offset, prefix):
+        """Decodes an integer, see :meth:`encode_integer`.
+
+        :param view: the data, a memoryview over the header block.
+        :param offset: the offset of the first octet.
+        :param prefix: the prefix size N, in bits.
+        :rtype: a tuple (the integer, the offset after it).
+        """
+        limit = (1 << prefix) - 1
+        value = view[offset] & limit
+        offset += 1
+        if value < limit:
+            return value, offset
+
+        shift = 0
+        end = len(view)
+        while True:
+            if offset == end:
+                raise HTTP2HpackTruncatedError("truncated integer")
+
+            octet = view[offset]
+            offset += 1
+            value += (octet & 0x7f) << shift
+            if not octet & 0x80:
+                return value, offset
+
+            shift += 7
+            if shift > 28:
+                raise HTTP2HpackDecodeError("integer overflow")
+
+    def decode_string(self, view, offset, limit=None):
+        """Decodes a string literal, see :meth:`encode_string`.
+        Only the string itself is copied out of the view, Huffman encoded
+        data goes to the decoder as a slice of the view.
+
+        :param view: the data, a memoryview over the header block.
+        :param offset: the offset of the first octet.
+        :param limit: the maximum size of the string, None for no limit, it
+                      is checked before the string is read.
+        :rtype: a tuple (the string, the offset after it).
         """
-        index = self.index_of_header(header)
-        index |= 1 << 7
-        return pack(">B", index)
+        if offset == len(view):
+            raise HTTP2HpackTruncatedError("truncated string")
+
+        huffman = view[offset] & 0x80
+        size, offset = self.decode_integer(view, offset, 7)
+
+        # the shortest Huffman code has 5 bits, the longest 30 bits.
+        if limit is not None and (size * 8 // 30 if huffman else size) > limit:
+            raise HTTP2HpackDecodeError("header list too large")
+
+        end = offset + size
+        if end > len(view):
+            raise HTTP2HpackTruncatedError("truncated string")
+
+        if huffman:
+            try:
+                return self.__huff.decode(view[offset:end]), end
+            except HTTP2HpackHuffmanDecodeError as e:
+                raise HTTP2HpackDecodeError("invalid huffman string: %s" % e)
+
+        return unit_type(view[offset:end]), end
+
+    def __decode_fields(self, view):
+        """Decodes the fields of the view into the current header block, and
+        checks the header list size after every field.
+
+        :param view: the data, a memoryview over the header block.
+        :rtype: the offset after the last complete field.
+        """
+        stats = self.__stats
+        headers = self.__block_headers
+        limit = self.max_header_list_size
+        offset, end = 0, len(view)
+        while offset < end:
+            start = offset
+            octet = view[offset]
+            try:
+                if octet & 0x80:
+                    # indexed header field.
+                    index, offset = self.decode_integer(view, offset, 7)
+                    header = self.decode_indexed(index)
+                    representation = HPACK_INDEXED
+                elif octet & 0x20 and not octet & 0x40:
+                    # dynamic table size update, only before the first field.
+                    if headers:
+                        raise HTTP2HpackDecodeError("dynamic table size update "
+                                                    "after header fields")
+
+                    size, offset = self.decode_integer(view, offset, 5)
+                    if size > self.__max_dynamic_table_size:
+                        raise HTTP2HpackDecodeError(
+                            "dynamic table size %d exceeds the limit %d"
+                            % (size, self.__max_dynamic_table_size))
+
+                    self.__dynamic.resize(size)
+                    continue
+                else:
+                    # literal header field with incremental indexing, without
+                    # indexing or never indexed.
+                    if octet & 0x40:
+                        representation = HPACK_INCR_INDEXING
+                        prefix = 6
+                    elif octet & 0x10:
+                        representation = HPACK_NEVER_INDEXED
+                        prefix = 4
+                    else:
+                        representation = HPACK_WITHOUT_INDEXING
+                        prefix = 4
+
+                    remains = None
+                    if limit is not None:
+                        remains = (limit - self.__block_size
+                                   - HPACK_ENTRY_OVERHEAD)
+
+                    index, offset = self.decode_integer(view, offset, prefix)
+                    if index:
+                        name = self.decode_indexed(index)[0]
+                    else:
+                        name, offset = self.decode_string(view, offset,
+                                                          remains)
+                        name = hpack_header_names.get(name, name)
+
+                    if remains is not None:
+                        remains -= len(name)
+
+                    value, offset = self.decode_string(view, offset, remains)
+                    header = (name, value)
 
-    def encode_incr_indexing(self, header):
-        newitem = (header[0], "")
-        header_index = self.index_of_header(newitem)
-        if header_index & (1 << 7) != 0:
-            raise HTTP2HpackEncodeError("invalid index %d" % header_index)
+            except HTTP2HpackTruncatedError:
+                # the field continues in the next fragment.
+                return start
 
-    def encode_without_indexing(self):
-        pass
+            self.__block_size += (len(header[0]) + len(header[1])
+                                  + HPACK_ENTRY_OVERHEAD)
+            if limit is not None and self.__block_size > limit:
+                raise HTTP2HpackDecodeError("header list too large, %d bytes "
+                                            "exceed the limit %d"
+                                            % (self.__block_size, limit))
 
-    def encode_never_indexed(self):
-        pass
+            if representation == HPACK_INDEXED:
+                stats.indexed += 1
+            elif representation == HPACK_INCR_INDEXING:
+                stats.incr_indexing += 1
+                self.__dynamic.add(header)
+            elif representation == HPACK_NEVER_INDEXED:
+                stats.never_indexed += 1
+            else:
+                stats.without_indexing += 1
 
-    def decode(self):
-        pass
+            headers.append(header)
+
+        return offset
+
+    def decode_fragment(self, fragment, end_headers=True):
+        """Decodes a fragment of a header block, i.e. the payload of a
+        HEADERS, PUSH_PROMISE or CONTINUATION frame.
+
+        The complete fields are decoded as the fragments come, only the
+        octets of a field which spans fragments are kept. The header list
+        size is checked after every field, and before every string is read,
+        so a block exceeding max_header_list_size fails at once.
+
+        :param fragment: the fragment, bytes, bytearray or memoryview.
+        :param end_headers: whether the fragment ends the header block.
+        :rtype: a list of tuples (name, value) if the block ends, else None.
+        """
+        tail = self.__block_tail
+        if tail is not None:
+            tail += fragment
+            data = tail
+        else:
+            data = fragment
+
+        view = octet_view(data)
+        self.__block_encoded_bytes += len(fragment)
+        try:
+            offset = self.__decode_fields(view)
+            if end_headers and offset < len(view):
+                raise HTTP2HpackTruncatedError("truncated header block")
+
+        except Exception:
+            # whatever the error, the block is dropped.
+            self.__reset_block()
+            raise
+
+        # the octets of a field which spans fragments are appended to the
+        # tail, which is trimmed in place, so a long field is not copied
+        # again for every fragment. A bytearray cannot be resized while a
+        # view exports it, the view goes first.
+        size = len(view)
+        del view
+        if offset == size:
+            self.__block_tail = None
+        elif tail is None:
+            tail = self.__block_tail = bytearray(data)
+            del tail[:offset]
+        elif offset:
+            del tail[:offset]
+
+        if not end_headers:
+            return None
+
+        headers = self.__block_headers
+        stats = self.__stats
+        stats.blocks += 1
+        stats.headers += len(headers)
+        stats.plain_bytes += (self.__block_size
+                              - len(headers) * HPACK_ENTRY_OVERHEAD)
+        stats.encoded_bytes += self.__block_encoded_bytes
+        self.__reset_block()
+        return headers
+
+    def __reset_block(self):
+        """Forgets the header block being decoded."""
+        self.__block_headers = []
+        self.__block_size = 0
+        self.__block_tail = None
+        self.__block_encoded_bytes = 0
+
+    def decode(self, data):
+        """Decodes a header block.
+        The block is parsed through a memoryview with an offset cursor, so it
+        is not sliced before the strings are copied out.
+
+        :param data: the header block, bytes, bytearray or memoryview.
+        :rtype: a list of tuples (name, value).
+        """
+        return self.decode_fragment(data, True)
 
     def decode_indexed(self, index):
         """Decodes the indexed header field.
@@ -216,14 +1331,13 @@ class HTTP2Hpack:
         :rtype: a tuple which contains the corresponding header name and value.
         """
         index -= 1
-        if index < len(self.__static):
+        if index < 0:
+            raise HTTP2HpackDecodeError("invalid index 0")
+        elif index < len(self.__static):
             return self.__static[index]
 
-        index -= len(self.__static)
-        if index < len(self.__dynamic):
-            return self.__dynamic[index]
-        else:
+        header = self.__dynamic.get(index - len(self.__static) + 1)
+        if header is None:
             raise HTTP2HpackDecodeError("index out of dynamic table bound")
 
-    def decode_incr_indexing(self):
-        pass
+        return header
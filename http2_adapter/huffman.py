@@ -9,12 +9,14 @@ Basically this module references the HTTP/2 implements by Nginx.
 
 from .compat import empty_unit
 from .compat import unit_type
-from .compat import is_py2
+from .compat import range_iter
+from .compat import int_to_bytes
 from .exceptions import HTTP2HpackHuffmanDecodeError
 from .exceptions import HTTP2HpackHuffmanEncodeError
+from array import array
+from collections import OrderedDict
 from struct import pack
-from struct import unpack
-from ctypes import c_uint64 as uint64
+from threading import Lock
 
 # (code, len)
 http2_huff_encode_table = (
@@ -152,2623 +154,520 @@ http2_huff_encode_table_lc = (
     (0x07ffffee, 27), (0x07ffffef, 27), (0x07fffff0, 27), (0x03ffffee, 26),
 )
 
-# (next, emit, sym, ending)
-http2_huff_decode_table = (
-    (
-        (0x04, 0x00, 0x00, 0x00), (0x05, 0x00, 0x00, 0x00),
-        (0x07, 0x00, 0x00, 0x00), (0x08, 0x00, 0x00, 0x00),
-        (0x0b, 0x00, 0x00, 0x00), (0x0c, 0x00, 0x00, 0x00),
-        (0x10, 0x00, 0x00, 0x00), (0x13, 0x00, 0x00, 0x00),
-        (0x19, 0x00, 0x00, 0x00), (0x1c, 0x00, 0x00, 0x00),
-        (0x20, 0x00, 0x00, 0x00), (0x23, 0x00, 0x00, 0x00),
-        (0x2a, 0x00, 0x00, 0x00), (0x31, 0x00, 0x00, 0x00),
-        (0x39, 0x00, 0x00, 0x00), (0x40, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x00, 0x01, 0x30, 0x01), (0x00, 0x01, 0x31, 0x01),
-        (0x00, 0x01, 0x32, 0x01), (0x00, 0x01, 0x61, 0x01),
-        (0x00, 0x01, 0x63, 0x01), (0x00, 0x01, 0x65, 0x01),
-        (0x00, 0x01, 0x69, 0x01), (0x00, 0x01, 0x6f, 0x01),
-        (0x00, 0x01, 0x73, 0x01), (0x00, 0x01, 0x74, 0x01),
-        (0x0d, 0x00, 0x00, 0x00), (0x0e, 0x00, 0x00, 0x00),
-        (0x11, 0x00, 0x00, 0x00), (0x12, 0x00, 0x00, 0x00),
-        (0x14, 0x00, 0x00, 0x00), (0x15, 0x00, 0x00, 0x00)
-    ),
-    (
-        (0x01, 0x01, 0x30, 0x00), (0x16, 0x01, 0x30, 0x01),
-        (0x01, 0x01, 0x31, 0x00), (0x16, 0x01, 0x31, 0x01),
-        (0x01, 0x01, 0x32, 0x00), (0x16, 0x01, 0x32, 0x01),
-        (0x01, 0x01, 0x61, 0x00), (0x16, 0x01, 0x61, 0x01),
-        (0x01, 0x01, 0x63, 0x00), (0x16, 0x01, 0x63, 0x01),
-        (0x01, 0x01, 0x65, 0x00), (0x16, 0x01, 0x65, 0x01),
-        (0x01, 0x01, 0x69, 0x00), (0x16, 0x01, 0x69, 0x01),
-        (0x01, 0x01, 0x6f, 0x00), (0x16, 0x01, 0x6f, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x30, 0x00), (0x09, 0x01, 0x30, 0x00),
-        (0x17, 0x01, 0x30, 0x00), (0x28, 0x01, 0x30, 0x01),
-        (0x02, 0x01, 0x31, 0x00), (0x09, 0x01, 0x31, 0x00),
-        (0x17, 0x01, 0x31, 0x00), (0x28, 0x01, 0x31, 0x01),
-        (0x02, 0x01, 0x32, 0x00), (0x09, 0x01, 0x32, 0x00),
-        (0x17, 0x01, 0x32, 0x00), (0x28, 0x01, 0x32, 0x01),
-        (0x02, 0x01, 0x61, 0x00), (0x09, 0x01, 0x61, 0x00),
-        (0x17, 0x01, 0x61, 0x00), (0x28, 0x01, 0x61, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x30, 0x00), (0x06, 0x01, 0x30, 0x00),
-        (0x0a, 0x01, 0x30, 0x00), (0x0f, 0x01, 0x30, 0x00),
-        (0x18, 0x01, 0x30, 0x00), (0x1f, 0x01, 0x30, 0x00),
-        (0x29, 0x01, 0x30, 0x00), (0x38, 0x01, 0x30, 0x01),
-        (0x03, 0x01, 0x31, 0x00), (0x06, 0x01, 0x31, 0x00),
-        (0x0a, 0x01, 0x31, 0x00), (0x0f, 0x01, 0x31, 0x00),
-        (0x18, 0x01, 0x31, 0x00), (0x1f, 0x01, 0x31, 0x00),
-        (0x29, 0x01, 0x31, 0x00), (0x38, 0x01, 0x31, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x32, 0x00), (0x06, 0x01, 0x32, 0x00),
-        (0x0a, 0x01, 0x32, 0x00), (0x0f, 0x01, 0x32, 0x00),
-        (0x18, 0x01, 0x32, 0x00), (0x1f, 0x01, 0x32, 0x00),
-        (0x29, 0x01, 0x32, 0x00), (0x38, 0x01, 0x32, 0x01),
-        (0x03, 0x01, 0x61, 0x00), (0x06, 0x01, 0x61, 0x00),
-        (0x0a, 0x01, 0x61, 0x00), (0x0f, 0x01, 0x61, 0x00),
-        (0x18, 0x01, 0x61, 0x00), (0x1f, 0x01, 0x61, 0x00),
-        (0x29, 0x01, 0x61, 0x00), (0x38, 0x01, 0x61, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x63, 0x00), (0x09, 0x01, 0x63, 0x00),
-        (0x17, 0x01, 0x63, 0x00), (0x28, 0x01, 0x63, 0x01),
-        (0x02, 0x01, 0x65, 0x00), (0x09, 0x01, 0x65, 0x00),
-        (0x17, 0x01, 0x65, 0x00), (0x28, 0x01, 0x65, 0x01),
-        (0x02, 0x01, 0x69, 0x00), (0x09, 0x01, 0x69, 0x00),
-        (0x17, 0x01, 0x69, 0x00), (0x28, 0x01, 0x69, 0x01),
-        (0x02, 0x01, 0x6f, 0x00), (0x09, 0x01, 0x6f, 0x00),
-        (0x17, 0x01, 0x6f, 0x00), (0x28, 0x01, 0x6f, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x63, 0x00), (0x06, 0x01, 0x63, 0x00),
-        (0x0a, 0x01, 0x63, 0x00), (0x0f, 0x01, 0x63, 0x00),
-        (0x18, 0x01, 0x63, 0x00), (0x1f, 0x01, 0x63, 0x00),
-        (0x29, 0x01, 0x63, 0x00), (0x38, 0x01, 0x63, 0x01),
-        (0x03, 0x01, 0x65, 0x00), (0x06, 0x01, 0x65, 0x00),
-        (0x0a, 0x01, 0x65, 0x00), (0x0f, 0x01, 0x65, 0x00),
-        (0x18, 0x01, 0x65, 0x00), (0x1f, 0x01, 0x65, 0x00),
-        (0x29, 0x01, 0x65, 0x00), (0x38, 0x01, 0x65, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x69, 0x00), (0x06, 0x01, 0x69, 0x00),
-        (0x0a, 0x01, 0x69, 0x00), (0x0f, 0x01, 0x69, 0x00),
-        (0x18, 0x01, 0x69, 0x00), (0x1f, 0x01, 0x69, 0x00),
-        (0x29, 0x01, 0x69, 0x00), (0x38, 0x01, 0x69, 0x01),
-        (0x03, 0x01, 0x6f, 0x00), (0x06, 0x01, 0x6f, 0x00),
-        (0x0a, 0x01, 0x6f, 0x00), (0x0f, 0x01, 0x6f, 0x00),
-        (0x18, 0x01, 0x6f, 0x00), (0x1f, 0x01, 0x6f, 0x00),
-        (0x29, 0x01, 0x6f, 0x00), (0x38, 0x01, 0x6f, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x73, 0x00), (0x16, 0x01, 0x73, 0x01),
-        (0x01, 0x01, 0x74, 0x00), (0x16, 0x01, 0x74, 0x01),
-        (0x00, 0x01, 0x20, 0x01), (0x00, 0x01, 0x25, 0x01),
-        (0x00, 0x01, 0x2d, 0x01), (0x00, 0x01, 0x2e, 0x01),
-        (0x00, 0x01, 0x2f, 0x01), (0x00, 0x01, 0x33, 0x01),
-        (0x00, 0x01, 0x34, 0x01), (0x00, 0x01, 0x35, 0x01),
-        (0x00, 0x01, 0x36, 0x01), (0x00, 0x01, 0x37, 0x01),
-        (0x00, 0x01, 0x38, 0x01), (0x00, 0x01, 0x39, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x73, 0x00), (0x09, 0x01, 0x73, 0x00),
-        (0x17, 0x01, 0x73, 0x00), (0x28, 0x01, 0x73, 0x01),
-        (0x02, 0x01, 0x74, 0x00), (0x09, 0x01, 0x74, 0x00),
-        (0x17, 0x01, 0x74, 0x00), (0x28, 0x01, 0x74, 0x01),
-        (0x01, 0x01, 0x20, 0x00), (0x16, 0x01, 0x20, 0x01),
-        (0x01, 0x01, 0x25, 0x00), (0x16, 0x01, 0x25, 0x01),
-        (0x01, 0x01, 0x2d, 0x00), (0x16, 0x01, 0x2d, 0x01),
-        (0x01, 0x01, 0x2e, 0x00), (0x16, 0x01, 0x2e, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x73, 0x00), (0x06, 0x01, 0x73, 0x00),
-        (0x0a, 0x01, 0x73, 0x00), (0x0f, 0x01, 0x73, 0x00),
-        (0x18, 0x01, 0x73, 0x00), (0x1f, 0x01, 0x73, 0x00),
-        (0x29, 0x01, 0x73, 0x00), (0x38, 0x01, 0x73, 0x01),
-        (0x03, 0x01, 0x74, 0x00), (0x06, 0x01, 0x74, 0x00),
-        (0x0a, 0x01, 0x74, 0x00), (0x0f, 0x01, 0x74, 0x00),
-        (0x18, 0x01, 0x74, 0x00), (0x1f, 0x01, 0x74, 0x00),
-        (0x29, 0x01, 0x74, 0x00), (0x38, 0x01, 0x74, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x20, 0x00), (0x09, 0x01, 0x20, 0x00),
-        (0x17, 0x01, 0x20, 0x00), (0x28, 0x01, 0x20, 0x01),
-        (0x02, 0x01, 0x25, 0x00), (0x09, 0x01, 0x25, 0x00),
-        (0x17, 0x01, 0x25, 0x00), (0x28, 0x01, 0x25, 0x01),
-        (0x02, 0x01, 0x2d, 0x00), (0x09, 0x01, 0x2d, 0x00),
-        (0x17, 0x01, 0x2d, 0x00), (0x28, 0x01, 0x2d, 0x01),
-        (0x02, 0x01, 0x2e, 0x00), (0x09, 0x01, 0x2e, 0x00),
-        (0x17, 0x01, 0x2e, 0x00), (0x28, 0x01, 0x2e, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x20, 0x00), (0x06, 0x01, 0x20, 0x00),
-        (0x0a, 0x01, 0x20, 0x00), (0x0f, 0x01, 0x20, 0x00),
-        (0x18, 0x01, 0x20, 0x00), (0x1f, 0x01, 0x20, 0x00),
-        (0x29, 0x01, 0x20, 0x00), (0x38, 0x01, 0x20, 0x01),
-        (0x03, 0x01, 0x25, 0x00), (0x06, 0x01, 0x25, 0x00),
-        (0x0a, 0x01, 0x25, 0x00), (0x0f, 0x01, 0x25, 0x00),
-        (0x18, 0x01, 0x25, 0x00), (0x1f, 0x01, 0x25, 0x00),
-        (0x29, 0x01, 0x25, 0x00), (0x38, 0x01, 0x25, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x2d, 0x00), (0x06, 0x01, 0x2d, 0x00),
-        (0x0a, 0x01, 0x2d, 0x00), (0x0f, 0x01, 0x2d, 0x00),
-        (0x18, 0x01, 0x2d, 0x00), (0x1f, 0x01, 0x2d, 0x00),
-        (0x29, 0x01, 0x2d, 0x00), (0x38, 0x01, 0x2d, 0x01),
-        (0x03, 0x01, 0x2e, 0x00), (0x06, 0x01, 0x2e, 0x00),
-        (0x0a, 0x01, 0x2e, 0x00), (0x0f, 0x01, 0x2e, 0x00),
-        (0x18, 0x01, 0x2e, 0x00), (0x1f, 0x01, 0x2e, 0x00),
-        (0x29, 0x01, 0x2e, 0x00), (0x38, 0x01, 0x2e, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x2f, 0x00), (0x16, 0x01, 0x2f, 0x01),
-        (0x01, 0x01, 0x33, 0x00), (0x16, 0x01, 0x33, 0x01),
-        (0x01, 0x01, 0x34, 0x00), (0x16, 0x01, 0x34, 0x01),
-        (0x01, 0x01, 0x35, 0x00), (0x16, 0x01, 0x35, 0x01),
-        (0x01, 0x01, 0x36, 0x00), (0x16, 0x01, 0x36, 0x01),
-        (0x01, 0x01, 0x37, 0x00), (0x16, 0x01, 0x37, 0x01),
-        (0x01, 0x01, 0x38, 0x00), (0x16, 0x01, 0x38, 0x01),
-        (0x01, 0x01, 0x39, 0x00), (0x16, 0x01, 0x39, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x2f, 0x00), (0x09, 0x01, 0x2f, 0x00),
-        (0x17, 0x01, 0x2f, 0x00), (0x28, 0x01, 0x2f, 0x01),
-        (0x02, 0x01, 0x33, 0x00), (0x09, 0x01, 0x33, 0x00),
-        (0x17, 0x01, 0x33, 0x00), (0x28, 0x01, 0x33, 0x01),
-        (0x02, 0x01, 0x34, 0x00), (0x09, 0x01, 0x34, 0x00),
-        (0x17, 0x01, 0x34, 0x00), (0x28, 0x01, 0x34, 0x01),
-        (0x02, 0x01, 0x35, 0x00), (0x09, 0x01, 0x35, 0x00),
-        (0x17, 0x01, 0x35, 0x00), (0x28, 0x01, 0x35, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x2f, 0x00), (0x06, 0x01, 0x2f, 0x00),
-        (0x0a, 0x01, 0x2f, 0x00), (0x0f, 0x01, 0x2f, 0x00),
-        (0x18, 0x01, 0x2f, 0x00), (0x1f, 0x01, 0x2f, 0x00),
-        (0x29, 0x01, 0x2f, 0x00), (0x38, 0x01, 0x2f, 0x01),
-        (0x03, 0x01, 0x33, 0x00), (0x06, 0x01, 0x33, 0x00),
-        (0x0a, 0x01, 0x33, 0x00), (0x0f, 0x01, 0x33, 0x00),
-        (0x18, 0x01, 0x33, 0x00), (0x1f, 0x01, 0x33, 0x00),
-        (0x29, 0x01, 0x33, 0x00), (0x38, 0x01, 0x33, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x34, 0x00), (0x06, 0x01, 0x34, 0x00),
-        (0x0a, 0x01, 0x34, 0x00), (0x0f, 0x01, 0x34, 0x00),
-        (0x18, 0x01, 0x34, 0x00), (0x1f, 0x01, 0x34, 0x00),
-        (0x29, 0x01, 0x34, 0x00), (0x38, 0x01, 0x34, 0x01),
-        (0x03, 0x01, 0x35, 0x00), (0x06, 0x01, 0x35, 0x00),
-        (0x0a, 0x01, 0x35, 0x00), (0x0f, 0x01, 0x35, 0x00),
-        (0x18, 0x01, 0x35, 0x00), (0x1f, 0x01, 0x35, 0x00),
-        (0x29, 0x01, 0x35, 0x00), (0x38, 0x01, 0x35, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x36, 0x00), (0x09, 0x01, 0x36, 0x00),
-        (0x17, 0x01, 0x36, 0x00), (0x28, 0x01, 0x36, 0x01),
-        (0x02, 0x01, 0x37, 0x00), (0x09, 0x01, 0x37, 0x00),
-        (0x17, 0x01, 0x37, 0x00), (0x28, 0x01, 0x37, 0x01),
-        (0x02, 0x01, 0x38, 0x00), (0x09, 0x01, 0x38, 0x00),
-        (0x17, 0x01, 0x38, 0x00), (0x28, 0x01, 0x38, 0x01),
-        (0x02, 0x01, 0x39, 0x00), (0x09, 0x01, 0x39, 0x00),
-        (0x17, 0x01, 0x39, 0x00), (0x28, 0x01, 0x39, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x36, 0x00), (0x06, 0x01, 0x36, 0x00),
-        (0x0a, 0x01, 0x36, 0x00), (0x0f, 0x01, 0x36, 0x00),
-        (0x18, 0x01, 0x36, 0x00), (0x1f, 0x01, 0x36, 0x00),
-        (0x29, 0x01, 0x36, 0x00), (0x38, 0x01, 0x36, 0x01),
-        (0x03, 0x01, 0x37, 0x00), (0x06, 0x01, 0x37, 0x00),
-        (0x0a, 0x01, 0x37, 0x00), (0x0f, 0x01, 0x37, 0x00),
-        (0x18, 0x01, 0x37, 0x00), (0x1f, 0x01, 0x37, 0x00),
-        (0x29, 0x01, 0x37, 0x00), (0x38, 0x01, 0x37, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x38, 0x00), (0x06, 0x01, 0x38, 0x00),
-        (0x0a, 0x01, 0x38, 0x00), (0x0f, 0x01, 0x38, 0x00),
-        (0x18, 0x01, 0x38, 0x00), (0x1f, 0x01, 0x38, 0x00),
-        (0x29, 0x01, 0x38, 0x00), (0x38, 0x01, 0x38, 0x01),
-        (0x03, 0x01, 0x39, 0x00), (0x06, 0x01, 0x39, 0x00),
-        (0x0a, 0x01, 0x39, 0x00), (0x0f, 0x01, 0x39, 0x00),
-        (0x18, 0x01, 0x39, 0x00), (0x1f, 0x01, 0x39, 0x00),
-        (0x29, 0x01, 0x39, 0x00), (0x38, 0x01, 0x39, 0x01)
-    ),
-    (
-        (0x1a, 0x00, 0x00, 0x00), (0x1b, 0x00, 0x00, 0x00),
-        (0x1d, 0x00, 0x00, 0x00), (0x1e, 0x00, 0x00, 0x00),
-        (0x21, 0x00, 0x00, 0x00), (0x22, 0x00, 0x00, 0x00),
-        (0x24, 0x00, 0x00, 0x00), (0x25, 0x00, 0x00, 0x00),
-        (0x2b, 0x00, 0x00, 0x00), (0x2e, 0x00, 0x00, 0x00),
-        (0x32, 0x00, 0x00, 0x00), (0x35, 0x00, 0x00, 0x00),
-        (0x3a, 0x00, 0x00, 0x00), (0x3d, 0x00, 0x00, 0x00),
-        (0x41, 0x00, 0x00, 0x00), (0x44, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x00, 0x01, 0x3d, 0x01), (0x00, 0x01, 0x41, 0x01),
-        (0x00, 0x01, 0x5f, 0x01), (0x00, 0x01, 0x62, 0x01),
-        (0x00, 0x01, 0x64, 0x01), (0x00, 0x01, 0x66, 0x01),
-        (0x00, 0x01, 0x67, 0x01), (0x00, 0x01, 0x68, 0x01),
-        (0x00, 0x01, 0x6c, 0x01), (0x00, 0x01, 0x6d, 0x01),
-        (0x00, 0x01, 0x6e, 0x01), (0x00, 0x01, 0x70, 0x01),
-        (0x00, 0x01, 0x72, 0x01), (0x00, 0x01, 0x75, 0x01),
-        (0x26, 0x00, 0x00, 0x00), (0x27, 0x00, 0x00, 0x00)
-    ),
-    (
-        (0x01, 0x01, 0x3d, 0x00), (0x16, 0x01, 0x3d, 0x01),
-        (0x01, 0x01, 0x41, 0x00), (0x16, 0x01, 0x41, 0x01),
-        (0x01, 0x01, 0x5f, 0x00), (0x16, 0x01, 0x5f, 0x01),
-        (0x01, 0x01, 0x62, 0x00), (0x16, 0x01, 0x62, 0x01),
-        (0x01, 0x01, 0x64, 0x00), (0x16, 0x01, 0x64, 0x01),
-        (0x01, 0x01, 0x66, 0x00), (0x16, 0x01, 0x66, 0x01),
-        (0x01, 0x01, 0x67, 0x00), (0x16, 0x01, 0x67, 0x01),
-        (0x01, 0x01, 0x68, 0x00), (0x16, 0x01, 0x68, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x3d, 0x00), (0x09, 0x01, 0x3d, 0x00),
-        (0x17, 0x01, 0x3d, 0x00), (0x28, 0x01, 0x3d, 0x01),
-        (0x02, 0x01, 0x41, 0x00), (0x09, 0x01, 0x41, 0x00),
-        (0x17, 0x01, 0x41, 0x00), (0x28, 0x01, 0x41, 0x01),
-        (0x02, 0x01, 0x5f, 0x00), (0x09, 0x01, 0x5f, 0x00),
-        (0x17, 0x01, 0x5f, 0x00), (0x28, 0x01, 0x5f, 0x01),
-        (0x02, 0x01, 0x62, 0x00), (0x09, 0x01, 0x62, 0x00),
-        (0x17, 0x01, 0x62, 0x00), (0x28, 0x01, 0x62, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x3d, 0x00), (0x06, 0x01, 0x3d, 0x00),
-        (0x0a, 0x01, 0x3d, 0x00), (0x0f, 0x01, 0x3d, 0x00),
-        (0x18, 0x01, 0x3d, 0x00), (0x1f, 0x01, 0x3d, 0x00),
-        (0x29, 0x01, 0x3d, 0x00), (0x38, 0x01, 0x3d, 0x01),
-        (0x03, 0x01, 0x41, 0x00), (0x06, 0x01, 0x41, 0x00),
-        (0x0a, 0x01, 0x41, 0x00), (0x0f, 0x01, 0x41, 0x00),
-        (0x18, 0x01, 0x41, 0x00), (0x1f, 0x01, 0x41, 0x00),
-        (0x29, 0x01, 0x41, 0x00), (0x38, 0x01, 0x41, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x5f, 0x00), (0x06, 0x01, 0x5f, 0x00),
-        (0x0a, 0x01, 0x5f, 0x00), (0x0f, 0x01, 0x5f, 0x00),
-        (0x18, 0x01, 0x5f, 0x00), (0x1f, 0x01, 0x5f, 0x00),
-        (0x29, 0x01, 0x5f, 0x00), (0x38, 0x01, 0x5f, 0x01),
-        (0x03, 0x01, 0x62, 0x00), (0x06, 0x01, 0x62, 0x00),
-        (0x0a, 0x01, 0x62, 0x00), (0x0f, 0x01, 0x62, 0x00),
-        (0x18, 0x01, 0x62, 0x00), (0x1f, 0x01, 0x62, 0x00),
-        (0x29, 0x01, 0x62, 0x00), (0x38, 0x01, 0x62, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x64, 0x00), (0x09, 0x01, 0x64, 0x00),
-        (0x17, 0x01, 0x64, 0x00), (0x28, 0x01, 0x64, 0x01),
-        (0x02, 0x01, 0x66, 0x00), (0x09, 0x01, 0x66, 0x00),
-        (0x17, 0x01, 0x66, 0x00), (0x28, 0x01, 0x66, 0x01),
-        (0x02, 0x01, 0x67, 0x00), (0x09, 0x01, 0x67, 0x00),
-        (0x17, 0x01, 0x67, 0x00), (0x28, 0x01, 0x67, 0x01),
-        (0x02, 0x01, 0x68, 0x00), (0x09, 0x01, 0x68, 0x00),
-        (0x17, 0x01, 0x68, 0x00), (0x28, 0x01, 0x68, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x64, 0x00), (0x06, 0x01, 0x64, 0x00),
-        (0x0a, 0x01, 0x64, 0x00), (0x0f, 0x01, 0x64, 0x00),
-        (0x18, 0x01, 0x64, 0x00), (0x1f, 0x01, 0x64, 0x00),
-        (0x29, 0x01, 0x64, 0x00), (0x38, 0x01, 0x64, 0x01),
-        (0x03, 0x01, 0x66, 0x00), (0x06, 0x01, 0x66, 0x00),
-        (0x0a, 0x01, 0x66, 0x00), (0x0f, 0x01, 0x66, 0x00),
-        (0x18, 0x01, 0x66, 0x00), (0x1f, 0x01, 0x66, 0x00),
-        (0x29, 0x01, 0x66, 0x00), (0x38, 0x01, 0x66, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x67, 0x00), (0x06, 0x01, 0x67, 0x00),
-        (0x0a, 0x01, 0x67, 0x00), (0x0f, 0x01, 0x67, 0x00),
-        (0x18, 0x01, 0x67, 0x00), (0x1f, 0x01, 0x67, 0x00),
-        (0x29, 0x01, 0x67, 0x00), (0x38, 0x01, 0x67, 0x01),
-        (0x03, 0x01, 0x68, 0x00), (0x06, 0x01, 0x68, 0x00),
-        (0x0a, 0x01, 0x68, 0x00), (0x0f, 0x01, 0x68, 0x00),
-        (0x18, 0x01, 0x68, 0x00), (0x1f, 0x01, 0x68, 0x00),
-        (0x29, 0x01, 0x68, 0x00), (0x38, 0x01, 0x68, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x6c, 0x00), (0x16, 0x01, 0x6c, 0x01),
-        (0x01, 0x01, 0x6d, 0x00), (0x16, 0x01, 0x6d, 0x01),
-        (0x01, 0x01, 0x6e, 0x00), (0x16, 0x01, 0x6e, 0x01),
-        (0x01, 0x01, 0x70, 0x00), (0x16, 0x01, 0x70, 0x01),
-        (0x01, 0x01, 0x72, 0x00), (0x16, 0x01, 0x72, 0x01),
-        (0x01, 0x01, 0x75, 0x00), (0x16, 0x01, 0x75, 0x01),
-        (0x00, 0x01, 0x3a, 0x01), (0x00, 0x01, 0x42, 0x01),
-        (0x00, 0x01, 0x43, 0x01), (0x00, 0x01, 0x44, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x6c, 0x00), (0x09, 0x01, 0x6c, 0x00),
-        (0x17, 0x01, 0x6c, 0x00), (0x28, 0x01, 0x6c, 0x01),
-        (0x02, 0x01, 0x6d, 0x00), (0x09, 0x01, 0x6d, 0x00),
-        (0x17, 0x01, 0x6d, 0x00), (0x28, 0x01, 0x6d, 0x01),
-        (0x02, 0x01, 0x6e, 0x00), (0x09, 0x01, 0x6e, 0x00),
-        (0x17, 0x01, 0x6e, 0x00), (0x28, 0x01, 0x6e, 0x01),
-        (0x02, 0x01, 0x70, 0x00), (0x09, 0x01, 0x70, 0x00),
-        (0x17, 0x01, 0x70, 0x00), (0x28, 0x01, 0x70, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x6c, 0x00), (0x06, 0x01, 0x6c, 0x00),
-        (0x0a, 0x01, 0x6c, 0x00), (0x0f, 0x01, 0x6c, 0x00),
-        (0x18, 0x01, 0x6c, 0x00), (0x1f, 0x01, 0x6c, 0x00),
-        (0x29, 0x01, 0x6c, 0x00), (0x38, 0x01, 0x6c, 0x01),
-        (0x03, 0x01, 0x6d, 0x00), (0x06, 0x01, 0x6d, 0x00),
-        (0x0a, 0x01, 0x6d, 0x00), (0x0f, 0x01, 0x6d, 0x00),
-        (0x18, 0x01, 0x6d, 0x00), (0x1f, 0x01, 0x6d, 0x00),
-        (0x29, 0x01, 0x6d, 0x00), (0x38, 0x01, 0x6d, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x6e, 0x00), (0x06, 0x01, 0x6e, 0x00),
-        (0x0a, 0x01, 0x6e, 0x00), (0x0f, 0x01, 0x6e, 0x00),
-        (0x18, 0x01, 0x6e, 0x00), (0x1f, 0x01, 0x6e, 0x00),
-        (0x29, 0x01, 0x6e, 0x00), (0x38, 0x01, 0x6e, 0x01),
-        (0x03, 0x01, 0x70, 0x00), (0x06, 0x01, 0x70, 0x00),
-        (0x0a, 0x01, 0x70, 0x00), (0x0f, 0x01, 0x70, 0x00),
-        (0x18, 0x01, 0x70, 0x00), (0x1f, 0x01, 0x70, 0x00),
-        (0x29, 0x01, 0x70, 0x00), (0x38, 0x01, 0x70, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x72, 0x00), (0x09, 0x01, 0x72, 0x00),
-        (0x17, 0x01, 0x72, 0x00), (0x28, 0x01, 0x72, 0x01),
-        (0x02, 0x01, 0x75, 0x00), (0x09, 0x01, 0x75, 0x00),
-        (0x17, 0x01, 0x75, 0x00), (0x28, 0x01, 0x75, 0x01),
-        (0x01, 0x01, 0x3a, 0x00), (0x16, 0x01, 0x3a, 0x01),
-        (0x01, 0x01, 0x42, 0x00), (0x16, 0x01, 0x42, 0x01),
-        (0x01, 0x01, 0x43, 0x00), (0x16, 0x01, 0x43, 0x01),
-        (0x01, 0x01, 0x44, 0x00), (0x16, 0x01, 0x44, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x72, 0x00), (0x06, 0x01, 0x72, 0x00),
-        (0x0a, 0x01, 0x72, 0x00), (0x0f, 0x01, 0x72, 0x00),
-        (0x18, 0x01, 0x72, 0x00), (0x1f, 0x01, 0x72, 0x00),
-        (0x29, 0x01, 0x72, 0x00), (0x38, 0x01, 0x72, 0x01),
-        (0x03, 0x01, 0x75, 0x00), (0x06, 0x01, 0x75, 0x00),
-        (0x0a, 0x01, 0x75, 0x00), (0x0f, 0x01, 0x75, 0x00),
-        (0x18, 0x01, 0x75, 0x00), (0x1f, 0x01, 0x75, 0x00),
-        (0x29, 0x01, 0x75, 0x00), (0x38, 0x01, 0x75, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x3a, 0x00), (0x09, 0x01, 0x3a, 0x00),
-        (0x17, 0x01, 0x3a, 0x00), (0x28, 0x01, 0x3a, 0x01),
-        (0x02, 0x01, 0x42, 0x00), (0x09, 0x01, 0x42, 0x00),
-        (0x17, 0x01, 0x42, 0x00), (0x28, 0x01, 0x42, 0x01),
-        (0x02, 0x01, 0x43, 0x00), (0x09, 0x01, 0x43, 0x00),
-        (0x17, 0x01, 0x43, 0x00), (0x28, 0x01, 0x43, 0x01),
-        (0x02, 0x01, 0x44, 0x00), (0x09, 0x01, 0x44, 0x00),
-        (0x17, 0x01, 0x44, 0x00), (0x28, 0x01, 0x44, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x3a, 0x00), (0x06, 0x01, 0x3a, 0x00),
-        (0x0a, 0x01, 0x3a, 0x00), (0x0f, 0x01, 0x3a, 0x00),
-        (0x18, 0x01, 0x3a, 0x00), (0x1f, 0x01, 0x3a, 0x00),
-        (0x29, 0x01, 0x3a, 0x00), (0x38, 0x01, 0x3a, 0x01),
-        (0x03, 0x01, 0x42, 0x00), (0x06, 0x01, 0x42, 0x00),
-        (0x0a, 0x01, 0x42, 0x00), (0x0f, 0x01, 0x42, 0x00),
-        (0x18, 0x01, 0x42, 0x00), (0x1f, 0x01, 0x42, 0x00),
-        (0x29, 0x01, 0x42, 0x00), (0x38, 0x01, 0x42, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x43, 0x00), (0x06, 0x01, 0x43, 0x00),
-        (0x0a, 0x01, 0x43, 0x00), (0x0f, 0x01, 0x43, 0x00),
-        (0x18, 0x01, 0x43, 0x00), (0x1f, 0x01, 0x43, 0x00),
-        (0x29, 0x01, 0x43, 0x00), (0x38, 0x01, 0x43, 0x01),
-        (0x03, 0x01, 0x44, 0x00), (0x06, 0x01, 0x44, 0x00),
-        (0x0a, 0x01, 0x44, 0x00), (0x0f, 0x01, 0x44, 0x00),
-        (0x18, 0x01, 0x44, 0x00), (0x1f, 0x01, 0x44, 0x00),
-        (0x29, 0x01, 0x44, 0x00), (0x38, 0x01, 0x44, 0x01)
-    ),
-    (
-        (0x2c, 0x00, 0x00, 0x00), (0x2d, 0x00, 0x00, 0x00),
-        (0x2f, 0x00, 0x00, 0x00), (0x30, 0x00, 0x00, 0x00),
-        (0x33, 0x00, 0x00, 0x00), (0x34, 0x00, 0x00, 0x00),
-        (0x36, 0x00, 0x00, 0x00), (0x37, 0x00, 0x00, 0x00),
-        (0x3b, 0x00, 0x00, 0x00), (0x3c, 0x00, 0x00, 0x00),
-        (0x3e, 0x00, 0x00, 0x00), (0x3f, 0x00, 0x00, 0x00),
-        (0x42, 0x00, 0x00, 0x00), (0x43, 0x00, 0x00, 0x00),
-        (0x45, 0x00, 0x00, 0x00), (0x48, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x00, 0x01, 0x45, 0x01), (0x00, 0x01, 0x46, 0x01),
-        (0x00, 0x01, 0x47, 0x01), (0x00, 0x01, 0x48, 0x01),
-        (0x00, 0x01, 0x49, 0x01), (0x00, 0x01, 0x4a, 0x01),
-        (0x00, 0x01, 0x4b, 0x01), (0x00, 0x01, 0x4c, 0x01),
-        (0x00, 0x01, 0x4d, 0x01), (0x00, 0x01, 0x4e, 0x01),
-        (0x00, 0x01, 0x4f, 0x01), (0x00, 0x01, 0x50, 0x01),
-        (0x00, 0x01, 0x51, 0x01), (0x00, 0x01, 0x52, 0x01),
-        (0x00, 0x01, 0x53, 0x01), (0x00, 0x01, 0x54, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x45, 0x00), (0x16, 0x01, 0x45, 0x01),
-        (0x01, 0x01, 0x46, 0x00), (0x16, 0x01, 0x46, 0x01),
-        (0x01, 0x01, 0x47, 0x00), (0x16, 0x01, 0x47, 0x01),
-        (0x01, 0x01, 0x48, 0x00), (0x16, 0x01, 0x48, 0x01),
-        (0x01, 0x01, 0x49, 0x00), (0x16, 0x01, 0x49, 0x01),
-        (0x01, 0x01, 0x4a, 0x00), (0x16, 0x01, 0x4a, 0x01),
-        (0x01, 0x01, 0x4b, 0x00), (0x16, 0x01, 0x4b, 0x01),
-        (0x01, 0x01, 0x4c, 0x00), (0x16, 0x01, 0x4c, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x45, 0x00), (0x09, 0x01, 0x45, 0x00),
-        (0x17, 0x01, 0x45, 0x00), (0x28, 0x01, 0x45, 0x01),
-        (0x02, 0x01, 0x46, 0x00), (0x09, 0x01, 0x46, 0x00),
-        (0x17, 0x01, 0x46, 0x00), (0x28, 0x01, 0x46, 0x01),
-        (0x02, 0x01, 0x47, 0x00), (0x09, 0x01, 0x47, 0x00),
-        (0x17, 0x01, 0x47, 0x00), (0x28, 0x01, 0x47, 0x01),
-        (0x02, 0x01, 0x48, 0x00), (0x09, 0x01, 0x48, 0x00),
-        (0x17, 0x01, 0x48, 0x00), (0x28, 0x01, 0x48, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x45, 0x00), (0x06, 0x01, 0x45, 0x00),
-        (0x0a, 0x01, 0x45, 0x00), (0x0f, 0x01, 0x45, 0x00),
-        (0x18, 0x01, 0x45, 0x00), (0x1f, 0x01, 0x45, 0x00),
-        (0x29, 0x01, 0x45, 0x00), (0x38, 0x01, 0x45, 0x01),
-        (0x03, 0x01, 0x46, 0x00), (0x06, 0x01, 0x46, 0x00),
-        (0x0a, 0x01, 0x46, 0x00), (0x0f, 0x01, 0x46, 0x00),
-        (0x18, 0x01, 0x46, 0x00), (0x1f, 0x01, 0x46, 0x00),
-        (0x29, 0x01, 0x46, 0x00), (0x38, 0x01, 0x46, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x47, 0x00), (0x06, 0x01, 0x47, 0x00),
-        (0x0a, 0x01, 0x47, 0x00), (0x0f, 0x01, 0x47, 0x00),
-        (0x18, 0x01, 0x47, 0x00), (0x1f, 0x01, 0x47, 0x00),
-        (0x29, 0x01, 0x47, 0x00), (0x38, 0x01, 0x47, 0x01),
-        (0x03, 0x01, 0x48, 0x00), (0x06, 0x01, 0x48, 0x00),
-        (0x0a, 0x01, 0x48, 0x00), (0x0f, 0x01, 0x48, 0x00),
-        (0x18, 0x01, 0x48, 0x00), (0x1f, 0x01, 0x48, 0x00),
-        (0x29, 0x01, 0x48, 0x00), (0x38, 0x01, 0x48, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x49, 0x00), (0x09, 0x01, 0x49, 0x00),
-        (0x17, 0x01, 0x49, 0x00), (0x28, 0x01, 0x49, 0x01),
-        (0x02, 0x01, 0x4a, 0x00), (0x09, 0x01, 0x4a, 0x00),
-        (0x17, 0x01, 0x4a, 0x00), (0x28, 0x01, 0x4a, 0x01),
-        (0x02, 0x01, 0x4b, 0x00), (0x09, 0x01, 0x4b, 0x00),
-        (0x17, 0x01, 0x4b, 0x00), (0x28, 0x01, 0x4b, 0x01),
-        (0x02, 0x01, 0x4c, 0x00), (0x09, 0x01, 0x4c, 0x00),
-        (0x17, 0x01, 0x4c, 0x00), (0x28, 0x01, 0x4c, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x49, 0x00), (0x06, 0x01, 0x49, 0x00),
-        (0x0a, 0x01, 0x49, 0x00), (0x0f, 0x01, 0x49, 0x00),
-        (0x18, 0x01, 0x49, 0x00), (0x1f, 0x01, 0x49, 0x00),
-        (0x29, 0x01, 0x49, 0x00), (0x38, 0x01, 0x49, 0x01),
-        (0x03, 0x01, 0x4a, 0x00), (0x06, 0x01, 0x4a, 0x00),
-        (0x0a, 0x01, 0x4a, 0x00), (0x0f, 0x01, 0x4a, 0x00),
-        (0x18, 0x01, 0x4a, 0x00), (0x1f, 0x01, 0x4a, 0x00),
-        (0x29, 0x01, 0x4a, 0x00), (0x38, 0x01, 0x4a, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x4b, 0x00), (0x06, 0x01, 0x4b, 0x00),
-        (0x0a, 0x01, 0x4b, 0x00), (0x0f, 0x01, 0x4b, 0x00),
-        (0x18, 0x01, 0x4b, 0x00), (0x1f, 0x01, 0x4b, 0x00),
-        (0x29, 0x01, 0x4b, 0x00), (0x38, 0x01, 0x4b, 0x01),
-        (0x03, 0x01, 0x4c, 0x00), (0x06, 0x01, 0x4c, 0x00),
-        (0x0a, 0x01, 0x4c, 0x00), (0x0f, 0x01, 0x4c, 0x00),
-        (0x18, 0x01, 0x4c, 0x00), (0x1f, 0x01, 0x4c, 0x00),
-        (0x29, 0x01, 0x4c, 0x00), (0x38, 0x01, 0x4c, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x4d, 0x00), (0x16, 0x01, 0x4d, 0x01),
-        (0x01, 0x01, 0x4e, 0x00), (0x16, 0x01, 0x4e, 0x01),
-        (0x01, 0x01, 0x4f, 0x00), (0x16, 0x01, 0x4f, 0x01),
-        (0x01, 0x01, 0x50, 0x00), (0x16, 0x01, 0x50, 0x01),
-        (0x01, 0x01, 0x51, 0x00), (0x16, 0x01, 0x51, 0x01),
-        (0x01, 0x01, 0x52, 0x00), (0x16, 0x01, 0x52, 0x01),
-        (0x01, 0x01, 0x53, 0x00), (0x16, 0x01, 0x53, 0x01),
-        (0x01, 0x01, 0x54, 0x00), (0x16, 0x01, 0x54, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x4d, 0x00), (0x09, 0x01, 0x4d, 0x00),
-        (0x17, 0x01, 0x4d, 0x00), (0x28, 0x01, 0x4d, 0x01),
-        (0x02, 0x01, 0x4e, 0x00), (0x09, 0x01, 0x4e, 0x00),
-        (0x17, 0x01, 0x4e, 0x00), (0x28, 0x01, 0x4e, 0x01),
-        (0x02, 0x01, 0x4f, 0x00), (0x09, 0x01, 0x4f, 0x00),
-        (0x17, 0x01, 0x4f, 0x00), (0x28, 0x01, 0x4f, 0x01),
-        (0x02, 0x01, 0x50, 0x00), (0x09, 0x01, 0x50, 0x00),
-        (0x17, 0x01, 0x50, 0x00), (0x28, 0x01, 0x50, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x4d, 0x00), (0x06, 0x01, 0x4d, 0x00),
-        (0x0a, 0x01, 0x4d, 0x00), (0x0f, 0x01, 0x4d, 0x00),
-        (0x18, 0x01, 0x4d, 0x00), (0x1f, 0x01, 0x4d, 0x00),
-        (0x29, 0x01, 0x4d, 0x00), (0x38, 0x01, 0x4d, 0x01),
-        (0x03, 0x01, 0x4e, 0x00), (0x06, 0x01, 0x4e, 0x00),
-        (0x0a, 0x01, 0x4e, 0x00), (0x0f, 0x01, 0x4e, 0x00),
-        (0x18, 0x01, 0x4e, 0x00), (0x1f, 0x01, 0x4e, 0x00),
-        (0x29, 0x01, 0x4e, 0x00), (0x38, 0x01, 0x4e, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x4f, 0x00), (0x06, 0x01, 0x4f, 0x00),
-        (0x0a, 0x01, 0x4f, 0x00), (0x0f, 0x01, 0x4f, 0x00),
-        (0x18, 0x01, 0x4f, 0x00), (0x1f, 0x01, 0x4f, 0x00),
-        (0x29, 0x01, 0x4f, 0x00), (0x38, 0x01, 0x4f, 0x01),
-        (0x03, 0x01, 0x50, 0x00), (0x06, 0x01, 0x50, 0x00),
-        (0x0a, 0x01, 0x50, 0x00), (0x0f, 0x01, 0x50, 0x00),
-        (0x18, 0x01, 0x50, 0x00), (0x1f, 0x01, 0x50, 0x00),
-        (0x29, 0x01, 0x50, 0x00), (0x38, 0x01, 0x50, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x51, 0x00), (0x09, 0x01, 0x51, 0x00),
-        (0x17, 0x01, 0x51, 0x00), (0x28, 0x01, 0x51, 0x01),
-        (0x02, 0x01, 0x52, 0x00), (0x09, 0x01, 0x52, 0x00),
-        (0x17, 0x01, 0x52, 0x00), (0x28, 0x01, 0x52, 0x01),
-        (0x02, 0x01, 0x53, 0x00), (0x09, 0x01, 0x53, 0x00),
-        (0x17, 0x01, 0x53, 0x00), (0x28, 0x01, 0x53, 0x01),
-        (0x02, 0x01, 0x54, 0x00), (0x09, 0x01, 0x54, 0x00),
-        (0x17, 0x01, 0x54, 0x00), (0x28, 0x01, 0x54, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x51, 0x00), (0x06, 0x01, 0x51, 0x00),
-        (0x0a, 0x01, 0x51, 0x00), (0x0f, 0x01, 0x51, 0x00),
-        (0x18, 0x01, 0x51, 0x00), (0x1f, 0x01, 0x51, 0x00),
-        (0x29, 0x01, 0x51, 0x00), (0x38, 0x01, 0x51, 0x01),
-        (0x03, 0x01, 0x52, 0x00), (0x06, 0x01, 0x52, 0x00),
-        (0x0a, 0x01, 0x52, 0x00), (0x0f, 0x01, 0x52, 0x00),
-        (0x18, 0x01, 0x52, 0x00), (0x1f, 0x01, 0x52, 0x00),
-        (0x29, 0x01, 0x52, 0x00), (0x38, 0x01, 0x52, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x53, 0x00), (0x06, 0x01, 0x53, 0x00),
-        (0x0a, 0x01, 0x53, 0x00), (0x0f, 0x01, 0x53, 0x00),
-        (0x18, 0x01, 0x53, 0x00), (0x1f, 0x01, 0x53, 0x00),
-        (0x29, 0x01, 0x53, 0x00), (0x38, 0x01, 0x53, 0x01),
-        (0x03, 0x01, 0x54, 0x00), (0x06, 0x01, 0x54, 0x00),
-        (0x0a, 0x01, 0x54, 0x00), (0x0f, 0x01, 0x54, 0x00),
-        (0x18, 0x01, 0x54, 0x00), (0x1f, 0x01, 0x54, 0x00),
-        (0x29, 0x01, 0x54, 0x00), (0x38, 0x01, 0x54, 0x01)
-    ),
-    (
-        (0x00, 0x01, 0x55, 0x01), (0x00, 0x01, 0x56, 0x01),
-        (0x00, 0x01, 0x57, 0x01), (0x00, 0x01, 0x59, 0x01),
-        (0x00, 0x01, 0x6a, 0x01), (0x00, 0x01, 0x6b, 0x01),
-        (0x00, 0x01, 0x71, 0x01), (0x00, 0x01, 0x76, 0x01),
-        (0x00, 0x01, 0x77, 0x01), (0x00, 0x01, 0x78, 0x01),
-        (0x00, 0x01, 0x79, 0x01), (0x00, 0x01, 0x7a, 0x01),
-        (0x46, 0x00, 0x00, 0x00), (0x47, 0x00, 0x00, 0x00),
-        (0x49, 0x00, 0x00, 0x00), (0x4a, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x55, 0x00), (0x16, 0x01, 0x55, 0x01),
-        (0x01, 0x01, 0x56, 0x00), (0x16, 0x01, 0x56, 0x01),
-        (0x01, 0x01, 0x57, 0x00), (0x16, 0x01, 0x57, 0x01),
-        (0x01, 0x01, 0x59, 0x00), (0x16, 0x01, 0x59, 0x01),
-        (0x01, 0x01, 0x6a, 0x00), (0x16, 0x01, 0x6a, 0x01),
-        (0x01, 0x01, 0x6b, 0x00), (0x16, 0x01, 0x6b, 0x01),
-        (0x01, 0x01, 0x71, 0x00), (0x16, 0x01, 0x71, 0x01),
-        (0x01, 0x01, 0x76, 0x00), (0x16, 0x01, 0x76, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x55, 0x00), (0x09, 0x01, 0x55, 0x00),
-        (0x17, 0x01, 0x55, 0x00), (0x28, 0x01, 0x55, 0x01),
-        (0x02, 0x01, 0x56, 0x00), (0x09, 0x01, 0x56, 0x00),
-        (0x17, 0x01, 0x56, 0x00), (0x28, 0x01, 0x56, 0x01),
-        (0x02, 0x01, 0x57, 0x00), (0x09, 0x01, 0x57, 0x00),
-        (0x17, 0x01, 0x57, 0x00), (0x28, 0x01, 0x57, 0x01),
-        (0x02, 0x01, 0x59, 0x00), (0x09, 0x01, 0x59, 0x00),
-        (0x17, 0x01, 0x59, 0x00), (0x28, 0x01, 0x59, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x55, 0x00), (0x06, 0x01, 0x55, 0x00),
-        (0x0a, 0x01, 0x55, 0x00), (0x0f, 0x01, 0x55, 0x00),
-        (0x18, 0x01, 0x55, 0x00), (0x1f, 0x01, 0x55, 0x00),
-        (0x29, 0x01, 0x55, 0x00), (0x38, 0x01, 0x55, 0x01),
-        (0x03, 0x01, 0x56, 0x00), (0x06, 0x01, 0x56, 0x00),
-        (0x0a, 0x01, 0x56, 0x00), (0x0f, 0x01, 0x56, 0x00),
-        (0x18, 0x01, 0x56, 0x00), (0x1f, 0x01, 0x56, 0x00),
-        (0x29, 0x01, 0x56, 0x00), (0x38, 0x01, 0x56, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x57, 0x00), (0x06, 0x01, 0x57, 0x00),
-        (0x0a, 0x01, 0x57, 0x00), (0x0f, 0x01, 0x57, 0x00),
-        (0x18, 0x01, 0x57, 0x00), (0x1f, 0x01, 0x57, 0x00),
-        (0x29, 0x01, 0x57, 0x00), (0x38, 0x01, 0x57, 0x01),
-        (0x03, 0x01, 0x59, 0x00), (0x06, 0x01, 0x59, 0x00),
-        (0x0a, 0x01, 0x59, 0x00), (0x0f, 0x01, 0x59, 0x00),
-        (0x18, 0x01, 0x59, 0x00), (0x1f, 0x01, 0x59, 0x00),
-        (0x29, 0x01, 0x59, 0x00), (0x38, 0x01, 0x59, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x6a, 0x00), (0x09, 0x01, 0x6a, 0x00),
-        (0x17, 0x01, 0x6a, 0x00), (0x28, 0x01, 0x6a, 0x01),
-        (0x02, 0x01, 0x6b, 0x00), (0x09, 0x01, 0x6b, 0x00),
-        (0x17, 0x01, 0x6b, 0x00), (0x28, 0x01, 0x6b, 0x01),
-        (0x02, 0x01, 0x71, 0x00), (0x09, 0x01, 0x71, 0x00),
-        (0x17, 0x01, 0x71, 0x00), (0x28, 0x01, 0x71, 0x01),
-        (0x02, 0x01, 0x76, 0x00), (0x09, 0x01, 0x76, 0x00),
-        (0x17, 0x01, 0x76, 0x00), (0x28, 0x01, 0x76, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x6a, 0x00), (0x06, 0x01, 0x6a, 0x00),
-        (0x0a, 0x01, 0x6a, 0x00), (0x0f, 0x01, 0x6a, 0x00),
-        (0x18, 0x01, 0x6a, 0x00), (0x1f, 0x01, 0x6a, 0x00),
-        (0x29, 0x01, 0x6a, 0x00), (0x38, 0x01, 0x6a, 0x01),
-        (0x03, 0x01, 0x6b, 0x00), (0x06, 0x01, 0x6b, 0x00),
-        (0x0a, 0x01, 0x6b, 0x00), (0x0f, 0x01, 0x6b, 0x00),
-        (0x18, 0x01, 0x6b, 0x00), (0x1f, 0x01, 0x6b, 0x00),
-        (0x29, 0x01, 0x6b, 0x00), (0x38, 0x01, 0x6b, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x71, 0x00), (0x06, 0x01, 0x71, 0x00),
-        (0x0a, 0x01, 0x71, 0x00), (0x0f, 0x01, 0x71, 0x00),
-        (0x18, 0x01, 0x71, 0x00), (0x1f, 0x01, 0x71, 0x00),
-        (0x29, 0x01, 0x71, 0x00), (0x38, 0x01, 0x71, 0x01),
-        (0x03, 0x01, 0x76, 0x00), (0x06, 0x01, 0x76, 0x00),
-        (0x0a, 0x01, 0x76, 0x00), (0x0f, 0x01, 0x76, 0x00),
-        (0x18, 0x01, 0x76, 0x00), (0x1f, 0x01, 0x76, 0x00),
-        (0x29, 0x01, 0x76, 0x00), (0x38, 0x01, 0x76, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x77, 0x00), (0x16, 0x01, 0x77, 0x01),
-        (0x01, 0x01, 0x78, 0x00), (0x16, 0x01, 0x78, 0x01),
-        (0x01, 0x01, 0x79, 0x00), (0x16, 0x01, 0x79, 0x01),
-        (0x01, 0x01, 0x7a, 0x00), (0x16, 0x01, 0x7a, 0x01),
-        (0x00, 0x01, 0x26, 0x01), (0x00, 0x01, 0x2a, 0x01),
-        (0x00, 0x01, 0x2c, 0x01), (0x00, 0x01, 0x3b, 0x01),
-        (0x00, 0x01, 0x58, 0x01), (0x00, 0x01, 0x5a, 0x01),
-        (0x4b, 0x00, 0x00, 0x00), (0x4e, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x77, 0x00), (0x09, 0x01, 0x77, 0x00),
-        (0x17, 0x01, 0x77, 0x00), (0x28, 0x01, 0x77, 0x01),
-        (0x02, 0x01, 0x78, 0x00), (0x09, 0x01, 0x78, 0x00),
-        (0x17, 0x01, 0x78, 0x00), (0x28, 0x01, 0x78, 0x01),
-        (0x02, 0x01, 0x79, 0x00), (0x09, 0x01, 0x79, 0x00),
-        (0x17, 0x01, 0x79, 0x00), (0x28, 0x01, 0x79, 0x01),
-        (0x02, 0x01, 0x7a, 0x00), (0x09, 0x01, 0x7a, 0x00),
-        (0x17, 0x01, 0x7a, 0x00), (0x28, 0x01, 0x7a, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x77, 0x00), (0x06, 0x01, 0x77, 0x00),
-        (0x0a, 0x01, 0x77, 0x00), (0x0f, 0x01, 0x77, 0x00),
-        (0x18, 0x01, 0x77, 0x00), (0x1f, 0x01, 0x77, 0x00),
-        (0x29, 0x01, 0x77, 0x00), (0x38, 0x01, 0x77, 0x01),
-        (0x03, 0x01, 0x78, 0x00), (0x06, 0x01, 0x78, 0x00),
-        (0x0a, 0x01, 0x78, 0x00), (0x0f, 0x01, 0x78, 0x00),
-        (0x18, 0x01, 0x78, 0x00), (0x1f, 0x01, 0x78, 0x00),
-        (0x29, 0x01, 0x78, 0x00), (0x38, 0x01, 0x78, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x79, 0x00), (0x06, 0x01, 0x79, 0x00),
-        (0x0a, 0x01, 0x79, 0x00), (0x0f, 0x01, 0x79, 0x00),
-        (0x18, 0x01, 0x79, 0x00), (0x1f, 0x01, 0x79, 0x00),
-        (0x29, 0x01, 0x79, 0x00), (0x38, 0x01, 0x79, 0x01),
-        (0x03, 0x01, 0x7a, 0x00), (0x06, 0x01, 0x7a, 0x00),
-        (0x0a, 0x01, 0x7a, 0x00), (0x0f, 0x01, 0x7a, 0x00),
-        (0x18, 0x01, 0x7a, 0x00), (0x1f, 0x01, 0x7a, 0x00),
-        (0x29, 0x01, 0x7a, 0x00), (0x38, 0x01, 0x7a, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x26, 0x00), (0x16, 0x01, 0x26, 0x01),
-        (0x01, 0x01, 0x2a, 0x00), (0x16, 0x01, 0x2a, 0x01),
-        (0x01, 0x01, 0x2c, 0x00), (0x16, 0x01, 0x2c, 0x01),
-        (0x01, 0x01, 0x3b, 0x00), (0x16, 0x01, 0x3b, 0x01),
-        (0x01, 0x01, 0x58, 0x00), (0x16, 0x01, 0x58, 0x01),
-        (0x01, 0x01, 0x5a, 0x00), (0x16, 0x01, 0x5a, 0x01),
-        (0x4c, 0x00, 0x00, 0x00), (0x4d, 0x00, 0x00, 0x00),
-        (0x4f, 0x00, 0x00, 0x00), (0x51, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x26, 0x00), (0x09, 0x01, 0x26, 0x00),
-        (0x17, 0x01, 0x26, 0x00), (0x28, 0x01, 0x26, 0x01),
-        (0x02, 0x01, 0x2a, 0x00), (0x09, 0x01, 0x2a, 0x00),
-        (0x17, 0x01, 0x2a, 0x00), (0x28, 0x01, 0x2a, 0x01),
-        (0x02, 0x01, 0x2c, 0x00), (0x09, 0x01, 0x2c, 0x00),
-        (0x17, 0x01, 0x2c, 0x00), (0x28, 0x01, 0x2c, 0x01),
-        (0x02, 0x01, 0x3b, 0x00), (0x09, 0x01, 0x3b, 0x00),
-        (0x17, 0x01, 0x3b, 0x00), (0x28, 0x01, 0x3b, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x26, 0x00), (0x06, 0x01, 0x26, 0x00),
-        (0x0a, 0x01, 0x26, 0x00), (0x0f, 0x01, 0x26, 0x00),
-        (0x18, 0x01, 0x26, 0x00), (0x1f, 0x01, 0x26, 0x00),
-        (0x29, 0x01, 0x26, 0x00), (0x38, 0x01, 0x26, 0x01),
-        (0x03, 0x01, 0x2a, 0x00), (0x06, 0x01, 0x2a, 0x00),
-        (0x0a, 0x01, 0x2a, 0x00), (0x0f, 0x01, 0x2a, 0x00),
-        (0x18, 0x01, 0x2a, 0x00), (0x1f, 0x01, 0x2a, 0x00),
-        (0x29, 0x01, 0x2a, 0x00), (0x38, 0x01, 0x2a, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x2c, 0x00), (0x06, 0x01, 0x2c, 0x00),
-        (0x0a, 0x01, 0x2c, 0x00), (0x0f, 0x01, 0x2c, 0x00),
-        (0x18, 0x01, 0x2c, 0x00), (0x1f, 0x01, 0x2c, 0x00),
-        (0x29, 0x01, 0x2c, 0x00), (0x38, 0x01, 0x2c, 0x01),
-        (0x03, 0x01, 0x3b, 0x00), (0x06, 0x01, 0x3b, 0x00),
-        (0x0a, 0x01, 0x3b, 0x00), (0x0f, 0x01, 0x3b, 0x00),
-        (0x18, 0x01, 0x3b, 0x00), (0x1f, 0x01, 0x3b, 0x00),
-        (0x29, 0x01, 0x3b, 0x00), (0x38, 0x01, 0x3b, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x58, 0x00), (0x09, 0x01, 0x58, 0x00),
-        (0x17, 0x01, 0x58, 0x00), (0x28, 0x01, 0x58, 0x01),
-        (0x02, 0x01, 0x5a, 0x00), (0x09, 0x01, 0x5a, 0x00),
-        (0x17, 0x01, 0x5a, 0x00), (0x28, 0x01, 0x5a, 0x01),
-        (0x00, 0x01, 0x21, 0x01), (0x00, 0x01, 0x22, 0x01),
-        (0x00, 0x01, 0x28, 0x01), (0x00, 0x01, 0x29, 0x01),
-        (0x00, 0x01, 0x3f, 0x01), (0x50, 0x00, 0x00, 0x00),
-        (0x52, 0x00, 0x00, 0x00), (0x54, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x58, 0x00), (0x06, 0x01, 0x58, 0x00),
-        (0x0a, 0x01, 0x58, 0x00), (0x0f, 0x01, 0x58, 0x00),
-        (0x18, 0x01, 0x58, 0x00), (0x1f, 0x01, 0x58, 0x00),
-        (0x29, 0x01, 0x58, 0x00), (0x38, 0x01, 0x58, 0x01),
-        (0x03, 0x01, 0x5a, 0x00), (0x06, 0x01, 0x5a, 0x00),
-        (0x0a, 0x01, 0x5a, 0x00), (0x0f, 0x01, 0x5a, 0x00),
-        (0x18, 0x01, 0x5a, 0x00), (0x1f, 0x01, 0x5a, 0x00),
-        (0x29, 0x01, 0x5a, 0x00), (0x38, 0x01, 0x5a, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x21, 0x00), (0x16, 0x01, 0x21, 0x01),
-        (0x01, 0x01, 0x22, 0x00), (0x16, 0x01, 0x22, 0x01),
-        (0x01, 0x01, 0x28, 0x00), (0x16, 0x01, 0x28, 0x01),
-        (0x01, 0x01, 0x29, 0x00), (0x16, 0x01, 0x29, 0x01),
-        (0x01, 0x01, 0x3f, 0x00), (0x16, 0x01, 0x3f, 0x01),
-        (0x00, 0x01, 0x27, 0x01), (0x00, 0x01, 0x2b, 0x01),
-        (0x00, 0x01, 0x7c, 0x01), (0x53, 0x00, 0x00, 0x00),
-        (0x55, 0x00, 0x00, 0x00), (0x58, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x21, 0x00), (0x09, 0x01, 0x21, 0x00),
-        (0x17, 0x01, 0x21, 0x00), (0x28, 0x01, 0x21, 0x01),
-        (0x02, 0x01, 0x22, 0x00), (0x09, 0x01, 0x22, 0x00),
-        (0x17, 0x01, 0x22, 0x00), (0x28, 0x01, 0x22, 0x01),
-        (0x02, 0x01, 0x28, 0x00), (0x09, 0x01, 0x28, 0x00),
-        (0x17, 0x01, 0x28, 0x00), (0x28, 0x01, 0x28, 0x01),
-        (0x02, 0x01, 0x29, 0x00), (0x09, 0x01, 0x29, 0x00),
-        (0x17, 0x01, 0x29, 0x00), (0x28, 0x01, 0x29, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x21, 0x00), (0x06, 0x01, 0x21, 0x00),
-        (0x0a, 0x01, 0x21, 0x00), (0x0f, 0x01, 0x21, 0x00),
-        (0x18, 0x01, 0x21, 0x00), (0x1f, 0x01, 0x21, 0x00),
-        (0x29, 0x01, 0x21, 0x00), (0x38, 0x01, 0x21, 0x01),
-        (0x03, 0x01, 0x22, 0x00), (0x06, 0x01, 0x22, 0x00),
-        (0x0a, 0x01, 0x22, 0x00), (0x0f, 0x01, 0x22, 0x00),
-        (0x18, 0x01, 0x22, 0x00), (0x1f, 0x01, 0x22, 0x00),
-        (0x29, 0x01, 0x22, 0x00), (0x38, 0x01, 0x22, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x28, 0x00), (0x06, 0x01, 0x28, 0x00),
-        (0x0a, 0x01, 0x28, 0x00), (0x0f, 0x01, 0x28, 0x00),
-        (0x18, 0x01, 0x28, 0x00), (0x1f, 0x01, 0x28, 0x00),
-        (0x29, 0x01, 0x28, 0x00), (0x38, 0x01, 0x28, 0x01),
-        (0x03, 0x01, 0x29, 0x00), (0x06, 0x01, 0x29, 0x00),
-        (0x0a, 0x01, 0x29, 0x00), (0x0f, 0x01, 0x29, 0x00),
-        (0x18, 0x01, 0x29, 0x00), (0x1f, 0x01, 0x29, 0x00),
-        (0x29, 0x01, 0x29, 0x00), (0x38, 0x01, 0x29, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x3f, 0x00), (0x09, 0x01, 0x3f, 0x00),
-        (0x17, 0x01, 0x3f, 0x00), (0x28, 0x01, 0x3f, 0x01),
-        (0x01, 0x01, 0x27, 0x00), (0x16, 0x01, 0x27, 0x01),
-        (0x01, 0x01, 0x2b, 0x00), (0x16, 0x01, 0x2b, 0x01),
-        (0x01, 0x01, 0x7c, 0x00), (0x16, 0x01, 0x7c, 0x01),
-        (0x00, 0x01, 0x23, 0x01), (0x00, 0x01, 0x3e, 0x01),
-        (0x56, 0x00, 0x00, 0x00), (0x57, 0x00, 0x00, 0x00),
-        (0x59, 0x00, 0x00, 0x00), (0x5a, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x3f, 0x00), (0x06, 0x01, 0x3f, 0x00),
-        (0x0a, 0x01, 0x3f, 0x00), (0x0f, 0x01, 0x3f, 0x00),
-        (0x18, 0x01, 0x3f, 0x00), (0x1f, 0x01, 0x3f, 0x00),
-        (0x29, 0x01, 0x3f, 0x00), (0x38, 0x01, 0x3f, 0x01),
-        (0x02, 0x01, 0x27, 0x00), (0x09, 0x01, 0x27, 0x00),
-        (0x17, 0x01, 0x27, 0x00), (0x28, 0x01, 0x27, 0x01),
-        (0x02, 0x01, 0x2b, 0x00), (0x09, 0x01, 0x2b, 0x00),
-        (0x17, 0x01, 0x2b, 0x00), (0x28, 0x01, 0x2b, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x27, 0x00), (0x06, 0x01, 0x27, 0x00),
-        (0x0a, 0x01, 0x27, 0x00), (0x0f, 0x01, 0x27, 0x00),
-        (0x18, 0x01, 0x27, 0x00), (0x1f, 0x01, 0x27, 0x00),
-        (0x29, 0x01, 0x27, 0x00), (0x38, 0x01, 0x27, 0x01),
-        (0x03, 0x01, 0x2b, 0x00), (0x06, 0x01, 0x2b, 0x00),
-        (0x0a, 0x01, 0x2b, 0x00), (0x0f, 0x01, 0x2b, 0x00),
-        (0x18, 0x01, 0x2b, 0x00), (0x1f, 0x01, 0x2b, 0x00),
-        (0x29, 0x01, 0x2b, 0x00), (0x38, 0x01, 0x2b, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x7c, 0x00), (0x09, 0x01, 0x7c, 0x00),
-        (0x17, 0x01, 0x7c, 0x00), (0x28, 0x01, 0x7c, 0x01),
-        (0x01, 0x01, 0x23, 0x00), (0x16, 0x01, 0x23, 0x01),
-        (0x01, 0x01, 0x3e, 0x00), (0x16, 0x01, 0x3e, 0x01),
-        (0x00, 0x01, 0x00, 0x01), (0x00, 0x01, 0x24, 0x01),
-        (0x00, 0x01, 0x40, 0x01), (0x00, 0x01, 0x5b, 0x01),
-        (0x00, 0x01, 0x5d, 0x01), (0x00, 0x01, 0x7e, 0x01),
-        (0x5b, 0x00, 0x00, 0x00), (0x5c, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x7c, 0x00), (0x06, 0x01, 0x7c, 0x00),
-        (0x0a, 0x01, 0x7c, 0x00), (0x0f, 0x01, 0x7c, 0x00),
-        (0x18, 0x01, 0x7c, 0x00), (0x1f, 0x01, 0x7c, 0x00),
-        (0x29, 0x01, 0x7c, 0x00), (0x38, 0x01, 0x7c, 0x01),
-        (0x02, 0x01, 0x23, 0x00), (0x09, 0x01, 0x23, 0x00),
-        (0x17, 0x01, 0x23, 0x00), (0x28, 0x01, 0x23, 0x01),
-        (0x02, 0x01, 0x3e, 0x00), (0x09, 0x01, 0x3e, 0x00),
-        (0x17, 0x01, 0x3e, 0x00), (0x28, 0x01, 0x3e, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x23, 0x00), (0x06, 0x01, 0x23, 0x00),
-        (0x0a, 0x01, 0x23, 0x00), (0x0f, 0x01, 0x23, 0x00),
-        (0x18, 0x01, 0x23, 0x00), (0x1f, 0x01, 0x23, 0x00),
-        (0x29, 0x01, 0x23, 0x00), (0x38, 0x01, 0x23, 0x01),
-        (0x03, 0x01, 0x3e, 0x00), (0x06, 0x01, 0x3e, 0x00),
-        (0x0a, 0x01, 0x3e, 0x00), (0x0f, 0x01, 0x3e, 0x00),
-        (0x18, 0x01, 0x3e, 0x00), (0x1f, 0x01, 0x3e, 0x00),
-        (0x29, 0x01, 0x3e, 0x00), (0x38, 0x01, 0x3e, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x00, 0x00), (0x16, 0x01, 0x00, 0x01),
-        (0x01, 0x01, 0x24, 0x00), (0x16, 0x01, 0x24, 0x01),
-        (0x01, 0x01, 0x40, 0x00), (0x16, 0x01, 0x40, 0x01),
-        (0x01, 0x01, 0x5b, 0x00), (0x16, 0x01, 0x5b, 0x01),
-        (0x01, 0x01, 0x5d, 0x00), (0x16, 0x01, 0x5d, 0x01),
-        (0x01, 0x01, 0x7e, 0x00), (0x16, 0x01, 0x7e, 0x01),
-        (0x00, 0x01, 0x5e, 0x01), (0x00, 0x01, 0x7d, 0x01),
-        (0x5d, 0x00, 0x00, 0x00), (0x5e, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x00, 0x00), (0x09, 0x01, 0x00, 0x00),
-        (0x17, 0x01, 0x00, 0x00), (0x28, 0x01, 0x00, 0x01),
-        (0x02, 0x01, 0x24, 0x00), (0x09, 0x01, 0x24, 0x00),
-        (0x17, 0x01, 0x24, 0x00), (0x28, 0x01, 0x24, 0x01),
-        (0x02, 0x01, 0x40, 0x00), (0x09, 0x01, 0x40, 0x00),
-        (0x17, 0x01, 0x40, 0x00), (0x28, 0x01, 0x40, 0x01),
-        (0x02, 0x01, 0x5b, 0x00), (0x09, 0x01, 0x5b, 0x00),
-        (0x17, 0x01, 0x5b, 0x00), (0x28, 0x01, 0x5b, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x00, 0x00), (0x06, 0x01, 0x00, 0x00),
-        (0x0a, 0x01, 0x00, 0x00), (0x0f, 0x01, 0x00, 0x00),
-        (0x18, 0x01, 0x00, 0x00), (0x1f, 0x01, 0x00, 0x00),
-        (0x29, 0x01, 0x00, 0x00), (0x38, 0x01, 0x00, 0x01),
-        (0x03, 0x01, 0x24, 0x00), (0x06, 0x01, 0x24, 0x00),
-        (0x0a, 0x01, 0x24, 0x00), (0x0f, 0x01, 0x24, 0x00),
-        (0x18, 0x01, 0x24, 0x00), (0x1f, 0x01, 0x24, 0x00),
-        (0x29, 0x01, 0x24, 0x00), (0x38, 0x01, 0x24, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x40, 0x00), (0x06, 0x01, 0x40, 0x00),
-        (0x0a, 0x01, 0x40, 0x00), (0x0f, 0x01, 0x40, 0x00),
-        (0x18, 0x01, 0x40, 0x00), (0x1f, 0x01, 0x40, 0x00),
-        (0x29, 0x01, 0x40, 0x00), (0x38, 0x01, 0x40, 0x01),
-        (0x03, 0x01, 0x5b, 0x00), (0x06, 0x01, 0x5b, 0x00),
-        (0x0a, 0x01, 0x5b, 0x00), (0x0f, 0x01, 0x5b, 0x00),
-        (0x18, 0x01, 0x5b, 0x00), (0x1f, 0x01, 0x5b, 0x00),
-        (0x29, 0x01, 0x5b, 0x00), (0x38, 0x01, 0x5b, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x5d, 0x00), (0x09, 0x01, 0x5d, 0x00),
-        (0x17, 0x01, 0x5d, 0x00), (0x28, 0x01, 0x5d, 0x01),
-        (0x02, 0x01, 0x7e, 0x00), (0x09, 0x01, 0x7e, 0x00),
-        (0x17, 0x01, 0x7e, 0x00), (0x28, 0x01, 0x7e, 0x01),
-        (0x01, 0x01, 0x5e, 0x00), (0x16, 0x01, 0x5e, 0x01),
-        (0x01, 0x01, 0x7d, 0x00), (0x16, 0x01, 0x7d, 0x01),
-        (0x00, 0x01, 0x3c, 0x01), (0x00, 0x01, 0x60, 0x01),
-        (0x00, 0x01, 0x7b, 0x01), (0x5f, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x5d, 0x00), (0x06, 0x01, 0x5d, 0x00),
-        (0x0a, 0x01, 0x5d, 0x00), (0x0f, 0x01, 0x5d, 0x00),
-        (0x18, 0x01, 0x5d, 0x00), (0x1f, 0x01, 0x5d, 0x00),
-        (0x29, 0x01, 0x5d, 0x00), (0x38, 0x01, 0x5d, 0x01),
-        (0x03, 0x01, 0x7e, 0x00), (0x06, 0x01, 0x7e, 0x00),
-        (0x0a, 0x01, 0x7e, 0x00), (0x0f, 0x01, 0x7e, 0x00),
-        (0x18, 0x01, 0x7e, 0x00), (0x1f, 0x01, 0x7e, 0x00),
-        (0x29, 0x01, 0x7e, 0x00), (0x38, 0x01, 0x7e, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x5e, 0x00), (0x09, 0x01, 0x5e, 0x00),
-        (0x17, 0x01, 0x5e, 0x00), (0x28, 0x01, 0x5e, 0x01),
-        (0x02, 0x01, 0x7d, 0x00), (0x09, 0x01, 0x7d, 0x00),
-        (0x17, 0x01, 0x7d, 0x00), (0x28, 0x01, 0x7d, 0x01),
-        (0x01, 0x01, 0x3c, 0x00), (0x16, 0x01, 0x3c, 0x01),
-        (0x01, 0x01, 0x60, 0x00), (0x16, 0x01, 0x60, 0x01),
-        (0x01, 0x01, 0x7b, 0x00), (0x16, 0x01, 0x7b, 0x01),
-        (0x60, 0x00, 0x00, 0x00), (0x6e, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x5e, 0x00), (0x06, 0x01, 0x5e, 0x00),
-        (0x0a, 0x01, 0x5e, 0x00), (0x0f, 0x01, 0x5e, 0x00),
-        (0x18, 0x01, 0x5e, 0x00), (0x1f, 0x01, 0x5e, 0x00),
-        (0x29, 0x01, 0x5e, 0x00), (0x38, 0x01, 0x5e, 0x01),
-        (0x03, 0x01, 0x7d, 0x00), (0x06, 0x01, 0x7d, 0x00),
-        (0x0a, 0x01, 0x7d, 0x00), (0x0f, 0x01, 0x7d, 0x00),
-        (0x18, 0x01, 0x7d, 0x00), (0x1f, 0x01, 0x7d, 0x00),
-        (0x29, 0x01, 0x7d, 0x00), (0x38, 0x01, 0x7d, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x3c, 0x00), (0x09, 0x01, 0x3c, 0x00),
-        (0x17, 0x01, 0x3c, 0x00), (0x28, 0x01, 0x3c, 0x01),
-        (0x02, 0x01, 0x60, 0x00), (0x09, 0x01, 0x60, 0x00),
-        (0x17, 0x01, 0x60, 0x00), (0x28, 0x01, 0x60, 0x01),
-        (0x02, 0x01, 0x7b, 0x00), (0x09, 0x01, 0x7b, 0x00),
-        (0x17, 0x01, 0x7b, 0x00), (0x28, 0x01, 0x7b, 0x01),
-        (0x61, 0x00, 0x00, 0x00), (0x65, 0x00, 0x00, 0x00),
-        (0x6f, 0x00, 0x00, 0x00), (0x85, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x3c, 0x00), (0x06, 0x01, 0x3c, 0x00),
-        (0x0a, 0x01, 0x3c, 0x00), (0x0f, 0x01, 0x3c, 0x00),
-        (0x18, 0x01, 0x3c, 0x00), (0x1f, 0x01, 0x3c, 0x00),
-        (0x29, 0x01, 0x3c, 0x00), (0x38, 0x01, 0x3c, 0x01),
-        (0x03, 0x01, 0x60, 0x00), (0x06, 0x01, 0x60, 0x00),
-        (0x0a, 0x01, 0x60, 0x00), (0x0f, 0x01, 0x60, 0x00),
-        (0x18, 0x01, 0x60, 0x00), (0x1f, 0x01, 0x60, 0x00),
-        (0x29, 0x01, 0x60, 0x00), (0x38, 0x01, 0x60, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x7b, 0x00), (0x06, 0x01, 0x7b, 0x00),
-        (0x0a, 0x01, 0x7b, 0x00), (0x0f, 0x01, 0x7b, 0x00),
-        (0x18, 0x01, 0x7b, 0x00), (0x1f, 0x01, 0x7b, 0x00),
-        (0x29, 0x01, 0x7b, 0x00), (0x38, 0x01, 0x7b, 0x01),
-        (0x62, 0x00, 0x00, 0x00), (0x63, 0x00, 0x00, 0x00),
-        (0x66, 0x00, 0x00, 0x00), (0x69, 0x00, 0x00, 0x00),
-        (0x70, 0x00, 0x00, 0x00), (0x77, 0x00, 0x00, 0x00),
-        (0x86, 0x00, 0x00, 0x00), (0x99, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x00, 0x01, 0x5c, 0x01), (0x00, 0x01, 0xc3, 0x01),
-        (0x00, 0x01, 0xd0, 0x01), (0x64, 0x00, 0x00, 0x00),
-        (0x67, 0x00, 0x00, 0x00), (0x68, 0x00, 0x00, 0x00),
-        (0x6a, 0x00, 0x00, 0x00), (0x6b, 0x00, 0x00, 0x00),
-        (0x71, 0x00, 0x00, 0x00), (0x74, 0x00, 0x00, 0x00),
-        (0x78, 0x00, 0x00, 0x00), (0x7e, 0x00, 0x00, 0x00),
-        (0x87, 0x00, 0x00, 0x00), (0x8e, 0x00, 0x00, 0x00),
-        (0x9a, 0x00, 0x00, 0x00), (0xa9, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x5c, 0x00), (0x16, 0x01, 0x5c, 0x01),
-        (0x01, 0x01, 0xc3, 0x00), (0x16, 0x01, 0xc3, 0x01),
-        (0x01, 0x01, 0xd0, 0x00), (0x16, 0x01, 0xd0, 0x01),
-        (0x00, 0x01, 0x80, 0x01), (0x00, 0x01, 0x82, 0x01),
-        (0x00, 0x01, 0x83, 0x01), (0x00, 0x01, 0xa2, 0x01),
-        (0x00, 0x01, 0xb8, 0x01), (0x00, 0x01, 0xc2, 0x01),
-        (0x00, 0x01, 0xe0, 0x01), (0x00, 0x01, 0xe2, 0x01),
-        (0x6c, 0x00, 0x00, 0x00), (0x6d, 0x00, 0x00, 0x00)
-    ),
-    (
-        (0x02, 0x01, 0x5c, 0x00), (0x09, 0x01, 0x5c, 0x00),
-        (0x17, 0x01, 0x5c, 0x00), (0x28, 0x01, 0x5c, 0x01),
-        (0x02, 0x01, 0xc3, 0x00), (0x09, 0x01, 0xc3, 0x00),
-        (0x17, 0x01, 0xc3, 0x00), (0x28, 0x01, 0xc3, 0x01),
-        (0x02, 0x01, 0xd0, 0x00), (0x09, 0x01, 0xd0, 0x00),
-        (0x17, 0x01, 0xd0, 0x00), (0x28, 0x01, 0xd0, 0x01),
-        (0x01, 0x01, 0x80, 0x00), (0x16, 0x01, 0x80, 0x01),
-        (0x01, 0x01, 0x82, 0x00), (0x16, 0x01, 0x82, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x5c, 0x00), (0x06, 0x01, 0x5c, 0x00),
-        (0x0a, 0x01, 0x5c, 0x00), (0x0f, 0x01, 0x5c, 0x00),
-        (0x18, 0x01, 0x5c, 0x00), (0x1f, 0x01, 0x5c, 0x00),
-        (0x29, 0x01, 0x5c, 0x00), (0x38, 0x01, 0x5c, 0x01),
-        (0x03, 0x01, 0xc3, 0x00), (0x06, 0x01, 0xc3, 0x00),
-        (0x0a, 0x01, 0xc3, 0x00), (0x0f, 0x01, 0xc3, 0x00),
-        (0x18, 0x01, 0xc3, 0x00), (0x1f, 0x01, 0xc3, 0x00),
-        (0x29, 0x01, 0xc3, 0x00), (0x38, 0x01, 0xc3, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xd0, 0x00), (0x06, 0x01, 0xd0, 0x00),
-        (0x0a, 0x01, 0xd0, 0x00), (0x0f, 0x01, 0xd0, 0x00),
-        (0x18, 0x01, 0xd0, 0x00), (0x1f, 0x01, 0xd0, 0x00),
-        (0x29, 0x01, 0xd0, 0x00), (0x38, 0x01, 0xd0, 0x01),
-        (0x02, 0x01, 0x80, 0x00), (0x09, 0x01, 0x80, 0x00),
-        (0x17, 0x01, 0x80, 0x00), (0x28, 0x01, 0x80, 0x01),
-        (0x02, 0x01, 0x82, 0x00), (0x09, 0x01, 0x82, 0x00),
-        (0x17, 0x01, 0x82, 0x00), (0x28, 0x01, 0x82, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x80, 0x00), (0x06, 0x01, 0x80, 0x00),
-        (0x0a, 0x01, 0x80, 0x00), (0x0f, 0x01, 0x80, 0x00),
-        (0x18, 0x01, 0x80, 0x00), (0x1f, 0x01, 0x80, 0x00),
-        (0x29, 0x01, 0x80, 0x00), (0x38, 0x01, 0x80, 0x01),
-        (0x03, 0x01, 0x82, 0x00), (0x06, 0x01, 0x82, 0x00),
-        (0x0a, 0x01, 0x82, 0x00), (0x0f, 0x01, 0x82, 0x00),
-        (0x18, 0x01, 0x82, 0x00), (0x1f, 0x01, 0x82, 0x00),
-        (0x29, 0x01, 0x82, 0x00), (0x38, 0x01, 0x82, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x83, 0x00), (0x16, 0x01, 0x83, 0x01),
-        (0x01, 0x01, 0xa2, 0x00), (0x16, 0x01, 0xa2, 0x01),
-        (0x01, 0x01, 0xb8, 0x00), (0x16, 0x01, 0xb8, 0x01),
-        (0x01, 0x01, 0xc2, 0x00), (0x16, 0x01, 0xc2, 0x01),
-        (0x01, 0x01, 0xe0, 0x00), (0x16, 0x01, 0xe0, 0x01),
-        (0x01, 0x01, 0xe2, 0x00), (0x16, 0x01, 0xe2, 0x01),
-        (0x00, 0x01, 0x99, 0x01), (0x00, 0x01, 0xa1, 0x01),
-        (0x00, 0x01, 0xa7, 0x01), (0x00, 0x01, 0xac, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x83, 0x00), (0x09, 0x01, 0x83, 0x00),
-        (0x17, 0x01, 0x83, 0x00), (0x28, 0x01, 0x83, 0x01),
-        (0x02, 0x01, 0xa2, 0x00), (0x09, 0x01, 0xa2, 0x00),
-        (0x17, 0x01, 0xa2, 0x00), (0x28, 0x01, 0xa2, 0x01),
-        (0x02, 0x01, 0xb8, 0x00), (0x09, 0x01, 0xb8, 0x00),
-        (0x17, 0x01, 0xb8, 0x00), (0x28, 0x01, 0xb8, 0x01),
-        (0x02, 0x01, 0xc2, 0x00), (0x09, 0x01, 0xc2, 0x00),
-        (0x17, 0x01, 0xc2, 0x00), (0x28, 0x01, 0xc2, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x83, 0x00), (0x06, 0x01, 0x83, 0x00),
-        (0x0a, 0x01, 0x83, 0x00), (0x0f, 0x01, 0x83, 0x00),
-        (0x18, 0x01, 0x83, 0x00), (0x1f, 0x01, 0x83, 0x00),
-        (0x29, 0x01, 0x83, 0x00), (0x38, 0x01, 0x83, 0x01),
-        (0x03, 0x01, 0xa2, 0x00), (0x06, 0x01, 0xa2, 0x00),
-        (0x0a, 0x01, 0xa2, 0x00), (0x0f, 0x01, 0xa2, 0x00),
-        (0x18, 0x01, 0xa2, 0x00), (0x1f, 0x01, 0xa2, 0x00),
-        (0x29, 0x01, 0xa2, 0x00), (0x38, 0x01, 0xa2, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xb8, 0x00), (0x06, 0x01, 0xb8, 0x00),
-        (0x0a, 0x01, 0xb8, 0x00), (0x0f, 0x01, 0xb8, 0x00),
-        (0x18, 0x01, 0xb8, 0x00), (0x1f, 0x01, 0xb8, 0x00),
-        (0x29, 0x01, 0xb8, 0x00), (0x38, 0x01, 0xb8, 0x01),
-        (0x03, 0x01, 0xc2, 0x00), (0x06, 0x01, 0xc2, 0x00),
-        (0x0a, 0x01, 0xc2, 0x00), (0x0f, 0x01, 0xc2, 0x00),
-        (0x18, 0x01, 0xc2, 0x00), (0x1f, 0x01, 0xc2, 0x00),
-        (0x29, 0x01, 0xc2, 0x00), (0x38, 0x01, 0xc2, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xe0, 0x00), (0x09, 0x01, 0xe0, 0x00),
-        (0x17, 0x01, 0xe0, 0x00), (0x28, 0x01, 0xe0, 0x01),
-        (0x02, 0x01, 0xe2, 0x00), (0x09, 0x01, 0xe2, 0x00),
-        (0x17, 0x01, 0xe2, 0x00), (0x28, 0x01, 0xe2, 0x01),
-        (0x01, 0x01, 0x99, 0x00), (0x16, 0x01, 0x99, 0x01),
-        (0x01, 0x01, 0xa1, 0x00), (0x16, 0x01, 0xa1, 0x01),
-        (0x01, 0x01, 0xa7, 0x00), (0x16, 0x01, 0xa7, 0x01),
-        (0x01, 0x01, 0xac, 0x00), (0x16, 0x01, 0xac, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xe0, 0x00), (0x06, 0x01, 0xe0, 0x00),
-        (0x0a, 0x01, 0xe0, 0x00), (0x0f, 0x01, 0xe0, 0x00),
-        (0x18, 0x01, 0xe0, 0x00), (0x1f, 0x01, 0xe0, 0x00),
-        (0x29, 0x01, 0xe0, 0x00), (0x38, 0x01, 0xe0, 0x01),
-        (0x03, 0x01, 0xe2, 0x00), (0x06, 0x01, 0xe2, 0x00),
-        (0x0a, 0x01, 0xe2, 0x00), (0x0f, 0x01, 0xe2, 0x00),
-        (0x18, 0x01, 0xe2, 0x00), (0x1f, 0x01, 0xe2, 0x00),
-        (0x29, 0x01, 0xe2, 0x00), (0x38, 0x01, 0xe2, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x99, 0x00), (0x09, 0x01, 0x99, 0x00),
-        (0x17, 0x01, 0x99, 0x00), (0x28, 0x01, 0x99, 0x01),
-        (0x02, 0x01, 0xa1, 0x00), (0x09, 0x01, 0xa1, 0x00),
-        (0x17, 0x01, 0xa1, 0x00), (0x28, 0x01, 0xa1, 0x01),
-        (0x02, 0x01, 0xa7, 0x00), (0x09, 0x01, 0xa7, 0x00),
-        (0x17, 0x01, 0xa7, 0x00), (0x28, 0x01, 0xa7, 0x01),
-        (0x02, 0x01, 0xac, 0x00), (0x09, 0x01, 0xac, 0x00),
-        (0x17, 0x01, 0xac, 0x00), (0x28, 0x01, 0xac, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x99, 0x00), (0x06, 0x01, 0x99, 0x00),
-        (0x0a, 0x01, 0x99, 0x00), (0x0f, 0x01, 0x99, 0x00),
-        (0x18, 0x01, 0x99, 0x00), (0x1f, 0x01, 0x99, 0x00),
-        (0x29, 0x01, 0x99, 0x00), (0x38, 0x01, 0x99, 0x01),
-        (0x03, 0x01, 0xa1, 0x00), (0x06, 0x01, 0xa1, 0x00),
-        (0x0a, 0x01, 0xa1, 0x00), (0x0f, 0x01, 0xa1, 0x00),
-        (0x18, 0x01, 0xa1, 0x00), (0x1f, 0x01, 0xa1, 0x00),
-        (0x29, 0x01, 0xa1, 0x00), (0x38, 0x01, 0xa1, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xa7, 0x00), (0x06, 0x01, 0xa7, 0x00),
-        (0x0a, 0x01, 0xa7, 0x00), (0x0f, 0x01, 0xa7, 0x00),
-        (0x18, 0x01, 0xa7, 0x00), (0x1f, 0x01, 0xa7, 0x00),
-        (0x29, 0x01, 0xa7, 0x00), (0x38, 0x01, 0xa7, 0x01),
-        (0x03, 0x01, 0xac, 0x00), (0x06, 0x01, 0xac, 0x00),
-        (0x0a, 0x01, 0xac, 0x00), (0x0f, 0x01, 0xac, 0x00),
-        (0x18, 0x01, 0xac, 0x00), (0x1f, 0x01, 0xac, 0x00),
-        (0x29, 0x01, 0xac, 0x00), (0x38, 0x01, 0xac, 0x01)
-    ),
-    (
-        (0x72, 0x00, 0x00, 0x00), (0x73, 0x00, 0x00, 0x00),
-        (0x75, 0x00, 0x00, 0x00), (0x76, 0x00, 0x00, 0x00),
-        (0x79, 0x00, 0x00, 0x00), (0x7b, 0x00, 0x00, 0x00),
-        (0x7f, 0x00, 0x00, 0x00), (0x82, 0x00, 0x00, 0x00),
-        (0x88, 0x00, 0x00, 0x00), (0x8b, 0x00, 0x00, 0x00),
-        (0x8f, 0x00, 0x00, 0x00), (0x92, 0x00, 0x00, 0x00),
-        (0x9b, 0x00, 0x00, 0x00), (0xa2, 0x00, 0x00, 0x00),
-        (0xaa, 0x00, 0x00, 0x00), (0xb4, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x00, 0x01, 0xb0, 0x01), (0x00, 0x01, 0xb1, 0x01),
-        (0x00, 0x01, 0xb3, 0x01), (0x00, 0x01, 0xd1, 0x01),
-        (0x00, 0x01, 0xd8, 0x01), (0x00, 0x01, 0xd9, 0x01),
-        (0x00, 0x01, 0xe3, 0x01), (0x00, 0x01, 0xe5, 0x01),
-        (0x00, 0x01, 0xe6, 0x01), (0x7a, 0x00, 0x00, 0x00),
-        (0x7c, 0x00, 0x00, 0x00), (0x7d, 0x00, 0x00, 0x00),
-        (0x80, 0x00, 0x00, 0x00), (0x81, 0x00, 0x00, 0x00),
-        (0x83, 0x00, 0x00, 0x00), (0x84, 0x00, 0x00, 0x00)
-    ),
-    (
-        (0x01, 0x01, 0xb0, 0x00), (0x16, 0x01, 0xb0, 0x01),
-        (0x01, 0x01, 0xb1, 0x00), (0x16, 0x01, 0xb1, 0x01),
-        (0x01, 0x01, 0xb3, 0x00), (0x16, 0x01, 0xb3, 0x01),
-        (0x01, 0x01, 0xd1, 0x00), (0x16, 0x01, 0xd1, 0x01),
-        (0x01, 0x01, 0xd8, 0x00), (0x16, 0x01, 0xd8, 0x01),
-        (0x01, 0x01, 0xd9, 0x00), (0x16, 0x01, 0xd9, 0x01),
-        (0x01, 0x01, 0xe3, 0x00), (0x16, 0x01, 0xe3, 0x01),
-        (0x01, 0x01, 0xe5, 0x00), (0x16, 0x01, 0xe5, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xb0, 0x00), (0x09, 0x01, 0xb0, 0x00),
-        (0x17, 0x01, 0xb0, 0x00), (0x28, 0x01, 0xb0, 0x01),
-        (0x02, 0x01, 0xb1, 0x00), (0x09, 0x01, 0xb1, 0x00),
-        (0x17, 0x01, 0xb1, 0x00), (0x28, 0x01, 0xb1, 0x01),
-        (0x02, 0x01, 0xb3, 0x00), (0x09, 0x01, 0xb3, 0x00),
-        (0x17, 0x01, 0xb3, 0x00), (0x28, 0x01, 0xb3, 0x01),
-        (0x02, 0x01, 0xd1, 0x00), (0x09, 0x01, 0xd1, 0x00),
-        (0x17, 0x01, 0xd1, 0x00), (0x28, 0x01, 0xd1, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xb0, 0x00), (0x06, 0x01, 0xb0, 0x00),
-        (0x0a, 0x01, 0xb0, 0x00), (0x0f, 0x01, 0xb0, 0x00),
-        (0x18, 0x01, 0xb0, 0x00), (0x1f, 0x01, 0xb0, 0x00),
-        (0x29, 0x01, 0xb0, 0x00), (0x38, 0x01, 0xb0, 0x01),
-        (0x03, 0x01, 0xb1, 0x00), (0x06, 0x01, 0xb1, 0x00),
-        (0x0a, 0x01, 0xb1, 0x00), (0x0f, 0x01, 0xb1, 0x00),
-        (0x18, 0x01, 0xb1, 0x00), (0x1f, 0x01, 0xb1, 0x00),
-        (0x29, 0x01, 0xb1, 0x00), (0x38, 0x01, 0xb1, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xb3, 0x00), (0x06, 0x01, 0xb3, 0x00),
-        (0x0a, 0x01, 0xb3, 0x00), (0x0f, 0x01, 0xb3, 0x00),
-        (0x18, 0x01, 0xb3, 0x00), (0x1f, 0x01, 0xb3, 0x00),
-        (0x29, 0x01, 0xb3, 0x00), (0x38, 0x01, 0xb3, 0x01),
-        (0x03, 0x01, 0xd1, 0x00), (0x06, 0x01, 0xd1, 0x00),
-        (0x0a, 0x01, 0xd1, 0x00), (0x0f, 0x01, 0xd1, 0x00),
-        (0x18, 0x01, 0xd1, 0x00), (0x1f, 0x01, 0xd1, 0x00),
-        (0x29, 0x01, 0xd1, 0x00), (0x38, 0x01, 0xd1, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xd8, 0x00), (0x09, 0x01, 0xd8, 0x00),
-        (0x17, 0x01, 0xd8, 0x00), (0x28, 0x01, 0xd8, 0x01),
-        (0x02, 0x01, 0xd9, 0x00), (0x09, 0x01, 0xd9, 0x00),
-        (0x17, 0x01, 0xd9, 0x00), (0x28, 0x01, 0xd9, 0x01),
-        (0x02, 0x01, 0xe3, 0x00), (0x09, 0x01, 0xe3, 0x00),
-        (0x17, 0x01, 0xe3, 0x00), (0x28, 0x01, 0xe3, 0x01),
-        (0x02, 0x01, 0xe5, 0x00), (0x09, 0x01, 0xe5, 0x00),
-        (0x17, 0x01, 0xe5, 0x00), (0x28, 0x01, 0xe5, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xd8, 0x00), (0x06, 0x01, 0xd8, 0x00),
-        (0x0a, 0x01, 0xd8, 0x00), (0x0f, 0x01, 0xd8, 0x00),
-        (0x18, 0x01, 0xd8, 0x00), (0x1f, 0x01, 0xd8, 0x00),
-        (0x29, 0x01, 0xd8, 0x00), (0x38, 0x01, 0xd8, 0x01),
-        (0x03, 0x01, 0xd9, 0x00), (0x06, 0x01, 0xd9, 0x00),
-        (0x0a, 0x01, 0xd9, 0x00), (0x0f, 0x01, 0xd9, 0x00),
-        (0x18, 0x01, 0xd9, 0x00), (0x1f, 0x01, 0xd9, 0x00),
-        (0x29, 0x01, 0xd9, 0x00), (0x38, 0x01, 0xd9, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xe3, 0x00), (0x06, 0x01, 0xe3, 0x00),
-        (0x0a, 0x01, 0xe3, 0x00), (0x0f, 0x01, 0xe3, 0x00),
-        (0x18, 0x01, 0xe3, 0x00), (0x1f, 0x01, 0xe3, 0x00),
-        (0x29, 0x01, 0xe3, 0x00), (0x38, 0x01, 0xe3, 0x01),
-        (0x03, 0x01, 0xe5, 0x00), (0x06, 0x01, 0xe5, 0x00),
-        (0x0a, 0x01, 0xe5, 0x00), (0x0f, 0x01, 0xe5, 0x00),
-        (0x18, 0x01, 0xe5, 0x00), (0x1f, 0x01, 0xe5, 0x00),
-        (0x29, 0x01, 0xe5, 0x00), (0x38, 0x01, 0xe5, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0xe6, 0x00), (0x16, 0x01, 0xe6, 0x01),
-        (0x00, 0x01, 0x81, 0x01), (0x00, 0x01, 0x84, 0x01),
-        (0x00, 0x01, 0x85, 0x01), (0x00, 0x01, 0x86, 0x01),
-        (0x00, 0x01, 0x88, 0x01), (0x00, 0x01, 0x92, 0x01),
-        (0x00, 0x01, 0x9a, 0x01), (0x00, 0x01, 0x9c, 0x01),
-        (0x00, 0x01, 0xa0, 0x01), (0x00, 0x01, 0xa3, 0x01),
-        (0x00, 0x01, 0xa4, 0x01), (0x00, 0x01, 0xa9, 0x01),
-        (0x00, 0x01, 0xaa, 0x01), (0x00, 0x01, 0xad, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xe6, 0x00), (0x09, 0x01, 0xe6, 0x00),
-        (0x17, 0x01, 0xe6, 0x00), (0x28, 0x01, 0xe6, 0x01),
-        (0x01, 0x01, 0x81, 0x00), (0x16, 0x01, 0x81, 0x01),
-        (0x01, 0x01, 0x84, 0x00), (0x16, 0x01, 0x84, 0x01),
-        (0x01, 0x01, 0x85, 0x00), (0x16, 0x01, 0x85, 0x01),
-        (0x01, 0x01, 0x86, 0x00), (0x16, 0x01, 0x86, 0x01),
-        (0x01, 0x01, 0x88, 0x00), (0x16, 0x01, 0x88, 0x01),
-        (0x01, 0x01, 0x92, 0x00), (0x16, 0x01, 0x92, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xe6, 0x00), (0x06, 0x01, 0xe6, 0x00),
-        (0x0a, 0x01, 0xe6, 0x00), (0x0f, 0x01, 0xe6, 0x00),
-        (0x18, 0x01, 0xe6, 0x00), (0x1f, 0x01, 0xe6, 0x00),
-        (0x29, 0x01, 0xe6, 0x00), (0x38, 0x01, 0xe6, 0x01),
-        (0x02, 0x01, 0x81, 0x00), (0x09, 0x01, 0x81, 0x00),
-        (0x17, 0x01, 0x81, 0x00), (0x28, 0x01, 0x81, 0x01),
-        (0x02, 0x01, 0x84, 0x00), (0x09, 0x01, 0x84, 0x00),
-        (0x17, 0x01, 0x84, 0x00), (0x28, 0x01, 0x84, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x81, 0x00), (0x06, 0x01, 0x81, 0x00),
-        (0x0a, 0x01, 0x81, 0x00), (0x0f, 0x01, 0x81, 0x00),
-        (0x18, 0x01, 0x81, 0x00), (0x1f, 0x01, 0x81, 0x00),
-        (0x29, 0x01, 0x81, 0x00), (0x38, 0x01, 0x81, 0x01),
-        (0x03, 0x01, 0x84, 0x00), (0x06, 0x01, 0x84, 0x00),
-        (0x0a, 0x01, 0x84, 0x00), (0x0f, 0x01, 0x84, 0x00),
-        (0x18, 0x01, 0x84, 0x00), (0x1f, 0x01, 0x84, 0x00),
-        (0x29, 0x01, 0x84, 0x00), (0x38, 0x01, 0x84, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x85, 0x00), (0x09, 0x01, 0x85, 0x00),
-        (0x17, 0x01, 0x85, 0x00), (0x28, 0x01, 0x85, 0x01),
-        (0x02, 0x01, 0x86, 0x00), (0x09, 0x01, 0x86, 0x00),
-        (0x17, 0x01, 0x86, 0x00), (0x28, 0x01, 0x86, 0x01),
-        (0x02, 0x01, 0x88, 0x00), (0x09, 0x01, 0x88, 0x00),
-        (0x17, 0x01, 0x88, 0x00), (0x28, 0x01, 0x88, 0x01),
-        (0x02, 0x01, 0x92, 0x00), (0x09, 0x01, 0x92, 0x00),
-        (0x17, 0x01, 0x92, 0x00), (0x28, 0x01, 0x92, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x85, 0x00), (0x06, 0x01, 0x85, 0x00),
-        (0x0a, 0x01, 0x85, 0x00), (0x0f, 0x01, 0x85, 0x00),
-        (0x18, 0x01, 0x85, 0x00), (0x1f, 0x01, 0x85, 0x00),
-        (0x29, 0x01, 0x85, 0x00), (0x38, 0x01, 0x85, 0x01),
-        (0x03, 0x01, 0x86, 0x00), (0x06, 0x01, 0x86, 0x00),
-        (0x0a, 0x01, 0x86, 0x00), (0x0f, 0x01, 0x86, 0x00),
-        (0x18, 0x01, 0x86, 0x00), (0x1f, 0x01, 0x86, 0x00),
-        (0x29, 0x01, 0x86, 0x00), (0x38, 0x01, 0x86, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x88, 0x00), (0x06, 0x01, 0x88, 0x00),
-        (0x0a, 0x01, 0x88, 0x00), (0x0f, 0x01, 0x88, 0x00),
-        (0x18, 0x01, 0x88, 0x00), (0x1f, 0x01, 0x88, 0x00),
-        (0x29, 0x01, 0x88, 0x00), (0x38, 0x01, 0x88, 0x01),
-        (0x03, 0x01, 0x92, 0x00), (0x06, 0x01, 0x92, 0x00),
-        (0x0a, 0x01, 0x92, 0x00), (0x0f, 0x01, 0x92, 0x00),
-        (0x18, 0x01, 0x92, 0x00), (0x1f, 0x01, 0x92, 0x00),
-        (0x29, 0x01, 0x92, 0x00), (0x38, 0x01, 0x92, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x9a, 0x00), (0x16, 0x01, 0x9a, 0x01),
-        (0x01, 0x01, 0x9c, 0x00), (0x16, 0x01, 0x9c, 0x01),
-        (0x01, 0x01, 0xa0, 0x00), (0x16, 0x01, 0xa0, 0x01),
-        (0x01, 0x01, 0xa3, 0x00), (0x16, 0x01, 0xa3, 0x01),
-        (0x01, 0x01, 0xa4, 0x00), (0x16, 0x01, 0xa4, 0x01),
-        (0x01, 0x01, 0xa9, 0x00), (0x16, 0x01, 0xa9, 0x01),
-        (0x01, 0x01, 0xaa, 0x00), (0x16, 0x01, 0xaa, 0x01),
-        (0x01, 0x01, 0xad, 0x00), (0x16, 0x01, 0xad, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x9a, 0x00), (0x09, 0x01, 0x9a, 0x00),
-        (0x17, 0x01, 0x9a, 0x00), (0x28, 0x01, 0x9a, 0x01),
-        (0x02, 0x01, 0x9c, 0x00), (0x09, 0x01, 0x9c, 0x00),
-        (0x17, 0x01, 0x9c, 0x00), (0x28, 0x01, 0x9c, 0x01),
-        (0x02, 0x01, 0xa0, 0x00), (0x09, 0x01, 0xa0, 0x00),
-        (0x17, 0x01, 0xa0, 0x00), (0x28, 0x01, 0xa0, 0x01),
-        (0x02, 0x01, 0xa3, 0x00), (0x09, 0x01, 0xa3, 0x00),
-        (0x17, 0x01, 0xa3, 0x00), (0x28, 0x01, 0xa3, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x9a, 0x00), (0x06, 0x01, 0x9a, 0x00),
-        (0x0a, 0x01, 0x9a, 0x00), (0x0f, 0x01, 0x9a, 0x00),
-        (0x18, 0x01, 0x9a, 0x00), (0x1f, 0x01, 0x9a, 0x00),
-        (0x29, 0x01, 0x9a, 0x00), (0x38, 0x01, 0x9a, 0x01),
-        (0x03, 0x01, 0x9c, 0x00), (0x06, 0x01, 0x9c, 0x00),
-        (0x0a, 0x01, 0x9c, 0x00), (0x0f, 0x01, 0x9c, 0x00),
-        (0x18, 0x01, 0x9c, 0x00), (0x1f, 0x01, 0x9c, 0x00),
-        (0x29, 0x01, 0x9c, 0x00), (0x38, 0x01, 0x9c, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xa0, 0x00), (0x06, 0x01, 0xa0, 0x00),
-        (0x0a, 0x01, 0xa0, 0x00), (0x0f, 0x01, 0xa0, 0x00),
-        (0x18, 0x01, 0xa0, 0x00), (0x1f, 0x01, 0xa0, 0x00),
-        (0x29, 0x01, 0xa0, 0x00), (0x38, 0x01, 0xa0, 0x01),
-        (0x03, 0x01, 0xa3, 0x00), (0x06, 0x01, 0xa3, 0x00),
-        (0x0a, 0x01, 0xa3, 0x00), (0x0f, 0x01, 0xa3, 0x00),
-        (0x18, 0x01, 0xa3, 0x00), (0x1f, 0x01, 0xa3, 0x00),
-        (0x29, 0x01, 0xa3, 0x00), (0x38, 0x01, 0xa3, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xa4, 0x00), (0x09, 0x01, 0xa4, 0x00),
-        (0x17, 0x01, 0xa4, 0x00), (0x28, 0x01, 0xa4, 0x01),
-        (0x02, 0x01, 0xa9, 0x00), (0x09, 0x01, 0xa9, 0x00),
-        (0x17, 0x01, 0xa9, 0x00), (0x28, 0x01, 0xa9, 0x01),
-        (0x02, 0x01, 0xaa, 0x00), (0x09, 0x01, 0xaa, 0x00),
-        (0x17, 0x01, 0xaa, 0x00), (0x28, 0x01, 0xaa, 0x01),
-        (0x02, 0x01, 0xad, 0x00), (0x09, 0x01, 0xad, 0x00),
-        (0x17, 0x01, 0xad, 0x00), (0x28, 0x01, 0xad, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xa4, 0x00), (0x06, 0x01, 0xa4, 0x00),
-        (0x0a, 0x01, 0xa4, 0x00), (0x0f, 0x01, 0xa4, 0x00),
-        (0x18, 0x01, 0xa4, 0x00), (0x1f, 0x01, 0xa4, 0x00),
-        (0x29, 0x01, 0xa4, 0x00), (0x38, 0x01, 0xa4, 0x01),
-        (0x03, 0x01, 0xa9, 0x00), (0x06, 0x01, 0xa9, 0x00),
-        (0x0a, 0x01, 0xa9, 0x00), (0x0f, 0x01, 0xa9, 0x00),
-        (0x18, 0x01, 0xa9, 0x00), (0x1f, 0x01, 0xa9, 0x00),
-        (0x29, 0x01, 0xa9, 0x00), (0x38, 0x01, 0xa9, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xaa, 0x00), (0x06, 0x01, 0xaa, 0x00),
-        (0x0a, 0x01, 0xaa, 0x00), (0x0f, 0x01, 0xaa, 0x00),
-        (0x18, 0x01, 0xaa, 0x00), (0x1f, 0x01, 0xaa, 0x00),
-        (0x29, 0x01, 0xaa, 0x00), (0x38, 0x01, 0xaa, 0x01),
-        (0x03, 0x01, 0xad, 0x00), (0x06, 0x01, 0xad, 0x00),
-        (0x0a, 0x01, 0xad, 0x00), (0x0f, 0x01, 0xad, 0x00),
-        (0x18, 0x01, 0xad, 0x00), (0x1f, 0x01, 0xad, 0x00),
-        (0x29, 0x01, 0xad, 0x00), (0x38, 0x01, 0xad, 0x01)
-    ),
-    (
-        (0x89, 0x00, 0x00, 0x00), (0x8a, 0x00, 0x00, 0x00),
-        (0x8c, 0x00, 0x00, 0x00), (0x8d, 0x00, 0x00, 0x00),
-        (0x90, 0x00, 0x00, 0x00), (0x91, 0x00, 0x00, 0x00),
-        (0x93, 0x00, 0x00, 0x00), (0x96, 0x00, 0x00, 0x00),
-        (0x9c, 0x00, 0x00, 0x00), (0x9f, 0x00, 0x00, 0x00),
-        (0xa3, 0x00, 0x00, 0x00), (0xa6, 0x00, 0x00, 0x00),
-        (0xab, 0x00, 0x00, 0x00), (0xae, 0x00, 0x00, 0x00),
-        (0xb5, 0x00, 0x00, 0x00), (0xbe, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x00, 0x01, 0xb2, 0x01), (0x00, 0x01, 0xb5, 0x01),
-        (0x00, 0x01, 0xb9, 0x01), (0x00, 0x01, 0xba, 0x01),
-        (0x00, 0x01, 0xbb, 0x01), (0x00, 0x01, 0xbd, 0x01),
-        (0x00, 0x01, 0xbe, 0x01), (0x00, 0x01, 0xc4, 0x01),
-        (0x00, 0x01, 0xc6, 0x01), (0x00, 0x01, 0xe4, 0x01),
-        (0x00, 0x01, 0xe8, 0x01), (0x00, 0x01, 0xe9, 0x01),
-        (0x94, 0x00, 0x00, 0x00), (0x95, 0x00, 0x00, 0x00),
-        (0x97, 0x00, 0x00, 0x00), (0x98, 0x00, 0x00, 0x00)
-    ),
-    (
-        (0x01, 0x01, 0xb2, 0x00), (0x16, 0x01, 0xb2, 0x01),
-        (0x01, 0x01, 0xb5, 0x00), (0x16, 0x01, 0xb5, 0x01),
-        (0x01, 0x01, 0xb9, 0x00), (0x16, 0x01, 0xb9, 0x01),
-        (0x01, 0x01, 0xba, 0x00), (0x16, 0x01, 0xba, 0x01),
-        (0x01, 0x01, 0xbb, 0x00), (0x16, 0x01, 0xbb, 0x01),
-        (0x01, 0x01, 0xbd, 0x00), (0x16, 0x01, 0xbd, 0x01),
-        (0x01, 0x01, 0xbe, 0x00), (0x16, 0x01, 0xbe, 0x01),
-        (0x01, 0x01, 0xc4, 0x00), (0x16, 0x01, 0xc4, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xb2, 0x00), (0x09, 0x01, 0xb2, 0x00),
-        (0x17, 0x01, 0xb2, 0x00), (0x28, 0x01, 0xb2, 0x01),
-        (0x02, 0x01, 0xb5, 0x00), (0x09, 0x01, 0xb5, 0x00),
-        (0x17, 0x01, 0xb5, 0x00), (0x28, 0x01, 0xb5, 0x01),
-        (0x02, 0x01, 0xb9, 0x00), (0x09, 0x01, 0xb9, 0x00),
-        (0x17, 0x01, 0xb9, 0x00), (0x28, 0x01, 0xb9, 0x01),
-        (0x02, 0x01, 0xba, 0x00), (0x09, 0x01, 0xba, 0x00),
-        (0x17, 0x01, 0xba, 0x00), (0x28, 0x01, 0xba, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xb2, 0x00), (0x06, 0x01, 0xb2, 0x00),
-        (0x0a, 0x01, 0xb2, 0x00), (0x0f, 0x01, 0xb2, 0x00),
-        (0x18, 0x01, 0xb2, 0x00), (0x1f, 0x01, 0xb2, 0x00),
-        (0x29, 0x01, 0xb2, 0x00), (0x38, 0x01, 0xb2, 0x01),
-        (0x03, 0x01, 0xb5, 0x00), (0x06, 0x01, 0xb5, 0x00),
-        (0x0a, 0x01, 0xb5, 0x00), (0x0f, 0x01, 0xb5, 0x00),
-        (0x18, 0x01, 0xb5, 0x00), (0x1f, 0x01, 0xb5, 0x00),
-        (0x29, 0x01, 0xb5, 0x00), (0x38, 0x01, 0xb5, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xb9, 0x00), (0x06, 0x01, 0xb9, 0x00),
-        (0x0a, 0x01, 0xb9, 0x00), (0x0f, 0x01, 0xb9, 0x00),
-        (0x18, 0x01, 0xb9, 0x00), (0x1f, 0x01, 0xb9, 0x00),
-        (0x29, 0x01, 0xb9, 0x00), (0x38, 0x01, 0xb9, 0x01),
-        (0x03, 0x01, 0xba, 0x00), (0x06, 0x01, 0xba, 0x00),
-        (0x0a, 0x01, 0xba, 0x00), (0x0f, 0x01, 0xba, 0x00),
-        (0x18, 0x01, 0xba, 0x00), (0x1f, 0x01, 0xba, 0x00),
-        (0x29, 0x01, 0xba, 0x00), (0x38, 0x01, 0xba, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xbb, 0x00), (0x09, 0x01, 0xbb, 0x00),
-        (0x17, 0x01, 0xbb, 0x00), (0x28, 0x01, 0xbb, 0x01),
-        (0x02, 0x01, 0xbd, 0x00), (0x09, 0x01, 0xbd, 0x00),
-        (0x17, 0x01, 0xbd, 0x00), (0x28, 0x01, 0xbd, 0x01),
-        (0x02, 0x01, 0xbe, 0x00), (0x09, 0x01, 0xbe, 0x00),
-        (0x17, 0x01, 0xbe, 0x00), (0x28, 0x01, 0xbe, 0x01),
-        (0x02, 0x01, 0xc4, 0x00), (0x09, 0x01, 0xc4, 0x00),
-        (0x17, 0x01, 0xc4, 0x00), (0x28, 0x01, 0xc4, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xbb, 0x00), (0x06, 0x01, 0xbb, 0x00),
-        (0x0a, 0x01, 0xbb, 0x00), (0x0f, 0x01, 0xbb, 0x00),
-        (0x18, 0x01, 0xbb, 0x00), (0x1f, 0x01, 0xbb, 0x00),
-        (0x29, 0x01, 0xbb, 0x00), (0x38, 0x01, 0xbb, 0x01),
-        (0x03, 0x01, 0xbd, 0x00), (0x06, 0x01, 0xbd, 0x00),
-        (0x0a, 0x01, 0xbd, 0x00), (0x0f, 0x01, 0xbd, 0x00),
-        (0x18, 0x01, 0xbd, 0x00), (0x1f, 0x01, 0xbd, 0x00),
-        (0x29, 0x01, 0xbd, 0x00), (0x38, 0x01, 0xbd, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xbe, 0x00), (0x06, 0x01, 0xbe, 0x00),
-        (0x0a, 0x01, 0xbe, 0x00), (0x0f, 0x01, 0xbe, 0x00),
-        (0x18, 0x01, 0xbe, 0x00), (0x1f, 0x01, 0xbe, 0x00),
-        (0x29, 0x01, 0xbe, 0x00), (0x38, 0x01, 0xbe, 0x01),
-        (0x03, 0x01, 0xc4, 0x00), (0x06, 0x01, 0xc4, 0x00),
-        (0x0a, 0x01, 0xc4, 0x00), (0x0f, 0x01, 0xc4, 0x00),
-        (0x18, 0x01, 0xc4, 0x00), (0x1f, 0x01, 0xc4, 0x00),
-        (0x29, 0x01, 0xc4, 0x00), (0x38, 0x01, 0xc4, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0xc6, 0x00), (0x16, 0x01, 0xc6, 0x01),
-        (0x01, 0x01, 0xe4, 0x00), (0x16, 0x01, 0xe4, 0x01),
-        (0x01, 0x01, 0xe8, 0x00), (0x16, 0x01, 0xe8, 0x01),
-        (0x01, 0x01, 0xe9, 0x00), (0x16, 0x01, 0xe9, 0x01),
-        (0x00, 0x01, 0x01, 0x01), (0x00, 0x01, 0x87, 0x01),
-        (0x00, 0x01, 0x89, 0x01), (0x00, 0x01, 0x8a, 0x01),
-        (0x00, 0x01, 0x8b, 0x01), (0x00, 0x01, 0x8c, 0x01),
-        (0x00, 0x01, 0x8d, 0x01), (0x00, 0x01, 0x8f, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xc6, 0x00), (0x09, 0x01, 0xc6, 0x00),
-        (0x17, 0x01, 0xc6, 0x00), (0x28, 0x01, 0xc6, 0x01),
-        (0x02, 0x01, 0xe4, 0x00), (0x09, 0x01, 0xe4, 0x00),
-        (0x17, 0x01, 0xe4, 0x00), (0x28, 0x01, 0xe4, 0x01),
-        (0x02, 0x01, 0xe8, 0x00), (0x09, 0x01, 0xe8, 0x00),
-        (0x17, 0x01, 0xe8, 0x00), (0x28, 0x01, 0xe8, 0x01),
-        (0x02, 0x01, 0xe9, 0x00), (0x09, 0x01, 0xe9, 0x00),
-        (0x17, 0x01, 0xe9, 0x00), (0x28, 0x01, 0xe9, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xc6, 0x00), (0x06, 0x01, 0xc6, 0x00),
-        (0x0a, 0x01, 0xc6, 0x00), (0x0f, 0x01, 0xc6, 0x00),
-        (0x18, 0x01, 0xc6, 0x00), (0x1f, 0x01, 0xc6, 0x00),
-        (0x29, 0x01, 0xc6, 0x00), (0x38, 0x01, 0xc6, 0x01),
-        (0x03, 0x01, 0xe4, 0x00), (0x06, 0x01, 0xe4, 0x00),
-        (0x0a, 0x01, 0xe4, 0x00), (0x0f, 0x01, 0xe4, 0x00),
-        (0x18, 0x01, 0xe4, 0x00), (0x1f, 0x01, 0xe4, 0x00),
-        (0x29, 0x01, 0xe4, 0x00), (0x38, 0x01, 0xe4, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xe8, 0x00), (0x06, 0x01, 0xe8, 0x00),
-        (0x0a, 0x01, 0xe8, 0x00), (0x0f, 0x01, 0xe8, 0x00),
-        (0x18, 0x01, 0xe8, 0x00), (0x1f, 0x01, 0xe8, 0x00),
-        (0x29, 0x01, 0xe8, 0x00), (0x38, 0x01, 0xe8, 0x01),
-        (0x03, 0x01, 0xe9, 0x00), (0x06, 0x01, 0xe9, 0x00),
-        (0x0a, 0x01, 0xe9, 0x00), (0x0f, 0x01, 0xe9, 0x00),
-        (0x18, 0x01, 0xe9, 0x00), (0x1f, 0x01, 0xe9, 0x00),
-        (0x29, 0x01, 0xe9, 0x00), (0x38, 0x01, 0xe9, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x01, 0x00), (0x16, 0x01, 0x01, 0x01),
-        (0x01, 0x01, 0x87, 0x00), (0x16, 0x01, 0x87, 0x01),
-        (0x01, 0x01, 0x89, 0x00), (0x16, 0x01, 0x89, 0x01),
-        (0x01, 0x01, 0x8a, 0x00), (0x16, 0x01, 0x8a, 0x01),
-        (0x01, 0x01, 0x8b, 0x00), (0x16, 0x01, 0x8b, 0x01),
-        (0x01, 0x01, 0x8c, 0x00), (0x16, 0x01, 0x8c, 0x01),
-        (0x01, 0x01, 0x8d, 0x00), (0x16, 0x01, 0x8d, 0x01),
-        (0x01, 0x01, 0x8f, 0x00), (0x16, 0x01, 0x8f, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x01, 0x00), (0x09, 0x01, 0x01, 0x00),
-        (0x17, 0x01, 0x01, 0x00), (0x28, 0x01, 0x01, 0x01),
-        (0x02, 0x01, 0x87, 0x00), (0x09, 0x01, 0x87, 0x00),
-        (0x17, 0x01, 0x87, 0x00), (0x28, 0x01, 0x87, 0x01),
-        (0x02, 0x01, 0x89, 0x00), (0x09, 0x01, 0x89, 0x00),
-        (0x17, 0x01, 0x89, 0x00), (0x28, 0x01, 0x89, 0x01),
-        (0x02, 0x01, 0x8a, 0x00), (0x09, 0x01, 0x8a, 0x00),
-        (0x17, 0x01, 0x8a, 0x00), (0x28, 0x01, 0x8a, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x01, 0x00), (0x06, 0x01, 0x01, 0x00),
-        (0x0a, 0x01, 0x01, 0x00), (0x0f, 0x01, 0x01, 0x00),
-        (0x18, 0x01, 0x01, 0x00), (0x1f, 0x01, 0x01, 0x00),
-        (0x29, 0x01, 0x01, 0x00), (0x38, 0x01, 0x01, 0x01),
-        (0x03, 0x01, 0x87, 0x00), (0x06, 0x01, 0x87, 0x00),
-        (0x0a, 0x01, 0x87, 0x00), (0x0f, 0x01, 0x87, 0x00),
-        (0x18, 0x01, 0x87, 0x00), (0x1f, 0x01, 0x87, 0x00),
-        (0x29, 0x01, 0x87, 0x00), (0x38, 0x01, 0x87, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x89, 0x00), (0x06, 0x01, 0x89, 0x00),
-        (0x0a, 0x01, 0x89, 0x00), (0x0f, 0x01, 0x89, 0x00),
-        (0x18, 0x01, 0x89, 0x00), (0x1f, 0x01, 0x89, 0x00),
-        (0x29, 0x01, 0x89, 0x00), (0x38, 0x01, 0x89, 0x01),
-        (0x03, 0x01, 0x8a, 0x00), (0x06, 0x01, 0x8a, 0x00),
-        (0x0a, 0x01, 0x8a, 0x00), (0x0f, 0x01, 0x8a, 0x00),
-        (0x18, 0x01, 0x8a, 0x00), (0x1f, 0x01, 0x8a, 0x00),
-        (0x29, 0x01, 0x8a, 0x00), (0x38, 0x01, 0x8a, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x8b, 0x00), (0x09, 0x01, 0x8b, 0x00),
-        (0x17, 0x01, 0x8b, 0x00), (0x28, 0x01, 0x8b, 0x01),
-        (0x02, 0x01, 0x8c, 0x00), (0x09, 0x01, 0x8c, 0x00),
-        (0x17, 0x01, 0x8c, 0x00), (0x28, 0x01, 0x8c, 0x01),
-        (0x02, 0x01, 0x8d, 0x00), (0x09, 0x01, 0x8d, 0x00),
-        (0x17, 0x01, 0x8d, 0x00), (0x28, 0x01, 0x8d, 0x01),
-        (0x02, 0x01, 0x8f, 0x00), (0x09, 0x01, 0x8f, 0x00),
-        (0x17, 0x01, 0x8f, 0x00), (0x28, 0x01, 0x8f, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x8b, 0x00), (0x06, 0x01, 0x8b, 0x00),
-        (0x0a, 0x01, 0x8b, 0x00), (0x0f, 0x01, 0x8b, 0x00),
-        (0x18, 0x01, 0x8b, 0x00), (0x1f, 0x01, 0x8b, 0x00),
-        (0x29, 0x01, 0x8b, 0x00), (0x38, 0x01, 0x8b, 0x01),
-        (0x03, 0x01, 0x8c, 0x00), (0x06, 0x01, 0x8c, 0x00),
-        (0x0a, 0x01, 0x8c, 0x00), (0x0f, 0x01, 0x8c, 0x00),
-        (0x18, 0x01, 0x8c, 0x00), (0x1f, 0x01, 0x8c, 0x00),
-        (0x29, 0x01, 0x8c, 0x00), (0x38, 0x01, 0x8c, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x8d, 0x00), (0x06, 0x01, 0x8d, 0x00),
-        (0x0a, 0x01, 0x8d, 0x00), (0x0f, 0x01, 0x8d, 0x00),
-        (0x18, 0x01, 0x8d, 0x00), (0x1f, 0x01, 0x8d, 0x00),
-        (0x29, 0x01, 0x8d, 0x00), (0x38, 0x01, 0x8d, 0x01),
-        (0x03, 0x01, 0x8f, 0x00), (0x06, 0x01, 0x8f, 0x00),
-        (0x0a, 0x01, 0x8f, 0x00), (0x0f, 0x01, 0x8f, 0x00),
-        (0x18, 0x01, 0x8f, 0x00), (0x1f, 0x01, 0x8f, 0x00),
-        (0x29, 0x01, 0x8f, 0x00), (0x38, 0x01, 0x8f, 0x01)
-    ),
-    (
-        (0x9d, 0x00, 0x00, 0x00), (0x9e, 0x00, 0x00, 0x00),
-        (0xa0, 0x00, 0x00, 0x00), (0xa1, 0x00, 0x00, 0x00),
-        (0xa4, 0x00, 0x00, 0x00), (0xa5, 0x00, 0x00, 0x00),
-        (0xa7, 0x00, 0x00, 0x00), (0xa8, 0x00, 0x00, 0x00),
-        (0xac, 0x00, 0x00, 0x00), (0xad, 0x00, 0x00, 0x00),
-        (0xaf, 0x00, 0x00, 0x00), (0xb1, 0x00, 0x00, 0x00),
-        (0xb6, 0x00, 0x00, 0x00), (0xb9, 0x00, 0x00, 0x00),
-        (0xbf, 0x00, 0x00, 0x00), (0xcf, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x00, 0x01, 0x93, 0x01), (0x00, 0x01, 0x95, 0x01),
-        (0x00, 0x01, 0x96, 0x01), (0x00, 0x01, 0x97, 0x01),
-        (0x00, 0x01, 0x98, 0x01), (0x00, 0x01, 0x9b, 0x01),
-        (0x00, 0x01, 0x9d, 0x01), (0x00, 0x01, 0x9e, 0x01),
-        (0x00, 0x01, 0xa5, 0x01), (0x00, 0x01, 0xa6, 0x01),
-        (0x00, 0x01, 0xa8, 0x01), (0x00, 0x01, 0xae, 0x01),
-        (0x00, 0x01, 0xaf, 0x01), (0x00, 0x01, 0xb4, 0x01),
-        (0x00, 0x01, 0xb6, 0x01), (0x00, 0x01, 0xb7, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x93, 0x00), (0x16, 0x01, 0x93, 0x01),
-        (0x01, 0x01, 0x95, 0x00), (0x16, 0x01, 0x95, 0x01),
-        (0x01, 0x01, 0x96, 0x00), (0x16, 0x01, 0x96, 0x01),
-        (0x01, 0x01, 0x97, 0x00), (0x16, 0x01, 0x97, 0x01),
-        (0x01, 0x01, 0x98, 0x00), (0x16, 0x01, 0x98, 0x01),
-        (0x01, 0x01, 0x9b, 0x00), (0x16, 0x01, 0x9b, 0x01),
-        (0x01, 0x01, 0x9d, 0x00), (0x16, 0x01, 0x9d, 0x01),
-        (0x01, 0x01, 0x9e, 0x00), (0x16, 0x01, 0x9e, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x93, 0x00), (0x09, 0x01, 0x93, 0x00),
-        (0x17, 0x01, 0x93, 0x00), (0x28, 0x01, 0x93, 0x01),
-        (0x02, 0x01, 0x95, 0x00), (0x09, 0x01, 0x95, 0x00),
-        (0x17, 0x01, 0x95, 0x00), (0x28, 0x01, 0x95, 0x01),
-        (0x02, 0x01, 0x96, 0x00), (0x09, 0x01, 0x96, 0x00),
-        (0x17, 0x01, 0x96, 0x00), (0x28, 0x01, 0x96, 0x01),
-        (0x02, 0x01, 0x97, 0x00), (0x09, 0x01, 0x97, 0x00),
-        (0x17, 0x01, 0x97, 0x00), (0x28, 0x01, 0x97, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x93, 0x00), (0x06, 0x01, 0x93, 0x00),
-        (0x0a, 0x01, 0x93, 0x00), (0x0f, 0x01, 0x93, 0x00),
-        (0x18, 0x01, 0x93, 0x00), (0x1f, 0x01, 0x93, 0x00),
-        (0x29, 0x01, 0x93, 0x00), (0x38, 0x01, 0x93, 0x01),
-        (0x03, 0x01, 0x95, 0x00), (0x06, 0x01, 0x95, 0x00),
-        (0x0a, 0x01, 0x95, 0x00), (0x0f, 0x01, 0x95, 0x00),
-        (0x18, 0x01, 0x95, 0x00), (0x1f, 0x01, 0x95, 0x00),
-        (0x29, 0x01, 0x95, 0x00), (0x38, 0x01, 0x95, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x96, 0x00), (0x06, 0x01, 0x96, 0x00),
-        (0x0a, 0x01, 0x96, 0x00), (0x0f, 0x01, 0x96, 0x00),
-        (0x18, 0x01, 0x96, 0x00), (0x1f, 0x01, 0x96, 0x00),
-        (0x29, 0x01, 0x96, 0x00), (0x38, 0x01, 0x96, 0x01),
-        (0x03, 0x01, 0x97, 0x00), (0x06, 0x01, 0x97, 0x00),
-        (0x0a, 0x01, 0x97, 0x00), (0x0f, 0x01, 0x97, 0x00),
-        (0x18, 0x01, 0x97, 0x00), (0x1f, 0x01, 0x97, 0x00),
-        (0x29, 0x01, 0x97, 0x00), (0x38, 0x01, 0x97, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x98, 0x00), (0x09, 0x01, 0x98, 0x00),
-        (0x17, 0x01, 0x98, 0x00), (0x28, 0x01, 0x98, 0x01),
-        (0x02, 0x01, 0x9b, 0x00), (0x09, 0x01, 0x9b, 0x00),
-        (0x17, 0x01, 0x9b, 0x00), (0x28, 0x01, 0x9b, 0x01),
-        (0x02, 0x01, 0x9d, 0x00), (0x09, 0x01, 0x9d, 0x00),
-        (0x17, 0x01, 0x9d, 0x00), (0x28, 0x01, 0x9d, 0x01),
-        (0x02, 0x01, 0x9e, 0x00), (0x09, 0x01, 0x9e, 0x00),
-        (0x17, 0x01, 0x9e, 0x00), (0x28, 0x01, 0x9e, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x98, 0x00), (0x06, 0x01, 0x98, 0x00),
-        (0x0a, 0x01, 0x98, 0x00), (0x0f, 0x01, 0x98, 0x00),
-        (0x18, 0x01, 0x98, 0x00), (0x1f, 0x01, 0x98, 0x00),
-        (0x29, 0x01, 0x98, 0x00), (0x38, 0x01, 0x98, 0x01),
-        (0x03, 0x01, 0x9b, 0x00), (0x06, 0x01, 0x9b, 0x00),
-        (0x0a, 0x01, 0x9b, 0x00), (0x0f, 0x01, 0x9b, 0x00),
-        (0x18, 0x01, 0x9b, 0x00), (0x1f, 0x01, 0x9b, 0x00),
-        (0x29, 0x01, 0x9b, 0x00), (0x38, 0x01, 0x9b, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x9d, 0x00), (0x06, 0x01, 0x9d, 0x00),
-        (0x0a, 0x01, 0x9d, 0x00), (0x0f, 0x01, 0x9d, 0x00),
-        (0x18, 0x01, 0x9d, 0x00), (0x1f, 0x01, 0x9d, 0x00),
-        (0x29, 0x01, 0x9d, 0x00), (0x38, 0x01, 0x9d, 0x01),
-        (0x03, 0x01, 0x9e, 0x00), (0x06, 0x01, 0x9e, 0x00),
-        (0x0a, 0x01, 0x9e, 0x00), (0x0f, 0x01, 0x9e, 0x00),
-        (0x18, 0x01, 0x9e, 0x00), (0x1f, 0x01, 0x9e, 0x00),
-        (0x29, 0x01, 0x9e, 0x00), (0x38, 0x01, 0x9e, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0xa5, 0x00), (0x16, 0x01, 0xa5, 0x01),
-        (0x01, 0x01, 0xa6, 0x00), (0x16, 0x01, 0xa6, 0x01),
-        (0x01, 0x01, 0xa8, 0x00), (0x16, 0x01, 0xa8, 0x01),
-        (0x01, 0x01, 0xae, 0x00), (0x16, 0x01, 0xae, 0x01),
-        (0x01, 0x01, 0xaf, 0x00), (0x16, 0x01, 0xaf, 0x01),
-        (0x01, 0x01, 0xb4, 0x00), (0x16, 0x01, 0xb4, 0x01),
-        (0x01, 0x01, 0xb6, 0x00), (0x16, 0x01, 0xb6, 0x01),
-        (0x01, 0x01, 0xb7, 0x00), (0x16, 0x01, 0xb7, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xa5, 0x00), (0x09, 0x01, 0xa5, 0x00),
-        (0x17, 0x01, 0xa5, 0x00), (0x28, 0x01, 0xa5, 0x01),
-        (0x02, 0x01, 0xa6, 0x00), (0x09, 0x01, 0xa6, 0x00),
-        (0x17, 0x01, 0xa6, 0x00), (0x28, 0x01, 0xa6, 0x01),
-        (0x02, 0x01, 0xa8, 0x00), (0x09, 0x01, 0xa8, 0x00),
-        (0x17, 0x01, 0xa8, 0x00), (0x28, 0x01, 0xa8, 0x01),
-        (0x02, 0x01, 0xae, 0x00), (0x09, 0x01, 0xae, 0x00),
-        (0x17, 0x01, 0xae, 0x00), (0x28, 0x01, 0xae, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xa5, 0x00), (0x06, 0x01, 0xa5, 0x00),
-        (0x0a, 0x01, 0xa5, 0x00), (0x0f, 0x01, 0xa5, 0x00),
-        (0x18, 0x01, 0xa5, 0x00), (0x1f, 0x01, 0xa5, 0x00),
-        (0x29, 0x01, 0xa5, 0x00), (0x38, 0x01, 0xa5, 0x01),
-        (0x03, 0x01, 0xa6, 0x00), (0x06, 0x01, 0xa6, 0x00),
-        (0x0a, 0x01, 0xa6, 0x00), (0x0f, 0x01, 0xa6, 0x00),
-        (0x18, 0x01, 0xa6, 0x00), (0x1f, 0x01, 0xa6, 0x00),
-        (0x29, 0x01, 0xa6, 0x00), (0x38, 0x01, 0xa6, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xa8, 0x00), (0x06, 0x01, 0xa8, 0x00),
-        (0x0a, 0x01, 0xa8, 0x00), (0x0f, 0x01, 0xa8, 0x00),
-        (0x18, 0x01, 0xa8, 0x00), (0x1f, 0x01, 0xa8, 0x00),
-        (0x29, 0x01, 0xa8, 0x00), (0x38, 0x01, 0xa8, 0x01),
-        (0x03, 0x01, 0xae, 0x00), (0x06, 0x01, 0xae, 0x00),
-        (0x0a, 0x01, 0xae, 0x00), (0x0f, 0x01, 0xae, 0x00),
-        (0x18, 0x01, 0xae, 0x00), (0x1f, 0x01, 0xae, 0x00),
-        (0x29, 0x01, 0xae, 0x00), (0x38, 0x01, 0xae, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xaf, 0x00), (0x09, 0x01, 0xaf, 0x00),
-        (0x17, 0x01, 0xaf, 0x00), (0x28, 0x01, 0xaf, 0x01),
-        (0x02, 0x01, 0xb4, 0x00), (0x09, 0x01, 0xb4, 0x00),
-        (0x17, 0x01, 0xb4, 0x00), (0x28, 0x01, 0xb4, 0x01),
-        (0x02, 0x01, 0xb6, 0x00), (0x09, 0x01, 0xb6, 0x00),
-        (0x17, 0x01, 0xb6, 0x00), (0x28, 0x01, 0xb6, 0x01),
-        (0x02, 0x01, 0xb7, 0x00), (0x09, 0x01, 0xb7, 0x00),
-        (0x17, 0x01, 0xb7, 0x00), (0x28, 0x01, 0xb7, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xaf, 0x00), (0x06, 0x01, 0xaf, 0x00),
-        (0x0a, 0x01, 0xaf, 0x00), (0x0f, 0x01, 0xaf, 0x00),
-        (0x18, 0x01, 0xaf, 0x00), (0x1f, 0x01, 0xaf, 0x00),
-        (0x29, 0x01, 0xaf, 0x00), (0x38, 0x01, 0xaf, 0x01),
-        (0x03, 0x01, 0xb4, 0x00), (0x06, 0x01, 0xb4, 0x00),
-        (0x0a, 0x01, 0xb4, 0x00), (0x0f, 0x01, 0xb4, 0x00),
-        (0x18, 0x01, 0xb4, 0x00), (0x1f, 0x01, 0xb4, 0x00),
-        (0x29, 0x01, 0xb4, 0x00), (0x38, 0x01, 0xb4, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xb6, 0x00), (0x06, 0x01, 0xb6, 0x00),
-        (0x0a, 0x01, 0xb6, 0x00), (0x0f, 0x01, 0xb6, 0x00),
-        (0x18, 0x01, 0xb6, 0x00), (0x1f, 0x01, 0xb6, 0x00),
-        (0x29, 0x01, 0xb6, 0x00), (0x38, 0x01, 0xb6, 0x01),
-        (0x03, 0x01, 0xb7, 0x00), (0x06, 0x01, 0xb7, 0x00),
-        (0x0a, 0x01, 0xb7, 0x00), (0x0f, 0x01, 0xb7, 0x00),
-        (0x18, 0x01, 0xb7, 0x00), (0x1f, 0x01, 0xb7, 0x00),
-        (0x29, 0x01, 0xb7, 0x00), (0x38, 0x01, 0xb7, 0x01)
-    ),
-    (
-        (0x00, 0x01, 0xbc, 0x01), (0x00, 0x01, 0xbf, 0x01),
-        (0x00, 0x01, 0xc5, 0x01), (0x00, 0x01, 0xe7, 0x01),
-        (0x00, 0x01, 0xef, 0x01), (0xb0, 0x00, 0x00, 0x00),
-        (0xb2, 0x00, 0x00, 0x00), (0xb3, 0x00, 0x00, 0x00),
-        (0xb7, 0x00, 0x00, 0x00), (0xb8, 0x00, 0x00, 0x00),
-        (0xba, 0x00, 0x00, 0x00), (0xbb, 0x00, 0x00, 0x00),
-        (0xc0, 0x00, 0x00, 0x00), (0xc7, 0x00, 0x00, 0x00),
-        (0xd0, 0x00, 0x00, 0x00), (0xdf, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xef, 0x00), (0x06, 0x01, 0xef, 0x00),
-        (0x0a, 0x01, 0xef, 0x00), (0x0f, 0x01, 0xef, 0x00),
-        (0x18, 0x01, 0xef, 0x00), (0x1f, 0x01, 0xef, 0x00),
-        (0x29, 0x01, 0xef, 0x00), (0x38, 0x01, 0xef, 0x01),
-        (0x02, 0x01, 0x09, 0x00), (0x09, 0x01, 0x09, 0x00),
-        (0x17, 0x01, 0x09, 0x00), (0x28, 0x01, 0x09, 0x01),
-        (0x02, 0x01, 0x8e, 0x00), (0x09, 0x01, 0x8e, 0x00),
-        (0x17, 0x01, 0x8e, 0x00), (0x28, 0x01, 0x8e, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x09, 0x00), (0x06, 0x01, 0x09, 0x00),
-        (0x0a, 0x01, 0x09, 0x00), (0x0f, 0x01, 0x09, 0x00),
-        (0x18, 0x01, 0x09, 0x00), (0x1f, 0x01, 0x09, 0x00),
-        (0x29, 0x01, 0x09, 0x00), (0x38, 0x01, 0x09, 0x01),
-        (0x03, 0x01, 0x8e, 0x00), (0x06, 0x01, 0x8e, 0x00),
-        (0x0a, 0x01, 0x8e, 0x00), (0x0f, 0x01, 0x8e, 0x00),
-        (0x18, 0x01, 0x8e, 0x00), (0x1f, 0x01, 0x8e, 0x00),
-        (0x29, 0x01, 0x8e, 0x00), (0x38, 0x01, 0x8e, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x90, 0x00), (0x09, 0x01, 0x90, 0x00),
-        (0x17, 0x01, 0x90, 0x00), (0x28, 0x01, 0x90, 0x01),
-        (0x02, 0x01, 0x91, 0x00), (0x09, 0x01, 0x91, 0x00),
-        (0x17, 0x01, 0x91, 0x00), (0x28, 0x01, 0x91, 0x01),
-        (0x02, 0x01, 0x94, 0x00), (0x09, 0x01, 0x94, 0x00),
-        (0x17, 0x01, 0x94, 0x00), (0x28, 0x01, 0x94, 0x01),
-        (0x02, 0x01, 0x9f, 0x00), (0x09, 0x01, 0x9f, 0x00),
-        (0x17, 0x01, 0x9f, 0x00), (0x28, 0x01, 0x9f, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x90, 0x00), (0x06, 0x01, 0x90, 0x00),
-        (0x0a, 0x01, 0x90, 0x00), (0x0f, 0x01, 0x90, 0x00),
-        (0x18, 0x01, 0x90, 0x00), (0x1f, 0x01, 0x90, 0x00),
-        (0x29, 0x01, 0x90, 0x00), (0x38, 0x01, 0x90, 0x01),
-        (0x03, 0x01, 0x91, 0x00), (0x06, 0x01, 0x91, 0x00),
-        (0x0a, 0x01, 0x91, 0x00), (0x0f, 0x01, 0x91, 0x00),
-        (0x18, 0x01, 0x91, 0x00), (0x1f, 0x01, 0x91, 0x00),
-        (0x29, 0x01, 0x91, 0x00), (0x38, 0x01, 0x91, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x94, 0x00), (0x06, 0x01, 0x94, 0x00),
-        (0x0a, 0x01, 0x94, 0x00), (0x0f, 0x01, 0x94, 0x00),
-        (0x18, 0x01, 0x94, 0x00), (0x1f, 0x01, 0x94, 0x00),
-        (0x29, 0x01, 0x94, 0x00), (0x38, 0x01, 0x94, 0x01),
-        (0x03, 0x01, 0x9f, 0x00), (0x06, 0x01, 0x9f, 0x00),
-        (0x0a, 0x01, 0x9f, 0x00), (0x0f, 0x01, 0x9f, 0x00),
-        (0x18, 0x01, 0x9f, 0x00), (0x1f, 0x01, 0x9f, 0x00),
-        (0x29, 0x01, 0x9f, 0x00), (0x38, 0x01, 0x9f, 0x01)
-    ),
-    (
-        (0x00, 0x01, 0xab, 0x01), (0x00, 0x01, 0xce, 0x01),
-        (0x00, 0x01, 0xd7, 0x01), (0x00, 0x01, 0xe1, 0x01),
-        (0x00, 0x01, 0xec, 0x01), (0x00, 0x01, 0xed, 0x01),
-        (0xbc, 0x00, 0x00, 0x00), (0xbd, 0x00, 0x00, 0x00),
-        (0xc1, 0x00, 0x00, 0x00), (0xc4, 0x00, 0x00, 0x00),
-        (0xc8, 0x00, 0x00, 0x00), (0xcb, 0x00, 0x00, 0x00),
-        (0xd1, 0x00, 0x00, 0x00), (0xd8, 0x00, 0x00, 0x00),
-        (0xe0, 0x00, 0x00, 0x00), (0xee, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0xab, 0x00), (0x16, 0x01, 0xab, 0x01),
-        (0x01, 0x01, 0xce, 0x00), (0x16, 0x01, 0xce, 0x01),
-        (0x01, 0x01, 0xd7, 0x00), (0x16, 0x01, 0xd7, 0x01),
-        (0x01, 0x01, 0xe1, 0x00), (0x16, 0x01, 0xe1, 0x01),
-        (0x01, 0x01, 0xec, 0x00), (0x16, 0x01, 0xec, 0x01),
-        (0x01, 0x01, 0xed, 0x00), (0x16, 0x01, 0xed, 0x01),
-        (0x00, 0x01, 0xc7, 0x01), (0x00, 0x01, 0xcf, 0x01),
-        (0x00, 0x01, 0xea, 0x01), (0x00, 0x01, 0xeb, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xab, 0x00), (0x09, 0x01, 0xab, 0x00),
-        (0x17, 0x01, 0xab, 0x00), (0x28, 0x01, 0xab, 0x01),
-        (0x02, 0x01, 0xce, 0x00), (0x09, 0x01, 0xce, 0x00),
-        (0x17, 0x01, 0xce, 0x00), (0x28, 0x01, 0xce, 0x01),
-        (0x02, 0x01, 0xd7, 0x00), (0x09, 0x01, 0xd7, 0x00),
-        (0x17, 0x01, 0xd7, 0x00), (0x28, 0x01, 0xd7, 0x01),
-        (0x02, 0x01, 0xe1, 0x00), (0x09, 0x01, 0xe1, 0x00),
-        (0x17, 0x01, 0xe1, 0x00), (0x28, 0x01, 0xe1, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xab, 0x00), (0x06, 0x01, 0xab, 0x00),
-        (0x0a, 0x01, 0xab, 0x00), (0x0f, 0x01, 0xab, 0x00),
-        (0x18, 0x01, 0xab, 0x00), (0x1f, 0x01, 0xab, 0x00),
-        (0x29, 0x01, 0xab, 0x00), (0x38, 0x01, 0xab, 0x01),
-        (0x03, 0x01, 0xce, 0x00), (0x06, 0x01, 0xce, 0x00),
-        (0x0a, 0x01, 0xce, 0x00), (0x0f, 0x01, 0xce, 0x00),
-        (0x18, 0x01, 0xce, 0x00), (0x1f, 0x01, 0xce, 0x00),
-        (0x29, 0x01, 0xce, 0x00), (0x38, 0x01, 0xce, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xd7, 0x00), (0x06, 0x01, 0xd7, 0x00),
-        (0x0a, 0x01, 0xd7, 0x00), (0x0f, 0x01, 0xd7, 0x00),
-        (0x18, 0x01, 0xd7, 0x00), (0x1f, 0x01, 0xd7, 0x00),
-        (0x29, 0x01, 0xd7, 0x00), (0x38, 0x01, 0xd7, 0x01),
-        (0x03, 0x01, 0xe1, 0x00), (0x06, 0x01, 0xe1, 0x00),
-        (0x0a, 0x01, 0xe1, 0x00), (0x0f, 0x01, 0xe1, 0x00),
-        (0x18, 0x01, 0xe1, 0x00), (0x1f, 0x01, 0xe1, 0x00),
-        (0x29, 0x01, 0xe1, 0x00), (0x38, 0x01, 0xe1, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xec, 0x00), (0x09, 0x01, 0xec, 0x00),
-        (0x17, 0x01, 0xec, 0x00), (0x28, 0x01, 0xec, 0x01),
-        (0x02, 0x01, 0xed, 0x00), (0x09, 0x01, 0xed, 0x00),
-        (0x17, 0x01, 0xed, 0x00), (0x28, 0x01, 0xed, 0x01),
-        (0x01, 0x01, 0xc7, 0x00), (0x16, 0x01, 0xc7, 0x01),
-        (0x01, 0x01, 0xcf, 0x00), (0x16, 0x01, 0xcf, 0x01),
-        (0x01, 0x01, 0xea, 0x00), (0x16, 0x01, 0xea, 0x01),
-        (0x01, 0x01, 0xeb, 0x00), (0x16, 0x01, 0xeb, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xec, 0x00), (0x06, 0x01, 0xec, 0x00),
-        (0x0a, 0x01, 0xec, 0x00), (0x0f, 0x01, 0xec, 0x00),
-        (0x18, 0x01, 0xec, 0x00), (0x1f, 0x01, 0xec, 0x00),
-        (0x29, 0x01, 0xec, 0x00), (0x38, 0x01, 0xec, 0x01),
-        (0x03, 0x01, 0xed, 0x00), (0x06, 0x01, 0xed, 0x00),
-        (0x0a, 0x01, 0xed, 0x00), (0x0f, 0x01, 0xed, 0x00),
-        (0x18, 0x01, 0xed, 0x00), (0x1f, 0x01, 0xed, 0x00),
-        (0x29, 0x01, 0xed, 0x00), (0x38, 0x01, 0xed, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xc7, 0x00), (0x09, 0x01, 0xc7, 0x00),
-        (0x17, 0x01, 0xc7, 0x00), (0x28, 0x01, 0xc7, 0x01),
-        (0x02, 0x01, 0xcf, 0x00), (0x09, 0x01, 0xcf, 0x00),
-        (0x17, 0x01, 0xcf, 0x00), (0x28, 0x01, 0xcf, 0x01),
-        (0x02, 0x01, 0xea, 0x00), (0x09, 0x01, 0xea, 0x00),
-        (0x17, 0x01, 0xea, 0x00), (0x28, 0x01, 0xea, 0x01),
-        (0x02, 0x01, 0xeb, 0x00), (0x09, 0x01, 0xeb, 0x00),
-        (0x17, 0x01, 0xeb, 0x00), (0x28, 0x01, 0xeb, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xc7, 0x00), (0x06, 0x01, 0xc7, 0x00),
-        (0x0a, 0x01, 0xc7, 0x00), (0x0f, 0x01, 0xc7, 0x00),
-        (0x18, 0x01, 0xc7, 0x00), (0x1f, 0x01, 0xc7, 0x00),
-        (0x29, 0x01, 0xc7, 0x00), (0x38, 0x01, 0xc7, 0x01),
-        (0x03, 0x01, 0xcf, 0x00), (0x06, 0x01, 0xcf, 0x00),
-        (0x0a, 0x01, 0xcf, 0x00), (0x0f, 0x01, 0xcf, 0x00),
-        (0x18, 0x01, 0xcf, 0x00), (0x1f, 0x01, 0xcf, 0x00),
-        (0x29, 0x01, 0xcf, 0x00), (0x38, 0x01, 0xcf, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xea, 0x00), (0x06, 0x01, 0xea, 0x00),
-        (0x0a, 0x01, 0xea, 0x00), (0x0f, 0x01, 0xea, 0x00),
-        (0x18, 0x01, 0xea, 0x00), (0x1f, 0x01, 0xea, 0x00),
-        (0x29, 0x01, 0xea, 0x00), (0x38, 0x01, 0xea, 0x01),
-        (0x03, 0x01, 0xeb, 0x00), (0x06, 0x01, 0xeb, 0x00),
-        (0x0a, 0x01, 0xeb, 0x00), (0x0f, 0x01, 0xeb, 0x00),
-        (0x18, 0x01, 0xeb, 0x00), (0x1f, 0x01, 0xeb, 0x00),
-        (0x29, 0x01, 0xeb, 0x00), (0x38, 0x01, 0xeb, 0x01)
-    ),
-    (
-        (0xc2, 0x00, 0x00, 0x00), (0xc3, 0x00, 0x00, 0x00),
-        (0xc5, 0x00, 0x00, 0x00), (0xc6, 0x00, 0x00, 0x00),
-        (0xc9, 0x00, 0x00, 0x00), (0xca, 0x00, 0x00, 0x00),
-        (0xcc, 0x00, 0x00, 0x00), (0xcd, 0x00, 0x00, 0x00),
-        (0xd2, 0x00, 0x00, 0x00), (0xd5, 0x00, 0x00, 0x00),
-        (0xd9, 0x00, 0x00, 0x00), (0xdc, 0x00, 0x00, 0x00),
-        (0xe1, 0x00, 0x00, 0x00), (0xe7, 0x00, 0x00, 0x00),
-        (0xef, 0x00, 0x00, 0x00), (0xf6, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x00, 0x01, 0xc0, 0x01), (0x00, 0x01, 0xc1, 0x01),
-        (0x00, 0x01, 0xc8, 0x01), (0x00, 0x01, 0xc9, 0x01),
-        (0x00, 0x01, 0xca, 0x01), (0x00, 0x01, 0xcd, 0x01),
-        (0x00, 0x01, 0xd2, 0x01), (0x00, 0x01, 0xd5, 0x01),
-        (0x00, 0x01, 0xda, 0x01), (0x00, 0x01, 0xdb, 0x01),
-        (0x00, 0x01, 0xee, 0x01), (0x00, 0x01, 0xf0, 0x01),
-        (0x00, 0x01, 0xf2, 0x01), (0x00, 0x01, 0xf3, 0x01),
-        (0x00, 0x01, 0xff, 0x01), (0xce, 0x00, 0x00, 0x00)
-    ),
-    (
-        (0x01, 0x01, 0xc0, 0x00), (0x16, 0x01, 0xc0, 0x01),
-        (0x01, 0x01, 0xc1, 0x00), (0x16, 0x01, 0xc1, 0x01),
-        (0x01, 0x01, 0xc8, 0x00), (0x16, 0x01, 0xc8, 0x01),
-        (0x01, 0x01, 0xc9, 0x00), (0x16, 0x01, 0xc9, 0x01),
-        (0x01, 0x01, 0xca, 0x00), (0x16, 0x01, 0xca, 0x01),
-        (0x01, 0x01, 0xcd, 0x00), (0x16, 0x01, 0xcd, 0x01),
-        (0x01, 0x01, 0xd2, 0x00), (0x16, 0x01, 0xd2, 0x01),
-        (0x01, 0x01, 0xd5, 0x00), (0x16, 0x01, 0xd5, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xc0, 0x00), (0x09, 0x01, 0xc0, 0x00),
-        (0x17, 0x01, 0xc0, 0x00), (0x28, 0x01, 0xc0, 0x01),
-        (0x02, 0x01, 0xc1, 0x00), (0x09, 0x01, 0xc1, 0x00),
-        (0x17, 0x01, 0xc1, 0x00), (0x28, 0x01, 0xc1, 0x01),
-        (0x02, 0x01, 0xc8, 0x00), (0x09, 0x01, 0xc8, 0x00),
-        (0x17, 0x01, 0xc8, 0x00), (0x28, 0x01, 0xc8, 0x01),
-        (0x02, 0x01, 0xc9, 0x00), (0x09, 0x01, 0xc9, 0x00),
-        (0x17, 0x01, 0xc9, 0x00), (0x28, 0x01, 0xc9, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xc0, 0x00), (0x06, 0x01, 0xc0, 0x00),
-        (0x0a, 0x01, 0xc0, 0x00), (0x0f, 0x01, 0xc0, 0x00),
-        (0x18, 0x01, 0xc0, 0x00), (0x1f, 0x01, 0xc0, 0x00),
-        (0x29, 0x01, 0xc0, 0x00), (0x38, 0x01, 0xc0, 0x01),
-        (0x03, 0x01, 0xc1, 0x00), (0x06, 0x01, 0xc1, 0x00),
-        (0x0a, 0x01, 0xc1, 0x00), (0x0f, 0x01, 0xc1, 0x00),
-        (0x18, 0x01, 0xc1, 0x00), (0x1f, 0x01, 0xc1, 0x00),
-        (0x29, 0x01, 0xc1, 0x00), (0x38, 0x01, 0xc1, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xc8, 0x00), (0x06, 0x01, 0xc8, 0x00),
-        (0x0a, 0x01, 0xc8, 0x00), (0x0f, 0x01, 0xc8, 0x00),
-        (0x18, 0x01, 0xc8, 0x00), (0x1f, 0x01, 0xc8, 0x00),
-        (0x29, 0x01, 0xc8, 0x00), (0x38, 0x01, 0xc8, 0x01),
-        (0x03, 0x01, 0xc9, 0x00), (0x06, 0x01, 0xc9, 0x00),
-        (0x0a, 0x01, 0xc9, 0x00), (0x0f, 0x01, 0xc9, 0x00),
-        (0x18, 0x01, 0xc9, 0x00), (0x1f, 0x01, 0xc9, 0x00),
-        (0x29, 0x01, 0xc9, 0x00), (0x38, 0x01, 0xc9, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xca, 0x00), (0x09, 0x01, 0xca, 0x00),
-        (0x17, 0x01, 0xca, 0x00), (0x28, 0x01, 0xca, 0x01),
-        (0x02, 0x01, 0xcd, 0x00), (0x09, 0x01, 0xcd, 0x00),
-        (0x17, 0x01, 0xcd, 0x00), (0x28, 0x01, 0xcd, 0x01),
-        (0x02, 0x01, 0xd2, 0x00), (0x09, 0x01, 0xd2, 0x00),
-        (0x17, 0x01, 0xd2, 0x00), (0x28, 0x01, 0xd2, 0x01),
-        (0x02, 0x01, 0xd5, 0x00), (0x09, 0x01, 0xd5, 0x00),
-        (0x17, 0x01, 0xd5, 0x00), (0x28, 0x01, 0xd5, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xca, 0x00), (0x06, 0x01, 0xca, 0x00),
-        (0x0a, 0x01, 0xca, 0x00), (0x0f, 0x01, 0xca, 0x00),
-        (0x18, 0x01, 0xca, 0x00), (0x1f, 0x01, 0xca, 0x00),
-        (0x29, 0x01, 0xca, 0x00), (0x38, 0x01, 0xca, 0x01),
-        (0x03, 0x01, 0xcd, 0x00), (0x06, 0x01, 0xcd, 0x00),
-        (0x0a, 0x01, 0xcd, 0x00), (0x0f, 0x01, 0xcd, 0x00),
-        (0x18, 0x01, 0xcd, 0x00), (0x1f, 0x01, 0xcd, 0x00),
-        (0x29, 0x01, 0xcd, 0x00), (0x38, 0x01, 0xcd, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xd2, 0x00), (0x06, 0x01, 0xd2, 0x00),
-        (0x0a, 0x01, 0xd2, 0x00), (0x0f, 0x01, 0xd2, 0x00),
-        (0x18, 0x01, 0xd2, 0x00), (0x1f, 0x01, 0xd2, 0x00),
-        (0x29, 0x01, 0xd2, 0x00), (0x38, 0x01, 0xd2, 0x01),
-        (0x03, 0x01, 0xd5, 0x00), (0x06, 0x01, 0xd5, 0x00),
-        (0x0a, 0x01, 0xd5, 0x00), (0x0f, 0x01, 0xd5, 0x00),
-        (0x18, 0x01, 0xd5, 0x00), (0x1f, 0x01, 0xd5, 0x00),
-        (0x29, 0x01, 0xd5, 0x00), (0x38, 0x01, 0xd5, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0xda, 0x00), (0x16, 0x01, 0xda, 0x01),
-        (0x01, 0x01, 0xdb, 0x00), (0x16, 0x01, 0xdb, 0x01),
-        (0x01, 0x01, 0xee, 0x00), (0x16, 0x01, 0xee, 0x01),
-        (0x01, 0x01, 0xf0, 0x00), (0x16, 0x01, 0xf0, 0x01),
-        (0x01, 0x01, 0xf2, 0x00), (0x16, 0x01, 0xf2, 0x01),
-        (0x01, 0x01, 0xf3, 0x00), (0x16, 0x01, 0xf3, 0x01),
-        (0x01, 0x01, 0xff, 0x00), (0x16, 0x01, 0xff, 0x01),
-        (0x00, 0x01, 0xcb, 0x01), (0x00, 0x01, 0xcc, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xda, 0x00), (0x09, 0x01, 0xda, 0x00),
-        (0x17, 0x01, 0xda, 0x00), (0x28, 0x01, 0xda, 0x01),
-        (0x02, 0x01, 0xdb, 0x00), (0x09, 0x01, 0xdb, 0x00),
-        (0x17, 0x01, 0xdb, 0x00), (0x28, 0x01, 0xdb, 0x01),
-        (0x02, 0x01, 0xee, 0x00), (0x09, 0x01, 0xee, 0x00),
-        (0x17, 0x01, 0xee, 0x00), (0x28, 0x01, 0xee, 0x01),
-        (0x02, 0x01, 0xf0, 0x00), (0x09, 0x01, 0xf0, 0x00),
-        (0x17, 0x01, 0xf0, 0x00), (0x28, 0x01, 0xf0, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xda, 0x00), (0x06, 0x01, 0xda, 0x00),
-        (0x0a, 0x01, 0xda, 0x00), (0x0f, 0x01, 0xda, 0x00),
-        (0x18, 0x01, 0xda, 0x00), (0x1f, 0x01, 0xda, 0x00),
-        (0x29, 0x01, 0xda, 0x00), (0x38, 0x01, 0xda, 0x01),
-        (0x03, 0x01, 0xdb, 0x00), (0x06, 0x01, 0xdb, 0x00),
-        (0x0a, 0x01, 0xdb, 0x00), (0x0f, 0x01, 0xdb, 0x00),
-        (0x18, 0x01, 0xdb, 0x00), (0x1f, 0x01, 0xdb, 0x00),
-        (0x29, 0x01, 0xdb, 0x00), (0x38, 0x01, 0xdb, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xee, 0x00), (0x06, 0x01, 0xee, 0x00),
-        (0x0a, 0x01, 0xee, 0x00), (0x0f, 0x01, 0xee, 0x00),
-        (0x18, 0x01, 0xee, 0x00), (0x1f, 0x01, 0xee, 0x00),
-        (0x29, 0x01, 0xee, 0x00), (0x38, 0x01, 0xee, 0x01),
-        (0x03, 0x01, 0xf0, 0x00), (0x06, 0x01, 0xf0, 0x00),
-        (0x0a, 0x01, 0xf0, 0x00), (0x0f, 0x01, 0xf0, 0x00),
-        (0x18, 0x01, 0xf0, 0x00), (0x1f, 0x01, 0xf0, 0x00),
-        (0x29, 0x01, 0xf0, 0x00), (0x38, 0x01, 0xf0, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xf2, 0x00), (0x09, 0x01, 0xf2, 0x00),
-        (0x17, 0x01, 0xf2, 0x00), (0x28, 0x01, 0xf2, 0x01),
-        (0x02, 0x01, 0xf3, 0x00), (0x09, 0x01, 0xf3, 0x00),
-        (0x17, 0x01, 0xf3, 0x00), (0x28, 0x01, 0xf3, 0x01),
-        (0x02, 0x01, 0xff, 0x00), (0x09, 0x01, 0xff, 0x00),
-        (0x17, 0x01, 0xff, 0x00), (0x28, 0x01, 0xff, 0x01),
-        (0x01, 0x01, 0xcb, 0x00), (0x16, 0x01, 0xcb, 0x01),
-        (0x01, 0x01, 0xcc, 0x00), (0x16, 0x01, 0xcc, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xf2, 0x00), (0x06, 0x01, 0xf2, 0x00),
-        (0x0a, 0x01, 0xf2, 0x00), (0x0f, 0x01, 0xf2, 0x00),
-        (0x18, 0x01, 0xf2, 0x00), (0x1f, 0x01, 0xf2, 0x00),
-        (0x29, 0x01, 0xf2, 0x00), (0x38, 0x01, 0xf2, 0x01),
-        (0x03, 0x01, 0xf3, 0x00), (0x06, 0x01, 0xf3, 0x00),
-        (0x0a, 0x01, 0xf3, 0x00), (0x0f, 0x01, 0xf3, 0x00),
-        (0x18, 0x01, 0xf3, 0x00), (0x1f, 0x01, 0xf3, 0x00),
-        (0x29, 0x01, 0xf3, 0x00), (0x38, 0x01, 0xf3, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xff, 0x00), (0x06, 0x01, 0xff, 0x00),
-        (0x0a, 0x01, 0xff, 0x00), (0x0f, 0x01, 0xff, 0x00),
-        (0x18, 0x01, 0xff, 0x00), (0x1f, 0x01, 0xff, 0x00),
-        (0x29, 0x01, 0xff, 0x00), (0x38, 0x01, 0xff, 0x01),
-        (0x02, 0x01, 0xcb, 0x00), (0x09, 0x01, 0xcb, 0x00),
-        (0x17, 0x01, 0xcb, 0x00), (0x28, 0x01, 0xcb, 0x01),
-        (0x02, 0x01, 0xcc, 0x00), (0x09, 0x01, 0xcc, 0x00),
-        (0x17, 0x01, 0xcc, 0x00), (0x28, 0x01, 0xcc, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xcb, 0x00), (0x06, 0x01, 0xcb, 0x00),
-        (0x0a, 0x01, 0xcb, 0x00), (0x0f, 0x01, 0xcb, 0x00),
-        (0x18, 0x01, 0xcb, 0x00), (0x1f, 0x01, 0xcb, 0x00),
-        (0x29, 0x01, 0xcb, 0x00), (0x38, 0x01, 0xcb, 0x01),
-        (0x03, 0x01, 0xcc, 0x00), (0x06, 0x01, 0xcc, 0x00),
-        (0x0a, 0x01, 0xcc, 0x00), (0x0f, 0x01, 0xcc, 0x00),
-        (0x18, 0x01, 0xcc, 0x00), (0x1f, 0x01, 0xcc, 0x00),
-        (0x29, 0x01, 0xcc, 0x00), (0x38, 0x01, 0xcc, 0x01)
-    ),
-    (
-        (0xd3, 0x00, 0x00, 0x00), (0xd4, 0x00, 0x00, 0x00),
-        (0xd6, 0x00, 0x00, 0x00), (0xd7, 0x00, 0x00, 0x00),
-        (0xda, 0x00, 0x00, 0x00), (0xdb, 0x00, 0x00, 0x00),
-        (0xdd, 0x00, 0x00, 0x00), (0xde, 0x00, 0x00, 0x00),
-        (0xe2, 0x00, 0x00, 0x00), (0xe4, 0x00, 0x00, 0x00),
-        (0xe8, 0x00, 0x00, 0x00), (0xeb, 0x00, 0x00, 0x00),
-        (0xf0, 0x00, 0x00, 0x00), (0xf3, 0x00, 0x00, 0x00),
-        (0xf7, 0x00, 0x00, 0x00), (0xfa, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x00, 0x01, 0xd3, 0x01), (0x00, 0x01, 0xd4, 0x01),
-        (0x00, 0x01, 0xd6, 0x01), (0x00, 0x01, 0xdd, 0x01),
-        (0x00, 0x01, 0xde, 0x01), (0x00, 0x01, 0xdf, 0x01),
-        (0x00, 0x01, 0xf1, 0x01), (0x00, 0x01, 0xf4, 0x01),
-        (0x00, 0x01, 0xf5, 0x01), (0x00, 0x01, 0xf6, 0x01),
-        (0x00, 0x01, 0xf7, 0x01), (0x00, 0x01, 0xf8, 0x01),
-        (0x00, 0x01, 0xfa, 0x01), (0x00, 0x01, 0xfb, 0x01),
-        (0x00, 0x01, 0xfc, 0x01), (0x00, 0x01, 0xfd, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0xd3, 0x00), (0x16, 0x01, 0xd3, 0x01),
-        (0x01, 0x01, 0xd4, 0x00), (0x16, 0x01, 0xd4, 0x01),
-        (0x01, 0x01, 0xd6, 0x00), (0x16, 0x01, 0xd6, 0x01),
-        (0x01, 0x01, 0xdd, 0x00), (0x16, 0x01, 0xdd, 0x01),
-        (0x01, 0x01, 0xde, 0x00), (0x16, 0x01, 0xde, 0x01),
-        (0x01, 0x01, 0xdf, 0x00), (0x16, 0x01, 0xdf, 0x01),
-        (0x01, 0x01, 0xf1, 0x00), (0x16, 0x01, 0xf1, 0x01),
-        (0x01, 0x01, 0xf4, 0x00), (0x16, 0x01, 0xf4, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xd3, 0x00), (0x09, 0x01, 0xd3, 0x00),
-        (0x17, 0x01, 0xd3, 0x00), (0x28, 0x01, 0xd3, 0x01),
-        (0x02, 0x01, 0xd4, 0x00), (0x09, 0x01, 0xd4, 0x00),
-        (0x17, 0x01, 0xd4, 0x00), (0x28, 0x01, 0xd4, 0x01),
-        (0x02, 0x01, 0xd6, 0x00), (0x09, 0x01, 0xd6, 0x00),
-        (0x17, 0x01, 0xd6, 0x00), (0x28, 0x01, 0xd6, 0x01),
-        (0x02, 0x01, 0xdd, 0x00), (0x09, 0x01, 0xdd, 0x00),
-        (0x17, 0x01, 0xdd, 0x00), (0x28, 0x01, 0xdd, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xd3, 0x00), (0x06, 0x01, 0xd3, 0x00),
-        (0x0a, 0x01, 0xd3, 0x00), (0x0f, 0x01, 0xd3, 0x00),
-        (0x18, 0x01, 0xd3, 0x00), (0x1f, 0x01, 0xd3, 0x00),
-        (0x29, 0x01, 0xd3, 0x00), (0x38, 0x01, 0xd3, 0x01),
-        (0x03, 0x01, 0xd4, 0x00), (0x06, 0x01, 0xd4, 0x00),
-        (0x0a, 0x01, 0xd4, 0x00), (0x0f, 0x01, 0xd4, 0x00),
-        (0x18, 0x01, 0xd4, 0x00), (0x1f, 0x01, 0xd4, 0x00),
-        (0x29, 0x01, 0xd4, 0x00), (0x38, 0x01, 0xd4, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xd6, 0x00), (0x06, 0x01, 0xd6, 0x00),
-        (0x0a, 0x01, 0xd6, 0x00), (0x0f, 0x01, 0xd6, 0x00),
-        (0x18, 0x01, 0xd6, 0x00), (0x1f, 0x01, 0xd6, 0x00),
-        (0x29, 0x01, 0xd6, 0x00), (0x38, 0x01, 0xd6, 0x01),
-        (0x03, 0x01, 0xdd, 0x00), (0x06, 0x01, 0xdd, 0x00),
-        (0x0a, 0x01, 0xdd, 0x00), (0x0f, 0x01, 0xdd, 0x00),
-        (0x18, 0x01, 0xdd, 0x00), (0x1f, 0x01, 0xdd, 0x00),
-        (0x29, 0x01, 0xdd, 0x00), (0x38, 0x01, 0xdd, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xde, 0x00), (0x09, 0x01, 0xde, 0x00),
-        (0x17, 0x01, 0xde, 0x00), (0x28, 0x01, 0xde, 0x01),
-        (0x02, 0x01, 0xdf, 0x00), (0x09, 0x01, 0xdf, 0x00),
-        (0x17, 0x01, 0xdf, 0x00), (0x28, 0x01, 0xdf, 0x01),
-        (0x02, 0x01, 0xf1, 0x00), (0x09, 0x01, 0xf1, 0x00),
-        (0x17, 0x01, 0xf1, 0x00), (0x28, 0x01, 0xf1, 0x01),
-        (0x02, 0x01, 0xf4, 0x00), (0x09, 0x01, 0xf4, 0x00),
-        (0x17, 0x01, 0xf4, 0x00), (0x28, 0x01, 0xf4, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xde, 0x00), (0x06, 0x01, 0xde, 0x00),
-        (0x0a, 0x01, 0xde, 0x00), (0x0f, 0x01, 0xde, 0x00),
-        (0x18, 0x01, 0xde, 0x00), (0x1f, 0x01, 0xde, 0x00),
-        (0x29, 0x01, 0xde, 0x00), (0x38, 0x01, 0xde, 0x01),
-        (0x03, 0x01, 0xdf, 0x00), (0x06, 0x01, 0xdf, 0x00),
-        (0x0a, 0x01, 0xdf, 0x00), (0x0f, 0x01, 0xdf, 0x00),
-        (0x18, 0x01, 0xdf, 0x00), (0x1f, 0x01, 0xdf, 0x00),
-        (0x29, 0x01, 0xdf, 0x00), (0x38, 0x01, 0xdf, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xf1, 0x00), (0x06, 0x01, 0xf1, 0x00),
-        (0x0a, 0x01, 0xf1, 0x00), (0x0f, 0x01, 0xf1, 0x00),
-        (0x18, 0x01, 0xf1, 0x00), (0x1f, 0x01, 0xf1, 0x00),
-        (0x29, 0x01, 0xf1, 0x00), (0x38, 0x01, 0xf1, 0x01),
-        (0x03, 0x01, 0xf4, 0x00), (0x06, 0x01, 0xf4, 0x00),
-        (0x0a, 0x01, 0xf4, 0x00), (0x0f, 0x01, 0xf4, 0x00),
-        (0x18, 0x01, 0xf4, 0x00), (0x1f, 0x01, 0xf4, 0x00),
-        (0x29, 0x01, 0xf4, 0x00), (0x38, 0x01, 0xf4, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0xf5, 0x00), (0x16, 0x01, 0xf5, 0x01),
-        (0x01, 0x01, 0xf6, 0x00), (0x16, 0x01, 0xf6, 0x01),
-        (0x01, 0x01, 0xf7, 0x00), (0x16, 0x01, 0xf7, 0x01),
-        (0x01, 0x01, 0xf8, 0x00), (0x16, 0x01, 0xf8, 0x01),
-        (0x01, 0x01, 0xfa, 0x00), (0x16, 0x01, 0xfa, 0x01),
-        (0x01, 0x01, 0xfb, 0x00), (0x16, 0x01, 0xfb, 0x01),
-        (0x01, 0x01, 0xfc, 0x00), (0x16, 0x01, 0xfc, 0x01),
-        (0x01, 0x01, 0xfd, 0x00), (0x16, 0x01, 0xfd, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xf5, 0x00), (0x09, 0x01, 0xf5, 0x00),
-        (0x17, 0x01, 0xf5, 0x00), (0x28, 0x01, 0xf5, 0x01),
-        (0x02, 0x01, 0xf6, 0x00), (0x09, 0x01, 0xf6, 0x00),
-        (0x17, 0x01, 0xf6, 0x00), (0x28, 0x01, 0xf6, 0x01),
-        (0x02, 0x01, 0xf7, 0x00), (0x09, 0x01, 0xf7, 0x00),
-        (0x17, 0x01, 0xf7, 0x00), (0x28, 0x01, 0xf7, 0x01),
-        (0x02, 0x01, 0xf8, 0x00), (0x09, 0x01, 0xf8, 0x00),
-        (0x17, 0x01, 0xf8, 0x00), (0x28, 0x01, 0xf8, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xf5, 0x00), (0x06, 0x01, 0xf5, 0x00),
-        (0x0a, 0x01, 0xf5, 0x00), (0x0f, 0x01, 0xf5, 0x00),
-        (0x18, 0x01, 0xf5, 0x00), (0x1f, 0x01, 0xf5, 0x00),
-        (0x29, 0x01, 0xf5, 0x00), (0x38, 0x01, 0xf5, 0x01),
-        (0x03, 0x01, 0xf6, 0x00), (0x06, 0x01, 0xf6, 0x00),
-        (0x0a, 0x01, 0xf6, 0x00), (0x0f, 0x01, 0xf6, 0x00),
-        (0x18, 0x01, 0xf6, 0x00), (0x1f, 0x01, 0xf6, 0x00),
-        (0x29, 0x01, 0xf6, 0x00), (0x38, 0x01, 0xf6, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xf7, 0x00), (0x06, 0x01, 0xf7, 0x00),
-        (0x0a, 0x01, 0xf7, 0x00), (0x0f, 0x01, 0xf7, 0x00),
-        (0x18, 0x01, 0xf7, 0x00), (0x1f, 0x01, 0xf7, 0x00),
-        (0x29, 0x01, 0xf7, 0x00), (0x38, 0x01, 0xf7, 0x01),
-        (0x03, 0x01, 0xf8, 0x00), (0x06, 0x01, 0xf8, 0x00),
-        (0x0a, 0x01, 0xf8, 0x00), (0x0f, 0x01, 0xf8, 0x00),
-        (0x18, 0x01, 0xf8, 0x00), (0x1f, 0x01, 0xf8, 0x00),
-        (0x29, 0x01, 0xf8, 0x00), (0x38, 0x01, 0xf8, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xfa, 0x00), (0x09, 0x01, 0xfa, 0x00),
-        (0x17, 0x01, 0xfa, 0x00), (0x28, 0x01, 0xfa, 0x01),
-        (0x02, 0x01, 0xfb, 0x00), (0x09, 0x01, 0xfb, 0x00),
-        (0x17, 0x01, 0xfb, 0x00), (0x28, 0x01, 0xfb, 0x01),
-        (0x02, 0x01, 0xfc, 0x00), (0x09, 0x01, 0xfc, 0x00),
-        (0x17, 0x01, 0xfc, 0x00), (0x28, 0x01, 0xfc, 0x01),
-        (0x02, 0x01, 0xfd, 0x00), (0x09, 0x01, 0xfd, 0x00),
-        (0x17, 0x01, 0xfd, 0x00), (0x28, 0x01, 0xfd, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xfa, 0x00), (0x06, 0x01, 0xfa, 0x00),
-        (0x0a, 0x01, 0xfa, 0x00), (0x0f, 0x01, 0xfa, 0x00),
-        (0x18, 0x01, 0xfa, 0x00), (0x1f, 0x01, 0xfa, 0x00),
-        (0x29, 0x01, 0xfa, 0x00), (0x38, 0x01, 0xfa, 0x01),
-        (0x03, 0x01, 0xfb, 0x00), (0x06, 0x01, 0xfb, 0x00),
-        (0x0a, 0x01, 0xfb, 0x00), (0x0f, 0x01, 0xfb, 0x00),
-        (0x18, 0x01, 0xfb, 0x00), (0x1f, 0x01, 0xfb, 0x00),
-        (0x29, 0x01, 0xfb, 0x00), (0x38, 0x01, 0xfb, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xfc, 0x00), (0x06, 0x01, 0xfc, 0x00),
-        (0x0a, 0x01, 0xfc, 0x00), (0x0f, 0x01, 0xfc, 0x00),
-        (0x18, 0x01, 0xfc, 0x00), (0x1f, 0x01, 0xfc, 0x00),
-        (0x29, 0x01, 0xfc, 0x00), (0x38, 0x01, 0xfc, 0x01),
-        (0x03, 0x01, 0xfd, 0x00), (0x06, 0x01, 0xfd, 0x00),
-        (0x0a, 0x01, 0xfd, 0x00), (0x0f, 0x01, 0xfd, 0x00),
-        (0x18, 0x01, 0xfd, 0x00), (0x1f, 0x01, 0xfd, 0x00),
-        (0x29, 0x01, 0xfd, 0x00), (0x38, 0x01, 0xfd, 0x01)
-    ),
-    (
-        (0x00, 0x01, 0xfe, 0x01), (0xe3, 0x00, 0x00, 0x00),
-        (0xe5, 0x00, 0x00, 0x00), (0xe6, 0x00, 0x00, 0x00),
-        (0xe9, 0x00, 0x00, 0x00), (0xea, 0x00, 0x00, 0x00),
-        (0xec, 0x00, 0x00, 0x00), (0xed, 0x00, 0x00, 0x00),
-        (0xf1, 0x00, 0x00, 0x00), (0xf2, 0x00, 0x00, 0x00),
-        (0xf4, 0x00, 0x00, 0x00), (0xf5, 0x00, 0x00, 0x00),
-        (0xf8, 0x00, 0x00, 0x00), (0xf9, 0x00, 0x00, 0x00),
-        (0xfb, 0x00, 0x00, 0x00), (0xfc, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0xfe, 0x00), (0x16, 0x01, 0xfe, 0x01),
-        (0x00, 0x01, 0x02, 0x01), (0x00, 0x01, 0x03, 0x01),
-        (0x00, 0x01, 0x04, 0x01), (0x00, 0x01, 0x05, 0x01),
-        (0x00, 0x01, 0x06, 0x01), (0x00, 0x01, 0x07, 0x01),
-        (0x00, 0x01, 0x08, 0x01), (0x00, 0x01, 0x0b, 0x01),
-        (0x00, 0x01, 0x0c, 0x01), (0x00, 0x01, 0x0e, 0x01),
-        (0x00, 0x01, 0x0f, 0x01), (0x00, 0x01, 0x10, 0x01),
-        (0x00, 0x01, 0x11, 0x01), (0x00, 0x01, 0x12, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0xfe, 0x00), (0x09, 0x01, 0xfe, 0x00),
-        (0x17, 0x01, 0xfe, 0x00), (0x28, 0x01, 0xfe, 0x01),
-        (0x01, 0x01, 0x02, 0x00), (0x16, 0x01, 0x02, 0x01),
-        (0x01, 0x01, 0x03, 0x00), (0x16, 0x01, 0x03, 0x01),
-        (0x01, 0x01, 0x04, 0x00), (0x16, 0x01, 0x04, 0x01),
-        (0x01, 0x01, 0x05, 0x00), (0x16, 0x01, 0x05, 0x01),
-        (0x01, 0x01, 0x06, 0x00), (0x16, 0x01, 0x06, 0x01),
-        (0x01, 0x01, 0x07, 0x00), (0x16, 0x01, 0x07, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xfe, 0x00), (0x06, 0x01, 0xfe, 0x00),
-        (0x0a, 0x01, 0xfe, 0x00), (0x0f, 0x01, 0xfe, 0x00),
-        (0x18, 0x01, 0xfe, 0x00), (0x1f, 0x01, 0xfe, 0x00),
-        (0x29, 0x01, 0xfe, 0x00), (0x38, 0x01, 0xfe, 0x01),
-        (0x02, 0x01, 0x02, 0x00), (0x09, 0x01, 0x02, 0x00),
-        (0x17, 0x01, 0x02, 0x00), (0x28, 0x01, 0x02, 0x01),
-        (0x02, 0x01, 0x03, 0x00), (0x09, 0x01, 0x03, 0x00),
-        (0x17, 0x01, 0x03, 0x00), (0x28, 0x01, 0x03, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x02, 0x00), (0x06, 0x01, 0x02, 0x00),
-        (0x0a, 0x01, 0x02, 0x00), (0x0f, 0x01, 0x02, 0x00),
-        (0x18, 0x01, 0x02, 0x00), (0x1f, 0x01, 0x02, 0x00),
-        (0x29, 0x01, 0x02, 0x00), (0x38, 0x01, 0x02, 0x01),
-        (0x03, 0x01, 0x03, 0x00), (0x06, 0x01, 0x03, 0x00),
-        (0x0a, 0x01, 0x03, 0x00), (0x0f, 0x01, 0x03, 0x00),
-        (0x18, 0x01, 0x03, 0x00), (0x1f, 0x01, 0x03, 0x00),
-        (0x29, 0x01, 0x03, 0x00), (0x38, 0x01, 0x03, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x04, 0x00), (0x09, 0x01, 0x04, 0x00),
-        (0x17, 0x01, 0x04, 0x00), (0x28, 0x01, 0x04, 0x01),
-        (0x02, 0x01, 0x05, 0x00), (0x09, 0x01, 0x05, 0x00),
-        (0x17, 0x01, 0x05, 0x00), (0x28, 0x01, 0x05, 0x01),
-        (0x02, 0x01, 0x06, 0x00), (0x09, 0x01, 0x06, 0x00),
-        (0x17, 0x01, 0x06, 0x00), (0x28, 0x01, 0x06, 0x01),
-        (0x02, 0x01, 0x07, 0x00), (0x09, 0x01, 0x07, 0x00),
-        (0x17, 0x01, 0x07, 0x00), (0x28, 0x01, 0x07, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x04, 0x00), (0x06, 0x01, 0x04, 0x00),
-        (0x0a, 0x01, 0x04, 0x00), (0x0f, 0x01, 0x04, 0x00),
-        (0x18, 0x01, 0x04, 0x00), (0x1f, 0x01, 0x04, 0x00),
-        (0x29, 0x01, 0x04, 0x00), (0x38, 0x01, 0x04, 0x01),
-        (0x03, 0x01, 0x05, 0x00), (0x06, 0x01, 0x05, 0x00),
-        (0x0a, 0x01, 0x05, 0x00), (0x0f, 0x01, 0x05, 0x00),
-        (0x18, 0x01, 0x05, 0x00), (0x1f, 0x01, 0x05, 0x00),
-        (0x29, 0x01, 0x05, 0x00), (0x38, 0x01, 0x05, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x06, 0x00), (0x06, 0x01, 0x06, 0x00),
-        (0x0a, 0x01, 0x06, 0x00), (0x0f, 0x01, 0x06, 0x00),
-        (0x18, 0x01, 0x06, 0x00), (0x1f, 0x01, 0x06, 0x00),
-        (0x29, 0x01, 0x06, 0x00), (0x38, 0x01, 0x06, 0x01),
-        (0x03, 0x01, 0x07, 0x00), (0x06, 0x01, 0x07, 0x00),
-        (0x0a, 0x01, 0x07, 0x00), (0x0f, 0x01, 0x07, 0x00),
-        (0x18, 0x01, 0x07, 0x00), (0x1f, 0x01, 0x07, 0x00),
-        (0x29, 0x01, 0x07, 0x00), (0x38, 0x01, 0x07, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x08, 0x00), (0x16, 0x01, 0x08, 0x01),
-        (0x01, 0x01, 0x0b, 0x00), (0x16, 0x01, 0x0b, 0x01),
-        (0x01, 0x01, 0x0c, 0x00), (0x16, 0x01, 0x0c, 0x01),
-        (0x01, 0x01, 0x0e, 0x00), (0x16, 0x01, 0x0e, 0x01),
-        (0x01, 0x01, 0x0f, 0x00), (0x16, 0x01, 0x0f, 0x01),
-        (0x01, 0x01, 0x10, 0x00), (0x16, 0x01, 0x10, 0x01),
-        (0x01, 0x01, 0x11, 0x00), (0x16, 0x01, 0x11, 0x01),
-        (0x01, 0x01, 0x12, 0x00), (0x16, 0x01, 0x12, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x08, 0x00), (0x09, 0x01, 0x08, 0x00),
-        (0x17, 0x01, 0x08, 0x00), (0x28, 0x01, 0x08, 0x01),
-        (0x02, 0x01, 0x0b, 0x00), (0x09, 0x01, 0x0b, 0x00),
-        (0x17, 0x01, 0x0b, 0x00), (0x28, 0x01, 0x0b, 0x01),
-        (0x02, 0x01, 0x0c, 0x00), (0x09, 0x01, 0x0c, 0x00),
-        (0x17, 0x01, 0x0c, 0x00), (0x28, 0x01, 0x0c, 0x01),
-        (0x02, 0x01, 0x0e, 0x00), (0x09, 0x01, 0x0e, 0x00),
-        (0x17, 0x01, 0x0e, 0x00), (0x28, 0x01, 0x0e, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x08, 0x00), (0x06, 0x01, 0x08, 0x00),
-        (0x0a, 0x01, 0x08, 0x00), (0x0f, 0x01, 0x08, 0x00),
-        (0x18, 0x01, 0x08, 0x00), (0x1f, 0x01, 0x08, 0x00),
-        (0x29, 0x01, 0x08, 0x00), (0x38, 0x01, 0x08, 0x01),
-        (0x03, 0x01, 0x0b, 0x00), (0x06, 0x01, 0x0b, 0x00),
-        (0x0a, 0x01, 0x0b, 0x00), (0x0f, 0x01, 0x0b, 0x00),
-        (0x18, 0x01, 0x0b, 0x00), (0x1f, 0x01, 0x0b, 0x00),
-        (0x29, 0x01, 0x0b, 0x00), (0x38, 0x01, 0x0b, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x0c, 0x00), (0x06, 0x01, 0x0c, 0x00),
-        (0x0a, 0x01, 0x0c, 0x00), (0x0f, 0x01, 0x0c, 0x00),
-        (0x18, 0x01, 0x0c, 0x00), (0x1f, 0x01, 0x0c, 0x00),
-        (0x29, 0x01, 0x0c, 0x00), (0x38, 0x01, 0x0c, 0x01),
-        (0x03, 0x01, 0x0e, 0x00), (0x06, 0x01, 0x0e, 0x00),
-        (0x0a, 0x01, 0x0e, 0x00), (0x0f, 0x01, 0x0e, 0x00),
-        (0x18, 0x01, 0x0e, 0x00), (0x1f, 0x01, 0x0e, 0x00),
-        (0x29, 0x01, 0x0e, 0x00), (0x38, 0x01, 0x0e, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x0f, 0x00), (0x09, 0x01, 0x0f, 0x00),
-        (0x17, 0x01, 0x0f, 0x00), (0x28, 0x01, 0x0f, 0x01),
-        (0x02, 0x01, 0x10, 0x00), (0x09, 0x01, 0x10, 0x00),
-        (0x17, 0x01, 0x10, 0x00), (0x28, 0x01, 0x10, 0x01),
-        (0x02, 0x01, 0x11, 0x00), (0x09, 0x01, 0x11, 0x00),
-        (0x17, 0x01, 0x11, 0x00), (0x28, 0x01, 0x11, 0x01),
-        (0x02, 0x01, 0x12, 0x00), (0x09, 0x01, 0x12, 0x00),
-        (0x17, 0x01, 0x12, 0x00), (0x28, 0x01, 0x12, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x0f, 0x00), (0x06, 0x01, 0x0f, 0x00),
-        (0x0a, 0x01, 0x0f, 0x00), (0x0f, 0x01, 0x0f, 0x00),
-        (0x18, 0x01, 0x0f, 0x00), (0x1f, 0x01, 0x0f, 0x00),
-        (0x29, 0x01, 0x0f, 0x00), (0x38, 0x01, 0x0f, 0x01),
-        (0x03, 0x01, 0x10, 0x00), (0x06, 0x01, 0x10, 0x00),
-        (0x0a, 0x01, 0x10, 0x00), (0x0f, 0x01, 0x10, 0x00),
-        (0x18, 0x01, 0x10, 0x00), (0x1f, 0x01, 0x10, 0x00),
-        (0x29, 0x01, 0x10, 0x00), (0x38, 0x01, 0x10, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x11, 0x00), (0x06, 0x01, 0x11, 0x00),
-        (0x0a, 0x01, 0x11, 0x00), (0x0f, 0x01, 0x11, 0x00),
-        (0x18, 0x01, 0x11, 0x00), (0x1f, 0x01, 0x11, 0x00),
-        (0x29, 0x01, 0x11, 0x00), (0x38, 0x01, 0x11, 0x01),
-        (0x03, 0x01, 0x12, 0x00), (0x06, 0x01, 0x12, 0x00),
-        (0x0a, 0x01, 0x12, 0x00), (0x0f, 0x01, 0x12, 0x00),
-        (0x18, 0x01, 0x12, 0x00), (0x1f, 0x01, 0x12, 0x00),
-        (0x29, 0x01, 0x12, 0x00), (0x38, 0x01, 0x12, 0x01)
-    ),
-    (
-        (0x00, 0x01, 0x13, 0x01), (0x00, 0x01, 0x14, 0x01),
-        (0x00, 0x01, 0x15, 0x01), (0x00, 0x01, 0x17, 0x01),
-        (0x00, 0x01, 0x18, 0x01), (0x00, 0x01, 0x19, 0x01),
-        (0x00, 0x01, 0x1a, 0x01), (0x00, 0x01, 0x1b, 0x01),
-        (0x00, 0x01, 0x1c, 0x01), (0x00, 0x01, 0x1d, 0x01),
-        (0x00, 0x01, 0x1e, 0x01), (0x00, 0x01, 0x1f, 0x01),
-        (0x00, 0x01, 0x7f, 0x01), (0x00, 0x01, 0xdc, 0x01),
-        (0x00, 0x01, 0xf9, 0x01), (0xfd, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x13, 0x00), (0x16, 0x01, 0x13, 0x01),
-        (0x01, 0x01, 0x14, 0x00), (0x16, 0x01, 0x14, 0x01),
-        (0x01, 0x01, 0x15, 0x00), (0x16, 0x01, 0x15, 0x01),
-        (0x01, 0x01, 0x17, 0x00), (0x16, 0x01, 0x17, 0x01),
-        (0x01, 0x01, 0x18, 0x00), (0x16, 0x01, 0x18, 0x01),
-        (0x01, 0x01, 0x19, 0x00), (0x16, 0x01, 0x19, 0x01),
-        (0x01, 0x01, 0x1a, 0x00), (0x16, 0x01, 0x1a, 0x01),
-        (0x01, 0x01, 0x1b, 0x00), (0x16, 0x01, 0x1b, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x13, 0x00), (0x09, 0x01, 0x13, 0x00),
-        (0x17, 0x01, 0x13, 0x00), (0x28, 0x01, 0x13, 0x01),
-        (0x02, 0x01, 0x14, 0x00), (0x09, 0x01, 0x14, 0x00),
-        (0x17, 0x01, 0x14, 0x00), (0x28, 0x01, 0x14, 0x01),
-        (0x02, 0x01, 0x15, 0x00), (0x09, 0x01, 0x15, 0x00),
-        (0x17, 0x01, 0x15, 0x00), (0x28, 0x01, 0x15, 0x01),
-        (0x02, 0x01, 0x17, 0x00), (0x09, 0x01, 0x17, 0x00),
-        (0x17, 0x01, 0x17, 0x00), (0x28, 0x01, 0x17, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x13, 0x00), (0x06, 0x01, 0x13, 0x00),
-        (0x0a, 0x01, 0x13, 0x00), (0x0f, 0x01, 0x13, 0x00),
-        (0x18, 0x01, 0x13, 0x00), (0x1f, 0x01, 0x13, 0x00),
-        (0x29, 0x01, 0x13, 0x00), (0x38, 0x01, 0x13, 0x01),
-        (0x03, 0x01, 0x14, 0x00), (0x06, 0x01, 0x14, 0x00),
-        (0x0a, 0x01, 0x14, 0x00), (0x0f, 0x01, 0x14, 0x00),
-        (0x18, 0x01, 0x14, 0x00), (0x1f, 0x01, 0x14, 0x00),
-        (0x29, 0x01, 0x14, 0x00), (0x38, 0x01, 0x14, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x15, 0x00), (0x06, 0x01, 0x15, 0x00),
-        (0x0a, 0x01, 0x15, 0x00), (0x0f, 0x01, 0x15, 0x00),
-        (0x18, 0x01, 0x15, 0x00), (0x1f, 0x01, 0x15, 0x00),
-        (0x29, 0x01, 0x15, 0x00), (0x38, 0x01, 0x15, 0x01),
-        (0x03, 0x01, 0x17, 0x00), (0x06, 0x01, 0x17, 0x00),
-        (0x0a, 0x01, 0x17, 0x00), (0x0f, 0x01, 0x17, 0x00),
-        (0x18, 0x01, 0x17, 0x00), (0x1f, 0x01, 0x17, 0x00),
-        (0x29, 0x01, 0x17, 0x00), (0x38, 0x01, 0x17, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x18, 0x00), (0x09, 0x01, 0x18, 0x00),
-        (0x17, 0x01, 0x18, 0x00), (0x28, 0x01, 0x18, 0x01),
-        (0x02, 0x01, 0x19, 0x00), (0x09, 0x01, 0x19, 0x00),
-        (0x17, 0x01, 0x19, 0x00), (0x28, 0x01, 0x19, 0x01),
-        (0x02, 0x01, 0x1a, 0x00), (0x09, 0x01, 0x1a, 0x00),
-        (0x17, 0x01, 0x1a, 0x00), (0x28, 0x01, 0x1a, 0x01),
-        (0x02, 0x01, 0x1b, 0x00), (0x09, 0x01, 0x1b, 0x00),
-        (0x17, 0x01, 0x1b, 0x00), (0x28, 0x01, 0x1b, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x18, 0x00), (0x06, 0x01, 0x18, 0x00),
-        (0x0a, 0x01, 0x18, 0x00), (0x0f, 0x01, 0x18, 0x00),
-        (0x18, 0x01, 0x18, 0x00), (0x1f, 0x01, 0x18, 0x00),
-        (0x29, 0x01, 0x18, 0x00), (0x38, 0x01, 0x18, 0x01),
-        (0x03, 0x01, 0x19, 0x00), (0x06, 0x01, 0x19, 0x00),
-        (0x0a, 0x01, 0x19, 0x00), (0x0f, 0x01, 0x19, 0x00),
-        (0x18, 0x01, 0x19, 0x00), (0x1f, 0x01, 0x19, 0x00),
-        (0x29, 0x01, 0x19, 0x00), (0x38, 0x01, 0x19, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x1a, 0x00), (0x06, 0x01, 0x1a, 0x00),
-        (0x0a, 0x01, 0x1a, 0x00), (0x0f, 0x01, 0x1a, 0x00),
-        (0x18, 0x01, 0x1a, 0x00), (0x1f, 0x01, 0x1a, 0x00),
-        (0x29, 0x01, 0x1a, 0x00), (0x38, 0x01, 0x1a, 0x01),
-        (0x03, 0x01, 0x1b, 0x00), (0x06, 0x01, 0x1b, 0x00),
-        (0x0a, 0x01, 0x1b, 0x00), (0x0f, 0x01, 0x1b, 0x00),
-        (0x18, 0x01, 0x1b, 0x00), (0x1f, 0x01, 0x1b, 0x00),
-        (0x29, 0x01, 0x1b, 0x00), (0x38, 0x01, 0x1b, 0x01)
-    ),
-    (
-        (0x01, 0x01, 0x1c, 0x00), (0x16, 0x01, 0x1c, 0x01),
-        (0x01, 0x01, 0x1d, 0x00), (0x16, 0x01, 0x1d, 0x01),
-        (0x01, 0x01, 0x1e, 0x00), (0x16, 0x01, 0x1e, 0x01),
-        (0x01, 0x01, 0x1f, 0x00), (0x16, 0x01, 0x1f, 0x01),
-        (0x01, 0x01, 0x7f, 0x00), (0x16, 0x01, 0x7f, 0x01),
-        (0x01, 0x01, 0xdc, 0x00), (0x16, 0x01, 0xdc, 0x01),
-        (0x01, 0x01, 0xf9, 0x00), (0x16, 0x01, 0xf9, 0x01),
-        (0xfe, 0x00, 0x00, 0x00), (0xff, 0x00, 0x00, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x1c, 0x00), (0x09, 0x01, 0x1c, 0x00),
-        (0x17, 0x01, 0x1c, 0x00), (0x28, 0x01, 0x1c, 0x01),
-        (0x02, 0x01, 0x1d, 0x00), (0x09, 0x01, 0x1d, 0x00),
-        (0x17, 0x01, 0x1d, 0x00), (0x28, 0x01, 0x1d, 0x01),
-        (0x02, 0x01, 0x1e, 0x00), (0x09, 0x01, 0x1e, 0x00),
-        (0x17, 0x01, 0x1e, 0x00), (0x28, 0x01, 0x1e, 0x01),
-        (0x02, 0x01, 0x1f, 0x00), (0x09, 0x01, 0x1f, 0x00),
-        (0x17, 0x01, 0x1f, 0x00), (0x28, 0x01, 0x1f, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x1c, 0x00), (0x06, 0x01, 0x1c, 0x00),
-        (0x0a, 0x01, 0x1c, 0x00), (0x0f, 0x01, 0x1c, 0x00),
-        (0x18, 0x01, 0x1c, 0x00), (0x1f, 0x01, 0x1c, 0x00),
-        (0x29, 0x01, 0x1c, 0x00), (0x38, 0x01, 0x1c, 0x01),
-        (0x03, 0x01, 0x1d, 0x00), (0x06, 0x01, 0x1d, 0x00),
-        (0x0a, 0x01, 0x1d, 0x00), (0x0f, 0x01, 0x1d, 0x00),
-        (0x18, 0x01, 0x1d, 0x00), (0x1f, 0x01, 0x1d, 0x00),
-        (0x29, 0x01, 0x1d, 0x00), (0x38, 0x01, 0x1d, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x1e, 0x00), (0x06, 0x01, 0x1e, 0x00),
-        (0x0a, 0x01, 0x1e, 0x00), (0x0f, 0x01, 0x1e, 0x00),
-        (0x18, 0x01, 0x1e, 0x00), (0x1f, 0x01, 0x1e, 0x00),
-        (0x29, 0x01, 0x1e, 0x00), (0x38, 0x01, 0x1e, 0x01),
-        (0x03, 0x01, 0x1f, 0x00), (0x06, 0x01, 0x1f, 0x00),
-        (0x0a, 0x01, 0x1f, 0x00), (0x0f, 0x01, 0x1f, 0x00),
-        (0x18, 0x01, 0x1f, 0x00), (0x1f, 0x01, 0x1f, 0x00),
-        (0x29, 0x01, 0x1f, 0x00), (0x38, 0x01, 0x1f, 0x01)
-    ),
-    (
-        (0x02, 0x01, 0x7f, 0x00), (0x09, 0x01, 0x7f, 0x00),
-        (0x17, 0x01, 0x7f, 0x00), (0x28, 0x01, 0x7f, 0x01),
-        (0x02, 0x01, 0xdc, 0x00), (0x09, 0x01, 0xdc, 0x00),
-        (0x17, 0x01, 0xdc, 0x00), (0x28, 0x01, 0xdc, 0x01),
-        (0x02, 0x01, 0xf9, 0x00), (0x09, 0x01, 0xf9, 0x00),
-        (0x17, 0x01, 0xf9, 0x00), (0x28, 0x01, 0xf9, 0x01),
-        (0x00, 0x01, 0x0a, 0x01), (0x00, 0x01, 0x0d, 0x01),
-        (0x00, 0x01, 0x16, 0x01), (0xfa, 0x00, 0x00, 0x00)
-    ),
-    (
-        (0x03, 0x01, 0x7f, 0x00), (0x06, 0x01, 0x7f, 0x00),
-        (0x0a, 0x01, 0x7f, 0x00), (0x0f, 0x01, 0x7f, 0x00),
-        (0x18, 0x01, 0x7f, 0x00), (0x1f, 0x01, 0x7f, 0x00),
-        (0x29, 0x01, 0x7f, 0x00), (0x38, 0x01, 0x7f, 0x01),
-        (0x03, 0x01, 0xdc, 0x00), (0x06, 0x01, 0xdc, 0x00),
-        (0x0a, 0x01, 0xdc, 0x00), (0x0f, 0x01, 0xdc, 0x00),
-        (0x18, 0x01, 0xdc, 0x00), (0x1f, 0x01, 0xdc, 0x00),
-        (0x29, 0x01, 0xdc, 0x00), (0x38, 0x01, 0xdc, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0xf9, 0x00), (0x06, 0x01, 0xf9, 0x00),
-        (0x0a, 0x01, 0xf9, 0x00), (0x0f, 0x01, 0xf9, 0x00),
-        (0x18, 0x01, 0xf9, 0x00), (0x1f, 0x01, 0xf9, 0x00),
-        (0x29, 0x01, 0xf9, 0x00), (0x38, 0x01, 0xf9, 0x01),
-        (0x01, 0x01, 0x0a, 0x00), (0x16, 0x01, 0x0a, 0x01),
-        (0x01, 0x01, 0x0d, 0x00), (0x16, 0x01, 0x0d, 0x01),
-        (0x01, 0x01, 0x16, 0x00), (0x16, 0x01, 0x16, 0x01),
-        (0xfc, 0x00, 0x00, 0x00), (0xfc, 0x00, 0x00, 0x00)
-    ),
-    (
-        (0x02, 0x01, 0x0a, 0x00), (0x09, 0x01, 0x0a, 0x00),
-        (0x17, 0x01, 0x0a, 0x00), (0x28, 0x01, 0x0a, 0x01),
-        (0x02, 0x01, 0x0d, 0x00), (0x09, 0x01, 0x0d, 0x00),
-        (0x17, 0x01, 0x0d, 0x00), (0x28, 0x01, 0x0d, 0x01),
-        (0x02, 0x01, 0x16, 0x00), (0x09, 0x01, 0x16, 0x00),
-        (0x17, 0x01, 0x16, 0x00), (0x28, 0x01, 0x16, 0x01),
-        (0xfd, 0x00, 0x00, 0x00), (0xfd, 0x00, 0x00, 0x00),
-        (0xfd, 0x00, 0x00, 0x00), (0xfd, 0x00, 0x00, 0x00)
-    ),
-    (
-        (0x03, 0x01, 0x0a, 0x00), (0x06, 0x01, 0x0a, 0x00),
-        (0x0a, 0x01, 0x0a, 0x00), (0x0f, 0x01, 0x0a, 0x00),
-        (0x18, 0x01, 0x0a, 0x00), (0x1f, 0x01, 0x0a, 0x00),
-        (0x29, 0x01, 0x0a, 0x00), (0x38, 0x01, 0x0a, 0x01),
-        (0x03, 0x01, 0x0d, 0x00), (0x06, 0x01, 0x0d, 0x00),
-        (0x0a, 0x01, 0x0d, 0x00), (0x0f, 0x01, 0x0d, 0x00),
-        (0x18, 0x01, 0x0d, 0x00), (0x1f, 0x01, 0x0d, 0x00),
-        (0x29, 0x01, 0x0d, 0x00), (0x38, 0x01, 0x0d, 0x01)
-    ),
-    (
-        (0x03, 0x01, 0x16, 0x00), (0x06, 0x01, 0x16, 0x00),
-        (0x0a, 0x01, 0x16, 0x00), (0x0f, 0x01, 0x16, 0x00),
-        (0x18, 0x01, 0x16, 0x00), (0x1f, 0x01, 0x16, 0x00),
-        (0x29, 0x01, 0x16, 0x00), (0x38, 0x01, 0x16, 0x01),
-        (0xff, 0x00, 0x00, 0x00), (0xff, 0x00, 0x00, 0x00),
-        (0xff, 0x00, 0x00, 0x00), (0xff, 0x00, 0x00, 0x00),
-        (0xff, 0x00, 0x00, 0x00), (0xff, 0x00, 0x00, 0x00),
-        (0xff, 0x00, 0x00, 0x00), (0xff, 0x00, 0x00, 0x00)
-    )
-);
 
+# the internal nodes of the code tree are states 0 ~ 255
+HTTP2_HUFF_DECODE_DEAD_STATE = 256
 
-class HTTP2Huffman:
-    """The HTTP/2 Huffman code class."""
+
+def _build_decode_table_8bits(encode_table):
+    """Builds the byte-at-a-time decoding state machine from the code table.
+
+    The states are the internal nodes of the Huffman code tree (the root is
+    state 0), so there are 256 of them, plus a dead state which every invalid
+    input (e.g. the EOS symbol) falls into and never leaves.
+
+    The table is stored flat, the entry of a byte in a state is at
+    ``state << 8 | byte`` of two arrays: ``nexts`` holds the next state and
+    ``emit_ids`` the index in ``emits`` of the (possibly empty) string of
+    symbols decoded by this byte, at most two since the shortest code is
+    5 bits; the distinct strings are shared. ``endings[state]`` tells
+    whether the padding seen so far allows the string to stop in the state.
+
+    :param encode_table: the (code, len) table, indexed by symbol.
+    :rtype: a tuple (nexts, emit_ids, emits, endings).
+    """
+    # EOS is never a valid symbol inside the string, but it shapes the tree.
+    codes = tuple(encode_table) + ((0x3fffffff, 30),)
+    eos = len(codes) - 1
+
+    # a child is either an internal node index (> 0) or ~symbol for a leaf,
+    # 0 stands for a not yet allocated node as the root has no parent.
+    tree = [[0, 0]]
+    for sym, (code, length) in enumerate(codes):
+        node = 0
+        for shift in range_iter(length - 1, 0, -1):
+            bit = code >> shift & 1
+            if tree[node][bit] == 0:
+                tree[node][bit] = len(tree)
+                tree.append([0, 0])
+            node = tree[node][bit]
+
+        tree[node][code & 1] = ~sym
+
+    dead = HTTP2_HUFF_DECODE_DEAD_STATE
+    tree.append([dead, dead])
+    singles = [pack(">B", sym) for sym in range_iter(256)]
+
+    # padding is the most significant bits of EOS (all ones), strictly
+    # shorter than 8 bits.
+    endings = array("B", [0] * (dead + 1))
+    node = 0
+    endings[node] = 1
+    for _ in range_iter(7):
+        node = tree[node][1]
+        endings[node] = 1
+
+    nexts, emit_ids = array("H"), array("H")
+    emits, ids = [empty_unit], {empty_unit: 0}
+    for state in range_iter(dead):
+        # expand one bit per round, MSB first, so that after 8 rounds the
+        # i-th item is the outcome of the byte i.
+        row = [(state, empty_unit)]
+        for _ in range_iter(8):
+            expanded = []
+            for node, emit in row:
+                for child in tree[node]:
+                    if child > 0:
+                        expanded.append((child, emit))
+                    elif ~child == eos:
+                        expanded.append((dead, emit))
+                    else:
+                        expanded.append((0, emit + singles[~child]))
+            row = expanded
+
+        for node, emit in row:
+            if node == dead:
+                emit = empty_unit
+
+            emit_id = ids.get(emit)
+            if emit_id is None:
+                emit_id = ids[emit] = len(emits)
+                emits.append(emit)
+
+            nexts.append(node)
+            emit_ids.append(emit_id)
+
+    nexts.extend([dead] * 256)
+    emit_ids.extend([0] * 256)
+    return nexts, emit_ids, tuple(emits), endings
+
+
+# (nexts, emit_ids, emits, endings), see _build_decode_table_8bits(), built
+# on first use by _load_decode_table_8bits() as it takes longer than the
+# rest of the module to set up.
+http2_huff_decode_table_8bits = None
+_decode_table_8bits_lock = Lock()
+
+
+def _load_decode_table_8bits():
+    """Returns the 8 bits decoding table, builds it if not yet done."""
+    global http2_huff_decode_table_8bits
+
+    with _decode_table_8bits_lock:
+        if http2_huff_decode_table_8bits is None:
+            http2_huff_decode_table_8bits = \
+                _build_decode_table_8bits(http2_huff_encode_table)
+
+    return http2_huff_decode_table_8bits
+
+
+# code lengths (in bits), indexed by symbol
+http2_huff_length_table = tuple(item[1] for item in http2_huff_encode_table)
+http2_huff_length_table_lc = \
+    tuple(item[1] for item in http2_huff_encode_table_lc)
+
+# codes as strings of "0" and "1", indexed by symbol
+http2_huff_bits_table = tuple(format(code, "0%db" % size)
+                              for code, size in http2_huff_encode_table)
+http2_huff_bits_table_lc = tuple(format(code, "0%db" % size)
+                                 for code, size in http2_huff_encode_table_lc)
+
+# the most significant bits of EOS, used as padding
+HTTP2_HUFF_PADDING = "1" * 7
+
+
+def encoded_length(payload, lower=False):
+    """Calculates the size of the payload after Huffman encoding, without
+    encoding it.
+
+    :param payload: the data waits for encoding.
+    :param lower: True for ignoring uppercase.
+    :rtype: the encoded size in bytes, padding included.
+    """
+    table = http2_huff_length_table_lc if lower else http2_huff_length_table
+    bits = sum(map(table.__getitem__, bytearray(payload)))
+    return (bits + 7) >> 3
+
+
+def encode(payload, lower=False):
+    """Encodes the payload (bytes for py3 and str for py2) with Huffman
+    Code.
+
+    The code of the whole payload is assembled as a string of bits, which
+    is then converted to an integer and to bytes at once.
+
+    :param payload: the data waits for encoding.
+    :param lower: True for ignoring uppercase.
+    :rtype: the encoded data stream.
+    """
+    if not isinstance(payload, unit_type):
+        raise ValueError("unexpected type \"%s\"" % type(payload))
+
+    table = http2_huff_bits_table_lc if lower else http2_huff_bits_table
+    bits = "".join(map(table.__getitem__, bytearray(payload)))
+    bits += HTTP2_HUFF_PADDING
+    size = len(bits) >> 3
+    if size == 0:
+        return empty_unit
+
+    return int_to_bytes(int(bits[:size << 3], 2), size)
+
+
+# NumPy is optional and slow to import, it is looked up on the first
+# encode_many() call by _load_numpy().
+_numpy = None
+_numpy_tables = {}
+
+# the maximum number of symbols encoded by a vectorized round, it bounds
+# the temporary arrays to a few megabytes.
+HTTP2_HUFF_NUMPY_CHUNK = 1 << 17
+
+
+def _load_numpy():
+    """Returns the numpy module, or False if it is not installed."""
+    global _numpy
+
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+
+        _numpy = numpy
+
+    return _numpy
+
+
+def _encode_many_numpy(np, values, lower):
+    """Encodes a batch of strings with vectorized table lookups.
+    This is an internal function called by encode_many.
+
+    The padding of every string is added as a pseudo symbol, so that the
+    codes of the whole batch form a single bit stream where each string
+    starts at a byte boundary. The codes are left-aligned in rows of 16
+    bits (enough for all the printable characters) or 32 bits, unpacked to
+    bits, masked to their lengths, and packed back to bytes at once.
+    """
+    tables = _numpy_tables.get(lower)
+    if tables is None:
+        table = http2_huff_encode_table_lc if lower else http2_huff_encode_table
+        tables = _numpy_tables[lower] = (
+            np.array([code for code, _ in table], dtype=np.uint32),
+            np.array([size for _, size in table], dtype=np.uint8),
+        )
+
+    sizes = np.array([len(value) for value in values], dtype=np.int64)
+    syms = np.frombuffer(empty_unit.join(values), dtype=np.uint8)
+    codes, lens = tables[0][syms], tables[1][syms]
+
+    ends = np.cumsum(sizes)
+    bits_cum = np.zeros(len(syms) + 1, dtype=np.int64)
+    np.cumsum(lens, out=bits_cum[1:])
+    bits = bits_cum[ends] - bits_cum[ends - sizes]
+    padding = (-bits) & 7
+    codes = np.insert(codes, ends, (1 << padding) - 1)
+    lens = np.insert(lens, ends, padding)
+
+    if lens.max() <= 16:
+        width, dtype = 16, ">u2"
+    else:
+        width, dtype = 32, ">u4"
+
+    rows = (codes << (width - lens).astype(np.uint32)).astype(dtype)
+    rows = np.unpackbits(rows.view(np.uint8)).reshape(-1, width)
+    stream = rows[np.arange(width, dtype=np.uint8) < lens[:, None]]
+    encoded = np.packbits(stream).tobytes()
+
+    offsets = [0]
+    offsets.extend(np.cumsum((bits + padding) >> 3).tolist())
+    return [encoded[offsets[i]:offsets[i + 1]] for i in range_iter(len(values))]
+
+
+def encode_many(values, lower=False):
+    """Encodes a batch of strings with Huffman Code.
+
+    With NumPy installed, the codes of the whole batch are looked up and
+    packed with vectorized operations, which pays off for large batches,
+    e.g. when precomputing header blocks. Otherwise it falls back to
+    :func:`encode` for every string.
+
+    :param values: a sequence of payloads (bytes for py3 and str for py2).
+    :param lower: True for ignoring uppercase.
+    :rtype: a list of the encoded data streams, in the same order.
+    """
+    np = _load_numpy()
+    if not np:
+        return [encode(value, lower) for value in values]
+
+    encoded, batch, count = [], [], 0
+    for value in values:
+        if not isinstance(value, unit_type):
+            raise ValueError("unexpected type \"%s\"" % type(value))
+
+        batch.append(value)
+        count += len(value)
+        if count >= HTTP2_HUFF_NUMPY_CHUNK:
+            encoded.extend(_encode_many_numpy(np, batch, lower))
+            batch, count = [], 0
+
+    if batch:
+        encoded.extend(_encode_many_numpy(np, batch, lower))
+
+    return encoded
+
+
+def _decode_8bits(payload, state):
+    """Runs the 8 bits state machine over the payload.
+    This is an internal function called by decode and HTTP2HuffmanDecoder.
+
+    :param payload: the data waits to decode.
+    :param state: the state to start from, 0 for a new string.
+    :rtype: a tuple (the plain string, the state reached).
+    """
+    table = http2_huff_decode_table_8bits or _load_decode_table_8bits()
+    nexts, emit_ids, emits = table[:3]
+    data = []
+    append = data.append
+    for ch in bytearray(payload):
+        index = state << 8 | ch
+        state = nexts[index]
+        append(emits[emit_ids[index]])
+
+    return empty_unit.join(data), state
+
+
+def _check_ending(state):
+    """Checks that a string may stop in the state.
+    This is an internal function called by decode and HTTP2HuffmanDecoder.
+    """
+    table = http2_huff_decode_table_8bits or _load_decode_table_8bits()
+    if not table[3][state]:
+        if state == HTTP2_HUFF_DECODE_DEAD_STATE:
+            raise HTTP2HpackHuffmanDecodeError("invalid code")
+        raise HTTP2HpackHuffmanDecodeError("incomplete code")
+
+
+def decode(payload):
+    """Decodes the payload to the plain string.
+    The payload is consumed a byte per step with the 8 bits state table,
+    which emits all the symbols completed by that byte at once.
+
+    :param payload: the data waits to decode.
+    :rtype: the plain string.
+    """
+    data, state = _decode_8bits(payload, 0)
+    _check_ending(state)
+    return data
+
+
+class HTTP2HuffmanDecoder(object):
+    """The incremental HTTP/2 Huffman decoder.
+
+    A Huffman encoded string can span several frames (HEADERS plus
+    CONTINUATION), the decoder carries its state across the chunks so that
+    they can be decoded as they arrive instead of being concatenated first.
+
+    Usage::
+
+      >>> decoder = HTTP2HuffmanDecoder()
+      >>> decoder.feed(b"\xf1\xe3\xc2\xe5\xf2\x3a")
+      b'www.exa'
+      >>> decoder.feed(b"\x6b\xa0\xab\x90\xf4\xff")
+      b'mple.com'
+      >>> decoder.finish()
+    """
     def __init__(self):
-        self.__encode_table = http2_huff_encode_table
-        self.__encode_table_lc = http2_huff_encode_table_lc
-        self.__decode_table = http2_huff_decode_table
-        self.__sizeof_buf = 64
-        self.__decode_state = 0
-        self.__decode_ending = False
+        self.__state = 0
 
     def __repr__(self):
-        return "<class HTTP2Huffman>"
+        return "<HTTP/2 Huffman decoder, state 0x%x>" % self.__state
+
+    def feed(self, chunk):
+        """Decodes the next chunk of the string.
 
-    def __decode_4bits(self, data, bits):
-        """Decodes the huffman code with 4 bits.
-        This is an internal method called by encode.
+        The decoder is reset if the chunk is invalid.
 
-        :param bits: 4 bits
-        :rtype: whether decoding error happens
+        :param chunk: a piece of the encoded string.
+        :rtype: the symbols completed by this chunk.
         """
-        state = self.__decode_state
-        code = self.__decode_table[state][bits]
-        if code[0] == state:
-            return False
-        if code[1] == 0x01:
-            data.append(chr(code[2]))
+        data, state = _decode_8bits(chunk, self.__state)
+        if state == HTTP2_HUFF_DECODE_DEAD_STATE:
+            self.__state = 0
+            raise HTTP2HpackHuffmanDecodeError("invalid code")
 
-        self.__decode_state = code[0]
-        self.__decode_ending = code[3]
-        return True
+        self.__state = state
+        return data
 
-    def encode(self, payload, lower=False):
-        """Encodes the payload (bytes for py3 and str for py2) with Huffman
-        Code.
+    def finish(self):
+        """Checks that the string is complete, then resets the decoder so
+        that it can be used for the next string.
+        """
+        state, self.__state = self.__state, 0
+        _check_ending(state)
 
-        :param payload: the data waits for encoding.
-        :param lower: True for ignoring uppercase.
-        :rtype: the encoded data stream.
+
+class HTTP2HuffmanCache(object):
+    """A bounded LRU cache of Huffman encoded/decoded strings.
+
+    The size of an entry is the length of its input plus the length of its
+    output, the least recently used entries are dropped once the total size
+    exceeds the budget. Lookups are serialized by a lock, so the cache can be
+    shared between threads.
+
+    :param max_size: the byte budget.
+    """
+    def __init__(self, max_size):
+        if max_size < 0:
+            raise ValueError("invalid cache size %d" % max_size)
+
+        self.__entries = OrderedDict()
+        self.__lock = Lock()
+        self.__size = 0
+        self.__max_size = max_size
+        self.__hits = 0
+        self.__misses = 0
+
+    def __repr__(self):
+        return "<HTTP/2 Huffman cache %d/%d bytes>" % (self.__size,
+                                                      self.__max_size)
+
+    def __len__(self):
+        return len(self.__entries)
+
+    @property
+    def size(self):
+        """Returns the current size (in bytes) of the cached entries."""
+        return self.__size
+
+    @property
+    def max_size(self):
+        """Returns the byte budget."""
+        return self.__max_size
+
+    @property
+    def hits(self):
+        """Returns the number of lookups which found the entry."""
+        return self.__hits
+
+    @property
+    def misses(self):
+        """Returns the number of lookups which missed."""
+        return self.__misses
+
+    def get(self, key):
+        """Looks up the entry and marks it as the most recently used.
+
+        :param key: the cache key.
+        :rtype: the cached value or None if missing.
         """
-        if not isinstance(payload, unit_type):
-            raise ValueError("unexpected type \"%s\"" % type(payload))
+        with self.__lock:
+            entry = self.__entries.pop(key, None)
+            if entry is None:
+                self.__misses += 1
+                return None
+
+            self.__entries[key] = entry
+            self.__hits += 1
+            return entry[0]
+
+    def put(self, key, value, size):
+        """Adds an entry, evicts the least recently used entries if needed.
+
+        :param key: the cache key.
+        :param value: the cached value.
+        :param size: the size (in bytes) charged to the budget.
+        """
+        if size > self.__max_size:
+            return
+
+        with self.__lock:
+            entry = self.__entries.pop(key, None)
+            if entry is not None:
+                self.__size -= entry[1]
+
+            while self.__size + size > self.__max_size:
+                self.__size -= self.__entries.popitem(last=False)[1][1]
+
+            self.__entries[key] = (value, size)
+            self.__size += size
+
+    def clear(self):
+        """Drops all the entries and resets the counters."""
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+            self.__hits = 0
+            self.__misses = 0
+
 
-        table = self.__encode_table_lc if lower else self.__encode_table
-        pending, buf, size_buf = 0, uint64(0), self.__sizeof_buf
-        encoded = list()
+class HTTP2Huffman:
+    """The HTTP/2 Huffman code class.
 
-        for e in payload:
-            huff = table[ord(e) if is_py2 else e]
-            code = huff[0]
-            pending += huff[1]
-            if pending < size_buf:
-                buf.value |= code << (size_buf - pending)
-                continue
+    It holds no decoding state, all the work is done by the module level
+    functions with locals, so a single instance (:data:`http2_huffman`) can
+    be shared by every connection and thread.
 
-            # pending > size_buf
-            pending -= size_buf
-            buf.value |= code >> pending
+    Repeated header values can be served by bounded LRU caches placed in
+    front of :meth:`encode` and :meth:`decode`, which are disabled by
+    default.
 
-            map(encoded.append, pack(">Q", buf.value))
-            buf.value = code << (size_buf - pending) if pending > 0 else 0
+    :param cache_size: the byte budget of each of the encoding and decoding
+                       caches, 0 disables them.
+    """
+    encoded_length = staticmethod(encoded_length)
+    encode_many = staticmethod(encode_many)
 
-        if pending == 0:
-            return empty_unit.join(encoded)
+    def __init__(self, cache_size=0):
+        self.encode_cache = None
+        self.decode_cache = None
+        if cache_size > 0:
+            self.encode_cache = HTTP2HuffmanCache(cache_size)
+            self.decode_cache = HTTP2HuffmanCache(cache_size)
 
-        buf.value |= uint64(-1).value >> pending
-        if pending % 8 > 0:
-            pending = (pending // 8 + 1) * 8
+    def __repr__(self):
+        return "<class HTTP2Huffman>"
 
-        buf.value >>= size_buf - pending
+    def encode(self, payload, lower=False):
+        """Encodes the payload with Huffman Code, see :func:`encode`.
 
-        rest = []
-        while pending > 0:
-            map(rest.append, pack(">B", buf.value & 0xff))
-            buf.value >>= 8
-            pending -= 8
+        :param payload: the data waits for encoding.
+        :param lower: True for ignoring uppercase.
+        :rtype: the encoded data stream.
+        """
+        cache = self.encode_cache
+        if cache is None or not isinstance(payload, unit_type):
+            # the uncached path rejects the other types.
+            return encode(payload, lower)
 
-        rest.reverse()
-        encoded += rest
+        key = (payload, lower)
+        encoded = cache.get(key)
+        if encoded is None:
+            encoded = encode(payload, lower)
+            cache.put(key, encoded, len(payload) + len(encoded))
 
-        return empty_unit.join(encoded)
+        return encoded
 
     def decode(self, payload):
-        """Decodes the payload to the plain string.
+        """Decodes the payload to the plain string, see :func:`decode`.
 
         :param payload: the data waits to decode.
         :rtype: the plain string.
         """
-        err_msg = "huffman decode error with state 0x%x and code 0x%x"
-        self.__decode_ending = False
-        self.__decode_state = 0
-        data = []
-        for ch in payload:
-            ch = ord(ch)
-            if not self.__decode_4bits(data, ch >> 4 & 0xf):
-                msg = err_msg % (self.__decode_state, ch >> 4 & 0xf)
-                raise HTTP2HpackHuffmanDecodeError(msg)
-
-            if not self.__decode_4bits(data, ch & 0xf):
-                msg = err_msg % (self.__decode_state, ch & 0xf)
-                raise HTTP2HpackHuffmanDecodeError(msg)
-
-        if self.__decode_ending is False:
-            raise HTTP2HpackHuffmanDecodeError("incomplete code")
-
-        return "".join(data)
+        cache = self.decode_cache
+        if cache is None:
+            return decode(payload)
+
+        if not isinstance(payload, unit_type):
+            # e.g. a memoryview, which cannot be a key
+            payload = unit_type(bytearray(payload))
+
+        data = cache.get(payload)
+        if data is None:
+            data = decode(payload)
+            cache.put(payload, data, len(payload) + len(data))
+
+        return data
+
+
+# the shared codec
+http2_huffman = HTTP2Huffman()
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+
+"""
+hpack-test-case generator
+~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Writes the stories of this directory, run it from anywhere with::
+
+    $ python tests/hpack-test-case/generate.py
+
+The rfc7541 stories carry the wire of RFC 7541, Appendix C.3 to C.6. The
+raw-data stories are synthetic traffic, derived from sha256 digests of
+fixed seeds, so the output is the same from one run to the other.
+"""
+
+import json
+import os
+from base64 import urlsafe_b64encode
+from hashlib import md5
+from hashlib import sha256
+
+
+directory = os.path.dirname(os.path.abspath(__file__))
+
+
+def token(seed, size):
+    """Makes a base64url token from the seed.
+
+    :param seed: str, the seed.
+    :param size: the length of the token.
+    :rtype: str.
+    """
+    chunks = []
+    digest = seed.encode("ascii")
+    while sum(map(len, chunks)) < size:
+        digest = sha256(digest).digest()
+        chunks.append(urlsafe_b64encode(digest).rstrip(b"=").decode("ascii"))
+
+    return "".join(chunks)[:size]
+
+
+def pick(seed, n):
+    """Picks a number in [0, n) from the seed."""
+    return int(sha256(seed.encode("ascii")).hexdigest(), 16) % n
+
+
+def dump(path, description, cases):
+    with open(os.path.join(directory, path), "w") as f:
+        json.dump({"description": description, "cases": cases}, f,
+                  indent=2, sort_keys=True, separators=(",", ": "))
+        f.write("\n")
+
+
+def rfc7541_story(blocks, header_table_size):
+    """Makes the cases of a story with wire.
+
+    :param blocks: a list of tuples (headers, hex wire).
+    :param header_table_size: the header table size of the story.
+    :rtype: a list of cases.
+    """
+    cases = []
+    for seqno, (headers, wire) in enumerate(blocks):
+        case = {"seqno": seqno, "wire": wire,
+                "headers": [{name: value} for name, value in headers]}
+        if seqno == 0:
+            case["header_table_size"] = header_table_size
+        cases.append(case)
+
+    return cases
+
+
+rfc7541_requests = (
+    [(":method", "GET"), (":scheme", "http"), (":path", "/"),
+     (":authority", "www.example.com")],
+    [(":method", "GET"), (":scheme", "http"), (":path", "/"),
+     (":authority", "www.example.com"), ("cache-control", "no-cache")],
+    [(":method", "GET"), (":scheme", "https"), (":path", "/index.html"),
+     (":authority", "www.example.com"), ("custom-key", "custom-value")],
+)
+
+rfc7541_responses = (
+    [(":status", "302"), ("cache-control", "private"),
+     ("date", "Mon, 21 Oct 2013 20:13:21 GMT"),
+     ("location", "https://www.example.com")],
+    [(":status", "307"), ("cache-control", "private"),
+     ("date", "Mon, 21 Oct 2013 20:13:21 GMT"),
+     ("location", "https://www.example.com")],
+    [(":status", "200"), ("cache-control", "private"),
+     ("date", "Mon, 21 Oct 2013 20:13:22 GMT"),
+     ("location", "https://www.example.com"), ("content-encoding", "gzip"),
+     ("set-cookie",
+      "foo=ASDJKHQKBZXOQWEOPIUAXQWEOIU; max-age=3600; version=1")],
+)
+
+# name: (description, header lists, header table size, wire)
+rfc7541_stories = {
+    "c3": ("RFC 7541, C.3, requests without Huffman coding.",
+           rfc7541_requests, 4096,
+           ("828684410f7777772e6578616d706c652e636f6d",
+            "828684be58086e6f2d6361636865",
+            "828785bf400a637573746f6d2d6b65790c637573746f6d2d76616c7565")),
+    "c4": ("RFC 7541, C.4, requests with Huffman coding.",
+           rfc7541_requests, 4096,
+           ("828684418cf1e3c2e5f23a6ba0ab90f4ff",
+            "828684be5886a8eb10649cbf",
+            "828785bf408825a849e95ba97d7f8925a849e95bb8e8b4bf")),
+    "c5": ("RFC 7541, C.5, responses without Huffman coding, with evictions.",
+           rfc7541_responses, 256,
+           ("4803333032580770726976617465611d4d6f6e2c203231204f637420323031"
+            "332032303a31333a323120474d546e1768747470733a2f2f7777772e657861"
+            "6d706c652e636f6d",
+            "4803333037c1c0bf",
+            "88c1611d4d6f6e2c203231204f637420323031332032303a31333a32322047"
+            "4d54c05a04677a69707738666f6f3d4153444a4b48514b425a584f5157454f"
+            "50495541585157454f49553b206d61782d6167653d333630303b2076657273"
+            "696f6e3d31")),
+    "c6": ("RFC 7541, C.6, responses with Huffman coding, with evictions.",
+           rfc7541_responses, 256,
+           ("488264025885aec3771a4b6196d07abe941054d444a8200595040b8166e082"
+            "a62d1bff6e919d29ad171863c78f0b97c8e9ae82ae43d3",
+            "4883640effc1c0bf",
+            "88c16196d07abe941054d444a8200595040b8166e084a62d1bffc05a839bd9"
+            "ab77ad94e7821dd7f2e6c7b335dfdfcd5b3960d5af27087f3672c1ab270fb5"
+            "291f9587316065c003ed4ee5b1063d5007")),
+}
+
+
+def api_client():
+    """A service calling a JSON API for three tenants."""
+    cases = []
+    for i in range(100):
+        tenant = ("acme", "globex", "initech")[pick("tenant%d" % i, 3)]
+        post = pick("post%d" % i, 4) == 0
+        path = "/v2/tenants/%s/orders" % tenant
+        if post:
+            pass
+        elif pick("x%d" % i, 2):
+            path += "/%s?expand=items&fields=id,status,total" % (
+                token("order%d" % i, 12))
+        else:
+            path += "?page=%d&per_page=50&sort=-created_at" % (
+                pick("p%d" % i, 20))
+
+        trace = (md5(("%d" % i).encode("ascii")).hexdigest(),
+                 md5(("s%d" % i).encode("ascii")).hexdigest()[:16])
+        headers = [
+            (":method", "POST" if post else "GET"), (":scheme", "https"),
+            (":authority", "api.example.com"), (":path", path),
+            ("user-agent", "orders-client/3.4.1 python-requests/2.31.0"),
+            ("accept", "application/json"),
+            ("accept-encoding", "gzip, deflate"),
+            ("authorization", "Bearer " + token("jwt" + tenant, 420)),
+            ("x-tenant-id", tenant), ("x-request-id", token("rid%d" % i, 32)),
+            ("traceparent", "00-%s-%s-01" % trace),
+        ]
+        if post:
+            headers += [("content-type", "application/json"),
+                        ("content-length", str(200 + pick("len%d" % i, 3000)))]
+
+        cases.append({"seqno": i,
+                      "headers": [{name: value} for name, value in headers]})
+
+    return cases
+
+
+browser_accept = {
+    "document": "text/html,application/xhtml+xml,application/xml;q=0.9,"
+                "image/avif,image/webp,*/*;q=0.8",
+    "style": "text/css,*/*;q=0.1",
+    "image": "image/avif,image/webp,image/apng,image/svg+xml,image/*,"
+             "*/*;q=0.8",
+}
+
+
+def browser_destination(path, document):
+    if document:
+        return "document"
+    if path.endswith(".css"):
+        return "style"
+    if path.endswith(".js"):
+        return "script"
+    if path.endswith(".woff2"):
+        return "font"
+    if path.startswith("/api"):
+        return "empty"
+    return "image"
+
+
+def browser():
+    """A browser loading ten pages of a site with 7 resources each."""
+    cases = []
+    cookie = ["session=" + token("session", 32),
+              "_ga=GA1.2." + str(10 ** 9 + pick("ga", 10 ** 9))]
+    resources = ["/", "/static/css/main.%s.css" % token("css", 8),
+                 "/static/js/runtime.%s.js" % token("rt", 8),
+                 "/static/js/main.%s.js" % token("js", 8),
+                 "/static/img/logo.svg", "/favicon.ico", "/api/session",
+                 "/static/fonts/inter.woff2"]
+
+    def page_path(page):
+        return "/" if page == 0 else "/products/%s" % token("prod%d" % page, 10)
+
+    for i in range(80):
+        page, resource = divmod(i, 8)
+        document = resource == 0
+        path = resources[resource]
+        if document:
+            path = page_path(page)
+            if page % 3 == 2:
+                cookie.append("pref_%d=%s" % (page,
+                                              token("pref%d" % page, 12)))
+
+        dest = browser_destination(path, document)
+        if dest == "document":
+            mode = "navigate"
+        elif dest in ("empty", "font"):
+            mode = "cors"
+        else:
+            mode = "no-cors"
+
+        headers = [
+            (":method", "GET"), (":scheme", "https"),
+            (":authority", "www.example.com"), (":path", path),
+            ("user-agent", "Mozilla/5.0 (X11; Linux x86_64) "
+                           "AppleWebKit/537.36 (KHTML, like Gecko) "
+                           "Chrome/120.0.0.0 Safari/537.36"),
+            ("accept", browser_accept.get(dest, "*/*")),
+            ("accept-encoding", "gzip, deflate, br"),
+            ("accept-language", "en-US,en;q=0.9,fr;q=0.8"),
+            ("sec-fetch-dest", dest), ("sec-fetch-mode", mode),
+            ("sec-fetch-site", "same-origin"),
+        ]
+        if not document:
+            headers.append(("referer", "https://www.example.com"
+                            + page_path(page)))
+        elif page:
+            headers.append(("referer", "https://www.example.com"
+                            + page_path(page - 1)))
+
+        headers.append(("cookie", "; ".join(cookie)))
+        cases.append({"seqno": i,
+                      "headers": [{name: value} for name, value in headers]})
+
+    return cases
+
+
+def api_responses():
+    """The responses of a JSON API behind a proxy."""
+    cases = []
+    statuses = ("200",) * 7 + ("304", "404", "201")
+    for i in range(100):
+        status = statuses[pick("st%d" % i, 10)]
+        headers = [
+            (":status", status),
+            ("date", "Tue, 14 Nov 2023 09:%02d:%02d GMT" % (12 + i // 60,
+                                                            i % 60)),
+            ("server", "envoy"),
+            ("content-type", "application/json; charset=utf-8"),
+            ("content-length", str(pick("cl%d" % i, 20000))),
+            ("cache-control", "private, max-age=0, no-cache"),
+            ("vary", "Accept-Encoding, Authorization"),
+            ("x-request-id", token("rid%d" % i, 32)),
+            ("x-envoy-upstream-service-time", str(3 + pick("ust%d" % i, 200))),
+            ("strict-transport-security",
+             "max-age=63072000; includeSubDomains; preload"),
+        ]
+        if status in ("200", "304"):
+            headers.append(("etag", '"%s"' % token(
+                "etag%d" % pick("e%d" % i, 30), 27)))
+        if i % 25 == 0:
+            headers.append(("set-cookie", "session=%s; Path=/; Secure; "
+                            "HttpOnly; SameSite=Lax" % token("sess%d" % i, 32)))
+
+        cases.append({"seqno": i,
+                      "headers": [{name: value} for name, value in headers]})
+
+    return cases
+
+
+# path: (description, cases factory)
+raw_data_stories = {
+    "raw-data/story_api_client.json": (
+        "Synthetic traffic: a service calling a JSON API for three tenants, "
+        "with bearer tokens, request ids and trace contexts.", api_client),
+    "raw-data/story_browser.json": (
+        "Synthetic traffic: a browser loading ten pages of a site with their "
+        "resources, the cookie grows along the way.", browser),
+    "raw-data/story_api_responses.json": (
+        "Synthetic traffic: the responses of a JSON API behind a proxy, with "
+        "dates, entity tags and request ids.", api_responses),
+}
+
+
+def main():
+    for name, (description, requests, size, wire) in sorted(
+            rfc7541_stories.items()):
+        dump("rfc7541/story_%s.json" % name, description,
+             rfc7541_story(zip(requests, wire), size))
+
+    for path, (description, factory) in sorted(raw_data_stories.items()):
+        dump(path, description, factory())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,472 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for HTTP/2 frames."""
+
+import errno
+import pytest
+import socket
+
+from binascii import unhexlify
+from struct import pack, unpack
+from http2_adapter.exceptions import HTTP2FrameError
+from http2_adapter.frame import HTTP2ControlFrameCache
+from http2_adapter.frame import HTTP2DataFrame
+from http2_adapter.frame import HTTP2FrameHeader
+from http2_adapter.frame import HTTP2FrameReader
+from http2_adapter.frame import HTTP2FrameWriter
+from http2_adapter.frame import HTTP2GoAwayFrame
+from http2_adapter.frame import HTTP2HeadersFrame
+from http2_adapter.frame import HTTP2PingFrame
+from http2_adapter.frame import HTTP2PriorityFrame
+from http2_adapter.frame import HTTP2PushPromiseFrame
+from http2_adapter.frame import HTTP2RSTStreamFrame
+from http2_adapter.frame import HTTP2SettingsFrame
+from http2_adapter.frame import HTTP2WindowUpdateFrame
+from http2_adapter.frame import HTTP_V2_ACK_FLAG
+from http2_adapter.frame import HTTP_V2_FRAME_PARSERS
+from http2_adapter.frame import HTTP_V2_CONTINUATION_FRAME
+from http2_adapter.frame import HTTP_V2_DATA_FRAME
+from http2_adapter.frame import HTTP_V2_END_HEADERS_FLAG
+from http2_adapter.frame import HTTP_V2_END_STREAM_FLAG
+from http2_adapter.frame import HTTP_V2_GOAWAY_FRAME
+from http2_adapter.frame import HTTP_V2_HEADERS_FRAME
+from http2_adapter.frame import HTTP_V2_PADDED_FLAG
+from http2_adapter.frame import HTTP_V2_PING_FRAME
+from http2_adapter.frame import HTTP_V2_PRIORITY_FRAME
+from http2_adapter.frame import HTTP_V2_PUSH_PROMISE_FRAME
+from http2_adapter.frame import HTTP_V2_RST_STREAM_FRAME
+from http2_adapter.frame import HTTP_V2_SETTINGS_FRAME
+from http2_adapter.frame import HTTP_V2_WINDOW_UPDATE_FRAME
+from http2_adapter.hpack import HTTP2Hpack
+
+
+def build_frame(_type, flags, sid, payload):
+    """Serializes a frame by hand."""
+    return pack(">IBI", len(payload) << 8 | _type, flags, sid) + payload
+
+
+def split_frames(data):
+    """Splits serialized frames to tuples (type, flags, sid, payload)."""
+    frames = []
+    while data:
+        length_type, flags, sid = unpack(">IBI", data[:9])
+        length = length_type >> 8
+        frames.append((length_type & 0xff, flags, sid, data[9:9 + length]))
+        data = data[9 + length:]
+
+    return frames
+
+
+class ShortSocket(object):
+    """Takes at most size bytes a sendmsg or send call, or has no sendmsg
+    at all, and would block once it took limit bytes.
+    """
+    def __init__(self, size, vectored=True, limit=None):
+        self.size = size
+        self.vectored = vectored
+        self.limit = limit
+        self.calls = 0
+        self.data = bytearray()
+
+    def sendmsg(self, buffers):
+        if not self.vectored:
+            raise NotImplementedError("sendmsg")
+
+        return self.send(b"".join(bytes(buf) for buf in buffers))
+
+    def send(self, data):
+        size = self.size
+        if self.limit is not None:
+            size = min(size, self.limit - len(self.data))
+            if size <= 0:
+                raise socket.error(errno.EAGAIN, "would block")
+
+        self.calls += 1
+        data = bytes(data[:size])
+        self.data += data
+        return len(data)
+
+
+class TestHTTP2Frame:
+    def test_frame_header(self):
+        header = HTTP2FrameHeader(HTTP_V2_DATA_FRAME, 16, 3,
+                                  HTTP_V2_END_STREAM_FLAG)
+        assert header.serialize() == b"\x00\x00\x10\x00\x01\x00\x00\x00\x03"
+        assert header.has_flag(HTTP_V2_END_STREAM_FLAG)
+        assert not header.has_flag(HTTP_V2_END_HEADERS_FLAG)
+        assert "DATA" in repr(header)
+
+        assert HTTP2FrameHeader(HTTP_V2_DATA_FRAME, 0, 1).flags == 0
+        with pytest.raises(HTTP2FrameError):
+            HTTP2FrameHeader(HTTP_V2_DATA_FRAME, 0, 1, 0x02)
+
+    def test_headers_frame(self):
+        header = HTTP2FrameHeader(HTTP_V2_HEADERS_FRAME, 0, 1,
+                                  HTTP_V2_END_STREAM_FLAG)
+        frame = HTTP2HeadersFrame(header, "www.example.com", "/", "GET", {
+            "User-Agent": "python-requests/2.31.0",
+            "Accept-Encoding": "gzip, deflate",
+            "Accept": "*/*",
+            "Connection": "keep-alive",
+            "X-Tenant-ID": u"acm\xe9",
+            b"x-raw": b"\xff",
+            "TE": "gzip",
+        })
+        assert frame.header_block == [
+            (b":method", b"GET"), (b":scheme", b"https"), (b":path", b"/"),
+            (b":authority", b"www.example.com"),
+            (b"user-agent", b"python-requests/2.31.0"),
+            (b"accept-encoding", b"gzip, deflate"), (b"accept", b"*/*"),
+            (b"x-tenant-id", b"acm\xe9"), (b"x-raw", b"\xff")]
+
+        frames = split_frames(frame.serialize(HTTP2Hpack(None, 4096)))
+        assert [frame[:3] for frame in frames] == [
+            (HTTP_V2_HEADERS_FRAME,
+             HTTP_V2_END_STREAM_FLAG | HTTP_V2_END_HEADERS_FLAG, 1)]
+        assert HTTP2Hpack(None, 4096).decode(frames[0][3]) == \
+            frame.header_block
+
+    def test_headers_frame_continuation(self):
+        header = HTTP2FrameHeader(HTTP_V2_HEADERS_FRAME, 0, 5)
+        frame = HTTP2HeadersFrame(header, b"example.com", b"/", b"POST",
+                                  {b"x-blob": b"\xfe" * 40000})
+
+        frames = split_frames(frame.serialize(HTTP2Hpack(None, 4096)))
+        assert [frame[:3] for frame in frames] == [
+            (HTTP_V2_HEADERS_FRAME, 0, 5),
+            (HTTP_V2_CONTINUATION_FRAME, 0, 5),
+            (HTTP_V2_CONTINUATION_FRAME, HTTP_V2_END_HEADERS_FLAG, 5)]
+        assert [len(frame[3]) for frame in frames[:2]] == [16384, 16384]
+
+        decoder = HTTP2Hpack(None, 4096)
+        for frame in frames[:-1]:
+            assert decoder.decode_fragment(frame[3], False) is None
+
+        assert decoder.decode_fragment(frames[-1][3])[-1] == \
+            (b"x-blob", b"\xfe" * 40000)
+
+    def test_reader(self):
+        stream = b"".join([
+            build_frame(HTTP_V2_SETTINGS_FRAME, 0, 0,
+                        pack(">HIHI", 0x3, 100, 0x4, 1 << 20)),
+            build_frame(HTTP_V2_SETTINGS_FRAME, HTTP_V2_ACK_FLAG, 0, b""),
+            build_frame(0xfa, 0, 0, b"unknown frame type"),
+            build_frame(HTTP_V2_HEADERS_FRAME, HTTP_V2_END_HEADERS_FLAG, 1,
+                        unhexlify(b"8841")),
+            build_frame(HTTP_V2_DATA_FRAME, HTTP_V2_PADDED_FLAG, 1,
+                        b"\x03hello\x00\x00\x00"),
+            build_frame(HTTP_V2_DATA_FRAME, HTTP_V2_END_STREAM_FLAG | 0x40, 1,
+                        b""),
+            build_frame(HTTP_V2_WINDOW_UPDATE_FRAME, 0, 0,
+                        pack(">I", 1 << 16)),
+            build_frame(HTTP_V2_PING_FRAME, HTTP_V2_ACK_FLAG, 0,
+                        pack(">Q", 42)),
+            build_frame(HTTP_V2_RST_STREAM_FRAME, 0, 3, pack(">I", 0x8)),
+            build_frame(HTTP_V2_GOAWAY_FRAME, 0, 0,
+                        pack(">II", 5, 0) + b"bye"),
+        ])
+
+        # the frames come whole, whatever the chunks.
+        for step in (1, 7, len(stream)):
+            reader = HTTP2FrameReader(buffer_size=64, recv_size=16)
+            frames = []
+            for offset in range(0, len(stream), step):
+                reader.feed(stream[offset:offset + step])
+                frames.extend(reader)
+
+            assert len(reader) == 0
+            assert [type(frame) for frame in frames] == [
+                HTTP2SettingsFrame, HTTP2SettingsFrame, HTTP2HeadersFrame,
+                HTTP2DataFrame, HTTP2DataFrame, HTTP2WindowUpdateFrame,
+                HTTP2PingFrame, HTTP2RSTStreamFrame, HTTP2GoAwayFrame]
+
+            settings, ack, headers, data, end, window, ping, rst, goaway = \
+                frames
+            assert settings.settings == [(0x3, 100), (0x4, 1 << 20)]
+            assert ack.header.has_flag(HTTP_V2_ACK_FLAG)
+            assert bytes(headers.fragment) == unhexlify(b"8841")
+            assert isinstance(data.data, memoryview)
+            assert data.data == b"hello"
+            assert end.header.flags == HTTP_V2_END_STREAM_FLAG
+            assert window.increment == 1 << 16
+            assert ping.opaque == 42
+            assert (rst.header.stream_id, rst.code) == (3, 0x8)
+            assert (goaway.last_stream_id, goaway.debug) == (5, b"bye")
+
+    def test_reader_errors(self):
+        def _t(data):
+            reader = HTTP2FrameReader()
+            reader.feed(data)
+            with pytest.raises(HTTP2FrameError):
+                list(reader)
+
+        _t(build_frame(HTTP_V2_DATA_FRAME, 0, 0, b"data"))
+        _t(build_frame(HTTP_V2_SETTINGS_FRAME, 0, 1, b""))
+        _t(build_frame(HTTP_V2_SETTINGS_FRAME, HTTP_V2_ACK_FLAG, 0,
+                       pack(">HI", 0x3, 100)))
+        _t(build_frame(HTTP_V2_SETTINGS_FRAME, 0, 0, b"\x00\x03"))
+        _t(build_frame(HTTP_V2_PING_FRAME, 0, 1, pack(">Q", 1)))
+        _t(build_frame(HTTP_V2_PING_FRAME, 0, 0, pack(">I", 1)))
+        _t(build_frame(HTTP_V2_PRIORITY_FRAME, 0, 3, pack(">IB", 3, 15)))
+        _t(build_frame(HTTP_V2_RST_STREAM_FRAME, 0, 0, pack(">I", 0x8)))
+        _t(build_frame(HTTP_V2_WINDOW_UPDATE_FRAME, 0, 0,
+                       pack(">I", 1 << 31)))
+        _t(build_frame(HTTP_V2_GOAWAY_FRAME, 0, 1, pack(">II", 5, 0)))
+        _t(build_frame(HTTP_V2_CONTINUATION_FRAME, 0, 0, b""))
+
+    def test_dispatch(self):
+        assert len(HTTP_V2_FRAME_PARSERS) == 256
+        assert HTTP_V2_FRAME_PARSERS[HTTP_V2_PING_FRAME] == \
+            HTTP2PingFrame.parse_frame
+        assert HTTP_V2_FRAME_PARSERS[0xfa] is None
+
+        header = HTTP2FrameHeader.parse_frame_header(
+            b"\xff" + build_frame(HTTP_V2_DATA_FRAME, HTTP_V2_PADDED_FLAG,
+                                  1 << 31 | 5, b""), 1)
+        assert (header.type, header.length, header.stream_id, header.flags) \
+            == (HTTP_V2_DATA_FRAME, 0, 5, HTTP_V2_PADDED_FLAG)
+        with pytest.raises(HTTP2FrameError):
+            HTTP2FrameHeader.parse_frame_header(build_frame(0xfa, 0, 0, b""))
+        with pytest.raises(HTTP2FrameError):
+            HTTP2FrameHeader.parse_frame_header(b"\x00" * 8)
+
+    def test_reader_buffer(self):
+        reader = HTTP2FrameReader(buffer_size=64, recv_size=16)
+        reader.feed(build_frame(HTTP_V2_DATA_FRAME, 0, 1, b"a" * 40))
+        first = next(iter(reader))
+
+        # frames larger than the buffer, which is compacted meanwhile.
+        data = build_frame(HTTP_V2_DATA_FRAME, 0, 1, b"b" * 1000)
+        reader.feed(data[:500])
+        assert list(reader) == []
+        reader.feed(data[500:])
+        second = next(iter(reader))
+        assert first.data == b"a" * 40
+        assert second.data == b"b" * 1000
+
+        reader.feed(build_frame(HTTP_V2_DATA_FRAME, 0, 1, b"c" * 16385))
+        with pytest.raises(HTTP2FrameError):
+            list(reader)
+
+    def test_reader_recv_into(self):
+        left, right = socket.socketpair()
+        try:
+            reader = HTTP2FrameReader(buffer_size=4096, recv_size=1024)
+            payload = bytes(bytearray(range(256))) * 40
+            data = b"".join(build_frame(HTTP_V2_DATA_FRAME, 0, 1,
+                                        payload[i:i + 1000])
+                            for i in range(0, len(payload), 1000))
+            left.sendall(data)
+            left.close()
+
+            received = []
+            while reader.recv_into(right):
+                received.extend(frame.data for frame in reader)
+
+            assert b"".join(received) == payload
+        finally:
+            right.close()
+
+    def test_serialize(self):
+        header = HTTP2FrameHeader(HTTP_V2_DATA_FRAME, 4, 1)
+        data = HTTP2DataFrame(header, b"abcd")
+        assert data.serialize() == build_frame(HTTP_V2_DATA_FRAME, 0, 1,
+                                               b"abcd")
+
+        header = HTTP2FrameHeader(HTTP_V2_DATA_FRAME, 7, 1,
+                                  HTTP_V2_PADDED_FLAG)
+        data = HTTP2DataFrame(header, b"abcd", b"\x00\x00")
+        assert data.serialize() == build_frame(HTTP_V2_DATA_FRAME,
+                                               HTTP_V2_PADDED_FLAG, 1,
+                                               b"\x02abcd\x00\x00")
+
+        header = HTTP2FrameHeader(HTTP_V2_PRIORITY_FRAME, 5, 3)
+        priority = HTTP2PriorityFrame(header, 1, 256, excl=True)
+        wire = build_frame(HTTP_V2_PRIORITY_FRAME, 0, 3,
+                           b"\x80\x00\x00\x01\xff")
+        assert priority.serialize() == wire
+
+        reader = HTTP2FrameReader()
+        reader.feed(wire)
+        frame, = list(reader)
+        assert frame.serialize() == wire
+
+    def test_slots(self):
+        header = HTTP2FrameHeader(HTTP_V2_PING_FRAME, 8, 0)
+        frames = [header, HTTP2PingFrame(header, 1),
+                  HTTP2DataFrame(HTTP2FrameHeader(HTTP_V2_DATA_FRAME, 0, 1),
+                                 b"")]
+        for frame in frames:
+            assert not hasattr(frame, "__dict__")
+            with pytest.raises(AttributeError):
+                frame.extra = 1
+
+    def test_serialize_into(self):
+        hpack = HTTP2Hpack(None, 4096)
+        headers = HTTP2HeadersFrame(
+            HTTP2FrameHeader(HTTP_V2_HEADERS_FRAME, 0, 1), "example.com",
+            "/", "GET", {"x-blob": "x" * 100})
+        ping = HTTP2PingFrame(HTTP2FrameHeader(HTTP_V2_PING_FRAME, 8, 0), 7)
+        rst = HTTP2RSTStreamFrame(
+            HTTP2FrameHeader(HTTP_V2_RST_STREAM_FRAME, 4, 1), 0x8)
+        goaway = HTTP2GoAwayFrame(
+            HTTP2FrameHeader(HTTP_V2_GOAWAY_FRAME, 11, 0), 1, 0, b"bye")
+        push = HTTP2PushPromiseFrame(
+            HTTP2FrameHeader(HTTP_V2_PUSH_PROMISE_FRAME, 12, 1,
+                             HTTP_V2_PADDED_FLAG), 2, b"\x82\x84")
+        data = HTTP2DataFrame(HTTP2FrameHeader(HTTP_V2_DATA_FRAME, 5000, 1),
+                              b"d" * 5000)
+
+        expected = [headers.serialize(HTTP2Hpack(None, 4096), 16)]
+        expected += [frame.serialize() for frame in (ping, rst, goaway, push,
+                                                     data)]
+        buf = HTTP2FrameWriter()
+        headers.serialize_into(buf, hpack, 16)
+        for frame in (ping, rst, goaway, push, data):
+            frame.serialize_into(buf)
+
+        assert buf.getvalue() == b"".join(expected)
+        assert len(buf) == len(buf.getvalue())
+        assert split_frames(push.serialize()) == [
+            (HTTP_V2_PUSH_PROMISE_FRAME, HTTP_V2_PADDED_FLAG, 1,
+             b"\x05\x00\x00\x00\x02\x82\x84" + b"\x00" * 5)]
+
+    def test_writer_references(self):
+        payload = bytearray(b"a" * 2048)
+        buf = HTTP2FrameWriter(copy_size=1024)
+        buf.write(b"head")
+        buf.write(payload)
+        buf.write(b"tail")
+
+        # the large payload is referenced, the small ones are copied.
+        payload[0:1] = b"b"
+        assert buf.getvalue() == b"head" + b"b" + b"a" * 2047 + b"tail"
+
+        sock = ShortSocket(1 << 20)
+        assert buf.flush(sock) == 2056
+        assert sock.calls == 1 and bytes(sock.data) == b"head" + payload + \
+            b"tail"
+        assert len(buf) == 0 and buf.getvalue() == b""
+
+    def test_writer_partial(self):
+        frames = [build_frame(HTTP_V2_DATA_FRAME, 0, 1, bytes(bytearray([i]))
+                              * (100 * i)) for i in range(1, 30)]
+        for vectored in (True, False):
+            buf = HTTP2FrameWriter(copy_size=1000)
+            for data in frames:
+                buf.write(data[:9])
+                buf.write(data[9:])
+
+            sock = ShortSocket(777, vectored)
+            assert buf.flush(sock) == sum(len(data) for data in frames)
+            assert bytes(sock.data) == b"".join(frames)
+            assert len(buf) == 0
+
+            # writes still work once a partial send sliced the bytearray.
+            buf.write(b"more")
+            buf.flush(sock)
+            assert bytes(sock.data).endswith(b"more")
+
+    def test_writer_would_block(self):
+        stream = b"".join(build_frame(HTTP_V2_DATA_FRAME, 0, 1, b"x" * 2000)
+                          for i in range(4))
+        for vectored in (True, False):
+            buf = HTTP2FrameWriter(copy_size=1000)
+            buf.write(stream[:4000])
+            buf.write(stream[4000:])
+
+            # a non-blocking socket which takes 3000 bytes, 700 a call.
+            sock = ShortSocket(700, vectored, limit=3000)
+            with pytest.raises(socket.error):
+                buf.flush(sock)
+
+            assert sock.calls == 5
+            assert len(buf) == len(stream) - 3000
+            assert buf.getvalue() == stream[3000:]
+
+            sock.limit = None
+            assert buf.flush(sock) == len(stream) - 3000
+            assert bytes(sock.data) == stream
+
+    def test_writer_socket(self):
+        left, right = socket.socketpair()
+        try:
+            payload = bytes(bytearray(range(256))) * 64
+            buf = HTTP2FrameWriter()
+            for i in range(0, len(payload), 4096):
+                header = HTTP2FrameHeader(HTTP_V2_DATA_FRAME, 4096, 1)
+                HTTP2DataFrame(header, payload[i:i + 4096]).serialize_into(buf)
+            HTTP2PingFrame(HTTP2FrameHeader(HTTP_V2_PING_FRAME, 8, 0),
+                           1).serialize_into(buf)
+
+            assert buf.flush(left) == len(payload) + 5 * 9 + 8
+            left.close()
+
+            reader = HTTP2FrameReader()
+            frames = []
+            while reader.recv_into(right):
+                frames.extend(reader)
+
+            assert b"".join(bytes(frame.data) for frame in frames[:-1]) == \
+                payload
+            assert frames[-1].opaque == 1
+        finally:
+            right.close()
+
+    def test_control_frame_cache(self):
+        cache = HTTP2ControlFrameCache(max_entries=3)
+        settings = [(0x3, 100), (0x4, 1 << 20)]
+
+        assert cache.settings_ack() == \
+            build_frame(HTTP_V2_SETTINGS_FRAME, HTTP_V2_ACK_FLAG, 0, b"")
+        assert cache.preface(settings) == \
+            b"PRI * HTTP/2.0\r\n\r\nSM\r\n\r\n" + build_frame(
+                HTTP_V2_SETTINGS_FRAME, 0, 0, pack(">HIHI", 0x3, 100, 0x4,
+                                                   1 << 20))
+        assert cache.ping(42) == \
+            build_frame(HTTP_V2_PING_FRAME, 0, 0, pack(">Q", 42))
+        assert (cache.hits, cache.misses, len(cache)) == (0, 3, 3)
+
+        # the same bytes, built once.
+        assert cache.settings_ack() is cache.settings_ack()
+        assert cache.preface(tuple(settings)) is cache.preface(settings)
+        assert cache.hits == 4
+
+        # the PING ACKs and the stream WINDOW_UPDATEs are not cached.
+        assert cache.ping(42, ack=True) == \
+            build_frame(HTTP_V2_PING_FRAME, HTTP_V2_ACK_FLAG, 0, pack(">Q", 42))
+        for sid in range(1, 100, 2):
+            assert cache.window_update(1 << 16, sid) == \
+                build_frame(HTTP_V2_WINDOW_UPDATE_FRAME, 0, sid,
+                            pack(">I", 1 << 16))
+        assert len(cache) == 3 and cache.misses == 3
+
+        # the least recently used frame, the PING, is dropped.
+        window = cache.window_update(1 << 16)
+        assert window == build_frame(HTTP_V2_WINDOW_UPDATE_FRAME, 0, 0,
+                                     pack(">I", 1 << 16))
+        assert len(cache) == 3
+        assert cache.window_update(1 << 16) is window
+        hits = cache.hits
+        cache.settings_ack()
+        cache.preface(settings)
+        assert cache.hits == hits + 2
+        cache.ping(42)
+        assert cache.hits == hits + 2
+
+        # built through the frame classes, so validated the same.
+        with pytest.raises(HTTP2FrameError):
+            cache.window_update(0)
+        with pytest.raises(HTTP2FrameError):
+            cache.window_update(1, -1)
+
+        buf = HTTP2FrameWriter()
+        buf.write(cache.settings_ack())
+        buf.write(window)
+        assert buf.getvalue() == cache.settings_ack() + window
+
+        cache.clear()
+        assert (len(cache), cache.hits, cache.misses) == (0, 0, 0)
+
+        cache.clear()
+        assert len(cache) == 0
@@ -0,0 +1,585 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for HTTP/2 HPACK encoding and decoding."""
+
+import pytest
+
+from binascii import unhexlify
+from http2_adapter.bench import check_hpack_stories
+from http2_adapter.bench import hpack_strategies
+from http2_adapter.bench import load_hpack_stories
+from http2_adapter.bench import replay_hpack
+from http2_adapter.exceptions import HTTP2HpackError
+from http2_adapter.exceptions import HTTP2HpackEncodeError
+from http2_adapter.exceptions import HTTP2HpackDecodeError
+from http2_adapter.exceptions import HTTP2HpackTruncatedError
+from http2_adapter.hpack import HTTP2Hpack
+from http2_adapter.hpack import hpack_header_name
+from http2_adapter.hpack import HTTP2HpackDynamicTable
+from http2_adapter.hpack import HTTP2HpackIndexingPolicy
+from http2_adapter.hpack import HPACK_INCR_INDEXING
+from http2_adapter.hpack import HPACK_NEVER_INDEXED
+from http2_adapter.hpack import HPACK_WITHOUT_INDEXING
+
+
+class TestHTTP2Hpack:
+    def test_encode_integer(self):
+        # RFC 7541, Appendix C.1
+        assert HTTP2Hpack.encode_integer(10, 5) == unhexlify(b"0a")
+        assert HTTP2Hpack.encode_integer(1337, 5) == unhexlify(b"1f9a0a")
+        assert HTTP2Hpack.encode_integer(42, 8) == unhexlify(b"2a")
+
+        assert HTTP2Hpack.encode_integer(31, 5) == unhexlify(b"1f00")
+        assert HTTP2Hpack.encode_integer(1, 4, 0x10) == unhexlify(b"11")
+
+    def test_encode_string_raw(self):
+        h = HTTP2Hpack(None, 4096)
+
+        # Huffman coding would make these longer
+        assert h.encode_string(b"") == unhexlify(b"00")
+        assert h.encode_string(b"\xff\x00") == unhexlify(b"02ff00")
+
+    def test_encode_string_huffman(self):
+        h = HTTP2Hpack(None, 4096)
+
+        # RFC 7541, Appendix C.4.1
+        assert h.encode_string(b"www.example.com") == \
+            unhexlify(b"8cf1e3c2e5f23a6ba0ab90f4ff")
+
+    def test_static_table(self):
+        h = HTTP2Hpack(None, 4096)
+
+        assert h.search_header((b":authority", b"")) == (1, True)
+        assert h.search_header((b":method", b"GET")) == (2, True)
+        assert h.search_header((b":method", b"POST")) == (3, True)
+        assert h.search_header((b":method", b"PUT")) == (2, False)
+        assert h.search_header((b"www-authenticate", b"")) == (61, True)
+        assert h.search_header((b"x-custom", b"")) == (0, False)
+
+        for index in range(1, 62):
+            header = h.decode_indexed(index)
+            assert h.index_of_header(header) == index
+
+    def test_dynamic_table(self):
+        h = HTTP2Hpack(None, 4096)
+
+        h.append_header((b"custom-key", b"custom-value"))
+        assert h.search_header((b"custom-key", b"custom-value")) == (62, True)
+
+        # the newest entry has the lowest index
+        h.append_header((b"custom-key", b"other-value"))
+        assert h.search_header((b"custom-key", b"other-value")) == (62, True)
+        assert h.search_header((b"custom-key", b"custom-value")) == (63, True)
+        assert h.search_header((b"custom-key", b"third-value")) == (62, False)
+        assert h.decode_indexed(62) == (b"custom-key", b"other-value")
+        assert h.decode_indexed(63) == (b"custom-key", b"custom-value")
+
+        # static entries are preferred
+        h.append_header((b":method", b"GET"))
+        assert h.search_header((b":method", b"GET")) == (2, True)
+
+        with pytest.raises(HTTP2HpackEncodeError):
+            h.index_of_header((b"custom-key", b"third-value"))
+        with pytest.raises(HTTP2HpackDecodeError):
+            h.decode_indexed(65)
+        with pytest.raises(HTTP2HpackDecodeError):
+            h.decode_indexed(0)
+
+    def test_dynamic_table_eviction(self):
+        # room for two entries of 54 bytes
+        h = HTTP2Hpack(None, 110)
+
+        h.append_header((b"custom-key", b"custom-val-1"))
+        h.append_header((b"custom-key", b"custom-val-2"))
+        h.append_header((b"custom-key", b"custom-val-3"))
+        assert h.search_header((b"custom-key", b"custom-val-1")) == (62, False)
+        assert h.search_header((b"custom-key", b"custom-val-2")) == (63, True)
+        assert h.search_header((b"custom-key", b"custom-val-3")) == (62, True)
+
+        # evicting an entry keeps a newer duplicate
+        h.append_header((b"custom-key", b"custom-val-2"))
+        h.append_header((b"other-key", b"other-value-"))
+        assert h.search_header((b"custom-key", b"custom-val-2")) == (63, True)
+        assert h.search_header((b"custom-key", b"custom-val-3")) == (63, False)
+
+        # too large, empties the table
+        h.append_header((b"custom-key", b"x" * 100))
+        assert h.search_header((b"custom-key", b"custom-val-2")) == (0, False)
+        assert h.search_header((b"other-key", b"other-value-")) == (0, False)
+
+    def test_initial_dynamic_table(self):
+        h = HTTP2Hpack([(b"key-1", b"value-1"), (b"key-2", b"value-2")], 4096)
+
+        assert h.index_of_header((b"key-1", b"value-1")) == 62
+        assert h.index_of_header((b"key-2", b"value-2")) == 63
+
+        with pytest.raises(HTTP2HpackError):
+            HTTP2Hpack([(b"key-1", b"value-1")], 32)
+
+    def test_dynamic_table_churn(self):
+        # 4 entries of 40 bytes fit, the ring wraps around many times.
+        table = HTTP2HpackDynamicTable(160)
+        for i in range(1000):
+            assert table.add((b"k%03d" % i, b"v%03d" % i))
+
+        assert len(table) == 4
+        assert table.size == 160
+        assert list(table) == [(b"k%03d" % i, b"v%03d" % i)
+                               for i in range(999, 995, -1)]
+        assert table.search((b"k997", b"v997")) == (3, True)
+        assert table.search((b"k995", b"v995")) == (0, False)
+        assert table.get(5) is None
+
+    def test_dynamic_table_resize(self):
+        table = HTTP2HpackDynamicTable(160)
+        for i in range(6):
+            table.add((b"k%03d" % i, b"v%03d" % i))
+
+        table.resize(80)
+        assert list(table) == [(b"k005", b"v005"), (b"k004", b"v004")]
+
+        table.resize(400)
+        for i in range(6, 12):
+            table.add((b"k%03d" % i, b"v%03d" % i))
+
+        assert len(table) == 8
+        assert table.get(8) == (b"k004", b"v004")
+
+        assert not table.add((b"k" * 400, b""))
+        assert len(table) == 0
+        assert table.size == 0
+
+    def test_dynamic_table_huge(self):
+        # the peer sets the table size, the ring follows the entries.
+        h = HTTP2Hpack(None, (1 << 32) - 1)
+        decoder = HTTP2Hpack(None, (1 << 32) - 1)
+        table = h.dynamic_table
+        assert len(table._HTTP2HpackDynamicTable__slots) == 16
+
+        headers = [(b"k%04d" % i, b"v%04d" % i) for i in range(1000)]
+        assert decoder.decode(h.encode(headers)) == headers
+        assert len(table) == len(decoder.dynamic_table) == 1000
+        assert list(table) == headers[::-1]
+        assert len(table._HTTP2HpackDynamicTable__slots) == 1024
+
+        # and shrinks back as the entries are evicted.
+        table.resize(42 * 10)
+        assert list(table) == headers[:-11:-1]
+        assert table.search((b"k0995", b"v0995")) == (5, True)
+        assert len(table._HTTP2HpackDynamicTable__slots) == 32
+        table.resize(0)
+        assert len(table) == 0 and table.get(1) is None
+
+    def test_encode_rfc7541_requests(self):
+        # RFC 7541, C.4, requests with Huffman coding.
+        h = HTTP2Hpack(None, 4096)
+        headers = [(b":method", b"GET"), (b":scheme", b"http"),
+                   (b":path", b"/"), (b":authority", b"www.example.com")]
+
+        assert h.encode(headers) == unhexlify(
+            b"828684418cf1e3c2e5f23a6ba0ab90f4ff")
+        assert h.dynamic_table.size == 57
+
+        assert h.encode(headers + [(b"cache-control", b"no-cache")]) == \
+            unhexlify(b"828684be5886a8eb10649cbf")
+        assert h.dynamic_table.size == 110
+
+        headers = [(b":method", b"GET"), (b":scheme", b"https"),
+                   (b":path", b"/index.html"),
+                   (b":authority", b"www.example.com"),
+                   (b"custom-key", b"custom-value")]
+        assert h.encode(headers) == unhexlify(
+            b"828785bf408825a849e95ba97d7f8925a849e95bb8e8b4bf")
+        assert h.dynamic_table.size == 164
+
+    def test_encode_literals(self):
+        h = HTTP2Hpack(None, 4096)
+
+        buf = h.encode_without_indexing((b":path", b"/sample/path"))
+        assert buf[0] == 0x04
+        size = len(buf)
+        h.encode_never_indexed((b"password", b"secret"), buf)
+        assert buf[size:] == b"\x10" + h.encode_string(b"password") \
+            + h.encode_string(b"secret")
+        assert len(h.dynamic_table) == 0
+
+        # indexes above 127 take more octets.
+        for i in range(100):
+            h.append_header((b"k%03d" % i, b"v%03d" % i))
+
+        assert h.encode_indexed((b"k000", b"v000")) == unhexlify(b"ff22")
+
+    def test_encode_table_size_update(self):
+        h = HTTP2Hpack(None, 4096)
+        h.encode([(b"custom-key", b"custom-header")])
+
+        # the smallest size and the final one are signaled.
+        h.update_dynamic_table_size(1024)
+        h.update_dynamic_table_size(0)
+        h.update_dynamic_table_size(100)
+        assert h.encode([]) == unhexlify(b"203f45")
+        assert len(h.dynamic_table) == 0
+        assert h.dynamic_table.max_size == 100
+        assert h.encode([]) == b""
+
+        with pytest.raises(HTTP2HpackEncodeError):
+            h.update_dynamic_table_size(4097)
+
+    def test_decode_rfc7541_requests(self):
+        # RFC 7541, C.3 and C.4, requests without and with Huffman coding.
+        for blocks in ((b"828684410f7777772e6578616d706c652e636f6d",
+                        b"828684be58086e6f2d6361636865",
+                        b"828785bf400a637573746f6d2d6b65790c637573746f6d2d"
+                        b"76616c7565"),
+                       (b"828684418cf1e3c2e5f23a6ba0ab90f4ff",
+                        b"828684be5886a8eb10649cbf",
+                        b"828785bf408825a849e95ba97d7f8925a849e95bb8e8b4bf")):
+            h = HTTP2Hpack(None, 4096)
+            headers = [(b":method", b"GET"), (b":scheme", b"http"),
+                       (b":path", b"/"), (b":authority", b"www.example.com")]
+            assert h.decode(unhexlify(blocks[0])) == headers
+
+            headers.append((b"cache-control", b"no-cache"))
+            assert h.decode(bytearray(unhexlify(blocks[1]))) == headers
+
+            assert h.decode(memoryview(unhexlify(blocks[2]))) == [
+                (b":method", b"GET"), (b":scheme", b"https"),
+                (b":path", b"/index.html"),
+                (b":authority", b"www.example.com"),
+                (b"custom-key", b"custom-value")]
+            assert list(h.dynamic_table) == [
+                (b"custom-key", b"custom-value"),
+                (b"cache-control", b"no-cache"),
+                (b":authority", b"www.example.com")]
+
+    def test_decode_rfc7541_responses(self):
+        # RFC 7541, C.6, responses with Huffman coding and evictions.
+        h = HTTP2Hpack(None, 256)
+        assert h.decode(unhexlify(
+            b"488264025885aec3771a4b6196d07abe941054d444a8200595040b8166e082"
+            b"a62d1bff6e919d29ad171863c78f0b97c8e9ae82ae43d3")) == [
+            (b":status", b"302"), (b"cache-control", b"private"),
+            (b"date", b"Mon, 21 Oct 2013 20:13:21 GMT"),
+            (b"location", b"https://www.example.com")]
+        assert h.dynamic_table.size == 222
+
+        assert h.decode(unhexlify(b"4883640effc1c0bf")) == [
+            (b":status", b"307"), (b"cache-control", b"private"),
+            (b"date", b"Mon, 21 Oct 2013 20:13:21 GMT"),
+            (b"location", b"https://www.example.com")]
+        assert h.dynamic_table.size == 222
+
+        headers = h.decode(unhexlify(
+            b"88c16196d07abe941054d444a8200595040b8166e084a62d1bffc05a839bd9"
+            b"ab77ad94e7821dd7f2e6c7b335dfdfcd5b3960d5af27087f3672c1ab270fb5"
+            b"291f9587316065c003ed4ee5b1063d5007"))
+        assert headers[-1] == (b"set-cookie", b"foo=ASDJKHQKBZXOQWEOPIUAXQWEO"
+                               b"IU; max-age=3600; version=1")
+        assert h.dynamic_table.size == 215
+        assert len(h.dynamic_table) == 3
+
+    def test_decode_round_trip(self):
+        encoder, decoder = HTTP2Hpack(None, 4096), HTTP2Hpack(None, 4096)
+        headers = [(b":method", b"POST"), (b":path", b"/upload"),
+                   (b"content-security-policy", b"default-src 'self'" * 50),
+                   (b"x-blob", bytes(bytearray(range(256))))]
+        for _ in range(3):
+            buf = encoder.encode(headers)
+            encoder.encode_never_indexed((b"authorization", b"secret"), buf)
+            encoder.encode_without_indexing((b"x-id", b"1"), buf)
+            assert decoder.decode(buf) == headers + [
+                (b"authorization", b"secret"), (b"x-id", b"1")]
+
+        assert list(decoder.dynamic_table) == list(encoder.dynamic_table)
+
+    def test_decode_errors(self):
+        h = HTTP2Hpack(None, 4096)
+        for block in (b"80", b"be", b"7f", b"ff80808080808080", b"400a6b6579",
+                      b"0403", b"823f", b"3fe21f"):
+            with pytest.raises(HTTP2HpackDecodeError):
+                h.decode(unhexlify(block))
+
+        # invalid huffman values: padding not made of the EOS prefix, EOS
+        # inside the string, a code which never ends.
+        for value in (b"8100", b"84ffffffff", b"82fffe"):
+            with pytest.raises(HTTP2HpackDecodeError):
+                h.decode(unhexlify(b"000178" + value))
+
+        h.decode(unhexlify(b"3fe11f"))
+        assert h.dynamic_table.max_size == 4096
+
+    def test_decode_after_error(self):
+        h = HTTP2Hpack(None, 4096)
+        good = unhexlify(b"0003782d610131")
+        with pytest.raises(HTTP2HpackDecodeError):
+            h.decode(good + unhexlify(b"00017884ffffffff"))
+
+        # the headers of the failed block are dropped
+        assert h.decode(good) == [(b"x-a", b"1")]
+
+        h.decode_fragment(good, end_headers=False)
+        with pytest.raises(HTTP2HpackDecodeError):
+            h.decode_fragment(unhexlify(b"00017881"), end_headers=True)
+        assert h.decode(good) == [(b"x-a", b"1")]
+
+    def test_indexing_policy(self):
+        policy = HTTP2HpackIndexingPolicy()
+        bearer = b"Bearer " + b"x" * 300
+        assert policy((b"authorization", bearer), 4096) == HPACK_INCR_INDEXING
+        assert policy((b"authorization", b"Basic Zm9vOmJhcg=="), 4096) == \
+            HPACK_NEVER_INDEXED
+        assert policy((b"proxy-authorization", bearer), 4096) == \
+            HPACK_NEVER_INDEXED
+        assert policy((b"x-request-id", b"1"), 4096) == HPACK_WITHOUT_INDEXING
+        assert policy((b"x-tenant-id", b"acme"), 4096) == HPACK_INCR_INDEXING
+        assert policy((b"authorization", bearer), 512) == \
+            HPACK_WITHOUT_INDEXING
+
+        policy = HTTP2HpackIndexingPolicy(never_indexed=[b"x-api-key"],
+                                          not_indexed=[])
+        assert policy((b"x-api-key", b"k" * 40), 4096) == HPACK_NEVER_INDEXED
+        assert policy((b"x-request-id", b"1"), 4096) == HPACK_INCR_INDEXING
+
+    def test_indexing_policy_hook(self):
+        encoder = HTTP2Hpack(None, 4096,
+                             policy=lambda header, size: HPACK_NEVER_INDEXED)
+        decoder = HTTP2Hpack(None, 4096)
+        headers = [(b":method", b"GET"), (b"x-tenant-id", b"acme")]
+        buf = encoder.encode(headers)
+        assert buf[1] == 0x10
+        assert decoder.decode(buf) == headers
+        assert len(encoder.dynamic_table) == len(decoder.dynamic_table) == 0
+        assert decoder.stats.never_indexed == 1
+
+    def test_stats(self):
+        encoder, decoder = HTTP2Hpack(None, 4096), HTTP2Hpack(None, 4096)
+        assert encoder.stats.compression_ratio == 0.0
+
+        for i in range(100):
+            headers = [(b":method", b"GET"), (b":path", b"/api/orders"),
+                       (b"user-agent", b"client/1.0"),
+                       (b"authorization", b"Bearer " + b"t" * 200),
+                       (b"x-request-id", b"%08d" % i)]
+            decoder.decode(encoder.encode(headers))
+
+        for stats in (encoder.stats, decoder.stats):
+            assert stats.blocks == 100
+            assert stats.headers == 500
+            assert stats.incr_indexing == 3
+            assert stats.without_indexing == 100
+            assert stats.indexed == 397
+            assert stats.compression_ratio < 0.1
+
+        assert encoder.stats.encoded_bytes == decoder.stats.encoded_bytes
+
+    def test_template(self):
+        h = HTTP2Hpack(None, 4096)
+        template = h.compile([(b":method", b"GET"), (b":scheme", b"http"),
+                              (b":path", None),
+                              (b":authority", b"www.example.com")])
+        assert template.varying == 1
+
+        # RFC 7541, C.4
+        assert template.render((b"/",)) == unhexlify(
+            b"828684418cf1e3c2e5f23a6ba0ab90f4ff")
+        assert template.render(
+            (b"/",), [(b"cache-control", b"no-cache")]) == \
+            unhexlify(b"828684be5886a8eb10649cbf")
+        assert h.stats.headers == 9
+        assert h.stats.plain_bytes == 2 * 52 + 21
+
+        with pytest.raises(HTTP2HpackEncodeError):
+            template.render()
+
+    def test_template_round_trip(self):
+        encoder, decoder = HTTP2Hpack(None, 256), HTTP2Hpack(None, 256)
+        template = encoder.compile([
+            (b":method", b"POST"), (b":scheme", b"https"),
+            (b":authority", b"api.example.com"), (b":path", None),
+            (b"x-tenant-id", b"acme"), (b"authorization", b"Basic c2VjcmV0"),
+            (b"x-request-id", None), (b"content-length", b"0")])
+
+        for i in range(50):
+            path = b"/orders/%d" % (i % 7)
+            buf = template.render(
+                (path, b"%d" % i), [(b"x-page", b"%d" % (i % 3))])
+            assert decoder.decode(buf) == [
+                (b":method", b"POST"), (b":scheme", b"https"),
+                (b":authority", b"api.example.com"), (b":path", path),
+                (b"x-tenant-id", b"acme"),
+                (b"authorization", b"Basic c2VjcmV0"),
+                (b"x-request-id", b"%d" % i), (b"content-length", b"0"),
+                (b"x-page", b"%d" % (i % 3))]
+            assert list(decoder.dynamic_table) == list(encoder.dynamic_table)
+
+        assert decoder.stats.never_indexed == 50
+        assert encoder.stats.encoded_bytes == decoder.stats.encoded_bytes
+        assert encoder.stats.plain_bytes == decoder.stats.plain_bytes
+        assert encoder.stats.indexed == decoder.stats.indexed
+
+    def test_decode_fragments(self):
+        encoder = HTTP2Hpack(None, 4096)
+        headers = [(b":status", b"200"), (b"content-type", b"text/html"),
+                   (b"set-cookie", b"sid=" + b"s" * 300),
+                   (b"content-security-policy", b"default-src 'self'" * 20)]
+        block = bytes(encoder.encode(headers))
+
+        # fields split anywhere across CONTINUATION frames.
+        for step in (1, 2, 7, 100):
+            decoder = HTTP2Hpack(None, 4096)
+            for offset in range(0, len(block) - step, step):
+                assert decoder.decode_fragment(block[offset:offset + step],
+                                               False) is None
+
+            offset = (len(block) - 1) // step * step
+            assert decoder.decode_fragment(block[offset:]) == headers
+            assert decoder.stats.encoded_bytes == len(block)
+            assert decoder.stats.plain_bytes == encoder.stats.plain_bytes
+
+        with pytest.raises(HTTP2HpackTruncatedError):
+            decoder.decode_fragment(block[:-1])
+
+        assert decoder.decode(block) == headers
+
+    def test_decode_fragments_long_field(self):
+        # a literal over many CONTINUATION frames is appended to a single
+        # tail, trimmed in place, not copied again for every fragment.
+        encoder, decoder = HTTP2Hpack(None, 4096), HTTP2Hpack(None, 4096)
+        headers = [(b"x-a", b"1"), (b"x-blob", b"\xfe" * 100000),
+                   (b"x-b", b"2")]
+        block = bytes(encoder.encode(headers))
+        tails = set()
+        for offset in range(0, len(block) - 4096, 4096):
+            decoder.decode_fragment(block[offset:offset + 4096], False)
+            tails.add(id(decoder._HTTP2Hpack__block_tail))
+
+        assert len(tails) == 1
+        offset = (len(block) - 1) // 4096 * 4096
+        assert decoder.decode_fragment(block[offset:]) == headers
+
+    def test_decode_max_header_list_size(self):
+        encoder = HTTP2Hpack(None, 4096)
+        block = bytes(encoder.encode([(b"x-large", b"\xfe" * 1000)]))
+        decoder = HTTP2Hpack(None, 4096, max_header_list_size=1000)
+
+        # 1039 bytes with the overhead, the length of the raw string is
+        # checked before the string arrives.
+        with pytest.raises(HTTP2HpackDecodeError):
+            decoder.decode_fragment(block[:12], False)
+
+        decoder.max_header_list_size = 1038
+        with pytest.raises(HTTP2HpackDecodeError):
+            decoder.decode(block)
+
+        decoder = HTTP2Hpack(None, 4096, max_header_list_size=1039)
+        assert decoder.decode(block) == [(b"x-large", b"\xfe" * 1000)]
+
+        # indexed fields count as well.
+        with pytest.raises(HTTP2HpackDecodeError):
+            decoder.decode_fragment(b"\xbe" * 2, False)
+
+        assert decoder.decode(b"\xbe") == [(b"x-large", b"\xfe" * 1000)]
+
+    def test_dynamic_table_counters(self):
+        table = HTTP2HpackDynamicTable(100)
+        table.add((b"key-1", b"value-1"))
+        table.add((b"key-2", b"value-2"))
+        table.add((b"key-3", b"value-3"))
+
+        assert table.search((b"key-3", b"value-3")) == (1, True)
+        assert table.search((b"key-2", b"other")) == (2, False)
+        assert table.search((b"key-1", b"value-1")) == (0, False)
+        assert (table.hits, table.name_hits, table.misses) == (1, 1, 1)
+        assert table.hit_rate == 1.0 / 3
+        assert table.insertions == 3
+        assert table.evictions == 1
+        assert table.evicted_bytes == 44
+
+    def test_auto_tune(self):
+        h = HTTP2Hpack(None, 4096, auto_tune=True)
+        decoder = HTTP2Hpack(None, 4096)
+        tuner = h.tuner
+        assert tuner.max_size == 4096
+
+        # three tenants, each with a token, take about 1.1 KB.
+        def block(i):
+            tenant = b"%d" % (i % 3)
+            return [(b":method", b"GET"), (b":path", b"/"),
+                    (b"x-tenant-id", tenant),
+                    (b"authorization", b"Bearer " + tenant * 300)]
+
+        for i in range(tuner.window):
+            decoder.decode(h.encode(block(i)))
+
+        assert h.dynamic_table.max_size == 4096
+        decoder.decode(h.encode(block(tuner.window)))
+        assert h.dynamic_table.max_size == 1280
+        assert decoder.dynamic_table.max_size == 1280
+
+        # the tokens stay indexed.
+        for i in range(tuner.window):
+            decoder.decode(h.encode(block(i)))
+
+        assert h.dynamic_table.evictions == 0
+        assert len(h.dynamic_table) == 6
+        assert list(decoder.dynamic_table) == list(h.dynamic_table)
+
+        # no more reuse, the table shrinks to nothing once the savings seen
+        # before decay.
+        for i in range(tuner.window * 16):
+            decoder.decode(h.encode([(b"x-id", b"%d" % i)]))
+
+        assert h.dynamic_table.max_size == 0
+        assert decoder.dynamic_table.max_size == 0
+
+    def test_auto_tune_large_header(self):
+        h = HTTP2Hpack(None, 4096, policy=lambda header, size:
+                       HPACK_INCR_INDEXING, auto_tune=True)
+        decoder = HTTP2Hpack(None, 4096)
+        headers = [(b"x-big", b"a" * 5000), (b"x-small", b"1")]
+        for _ in range(3):
+            assert decoder.decode(h.encode(headers)) == headers
+
+    def test_auto_tune_huge_table(self):
+        # the peer sets the limit, the model is capped and sparse.
+        h = HTTP2Hpack(None, 1 << 30, auto_tune=True)
+        decoder = HTTP2Hpack(None, 1 << 30)
+        tuner = h.tuner
+        assert tuner.max_size == 1 << 16
+        for i in range(tuner.window * 2):
+            headers = [(b"x-tenant-id", b"%d" % (i % 3)),
+                       (b"x-request-id", b"%d" % i)]
+            assert decoder.decode(h.encode(headers)) == headers
+
+        assert len(tuner.savings) <= 2
+        assert h.dynamic_table.max_size <= 1 << 16
+
+    def test_stories_conformance(self):
+        stories = load_hpack_stories()
+        assert len([story for story in stories
+                    if story[2][0][1] is not None]) == 4
+        assert check_hpack_stories(stories) == []
+
+    def test_stories_round_trip(self):
+        stories = load_hpack_stories()
+        for name, factory in hpack_strategies:
+            for story, (_, size, cases) in zip(replay_hpack(stories, factory),
+                                               stories):
+                decoder = HTTP2Hpack(None, size)
+                assert [decoder.decode(block) for block in story] == \
+                    [headers for headers, wire in cases]
+
+    def test_header_names(self):
+        for name in ("content-type", "Content-Type", b"content-type",
+                     b"Content-Type", "CONTENT-TYPE"):
+            assert hpack_header_name(name) == b"content-type"
+
+        name = hpack_header_name("X-Request-Id")
+        assert name == b"x-request-id"
+        assert name is hpack_header_name(b"x-request-id")
+        assert hpack_header_name("X-Custom") == b"x-custom"
+
+        # the names decoded are interned as well.
+        h = HTTP2Hpack(None, 4096)
+        name = h.decode(unhexlify(b"000c636f6e74656e742d7479706500"))[0][0]
+        assert name is hpack_header_name("Content-Type")
@@ -3,15 +3,23 @@
 """Tests for HTTP/2 Huffman encoding and decoding."""
 
 import pytest
+import threading
 import http2_adapter
 
-from .compat import unit_type
+from binascii import unhexlify
+from struct import pack
+from http2_adapter.exceptions import HTTP2HpackHuffmanDecodeError
+from http2_adapter.huffman import HTTP2HuffmanCache
+from http2_adapter.huffman import HTTP2HuffmanDecoder
+from http2_adapter.huffman_4bits import decode as decode_4bits
 
 
 class TestHTTP2Huffman:
     def test_entry_points(self):
         http2_adapter.HTTP2Huffman
         http2_adapter.HTTP2Huffman()
+        assert isinstance(http2_adapter.http2_huffman,
+                          http2_adapter.HTTP2Huffman)
 
     def test_encode_and_decode(self):
         h = http2_adapter.HTTP2Huffman()
@@ -24,9 +32,225 @@ class TestHTTP2Huffman:
             else:
                 assert data_after_decoding == __data
 
-        _t(unit_type("H"))
-        _t(unit_type("Hello World!@#$!!*&?"), lower=True)
-        _t(unit_type("Hello World!@#$!!*&?"))
-        _t(unit_type("Hello VVVVWorld!@#$!!*&?"))
-        _t(unit_type("ASDIuu393849Hello VVVVWorld!@#$!!*&?"))
-        _t(unit_type("1234567890-_=+qwertyuiop[]{}\\|asdfghjkl:;"))
+        _t(b"")
+        _t(b"H")
+        _t(b"Hello World!@#$!!*&?", lower=True)
+        _t(b"Hello World!@#$!!*&?")
+        _t(b"Hello VVVVWorld!@#$!!*&?")
+        _t(b"ASDIuu393849Hello VVVVWorld!@#$!!*&?")
+        _t(b"1234567890-_=+qwertyuiop[]{}\\|asdfghjkl:;")
+        _t(b"".join(pack(">B", i) for i in range(256)))
+        _t(b"; ".join([b"session=0123456789abcdefABCDEF"] * 64))
+
+    def test_encode_rfc7541_examples(self):
+        h = http2_adapter.HTTP2Huffman()
+
+        assert h.encode(b"www.example.com") == \
+            unhexlify(b"f1e3c2e5f23a6ba0ab90f4ff")
+        assert h.encode(b"no-cache") == unhexlify(b"a8eb10649cbf")
+        assert h.encode(b"302") == unhexlify(b"6402")
+        assert h.encode(b"foo=ASDJKHQKBZXOQWEOPIUAXQWEOIU; max-age=3600; "
+                        b"version=1") == \
+            unhexlify(b"94e7821dd7f2e6c7b335dfdfcd5b3960d5af27087f3672c1"
+                      b"ab270fb5291f9587316065c003ed4ee5b1063d5007")
+        assert h.encode(b"CUSTOM-KEY", lower=True) == \
+            unhexlify(b"25a849e95ba97d7f")
+
+    def test_decode_rfc7541_examples(self):
+        h = http2_adapter.HTTP2Huffman()
+
+        def _t(hex_data, plain):
+            assert h.decode(unhexlify(hex_data)) == plain
+            assert decode_4bits(unhexlify(hex_data)) == plain
+
+        _t(b"f1e3c2e5f23a6ba0ab90f4ff", b"www.example.com")
+        _t(b"a8eb10649cbf", b"no-cache")
+        _t(b"25a849e95ba97d7f", b"custom-key")
+        _t(b"25a849e95bb8e8b4bf", b"custom-value")
+        _t(b"6402", b"302")
+        _t(b"aec3771a4b", b"private")
+        _t(b"d07abe941054d444a8200595040b8166e082a62d1bff",
+           b"Mon, 21 Oct 2013 20:13:21 GMT")
+        _t(b"9d29ad171863c78f0b97c8e9ae82ae43d3", b"https://www.example.com")
+        _t(b"94e7821dd7f2e6c7b335dfdfcd5b3960d5af27087f3672c1ab270fb5291f95"
+           b"87316065c003ed4ee5b1063d5007",
+           b"foo=ASDJKHQKBZXOQWEOPIUAXQWEOIU; max-age=3600; version=1")
+
+    def test_decode_rare_symbols(self):
+        h = http2_adapter.HTTP2Huffman()
+
+        # 0x00 (13 bits) + 0xff (26 bits) + 0x7f (28 bits), then 5 bits padding
+        assert h.decode(unhexlify(b"ffc7ffffddffffff9f")) == b"\x00\xff\x7f"
+
+    def test_decode_error(self):
+        h = http2_adapter.HTTP2Huffman()
+
+        # EOS inside the string
+        with pytest.raises(HTTP2HpackHuffmanDecodeError):
+            h.decode(unhexlify(b"ffffffff"))
+
+        # padding longer than 7 bits
+        with pytest.raises(HTTP2HpackHuffmanDecodeError):
+            h.decode(unhexlify(b"f1e3c2e5f23a6ba0ab90f4ffff"))
+
+        # padding not made of the EOS prefix
+        with pytest.raises(HTTP2HpackHuffmanDecodeError):
+            h.decode(unhexlify(b"f1e3c2e5f23a6ba0ab90f4fe"))
+
+    def test_shared_across_threads(self):
+        h = http2_adapter.http2_huffman
+        samples = [
+            (unhexlify(b"f1e3c2e5f23a6ba0ab90f4ff"), b"www.example.com"),
+            (unhexlify(b"a8eb10649cbf"), b"no-cache"),
+            (unhexlify(b"9d29ad171863c78f0b97c8e9ae82ae43d3"),
+             b"https://www.example.com"),
+        ]
+        errors = []
+
+        def _worker(encoded, plain):
+            for _ in range(500):
+                if h.decode(encoded) != plain:
+                    errors.append(plain)
+
+        threads = [threading.Thread(target=_worker, args=sample)
+                   for sample in samples * 4]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+
+    def test_encoded_length(self):
+        h = http2_adapter.http2_huffman
+
+        assert h.encoded_length(b"") == 0
+        assert h.encoded_length(b"www.example.com") == 12
+        assert h.encoded_length(b"no-cache") == 6
+        assert h.encoded_length(b"\xff\x00") == 5
+        assert h.encoded_length(b"CUSTOM-KEY", lower=True) == 8
+
+    def test_cache(self):
+        h = http2_adapter.HTTP2Huffman(cache_size=64)
+        plain = b"www.example.com"
+        encoded = unhexlify(b"f1e3c2e5f23a6ba0ab90f4ff")
+
+        assert h.encode(plain) == encoded
+        assert h.encode(plain) == encoded
+        assert h.encode_cache.hits == 1
+        assert h.encode_cache.misses == 1
+        assert h.encode_cache.size == len(plain) + len(encoded)
+
+        assert h.decode(encoded) == plain
+        assert h.decode(bytearray(encoded)) == plain
+        assert h.decode_cache.hits == 1
+        assert h.decode_cache.misses == 1
+
+        # lowercase encoding is cached apart
+        assert h.encode(b"WWW.EXAMPLE.COM", lower=True) == encoded
+        assert h.encode(plain, lower=True) == encoded
+        assert h.encode_cache.misses == 3
+
+    def test_cache_types(self):
+        for h in (http2_adapter.HTTP2Huffman(),
+                  http2_adapter.HTTP2Huffman(cache_size=64)):
+            for payload in (bytearray(b"abc"), memoryview(b"abc"), u"abc"):
+                with pytest.raises(ValueError):
+                    h.encode(payload)
+
+            encoded = unhexlify(b"f1e3c2e5f23a6ba0ab90f4ff")
+            assert h.decode(bytearray(encoded)) == b"www.example.com"
+            assert h.decode(memoryview(encoded)) == b"www.example.com"
+
+    def test_cache_eviction(self):
+        cache = HTTP2HuffmanCache(10)
+
+        cache.put(b"a", b"1", 4)
+        cache.put(b"b", b"2", 4)
+        assert cache.get(b"a") == b"1"
+
+        # b is the least recently used one
+        cache.put(b"c", b"3", 4)
+        assert cache.get(b"b") is None
+        assert cache.get(b"a") == b"1"
+        assert cache.get(b"c") == b"3"
+        assert cache.size == 8
+        assert len(cache) == 2
+
+        # never cached when larger than the budget
+        cache.put(b"d", b"4", 11)
+        assert cache.get(b"d") is None
+        assert len(cache) == 2
+
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.size == 0
+        assert cache.hits == 0
+        assert cache.misses == 0
+
+    def test_decode_table_8bits(self):
+        nexts, emit_ids, emits, endings = \
+            http2_adapter.huffman._load_decode_table_8bits()
+
+        assert len(nexts) == len(emit_ids) == 257 << 8
+        assert len(endings) == 257
+        assert max(nexts) == 256 and endings[256] == 0
+        assert endings[0] == 1
+
+        # at most two symbols per byte, each string stored once
+        assert max(len(emit) for emit in emits) == 2
+        assert len(set(emits)) == len(emits)
+
+    def test_incremental_decoder(self):
+        encoded = unhexlify(b"94e7821dd7f2e6c7b335dfdfcd5b3960d5af27087f3672c1"
+                            b"ab270fb5291f9587316065c003ed4ee5b1063d5007")
+        plain = b"foo=ASDJKHQKBZXOQWEOPIUAXQWEOIU; max-age=3600; version=1"
+        decoder = HTTP2HuffmanDecoder()
+
+        for step in (1, 2, 3, 7, len(encoded)):
+            chunks = [encoded[i:i + step]
+                      for i in range(0, len(encoded), step)]
+            assert b"".join(decoder.feed(chunk) for chunk in chunks) == plain
+            decoder.finish()
+
+        # the decoder is reset, even after an error
+        decoder.feed(encoded[:5])
+        with pytest.raises(HTTP2HpackHuffmanDecodeError):
+            decoder.finish()
+        assert decoder.feed(encoded) == plain
+        decoder.finish()
+
+        # invalid codes fail as soon as they are fed
+        with pytest.raises(HTTP2HpackHuffmanDecodeError):
+            decoder.feed(unhexlify(b"ffffffff"))
+
+        # and reset the decoder too
+        decoder.feed(encoded[:5])
+        with pytest.raises(HTTP2HpackHuffmanDecodeError):
+            decoder.feed(unhexlify(b"ffffffff"))
+        assert decoder.feed(encoded) == plain
+        decoder.finish()
+
+    def test_encode_many(self, monkeypatch):
+        h = http2_adapter.http2_huffman
+        values = [b"", b"www.example.com", b"".join(pack(">B", i)
+                                                    for i in range(256))]
+        values += [b"/search?q=%d&lang=EN" % i for i in range(100)]
+        expected = [h.encode(value) for value in values]
+        expected_lc = [h.encode(value, lower=True) for value in values]
+
+        assert h.encode_many([]) == []
+        assert h.encode_many(values) == expected
+        assert h.encode_many(values, lower=True) == expected_lc
+
+        # in several rounds
+        monkeypatch.setattr(http2_adapter.huffman, "HTTP2_HUFF_NUMPY_CHUNK", 64)
+        assert h.encode_many(values) == expected
+
+        # without NumPy
+        monkeypatch.setattr(http2_adapter.huffman, "_numpy", False)
+        assert h.encode_many(values) == expected
+        assert h.encode_many(values, lower=True) == expected_lc
+
+        with pytest.raises(ValueError):
+            h.encode_many([b"abc", u"abc"])